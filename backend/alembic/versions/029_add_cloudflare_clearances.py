@@ -0,0 +1,37 @@
+"""Add cloudflare_clearances table
+
+Revision ID: 029_add_cloudflare_clearances
+Revises: 028_add_hardlink_and_qbit_settings
+Create Date: 2026-10-16 10:00:00.000000
+
+Persists the cookies solved by FlareSolverr per tracker domain, with the
+user agent they are bound to and their expiration, so Cloudflare clearance
+is reused across requests and application restarts.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '029_add_cloudflare_clearances'
+down_revision = '028_add_hardlink_and_qbit_settings'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cloudflare_clearances',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('domain', sa.String(length=255), nullable=False),
+        sa.Column('cookies', sa.JSON(), nullable=False),
+        sa.Column('user_agent', sa.String(length=500), nullable=True),
+        sa.Column('solved_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cloudflare_clearances_domain'), 'cloudflare_clearances', ['domain'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cloudflare_clearances_domain'), table_name='cloudflare_clearances')
+    op.drop_table('cloudflare_clearances')
@@ -0,0 +1,38 @@
+"""Add mediainfo_cache table
+
+Revision ID: 030_add_mediainfo_cache
+Revises: 029_add_cloudflare_clearances
+Create Date: 2026-10-16 21:30:00.000000
+
+Persists parsed MediaInfo data keyed on the file identity (device, inode)
+with the size and mtime it was parsed at, so each media file is parsed once
+across pipeline stages, trackers, hardlinked copies and retries.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '030_add_mediainfo_cache'
+down_revision = '029_add_cloudflare_clearances'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'mediainfo_cache',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('device', sa.BigInteger(), nullable=False),
+        sa.Column('inode', sa.BigInteger(), nullable=False),
+        sa.Column('file_size', sa.BigInteger(), nullable=False),
+        sa.Column('mtime_ns', sa.BigInteger(), nullable=False),
+        sa.Column('file_name', sa.String(length=500), nullable=True),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('device', 'inode', name='uq_mediainfo_cache_device_inode')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('mediainfo_cache')
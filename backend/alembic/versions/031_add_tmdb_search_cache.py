@@ -0,0 +1,37 @@
+"""Add tmdb_search_cache table
+
+Revision ID: 031_add_tmdb_search_cache
+Revises: 030_add_mediainfo_cache
+Create Date: 2026-10-16 22:00:00.000000
+
+Persists TMDB /search results per normalized (content type, language, year,
+title) query, so identical title lookups share one TMDB request.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '031_add_tmdb_search_cache'
+down_revision = '030_add_mediainfo_cache'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tmdb_search_cache',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('query_key', sa.String(length=600), nullable=False),
+        sa.Column('results', sa.JSON(), nullable=False),
+        sa.Column('cached_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tmdb_search_cache_query_key', 'tmdb_search_cache', ['query_key'], unique=True)
+    op.create_index('ix_tmdb_search_cache_expires_at', 'tmdb_search_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tmdb_search_cache_expires_at', table_name='tmdb_search_cache')
+    op.drop_index('ix_tmdb_search_cache_query_key', table_name='tmdb_search_cache')
+    op.drop_table('tmdb_search_cache')
@@ -0,0 +1,133 @@
+"""Add file_entries query indexes, is_terminal column and status counts
+
+Revision ID: 032_add_file_entry_query_indexes
+Revises: 031_add_tmdb_search_cache
+Create Date: 2026-10-16 23:00:00.000000
+
+Adds composite indexes for the dashboard, queue, history and statistics
+queries, a denormalized is_terminal flag (status in UPLOADED/FAILED) so
+history and queue pages read one index range in updated_at order, and a
+file_entry_status_counts table kept up to date by triggers on file_entries
+for the all-time totals of the dashboard and history pages.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '032_add_file_entry_query_indexes'
+down_revision = '031_add_tmdb_search_cache'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('idx_file_entries_status_updated_at', ['status', 'updated_at']),
+    ('idx_file_entries_status_uploaded_at', ['status', 'uploaded_at']),
+    ('idx_file_entries_status_approval_requested_at', ['status', 'approval_requested_at']),
+    ('idx_file_entries_created_at_status', ['created_at', 'status']),
+    ('idx_file_entries_terminal_updated_at', ['is_terminal', 'updated_at']),
+    ('idx_file_entries_updated_at', ['updated_at']),
+]
+
+STATUS_COUNT_TRIGGERS = {
+    'sqlite': [
+        """
+        CREATE TRIGGER file_entries_status_count_insert
+        AFTER INSERT ON file_entries
+        BEGIN
+            INSERT INTO file_entry_status_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER file_entries_status_count_update
+        AFTER UPDATE OF status ON file_entries
+        WHEN OLD.status IS NOT NEW.status
+        BEGIN
+            UPDATE file_entry_status_counts SET count = count - 1 WHERE status = OLD.status;
+            INSERT INTO file_entry_status_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER file_entries_status_count_delete
+        AFTER DELETE ON file_entries
+        BEGIN
+            UPDATE file_entry_status_counts SET count = count - 1 WHERE status = OLD.status;
+        END
+        """,
+    ],
+    'postgresql': [
+        """
+        CREATE OR REPLACE FUNCTION file_entries_status_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE file_entry_status_counts SET count = count - 1 WHERE status = OLD.status::text;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO file_entry_status_counts (status, count) VALUES (NEW.status::text, 1)
+                ON CONFLICT (status) DO UPDATE SET count = file_entry_status_counts.count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER file_entries_status_count
+        AFTER INSERT OR DELETE OR UPDATE OF status ON file_entries
+        FOR EACH ROW EXECUTE FUNCTION file_entries_status_count()
+        """,
+    ],
+}
+
+DROP_STATUS_COUNT_TRIGGERS = {
+    'sqlite': [
+        "DROP TRIGGER IF EXISTS file_entries_status_count_insert",
+        "DROP TRIGGER IF EXISTS file_entries_status_count_update",
+        "DROP TRIGGER IF EXISTS file_entries_status_count_delete",
+    ],
+    'postgresql': [
+        "DROP TRIGGER IF EXISTS file_entries_status_count ON file_entries",
+        "DROP FUNCTION IF EXISTS file_entries_status_count()",
+    ],
+}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('file_entries') as batch_op:
+        batch_op.add_column(sa.Column('is_terminal', sa.Boolean(), nullable=False, server_default=sa.false()))
+
+    op.get_bind().execute(
+        sa.text("UPDATE file_entries SET is_terminal = :terminal WHERE status IN ('UPLOADED', 'FAILED')"),
+        {'terminal': True}
+    )
+
+    for name, columns in INDEXES:
+        op.create_index(name, 'file_entries', columns)
+
+    op.create_table(
+        'file_entry_status_counts',
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('status')
+    )
+    op.execute(
+        "INSERT INTO file_entry_status_counts (status, count) "
+        "SELECT status, COUNT(*) FROM file_entries GROUP BY status"
+    )
+    for statement in STATUS_COUNT_TRIGGERS.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in DROP_STATUS_COUNT_TRIGGERS.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+    op.drop_table('file_entry_status_counts')
+
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='file_entries')
+
+    with op.batch_alter_table('file_entries') as batch_op:
+        batch_op.drop_column('is_terminal')
@@ -0,0 +1,28 @@
+"""Add timed_uploads to tracker_statistics
+
+Revision ID: 033_add_tracker_statistics_timed_uploads
+Revises: 032_add_file_entry_query_indexes
+Create Date: 2026-10-17 09:00:00.000000
+
+Adds timed_uploads column to tracker_statistics: the number of uploads
+whose duration is included in total_processing_time_seconds, so the
+average upload time ignores uploads recorded without a duration.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '033_add_tracker_statistics_timed_uploads'
+down_revision = '032_add_file_entry_query_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tracker_statistics') as batch_op:
+        batch_op.add_column(sa.Column('timed_uploads', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tracker_statistics') as batch_op:
+        batch_op.drop_column('timed_uploads')
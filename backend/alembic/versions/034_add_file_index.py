@@ -0,0 +1,52 @@
+"""Add file_index table
+
+Revision ID: 034_add_file_index
+Revises: 033_add_tracker_statistics_timed_uploads
+Create Date: 2026-10-17 11:00:00.000000
+
+Persistent index of the files and folders under the media roots, so file
+manager listings and searches read the database instead of the disk. The
+index is built by the application in the background after the upgrade.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '034_add_file_index'
+down_revision = '033_add_tracker_statistics_timed_uploads'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'file_index',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('path', sa.String(length=1000), nullable=False),
+        sa.Column('parent', sa.String(length=1000), nullable=False),
+        sa.Column('root', sa.String(length=1000), nullable=False),
+        sa.Column('name', sa.String(length=500), nullable=False),
+        sa.Column('name_lower', sa.String(length=500), nullable=False),
+        sa.Column('extension', sa.String(length=20), nullable=False),
+        sa.Column('is_dir', sa.Boolean(), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('mtime_ns', sa.BigInteger(), nullable=False),
+        sa.Column('inode', sa.BigInteger(), nullable=True),
+        sa.Column('listed_mtime_ns', sa.BigInteger(), nullable=True),
+        sa.Column('indexed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('path')
+    )
+    op.create_index(
+        'ix_file_index_parent_listing', 'file_index',
+        ['parent', sa.text('is_dir DESC'), 'name_lower']
+    )
+    op.create_index('ix_file_index_name_lower', 'file_index', ['name_lower'])
+    op.create_index('ix_file_index_root', 'file_index', ['root'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_file_index_root', table_name='file_index')
+    op.drop_index('ix_file_index_name_lower', table_name='file_index')
+    op.drop_index('ix_file_index_parent_listing', table_name='file_index')
+    op.drop_table('file_index')
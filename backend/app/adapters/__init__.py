@@ -17,6 +17,7 @@ Available Adapters:
 
 Supporting Classes:
     - TrackerFactory: Factory for creating adapters based on configuration
+    - TrackerAdapterPool: Process-wide pool of authenticated adapters
     - TrackerConfigLoader: Loads and validates tracker YAML/JSON configs
 
 Architecture:
@@ -36,6 +37,7 @@ from .lacale_adapter import LaCaleAdapter
 from .c411_adapter import C411Adapter
 from .config_adapter import ConfigAdapter
 from .generic_adapter import GenericTrackerAdapter
+from .adapter_pool import TrackerAdapterPool, get_adapter_pool
 from .tracker_factory import TrackerFactory, get_tracker_factory
 from .tracker_config_loader import TrackerConfigLoader, get_config_loader, load_tracker_config
 
@@ -47,6 +49,8 @@ __all__ = [
     'GenericTrackerAdapter',
     'TrackerFactory',
     'get_tracker_factory',
+    'TrackerAdapterPool',
+    'get_adapter_pool',
     'TrackerConfigLoader',
     'get_config_loader',
     'load_tracker_config'
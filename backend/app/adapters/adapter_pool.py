@@ -0,0 +1,337 @@
+"""
+Tracker Adapter Pool for Seedarr v2.0
+
+This module provides the process-wide pool of tracker adapters. Every
+TrackerFactory (pipeline upload stage, duplicate checks, tracker and
+dashboard routes) borrows the same adapter for a tracker, so its
+authenticated session, Cloudflare cookies, httpx client and cached
+categories/tags outlive the request or file that created it.
+
+Features:
+    - One adapter per tracker, keyed on the tracker ID and a version of its
+      settings (see TrackerFactory._config_version); a new version replaces
+      the adapter
+    - Authentication once per session: authenticate() only calls the
+      adapter for a new session, concurrent callers wait for that call
+    - Session health check on checkout: sessions older than
+      TRACKER_SESSION_MAX_AGE, or that the adapter reports as no longer
+      valid (expired or challenged Cloudflare clearance), are replaced
+    - Adapters unused for TRACKER_ADAPTER_IDLE_TIMEOUT are closed
+    - Replaced adapters are closed after a grace period, so requests still
+      using them can finish
+
+Usage Example:
+    Adapters are shared, so callers borrow them without closing them:
+    >>> adapter = factory.get_adapter(tracker)
+    >>> await get_adapter_pool().authenticate(adapter)
+    >>> await adapter.upload_torrent(...)
+
+Shutdown:
+    close_tracker_adapters() is awaited from main.lifespan on shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..config import config
+from .tracker_adapter import TrackerAdapter
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two passes of the idle / replaced adapter sweeper
+SWEEP_INTERVAL = 60.0
+
+
+@dataclass
+class _PooledAdapter:
+    """An adapter of the pool and the state of its session."""
+    adapter: TrackerAdapter
+    version: Hashable
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    authenticated_at: Optional[float] = None
+    checkouts: int = 0
+    auth_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+
+class TrackerAdapterPool:
+    """
+    Registry of long-lived tracker adapters, one per tracker.
+
+    Adapters hold httpx clients bound to the event loop they were created
+    on; if the loop changes (e.g. between test cases), adapters of the old
+    loop are replaced and closed on the next sweep.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = 1800.0,
+        session_max_age: float = 21600.0,
+        retire_grace: float = 600.0
+    ):
+        """
+        Initialize the adapter pool.
+
+        Args:
+            idle_timeout: Seconds without checkout before an adapter is closed
+            session_max_age: Seconds after authentication before a session is replaced
+            retire_grace: Seconds a replaced adapter is kept open for requests in flight
+        """
+        self.idle_timeout = idle_timeout
+        self.session_max_age = session_max_age
+        self.retire_grace = retire_grace
+        self._entries: Dict[int, _PooledAdapter] = {}
+        # id(adapter) -> entry, to find the session of a borrowed adapter
+        self._by_adapter: Dict[int, _PooledAdapter] = {}
+        # (retired at, adapter) waiting to be closed
+        self._retired: List[Tuple[float, TrackerAdapter]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sweeper: Optional[asyncio.Task] = None
+        self.created = 0
+        self.reused = 0
+        self.authentications = 0
+
+    def get(
+        self,
+        tracker_id: int,
+        version: Hashable,
+        create: Callable[[], TrackerAdapter]
+    ) -> TrackerAdapter:
+        """
+        Get the pooled adapter of a tracker, creating it if needed.
+
+        The returned adapter must not be closed by the caller.
+
+        Args:
+            tracker_id: Tracker ID
+            version: Version of the tracker settings the adapter is built from
+            create: Builds a new adapter for the tracker
+
+        Returns:
+            Shared TrackerAdapter for the tracker
+        """
+        self._check_loop()
+        now = time.monotonic()
+
+        entry = self._entries.get(tracker_id)
+        if entry is not None:
+            reason = self._stale_reason(entry, version, now)
+            if reason:
+                logger.info(f"Replacing pooled adapter of tracker {tracker_id}: {reason}")
+                self._retire(tracker_id, now)
+                entry = None
+
+        if entry is None:
+            entry = _PooledAdapter(adapter=create(), version=version)
+            self._entries[tracker_id] = entry
+            self._by_adapter[id(entry.adapter)] = entry
+            self.created += 1
+        else:
+            self.reused += 1
+
+        entry.last_used = now
+        entry.checkouts += 1
+        self._ensure_sweeper()
+        return entry.adapter
+
+    def peek(self, tracker_id: int) -> Optional[TrackerAdapter]:
+        """Get the pooled adapter of a tracker without creating or checking it."""
+        entry = self._entries.get(tracker_id)
+        return entry.adapter if entry is not None else None
+
+    async def authenticate(self, adapter: TrackerAdapter) -> bool:
+        """
+        Authenticate a borrowed adapter once per session.
+
+        Adapters that are not (or no longer) pooled are authenticated
+        directly.
+
+        Args:
+            adapter: Adapter returned by get()
+
+        Returns:
+            True if the session is authenticated
+        """
+        entry = self._by_adapter.get(id(adapter))
+        if entry is None or entry.adapter is not adapter:
+            return await adapter.authenticate()
+
+        if entry.authenticated_at is not None:
+            return True
+
+        async with entry.auth_lock:
+            if entry.authenticated_at is None:
+                if not await adapter.authenticate():
+                    return False
+                entry.authenticated_at = time.monotonic()
+                self.authentications += 1
+        return True
+
+    def invalidate(self, tracker_id: Optional[int] = None) -> None:
+        """
+        Replace the adapter of a tracker (or of all trackers) on next checkout.
+
+        Call when tracker settings change, the tracker is deleted or its
+        session is rejected. The old adapters are closed after the grace
+        period.
+
+        Args:
+            tracker_id: Tracker ID, or None for all trackers
+        """
+        now = time.monotonic()
+        tracker_ids = list(self._entries) if tracker_id is None else [tracker_id]
+        for pooled_id in tracker_ids:
+            if pooled_id in self._entries:
+                self._retire(pooled_id, now)
+                logger.info(f"Pooled adapter of tracker {pooled_id} invalidated")
+        # The sweeper closes them once the grace period is over
+        self._ensure_sweeper()
+
+    def _stale_reason(self, entry: _PooledAdapter, version: Hashable, now: float) -> Optional[str]:
+        """Get why a pooled adapter cannot be reused (None if it can)."""
+        if entry.version != version:
+            return "tracker settings changed"
+        if entry.authenticated_at is not None and now - entry.authenticated_at > self.session_max_age:
+            return "session expired"
+        try:
+            if not entry.adapter.has_valid_session():
+                return "session no longer valid"
+        except Exception as e:
+            return f"session check failed: {e}"
+        return None
+
+    def _retire(self, tracker_id: int, now: float) -> None:
+        entry = self._entries.pop(tracker_id)
+        self._by_adapter.pop(id(entry.adapter), None)
+        self._retired.append((now, entry.adapter))
+
+    def _check_loop(self) -> None:
+        """Retire the adapters of a previous event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop is not self._loop:
+            if self._entries or self._retired:
+                logger.debug("Event loop changed, dropping pooled tracker adapters")
+            self._loop = loop
+            self._sweeper = None
+            # Not usable on this loop: closed on the next sweep, without grace period
+            now = time.monotonic()
+            for tracker_id in list(self._entries):
+                self._retire(tracker_id, now - self.retire_grace)
+            self._retired = [(now - self.retire_grace, adapter) for _, adapter in self._retired]
+
+    def _ensure_sweeper(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop is self._loop and (self._sweeper is None or self._sweeper.done()):
+            self._sweeper = loop.create_task(self._sweep_loop())
+
+    async def _sweep_loop(self) -> None:
+        """Sweep periodically while the pool holds adapters."""
+        while self._entries or self._retired:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            await self.sweep()
+
+    async def sweep(self) -> None:
+        """Close idle adapters and replaced adapters past their grace period."""
+        now = time.monotonic()
+        for tracker_id, entry in list(self._entries.items()):
+            if now - entry.last_used > self.idle_timeout:
+                logger.info(f"Closing idle adapter of tracker {tracker_id}")
+                # Idle: nothing is using it, close without grace period
+                self._retire(tracker_id, now - self.retire_grace)
+
+        closable = [adapter for retired_at, adapter in self._retired if now - retired_at >= self.retire_grace]
+        self._retired = [(retired_at, adapter) for retired_at, adapter in self._retired if now - retired_at < self.retire_grace]
+        for adapter in closable:
+            await self._close(adapter)
+
+    async def _close(self, adapter: TrackerAdapter) -> None:
+        try:
+            await adapter.close()
+        except Exception as e:
+            logger.warning(f"Error closing tracker adapter {adapter!r}: {e}")
+
+    async def aclose(self) -> None:
+        """Close all adapters, pooled and replaced."""
+        if self._sweeper is not None and not self._sweeper.done():
+            self._sweeper.cancel()
+        self._sweeper = None
+
+        adapters = [entry.adapter for entry in self._entries.values()]
+        adapters += [adapter for _, adapter in self._retired]
+        self._entries.clear()
+        self._by_adapter.clear()
+        self._retired.clear()
+        for adapter in adapters:
+            await self._close(adapter)
+        if adapters:
+            logger.info(f"✓ Closed {len(adapters)} tracker adapter(s)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with adapters created, reused and authenticated, and
+            per tracker the adapter type, age, idle time and checkouts
+        """
+        now = time.monotonic()
+        adapters = {}
+        for tracker_id, entry in self._entries.items():
+            adapters[tracker_id] = {
+                "adapter": type(entry.adapter).__name__,
+                "authenticated": entry.authenticated_at is not None,
+                "session_age": round(now - entry.authenticated_at, 1) if entry.authenticated_at is not None else None,
+                "idle": round(now - entry.last_used, 1),
+                "checkouts": entry.checkouts,
+            }
+
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "authentications": self.authentications,
+            "retired": len(self._retired),
+            "adapters": adapters,
+        }
+
+
+# Global adapter pool instance
+_adapter_pool: Optional[TrackerAdapterPool] = None
+
+
+def get_adapter_pool() -> TrackerAdapterPool:
+    """
+    Get the process-wide TrackerAdapterPool instance.
+
+    Returns:
+        TrackerAdapterPool configured from app.config
+    """
+    global _adapter_pool
+    if _adapter_pool is None:
+        _adapter_pool = TrackerAdapterPool(
+            idle_timeout=config.TRACKER_ADAPTER_IDLE_TIMEOUT,
+            session_max_age=config.TRACKER_SESSION_MAX_AGE,
+            # Replaced adapters may still be uploading
+            retire_grace=config.PIPELINE_TRACKER_UPLOAD_TIMEOUT,
+        )
+    return _adapter_pool
+
+
+def invalidate_tracker_adapter(tracker_id: Optional[int] = None) -> None:
+    """Replace the pooled adapter of a tracker (or of all trackers) on next use."""
+    if _adapter_pool is not None:
+        _adapter_pool.invalidate(tracker_id)
+
+
+async def close_tracker_adapters() -> None:
+    """Close all pooled tracker adapters (call on application shutdown)."""
+    if _adapter_pool is not None:
+        await _adapter_pool.aclose()
@@ -126,6 +126,7 @@ class ConfigAdapter(TrackerAdapter):
 
         # Initialize HTTP client
         self._client: Optional[httpx.AsyncClient] = None
+        self._retired_clients: List[httpx.AsyncClient] = []
         self._session: Optional[Session] = None
         self._authenticated = False
 
@@ -171,30 +172,64 @@ class ConfigAdapter(TrackerAdapter):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
+            await self._close_retired_clients()
             headers = self._build_auth_headers()
 
             # Transfer cookies from FlareSolverr session if available
             cookies = None
+            event_hooks = {}
             if self._session:
                 cookies = httpx.Cookies()
                 for cookie in self._session.cookies:
                     cookies.set(cookie.name, cookie.value, domain=cookie.domain)
                 logger.debug(f"Transferred {len(self._session.cookies)} cookies to httpx client")
 
+                # cf_clearance is bound to the user agent that solved the challenge
+                user_agent = self._session.headers.get('User-Agent', '')
+                if user_agent and not user_agent.startswith('python-requests'):
+                    headers.setdefault('User-Agent', user_agent)
+
+                event_hooks['response'] = [self._invalidate_on_challenge]
+
             self._client = httpx.AsyncClient(
                 headers=headers,
                 cookies=cookies,
                 timeout=self.timeout,
-                follow_redirects=True
+                follow_redirects=True,
+                event_hooks=event_hooks
             )
         return self._client
 
+    async def _invalidate_on_challenge(self, response: httpx.Response) -> None:
+        """Drop the cached Cloudflare clearance when the tracker answers with a challenge."""
+        from ..services.cloudflare_session_manager import is_cloudflare_challenge
+
+        body = None
+        if response.status_code in (403, 503):
+            await response.aread()
+            body = response.text
+        if self._session_manager and is_cloudflare_challenge(response.status_code, response.headers, body):
+            logger.warning(f"Cloudflare challenge returned by {self.tracker_url}, clearance expired")
+            self._session_manager.invalidate(self.tracker_url)
+            # The client carries the stale cf_clearance cookies: drop it and
+            # solve again on the next request
+            self._session = None
+            self._authenticated = False
+            self._reset_client()
+
     def _reset_client(self):
         """Reset the HTTP client (needed after Cloudflare session update)."""
         if self._client:
-            # We can't await aclose here, so just clear the reference
+            # It may be serving the current request: close it on the next
+            # _get_client() or close()
+            self._retired_clients.append(self._client)
             self._client = None
 
+    async def _close_retired_clients(self) -> None:
+        """Close the clients dropped by _reset_client()."""
+        while self._retired_clients:
+            await self._retired_clients.pop().aclose()
+
     def _build_auth_headers(self) -> Dict[str, str]:
         """Build authentication headers based on config."""
         auth_config = self.config.get("auth", {})
@@ -246,12 +281,13 @@ class ConfigAdapter(TrackerAdapter):
     async def _init_cloudflare_session(self):
         """Initialize Cloudflare session manager if needed."""
         if self.requires_cloudflare and self.flaresolverr_url:
-            from ..services.cloudflare_session_manager import CloudflareSessionManager
+            from ..services.cloudflare_session_manager import CloudflareSessionManager, get_clearance_cache
 
             if self._session_manager is None:
                 self._session_manager = CloudflareSessionManager(
                     flaresolverr_url=self.flaresolverr_url,
-                    max_timeout=self.flaresolverr_timeout
+                    max_timeout=self.flaresolverr_timeout,
+                    clearance_cache=get_clearance_cache()
                 )
 
             self._session = await self._session_manager.get_session(
@@ -1556,6 +1592,7 @@ class ConfigAdapter(TrackerAdapter):
         except Exception as e:
             logger.error(f"Duplicate check failed: {type(e).__name__}: {e}", exc_info=True)
             result['message'] = f"Check failed: {str(e)}"
+            result['error'] = str(e)
             return result
 
     def _parse_response_auto(self, response: httpx.Response, response_format: str = "json") -> List[Dict[str, Any]]:
@@ -2264,8 +2301,30 @@ class ConfigAdapter(TrackerAdapter):
             logger.warning(f"Failed to build TMDB data: {e}")
             return None
 
+    def has_valid_session(self) -> bool:
+        """
+        Check whether the session can still be reused.
+
+        A Cloudflare session is only valid while its clearance is cached:
+        it is dropped when it expires or when the tracker answers with a
+        challenge (see _invalidate_on_challenge).
+        """
+        if self._client is not None and self._client.is_closed:
+            return False
+        if self._authenticated and self.requires_cloudflare and self._session_manager is not None:
+            from ..services.cloudflare_session_manager import clearance_domain
+
+            clearance_cache = self._session_manager.clearance_cache
+            if clearance_cache is not None and clearance_cache.get(clearance_domain(self.tracker_url)) is None:
+                return False
+        return True
+
     async def close(self):
         """Close HTTP client and cleanup resources."""
+        if self._session:
+            self._session.close()
+            self._session = None
+        await self._close_retired_clients()
         if self._client:
             await self._client.aclose()
             self._client = None
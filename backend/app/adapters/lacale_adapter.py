@@ -54,7 +54,7 @@ from typing import Dict, List, Optional, Any
 from requests import Session
 
 from .tracker_adapter import TrackerAdapter
-from ..services.cloudflare_session_manager import CloudflareSessionManager
+from ..services.cloudflare_session_manager import CloudflareSessionManager, get_clearance_cache
 from ..services.lacale_client import LaCaleClient
 from ..services.exceptions import (
     TrackerAPIError,
@@ -110,7 +110,8 @@ class LaCaleAdapter(TrackerAdapter):
         # Initialize session manager for Cloudflare bypass
         self.session_manager = CloudflareSessionManager(
             flaresolverr_url=flaresolverr_url,
-            max_timeout=flaresolverr_timeout
+            max_timeout=flaresolverr_timeout,
+            clearance_cache=get_clearance_cache()
         )
 
         # Initialize La Cale API client
@@ -726,6 +727,12 @@ class LaCaleAdapter(TrackerAdapter):
             ]
         }
 
+    async def close(self) -> None:
+        """Close the authenticated session."""
+        if self.authenticated_session is not None:
+            self.authenticated_session.close()
+            self.authenticated_session = None
+
     def __repr__(self) -> str:
         """String representation of LaCaleAdapter."""
         return (
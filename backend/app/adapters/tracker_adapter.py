@@ -307,7 +307,8 @@ class TrackerAdapter(ABC):
                     'is_duplicate': bool,  # True if release exists
                     'existing_torrents': List[Dict],  # List of matching torrents found
                     'search_method': str,  # Which method found the match ("tmdb", "imdb", "name", "none")
-                    'message': str  # Human-readable result message
+                    'message': str,  # Human-readable result message
+                    'error': str  # Only if the check failed (the result is not cached)
                 }
 
             Each torrent in existing_torrents contains:
@@ -396,3 +397,24 @@ class TrackerAdapter(ABC):
             print(f"Using {info['name']} v{info['version']} for {info['tracker_name']}")
         """
         pass
+
+    def has_valid_session(self) -> bool:
+        """
+        Check whether the authenticated session can still be reused.
+
+        The adapter pool (see adapter_pool.py) replaces adapters whose
+        session is no longer valid. Adapters without expiring sessions keep
+        this default.
+
+        Returns:
+            True if the adapter can keep serving requests
+        """
+        return True
+
+    async def close(self) -> None:
+        """
+        Release the adapter's resources (HTTP clients, sessions).
+
+        Called by the adapter pool when it drops the adapter.
+        """
+        pass
@@ -90,6 +90,9 @@ class TrackerConfigLoader:
         """
         self.config_dir = Path(config_dir) if config_dir else self.DEFAULT_CONFIG_DIR
         self._cache: Dict[str, Dict[str, Any]] = {}
+        # Incremented whenever cached configs are dropped or replaced, so
+        # adapters built from an older config can be detected (adapter pool)
+        self.generation = 0
 
         logger.debug(f"TrackerConfigLoader initialized with config_dir: {self.config_dir}")
 
@@ -485,6 +488,7 @@ class TrackerConfigLoader:
         Args:
             slug: Specific slug to clear, or None to clear all
         """
+        self.generation += 1
         if slug:
             self._cache.pop(slug, None)
             logger.debug(f"Cleared cache for: {slug}")
@@ -574,6 +578,7 @@ class TrackerConfigLoader:
 
         # Update cache
         self._cache[slug] = config
+        self.generation += 1
 
         logger.info(f"Saved configuration to: {file_path}")
         return file_path
@@ -5,6 +5,10 @@ This module provides a factory for creating tracker adapters dynamically
 based on tracker configuration. It manages the registry of adapter types
 and instantiates the appropriate adapter for each tracker.
 
+Adapters are kept in the process-wide adapter pool (see adapter_pool.py):
+factories created per request or per file share the same authenticated
+adapter of each tracker.
+
 Architecture:
     TrackerFactory
         ├── ConfigAdapter (adapter_type: "config") - YAML-driven, handles ALL trackers
@@ -20,12 +24,13 @@ Usage:
     # Get all enabled adapters
     adapters = factory.get_all_enabled_adapters()
     for tracker, adapter in adapters:
-        await adapter.authenticate()
+        await get_adapter_pool().authenticate(adapter)
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Type, TYPE_CHECKING
+from typing import Dict, Hashable, List, Optional, Tuple, Type, TYPE_CHECKING
 
+from .adapter_pool import TrackerAdapterPool, get_adapter_pool
 from .tracker_adapter import TrackerAdapter
 
 if TYPE_CHECKING:
@@ -54,11 +59,11 @@ class TrackerFactory:
         >>> # Get adapter for specific tracker
         >>> tracker = Tracker.get_by_slug(db, "lacale")
         >>> adapter = factory.get_adapter(tracker)
-        >>> await adapter.authenticate()
+        >>> await get_adapter_pool().authenticate(adapter)
         >>>
         >>> # Get all enabled adapters
         >>> for tracker, adapter in factory.get_all_enabled_adapters():
-        ...     await adapter.authenticate()
+        ...     await get_adapter_pool().authenticate(adapter)
         ...     result = await adapter.upload_torrent(...)
     """
 
@@ -71,7 +76,8 @@ class TrackerFactory:
         self,
         db: 'Session',
         flaresolverr_url: Optional[str] = None,
-        flaresolverr_timeout: int = 60000
+        flaresolverr_timeout: int = 60000,
+        adapter_pool: Optional[TrackerAdapterPool] = None
     ):
         """
         Initialize TrackerFactory.
@@ -80,6 +86,7 @@ class TrackerFactory:
             db: SQLAlchemy database session
             flaresolverr_url: FlareSolverr service URL (for Cloudflare bypass)
             flaresolverr_timeout: FlareSolverr request timeout in ms
+            adapter_pool: Pool holding the adapters (defaults to the process-wide pool)
         """
         self.db = db
         self.flaresolverr_url = flaresolverr_url
@@ -88,8 +95,8 @@ class TrackerFactory:
         # Initialize registry if not done
         self._ensure_registry()
 
-        # Cache of instantiated adapters (keyed by tracker_id)
-        self._adapter_cache: Dict[int, TrackerAdapter] = {}
+        # Instantiated adapters (keyed by tracker_id and settings version)
+        self._pool = adapter_pool if adapter_pool is not None else get_adapter_pool()
 
     @classmethod
     def _ensure_registry(cls) -> None:
@@ -136,8 +143,9 @@ class TrackerFactory:
         """
         Get adapter instance for a tracker.
 
-        Creates a new adapter instance if not cached, or returns
-        the cached instance for the tracker.
+        Returns the pooled adapter of the tracker, creating a new one if
+        none is pooled yet, or if the tracker settings changed or its
+        session expired since the pooled one was created.
 
         Adapter selection logic:
         1. If a YAML config file exists for tracker.slug -> use ConfigAdapter
@@ -153,10 +161,42 @@ class TrackerFactory:
         Raises:
             ValueError: If adapter_type is not registered
         """
-        # Check cache first
-        if tracker.id in self._adapter_cache:
-            return self._adapter_cache[tracker.id]
+        return self._pool.get(
+            tracker.id,
+            self._config_version(tracker),
+            lambda: self._build_adapter(tracker)
+        )
+
+    def _config_version(self, tracker: 'Tracker') -> Hashable:
+        """
+        Get the version of the settings an adapter of the tracker is built from.
+
+        Tracker.updated_at changes on every update of the tracker row; the
+        fields are compared too, for rows edited outside the ORM.
+        """
+        from .tracker_config_loader import get_config_loader
+
+        return (
+            getattr(tracker, 'updated_at', None),
+            tracker.slug,
+            tracker.adapter_type,
+            tracker.tracker_url,
+            tracker.api_key,
+            tracker.passkey,
+            tracker.default_category_id,
+            getattr(tracker, 'default_subcategory_id', None),
+            self.flaresolverr_url,
+            self.flaresolverr_timeout,
+            get_config_loader().generation,
+        )
 
+    def _build_adapter(self, tracker: 'Tracker') -> TrackerAdapter:
+        """
+        Create a new adapter for a tracker.
+
+        Raises:
+            ValueError: If adapter_type is not registered
+        """
         # Determine adapter type (always prefer ConfigAdapter if YAML exists)
         adapter_type = self._determine_adapter_type(tracker)
 
@@ -171,9 +211,6 @@ class TrackerFactory:
         # Create adapter based on type
         adapter = self._create_adapter(adapter_class, tracker)
 
-        # Cache the adapter
-        self._adapter_cache[tracker.id] = adapter
-
         logger.info(
             f"Created {adapter_type} adapter for tracker: {tracker.name} "
             f"(id={tracker.id})"
@@ -338,21 +375,21 @@ class TrackerFactory:
         return adapters
 
     def clear_cache(self) -> None:
-        """Clear the adapter cache."""
-        self._adapter_cache.clear()
+        """Drop the pooled adapters (they are created again on next use)."""
+        self._pool.invalidate()
         logger.debug("Adapter cache cleared")
 
     def get_cached_adapter(self, tracker_id: int) -> Optional[TrackerAdapter]:
         """
-        Get cached adapter by tracker ID.
+        Get pooled adapter by tracker ID.
 
         Args:
             tracker_id: Tracker ID
 
         Returns:
-            Cached adapter or None if not cached
+            Pooled adapter or None if not pooled
         """
-        return self._adapter_cache.get(tracker_id)
+        return self._pool.peek(tracker_id)
 
 
 # Singleton factory instance
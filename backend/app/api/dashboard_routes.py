@@ -19,16 +19,22 @@ UI Design:
 """
 
 from fastapi import APIRouter, Depends, Request, Query
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
+import asyncio
+import json
 import logging
+import time
 from typing import Optional
 
 from app.models.file_entry import FileEntry, Status
+from app.models.file_entry_status_count import FileEntryStatusCount
 from app.services.log_store import get_log_store
+from app.services.statistics_service import get_statistics_service
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -42,7 +48,7 @@ templates_dir = "templates" if os.path.exists("templates") else "backend/templat
 templates = Jinja2Templates(directory=templates_dir)
 
 # Database dependency
-from app.database import get_db
+from app.database import get_db, get_async_db
 
 
 def _compute_tracker_upload_names(entry: FileEntry, trackers: list, db) -> list:
@@ -207,6 +213,8 @@ def _compute_tracker_upload_names(entry: FileEntry, trackers: list, db) -> list:
 def _transform_jobs_for_queue(entries: list) -> list:
     """Transform FileEntry objects to format expected by queue template."""
     import os
+    from app.services.piece_hasher import get_hash_progress
+    from app.services.file_preparation import get_copy_progress
     jobs = []
     for entry in entries:
         filename = os.path.basename(entry.file_path) if entry.file_path else "Unknown"
@@ -229,67 +237,148 @@ def _transform_jobs_for_queue(entries: list) -> list:
             "file_count": 1,
             "current_stage": entry.status.value.replace("_", " ").title(),
             "progress": _calculate_progress(entry.status),
+            "hash_progress": _get_entry_hash_progress(entry, get_hash_progress),
+            "copy_progress": get_copy_progress(entry.file_path) if entry.file_path else None,
             "time_remaining": "Unknown",
             "started_relative": started_relative
         })
     return jobs
 
 
+def _get_entry_hash_progress(entry: FileEntry, get_hash_progress) -> Optional[float]:
+    """Return torrent hashing percentage for an entry, or None if not hashing."""
+    candidates = [entry.prepared_media_path, entry.file_path]
+    candidates.extend(
+        data.get('media_file')
+        for data in entry.get_tracker_statuses().values()
+        if isinstance(data, dict)
+    )
+    for path in candidates:
+        if path:
+            progress = get_hash_progress(path)
+            if progress is not None:
+                return progress
+    return None
+
+
+# Jobs per history page (keyset pagination, see _query_history_page)
+HISTORY_PAGE_SIZE = 50
+
+# History status filters mapped to the statuses they select ('all' = terminal)
+HISTORY_STATUS_FILTERS = {
+    'successful': [Status.UPLOADED],
+    'failed': [Status.FAILED],
+}
+
+
+def _encode_history_cursor(entry: FileEntry) -> str:
+    """Build the keyset cursor of the page that follows ``entry``."""
+    return f"{entry.updated_at.isoformat()}_{entry.id}"
+
+
+def _decode_history_cursor(cursor: str) -> tuple:
+    """Parse a history cursor into its (updated_at, id) key."""
+    updated_at, _, entry_id = cursor.rpartition("_")
+    return datetime.fromisoformat(updated_at), int(entry_id)
+
+
+def _query_history_page(
+    db: Session,
+    status_filter: str = '',
+    cursor: Optional[str] = None,
+    limit: int = HISTORY_PAGE_SIZE
+) -> tuple:
+    """
+    Fetch one page of finished jobs, most recently updated first.
+
+    Pages are keyed on (updated_at, id) instead of OFFSET, so every page is
+    a single index range read however deep into the history it is.
+
+    Args:
+        db: Database session
+        status_filter: '' / 'all', 'successful' or 'failed'
+        cursor: Cursor returned with the previous page, None for the first
+        limit: Page size
+
+    Returns:
+        Tuple of (entries, next_cursor), next_cursor is None on the last page
+    """
+    statuses = HISTORY_STATUS_FILTERS.get(status_filter)
+    if statuses:
+        query = db.query(FileEntry).filter(FileEntry.status.in_(statuses))
+    else:
+        query = db.query(FileEntry).filter(FileEntry.is_terminal == True)
+
+    if cursor:
+        query = query.filter(
+            tuple_(FileEntry.updated_at, FileEntry.id) < tuple_(*_decode_history_cursor(cursor))
+        )
+
+    entries = query.order_by(
+        FileEntry.updated_at.desc(), FileEntry.id.desc()
+    ).limit(limit + 1).all()
+
+    next_cursor = _encode_history_cursor(entries[limit - 1]) if len(entries) > limit else None
+    return entries[:limit], next_cursor
+
+
+def _get_history_stats(db: Session) -> dict:
+    """Count finished jobs per final status (all time), from the denormalized counts."""
+    counts = FileEntryStatusCount.get_counts(db)
+    successful = counts.get(Status.UPLOADED, 0)
+    failed = counts.get(Status.FAILED, 0)
+    total = successful + failed
+    return {
+        "total": total,
+        "successful": successful,
+        "failed": failed,
+        "success_rate": round(successful / total * 100) if total else 0
+    }
+
+
 def _transform_jobs_for_history(entries: list) -> list:
-    """Transform FileEntry objects to format expected by history template."""
+    """Transform FileEntry objects to the rows of the history table."""
     import os
-    jobs = []
+    completed_jobs = []
     for entry in entries:
+        # Use release_name if available, otherwise filename without extension
         filename = os.path.basename(entry.file_path) if entry.file_path else "Unknown"
+        display_name = entry.release_name if entry.release_name else os.path.splitext(filename)[0]
 
-        # Calculate duration
-        duration = "Unknown"
-        if entry.created_at and entry.updated_at:
-            duration_seconds = (entry.updated_at - entry.created_at).total_seconds()
-            if duration_seconds > 3600:
-                hours = int(duration_seconds // 3600)
-                minutes = int((duration_seconds % 3600) // 60)
-                duration = f"{hours}h {minutes}m"
-            elif duration_seconds > 60:
-                minutes = int(duration_seconds // 60)
-                seconds = int(duration_seconds % 60)
-                duration = f"{minutes}m {seconds}s"
-            else:
-                duration = f"{int(duration_seconds)}s"
-
-        # Calculate relative completed time
-        if entry.updated_at:
-            time_diff = datetime.utcnow() - entry.updated_at
-            if time_diff.days > 0:
-                completed_relative = f"{time_diff.days}d ago"
-            elif time_diff.seconds > 3600:
-                completed_relative = f"{time_diff.seconds // 3600}h ago"
-            elif time_diff.seconds > 60:
-                completed_relative = f"{time_diff.seconds // 60}m ago"
-            else:
-                completed_relative = "just now"
-        else:
-            completed_relative = "Unknown"
-
-        # Map status to template format
-        if entry.status == Status.UPLOADED:
-            status = "successful"
-        elif entry.status == Status.FAILED:
-            status = "failed"
-        else:
-            status = "cancelled"
+        file_size = None
+        if entry.file_path:
+            try:
+                if os.path.exists(entry.file_path):
+                    file_size = os.path.getsize(entry.file_path)
+            except Exception:
+                pass
 
-        jobs.append({
+        completed_jobs.append({
             "id": entry.id,
-            "name": filename,
-            "size": "Unknown",  # FileEntry doesn't have size field yet
-            "file_count": 1,
-            "status": status,
-            "duration": duration,
-            "completed_relative": completed_relative,
-            "completed_datetime": entry.updated_at.strftime("%Y-%m-%d %H:%M") if entry.updated_at else "Unknown"
+            "filename": display_name,
+            "file_path": entry.file_path,
+            "file_size": file_size,
+            "status": entry.status,
+            "error_message": entry.error_message,
+            "created_at": entry.created_at,
+            "updated_at": entry.updated_at,
+            "tracker_torrent_url": entry.tracker_torrent_url
         })
-    return jobs
+    return completed_jobs
+
+
+def _render_history_table(request: Request, db: Session, status_filter: str = ''):
+    """Render the first page of the history table component."""
+    entries, next_cursor = _query_history_page(db, status_filter)
+    return templates.TemplateResponse(
+        "components/history_table.html",
+        {
+            "request": request,
+            "completed_jobs": _transform_jobs_for_history(entries),
+            "next_cursor": next_cursor,
+            "status_filter": status_filter
+        }
+    )
 
 
 class _DotDict:
@@ -364,7 +453,7 @@ async def dashboard_page(request: Request, db: Session = Depends(get_db)):
     try:
         # Calculate active count (files being processed, not in terminal states)
         active_count = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         ).count()
 
         # Calculate completed today (files uploaded today)
@@ -380,16 +469,9 @@ async def dashboard_page(request: Request, db: Session = Depends(get_db)):
         ).count()
 
         # Calculate success rate
-        total_uploaded = db.query(FileEntry).filter(
-            FileEntry.status == Status.UPLOADED
-        ).count()
-        total_failed = db.query(FileEntry).filter(
-            FileEntry.status == Status.FAILED
-        ).count()
-        total_completed = total_uploaded + total_failed
-
-        if total_completed > 0:
-            success_rate = round((total_uploaded / total_completed) * 100, 1)
+        history_stats = _get_history_stats(db)
+        if history_stats["total"] > 0:
+            success_rate = round((history_stats["successful"] / history_stats["total"]) * 100, 1)
         else:
             success_rate = 0.0
 
@@ -493,7 +575,7 @@ async def queue_page(request: Request, db: Session = Depends(get_db)):
     try:
         # Build query for active jobs (not uploaded or failed)
         query = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         )
 
         # Get total count
@@ -584,15 +666,17 @@ async def queue_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/api/dashboard/refresh-jobs", response_class=HTMLResponse)
-async def refresh_dashboard_jobs(request: Request, db: Session = Depends(get_db)):
+async def refresh_dashboard_jobs(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Refresh recent jobs on the dashboard.
 
     Returns the recent jobs fragment for HTMX polling/injection.
+    Polled every 5s, so it reads through the async engine (or, without
+    one, a sync session in a worker thread; see get_async_db()).
 
     Args:
         request: FastAPI request object
-        db: Database session
+        db: Async database session
 
     Returns:
         HTML fragment containing the updated recent jobs
@@ -601,7 +685,8 @@ async def refresh_dashboard_jobs(request: Request, db: Session = Depends(get_db)
 
     try:
         # Fetch recent jobs (last 10) ordered by updated_at
-        recent_entries = db.query(FileEntry).order_by(FileEntry.updated_at.desc()).limit(10).all()
+        result = await db.execute(select(FileEntry).order_by(FileEntry.updated_at.desc()).limit(10))
+        recent_entries = result.scalars().all()
 
         # Transform entries to job format for template
         recent_jobs = []
@@ -672,7 +757,7 @@ async def refresh_queue(
     try:
         # Build base query for active jobs (not uploaded or failed)
         query = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         )
 
         # Apply search filter if provided
@@ -792,7 +877,7 @@ async def load_more_queue(
     try:
         # Build base query for active jobs (not uploaded or failed)
         query = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         )
 
         # Apply search filter if provided
@@ -1040,11 +1125,18 @@ async def release_details_page(request: Request, release_id: int, db: Session =
             "uploaded_at": entry.uploaded_at,
         }
 
+        # Pipeline logs of this release (newer ones are pushed by /api/logs/stream)
+        store = get_log_store()
+        latest_seq = store.latest_seq
+        release_logs = store.get_entries_by_file_entry_id(entry.id, limit=200)
+
         return templates.TemplateResponse(
             "release_details.html",
             {
                 "request": request,
                 "release": release,
+                "release_logs": release_logs,
+                "release_logs_seq": _log_cursor(release_logs, latest_seq),
                 "error": None
             }
         )
@@ -1090,48 +1182,18 @@ async def history_page(request: Request, db: Session = Depends(get_db)):
     Returns:
         HTML response with history view
     """
-    import os
-
     try:
-        # Fetch completed and failed jobs (terminal states) ordered by most recently updated
-        entries = db.query(FileEntry).filter(
-            FileEntry.status.in_([Status.UPLOADED, Status.FAILED])
-        ).order_by(FileEntry.updated_at.desc()).all()
-
-        # Transform entries to include computed fields
-        completed_jobs = []
-        for entry in entries:
-            # Get filename from path
-            filename = os.path.basename(entry.file_path) if entry.file_path else "Unknown"
-            # Use release_name if available, otherwise filename without extension
-            display_name = entry.release_name if entry.release_name else os.path.splitext(filename)[0]
-
-            # Try to get file size
-            file_size = None
-            if entry.file_path:
-                try:
-                    if os.path.exists(entry.file_path):
-                        file_size = os.path.getsize(entry.file_path)
-                except Exception:
-                    pass
-
-            completed_jobs.append({
-                "id": entry.id,
-                "filename": display_name,
-                "file_path": entry.file_path,
-                "file_size": file_size,
-                "status": entry.status,
-                "error_message": entry.error_message,
-                "created_at": entry.created_at,
-                "updated_at": entry.updated_at,
-                "tracker_torrent_url": entry.tracker_torrent_url
-            })
+        # First page of finished jobs; later pages are loaded with /api/history/page
+        entries, next_cursor = _query_history_page(db)
 
         return templates.TemplateResponse(
             "history.html",
             {
                 "request": request,
-                "completed_jobs": completed_jobs
+                "completed_jobs": _transform_jobs_for_history(entries),
+                "next_cursor": next_cursor,
+                "status_filter": "",
+                "history_stats": _get_history_stats(db)
             }
         )
     except Exception as e:
@@ -1146,6 +1208,64 @@ async def history_page(request: Request, db: Session = Depends(get_db)):
         )
 
 
+LOG_LEVELS = ['all', 'info', 'warning', 'error', 'debug', 'success']
+
+# Log stream: comment sent when idle (keeps proxies from closing the
+# connection), and delay gathering a burst of entries into one event
+LOG_STREAM_HEARTBEAT = 15.0
+LOG_STREAM_BATCH_DELAY = 0.2
+LOG_STREAM_MAX_ENTRIES = 500
+
+
+def _log_cursor(entries: list, latest_seq: int, limit: Optional[int] = None) -> int:
+    """
+    Cursor to resume after entries read from the log store.
+
+    Entries added while reading may already be in ``entries``, so the
+    cursor is the newest of both. A full batch read with ``oldest_first``
+    may be followed by more entries: the cursor is then the last entry
+    returned.
+
+    Args:
+        entries: Entries returned by the store, most recent first
+        latest_seq: store.latest_seq read before the entries
+        limit: Limit of an ``oldest_first`` read
+
+    Returns:
+        Sequence number after which the next read starts
+    """
+    if not entries:
+        return latest_seq
+    if limit is not None and len(entries) >= limit:
+        return entries[0]['seq']
+    return max(latest_seq, entries[0]['seq'])
+
+
+async def _log_event_stream(
+    request: Request,
+    after: int,
+    level: Optional[str] = None,
+    file_entry_id: Optional[int] = None
+):
+    """Yield Server-Sent Events with the log entries added after ``after``, oldest first."""
+    store = get_log_store()
+    while not await request.is_disconnected():
+        if not await store.wait_for_entries(after, timeout=LOG_STREAM_HEARTBEAT):
+            yield ": keep-alive\n\n"
+            continue
+        await asyncio.sleep(LOG_STREAM_BATCH_DELAY)
+
+        latest_seq = store.latest_seq
+        entries = store.get_entries(
+            limit=LOG_STREAM_MAX_ENTRIES, after=after, level=level,
+            file_entry_id=file_entry_id, oldest_first=True
+        )
+        after = _log_cursor(entries, latest_seq, LOG_STREAM_MAX_ENTRIES)
+        if entries:
+            data = json.dumps(entries[::-1], default=str)
+            yield f"id: {after}\nevent: log\ndata: {data}\n\n"
+
+
 @router.get("/logs", response_class=HTMLResponse)
 async def logs_page(request: Request, db: Session = Depends(get_db)):
     """
@@ -1154,7 +1274,7 @@ async def logs_page(request: Request, db: Session = Depends(get_db)):
     Displays application logs in a terminal-style interface with:
     - Black background and monospace font
     - Collapsible log sections
-    - Real-time log streaming (future enhancement)
+    - Real-time log streaming (/api/logs/stream)
     - Log level filtering
 
     Args:
@@ -1167,6 +1287,7 @@ async def logs_page(request: Request, db: Session = Depends(get_db)):
     try:
         logger.info("Loading logs page")
         store = get_log_store()
+        latest_seq = store.latest_seq
         log_entries = store.get_entries(limit=1000)  # Increased from 500 to 1000
         stats = store.get_stats()
 
@@ -1176,7 +1297,8 @@ async def logs_page(request: Request, db: Session = Depends(get_db)):
             {
                 "request": request,
                 "log_entries": log_entries,
-                "log_stats": stats
+                "log_stats": stats,
+                "last_seq": _log_cursor(log_entries, latest_seq)
             }
         )
     except Exception as e:
@@ -1211,49 +1333,9 @@ async def refresh_history(request: Request, db: Session = Depends(get_db)):
     Returns:
         HTML fragment containing the history table component
     """
-    import os
-
     try:
-        # Fetch completed and failed jobs
-        entries = db.query(FileEntry).filter(
-            FileEntry.status.in_([Status.UPLOADED, Status.FAILED])
-        ).order_by(FileEntry.updated_at.desc()).all()
-
-        # Transform entries to include computed fields
-        completed_jobs = []
-        for entry in entries:
-            filename = os.path.basename(entry.file_path) if entry.file_path else "Unknown"
-            display_name = entry.release_name if entry.release_name else os.path.splitext(filename)[0]
-
-            file_size = None
-            if entry.file_path:
-                try:
-                    if os.path.exists(entry.file_path):
-                        file_size = os.path.getsize(entry.file_path)
-                except Exception:
-                    pass
-
-            completed_jobs.append({
-                "id": entry.id,
-                "filename": display_name,
-                "file_path": entry.file_path,
-                "file_size": file_size,
-                "status": entry.status,
-                "error_message": entry.error_message,
-                "created_at": entry.created_at,
-                "updated_at": entry.updated_at,
-                "tracker_torrent_url": entry.tracker_torrent_url
-            })
-
-        logger.info(f"Refreshing history: {len(completed_jobs)} jobs")
-
-        return templates.TemplateResponse(
-            "components/history_table.html",
-            {
-                "request": request,
-                "completed_jobs": completed_jobs
-            }
-        )
+        logger.info("Refreshing history")
+        return _render_history_table(request, db)
     except Exception as e:
         logger.error(f"Error refreshing history: {e}")
         return f"<p class='text-error'>Error refreshing history: {str(e)}</p>"
@@ -1277,8 +1359,6 @@ async def filter_history(
     Returns:
         HTML fragment containing the filtered history table component
     """
-    import os
-
     try:
         # Get form data
         form_data = await request.form()
@@ -1288,53 +1368,10 @@ async def filter_history(
         valid_statuses = ['', 'all', 'successful', 'failed', 'cancelled']
         filter_status = status if status in valid_statuses else ''
 
-        # Build query based on filter
-        if filter_status == 'successful':
-            query = db.query(FileEntry).filter(FileEntry.status == Status.UPLOADED)
-        elif filter_status == 'failed':
-            query = db.query(FileEntry).filter(FileEntry.status == Status.FAILED)
-        else:  # 'all' or '' or 'cancelled' (we don't have a cancelled status yet)
-            query = db.query(FileEntry).filter(
-                FileEntry.status.in_([Status.UPLOADED, Status.FAILED])
-            )
-
-        entries = query.order_by(FileEntry.updated_at.desc()).all()
-
-        logger.info(f"Filtering history by status: '{filter_status}' - found {len(entries)} jobs")
-
-        # Transform entries to include computed fields
-        completed_jobs = []
-        for entry in entries:
-            filename = os.path.basename(entry.file_path) if entry.file_path else "Unknown"
-            display_name = entry.release_name if entry.release_name else os.path.splitext(filename)[0]
-
-            file_size = None
-            if entry.file_path:
-                try:
-                    if os.path.exists(entry.file_path):
-                        file_size = os.path.getsize(entry.file_path)
-                except Exception:
-                    pass
-
-            completed_jobs.append({
-                "id": entry.id,
-                "filename": display_name,
-                "file_path": entry.file_path,
-                "file_size": file_size,
-                "status": entry.status,
-                "error_message": entry.error_message,
-                "created_at": entry.created_at,
-                "updated_at": entry.updated_at,
-                "tracker_torrent_url": entry.tracker_torrent_url
-            })
+        logger.info(f"Filtering history by status: '{filter_status}'")
 
-        return templates.TemplateResponse(
-            "components/history_table.html",
-            {
-                "request": request,
-                "completed_jobs": completed_jobs
-            }
-        )
+        # 'all', '' and 'cancelled' (we don't have a cancelled status yet) show every finished job
+        return _render_history_table(request, db, filter_status)
     except Exception as e:
         logger.error(f"Error filtering history: {e}")
         return f"<p class='text-error'>Error filtering history: {str(e)}</p>"
@@ -1343,42 +1380,38 @@ async def filter_history(
 @router.get("/api/history/page", response_class=HTMLResponse)
 async def paginate_history(
     request: Request,
-    page: int = Query(1, ge=1),
+    cursor: str = Query(..., max_length=100),
+    status: str = Query("", max_length=20),
     db: Session = Depends(get_db)
 ):
     """
-    Paginate through history table.
+    Load the next page of the history table.
 
-    Loads a specific page of job history from the database.
-    Implements pagination with configurable page size.
+    Uses keyset pagination: ``cursor`` is the value returned with the
+    previous page, and the rows that follow it are returned together with
+    a "load more" row carrying the next cursor.
 
     Args:
         request: FastAPI request object
-        page: Page number (1-indexed)
+        cursor: Cursor of the page to load
+        status: Active status filter ('', 'all', 'successful', 'failed')
         db: Database session
 
     Returns:
-        HTML fragment containing the history table component for the requested page
+        HTML fragment containing the table rows of the requested page
     """
     try:
-        # Page size configuration
-        page_size = 10  # Items per page
-
-        # TODO: Query database for jobs on requested page
-        # Implement offset calculation: offset = (page - 1) * page_size
-        # Query should include total_pages calculation for pagination controls
-        paginated_jobs = []
-        total_pages = 1
+        entries, next_cursor = _query_history_page(db, status, cursor)
 
-        logger.info(f"Loading history page: {page}")
+        logger.info(f"Loading history page after {cursor}: {len(entries)} jobs")
 
         return templates.TemplateResponse(
-            "components/history_table.html",
+            "components/history_rows.html",
             {
                 "request": request,
-                "jobs": paginated_jobs,
-                "current_page": page,
-                "total_pages": total_pages
+                "completed_jobs": _transform_jobs_for_history(entries),
+                "next_cursor": next_cursor,
+                "status_filter": status
             }
         )
     except Exception as e:
@@ -1456,20 +1489,8 @@ async def reprocess_job(
 
         logger.info(f"Reprocessing job: {job_id}")
 
-        # Return updated table with all completed jobs
-        completed_entries = db.query(FileEntry).filter(
-            FileEntry.status.in_([Status.UPLOADED, Status.FAILED])
-        ).order_by(FileEntry.updated_at.desc()).all()
-
-        jobs = _transform_jobs_for_history(completed_entries)
-
-        return templates.TemplateResponse(
-            "components/history_table.html",
-            {
-                "request": request,
-                "jobs": jobs
-            }
-        )
+        # Return the refreshed first page of the history table
+        return _render_history_table(request, db)
     except Exception as e:
         logger.error(f"Error reprocessing job: {e}")
         return f"<p class='text-error'>Error reprocessing job: {str(e)}</p>"
@@ -1558,20 +1579,8 @@ async def retry_job(
 
         logger.info(f"Retrying job: {job_id}")
 
-        # Return updated table with all completed jobs
-        completed_entries = db.query(FileEntry).filter(
-            FileEntry.status.in_([Status.UPLOADED, Status.FAILED])
-        ).order_by(FileEntry.updated_at.desc()).all()
-
-        jobs = _transform_jobs_for_history(completed_entries)
-
-        return templates.TemplateResponse(
-            "components/history_table.html",
-            {
-                "request": request,
-                "jobs": jobs
-            }
-        )
+        # Return the refreshed first page of the history table
+        return _render_history_table(request, db)
     except Exception as e:
         logger.error(f"Error retrying job: {e}")
         return f"<p class='text-error'>Error retrying job: {str(e)}</p>"
@@ -1608,7 +1617,7 @@ async def filter_queue(
 
         # Build query for active jobs
         query = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         )
 
         # Apply stage filter
@@ -1710,7 +1719,7 @@ async def pause_job(
 
         # Refresh and return queue
         active_entries = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         ).order_by(FileEntry.updated_at.desc()).all()
 
         active_jobs = _transform_jobs_for_queue(active_entries)
@@ -1755,14 +1764,17 @@ async def cancel_job(
         # Find the job
         job = db.query(FileEntry).filter(FileEntry.id == int(job_id)).first()
         if job:
+            was_terminal = job.is_terminal
             # Mark as failed with cancellation message
             job.mark_failed("Cancelled by user")
             db.commit()
+            if not was_terminal:
+                await get_statistics_service(db).record_file_finished(job)
             logger.info(f"Cancelled job: {job_id}")
 
         # Refresh and return queue
         active_entries = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         ).order_by(FileEntry.updated_at.desc()).all()
 
         active_jobs = _transform_jobs_for_queue(active_entries)
@@ -2101,11 +2113,11 @@ async def delete_job(
 
         # Re-fetch and return updated queue content (same format as refresh_queue)
         entries = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         ).order_by(FileEntry.updated_at.desc()).limit(20).all()
 
         total_count = db.query(FileEntry).filter(
-            FileEntry.status.notin_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == False
         ).count()
 
         active_jobs = []
@@ -2223,13 +2235,15 @@ async def refresh_logs(request: Request, db: Session = Depends(get_db)):
     try:
         logger.info("Refreshing logs viewer")
         store = get_log_store()
+        latest_seq = store.latest_seq
         log_entries = store.get_entries(limit=1000)  # Increased from 500 to 1000
 
         return templates.TemplateResponse(
             "components/log_viewer.html",
             {
                 "request": request,
-                "log_entries": log_entries
+                "log_entries": log_entries,
+                "last_seq": _log_cursor(log_entries, latest_seq)
             }
         )
     except Exception as e:
@@ -2257,11 +2271,11 @@ async def filter_logs(
         HTML fragment containing the filtered logs
     """
     try:
-        valid_levels = ['all', 'info', 'warning', 'error', 'debug', 'success']
-        filter_level = level if level in valid_levels else 'all'
+        filter_level = level if level in LOG_LEVELS else 'all'
 
         logger.info(f"Filtering logs by level: {filter_level}")
         store = get_log_store()
+        latest_seq = store.latest_seq
         log_entries = store.get_filtered_entries(filter_level, limit=1000)  # Increased from 500 to 1000
 
         return templates.TemplateResponse(
@@ -2269,7 +2283,8 @@ async def filter_logs(
             {
                 "request": request,
                 "log_entries": log_entries,
-                "filter_level": filter_level
+                "filter_level": filter_level,
+                "last_seq": _log_cursor(log_entries, latest_seq)
             }
         )
     except Exception as e:
@@ -2277,6 +2292,84 @@ async def filter_logs(
         return f"<p class='text-error'>Error filtering logs: {str(e)}</p>"
 
 
+@router.get("/api/logs/entries")
+async def get_log_entries(
+    after: int = Query(0, ge=0),
+    level: Optional[str] = Query(None),
+    request_id: Optional[str] = Query(None),
+    file_entry_id: Optional[int] = Query(None),
+    limit: int = Query(500, ge=1, le=5000)
+):
+    """
+    Get the log entries added after a cursor.
+
+    Args:
+        after: Sequence number of the last entry already received
+        level: Log level to filter by (all, info, warning, error, debug, success)
+        request_id: Only entries of this request
+        file_entry_id: Only entries of this release
+        limit: Maximum number of entries
+
+    Returns:
+        JSON with the entries (most recent first) and the cursor to pass
+        as ``after`` on the next call; with more than ``limit`` new entries,
+        the oldest ones are returned and the next call gets the rest
+    """
+    store = get_log_store()
+    latest_seq = store.latest_seq
+    entries = store.get_entries(
+        limit=limit,
+        after=after,
+        level=level if level in LOG_LEVELS else None,
+        request_id=request_id,
+        file_entry_id=file_entry_id,
+        oldest_first=True
+    )
+    return {
+        "entries": entries,
+        "last_seq": max(after, _log_cursor(entries, latest_seq, limit))
+    }
+
+
+@router.get("/api/logs/stream")
+async def stream_logs(
+    request: Request,
+    after: int = Query(0, ge=0),
+    level: Optional[str] = Query(None),
+    file_entry_id: Optional[int] = Query(None)
+):
+    """
+    Push new log entries as Server-Sent Events.
+
+    Each "log" event carries a JSON list of the entries added since the
+    previous one (oldest first); its id is the cursor, so a reconnecting
+    EventSource resumes where it stopped (Last-Event-ID).
+
+    Args:
+        request: FastAPI request object
+        after: Sequence number of the last entry already displayed
+        level: Log level to filter by (all, info, warning, error, debug, success)
+        file_entry_id: Only entries of this release
+
+    Returns:
+        text/event-stream response
+    """
+    last_event_id = request.headers.get("last-event-id", "")
+    if last_event_id.isdigit():
+        after = max(after, int(last_event_id))
+
+    return StreamingResponse(
+        _log_event_stream(
+            request,
+            after,
+            level=level if level in LOG_LEVELS else None,
+            file_entry_id=file_entry_id
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/api/logs/clear", response_class=HTMLResponse)
 async def clear_logs(request: Request, db: Session = Depends(get_db)):
     """
@@ -3085,6 +3178,7 @@ async def reject_release(
         # Mark as failed
         file_entry.mark_failed(f"Rejected: {reason}")
         db.commit()
+        await get_statistics_service(db).record_file_finished(file_entry)
 
         rejected_by = request.client.host if request.client else "unknown"
         logger.info(f"Release {release_id} rejected by {rejected_by}: {reason}")
@@ -3132,6 +3226,7 @@ async def retry_tracker_upload(
     from app.models.settings import Settings
     from app.models.tracker import Tracker
     from app.adapters.tracker_factory import TrackerFactory
+    from app.adapters.adapter_pool import get_adapter_pool
     import os
 
     try:
@@ -3226,8 +3321,8 @@ async def retry_tracker_upload(
             with open(file_entry.nfo_path, 'rb') as f:
                 nfo_data = f.read()
 
-        # Authenticate
-        authenticated = await adapter.authenticate()
+        # Authenticate (once per pooled session)
+        authenticated = await get_adapter_pool().authenticate(adapter)
         if not authenticated:
             file_entry.set_tracker_status(
                 tracker_slug=tracker_slug,
@@ -3261,7 +3356,9 @@ async def retry_tracker_upload(
             upload_kwargs['subcategory_id'] = tracker.default_subcategory_id
 
         # Upload
+        started = time.monotonic()
         result = await adapter.upload_torrent(**upload_kwargs)
+        duration = time.monotonic() - started
 
         if result.get('success'):
             file_entry.set_tracker_status(
@@ -3269,9 +3366,11 @@ async def retry_tracker_upload(
                 status=TrackerStatus.SUCCESS.value,
                 torrent_id=str(result['torrent_id']),
                 torrent_url=result['torrent_url'],
-                retry_count=retry_count
+                retry_count=retry_count,
+                duration=duration
             )
             db.commit()
+            await get_statistics_service(db).record_tracker_upload(tracker_slug, True, duration)
 
             logger.info(f"Retry successful for {tracker.name}: {result['torrent_url']}")
 
@@ -3289,9 +3388,11 @@ async def retry_tracker_upload(
                 tracker_slug=tracker_slug,
                 status=TrackerStatus.FAILED.value,
                 error=error_msg,
-                retry_count=retry_count
+                retry_count=retry_count,
+                duration=duration
             )
             db.commit()
+            await get_statistics_service(db).record_tracker_upload(tracker_slug, False, duration)
 
             logger.error(f"Retry failed for {tracker.name}: {error_msg}")
 
@@ -3498,6 +3599,7 @@ async def check_release_duplicates(
     from ..models.tracker import Tracker
     from ..models.settings import Settings
     from ..adapters.tracker_factory import TrackerFactory
+    from ..services.duplicate_check_service import check_duplicate_cached
 
     try:
         # Find the release
@@ -3551,15 +3653,12 @@ async def check_release_duplicates(
             else:
                 quality = "sd"
 
-        results = {}
-        has_duplicates = False
-
-        # Check each tracker
-        for tracker in trackers:
+        async def _check_tracker(tracker: Tracker) -> dict:
             try:
                 adapter = factory.get_adapter(tracker)
 
-                result = await adapter.check_duplicate(
+                result = await check_duplicate_cached(
+                    tracker, adapter,
                     tmdb_id=tmdb_id,
                     imdb_id=None,  # Could be extracted from TMDB data
                     release_name=release_name,
@@ -3567,7 +3666,7 @@ async def check_release_duplicates(
                     file_size=file_entry.file_size
                 )
 
-                results[tracker.slug] = {
+                return {
                     "tracker_name": tracker.name,
                     "is_duplicate": result.get("is_duplicate", False),
                     "exact_match": result.get("exact_match", False),
@@ -3577,19 +3676,22 @@ async def check_release_duplicates(
                     "message": result.get("message", "")
                 }
 
-                if result.get("is_duplicate"):
-                    has_duplicates = True
-
             except Exception as e:
-                logger.error(f"Duplicate check failed for tracker {tracker.slug}: {e}")
-                results[tracker.slug] = {
+                error = str(e) or type(e).__name__
+                logger.error(f"Duplicate check failed for tracker {tracker.slug}: {error}")
+                return {
                     "tracker_name": tracker.name,
                     "is_duplicate": False,
-                    "error": str(e),
+                    "error": error,
                     "search_method": "error",
-                    "message": f"Check failed: {str(e)}"
+                    "message": f"Check failed: {error}"
                 }
 
+        # Check all trackers concurrently (results are cached process-wide)
+        tracker_results = await asyncio.gather(*[_check_tracker(tracker) for tracker in trackers])
+        results = {tracker.slug: result for tracker, result in zip(trackers, tracker_results)}
+        has_duplicates = any(result["is_duplicate"] for result in tracker_results)
+
         # Save duplicate check results to database for persistence
         from datetime import datetime
         file_entry.duplicate_check_results = {
@@ -3856,7 +3958,8 @@ async def get_release_bbcode(
                 bbcode = await bbcode_generator.generate_from_template(
                     template.content,
                     file_entry.file_path,
-                    tmdb_data
+                    tmdb_data,
+                    template_id=template.id
                 )
             else:
                 # Fallback to hardcoded template
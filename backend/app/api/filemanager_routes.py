@@ -7,23 +7,37 @@ and trigger scans on media files.
 Features:
     - GET /filemanager: File manager UI page
     - GET /api/filemanager/browse: List directory contents (HTMX)
-    - POST /api/filemanager/scan: Trigger scan on file/folder
+    - GET /api/filemanager/search: Search names under a directory
+    - POST /api/filemanager/scan: Trigger scan on file/folder (folders run as
+      background jobs)
+    - GET /api/filemanager/scan/{job_id}: Folder scan progress
+    - GET /api/filemanager/scan/{job_id}/stream: Folder scan progress (Server-Sent Events)
+    - POST /api/filemanager/scan/{job_id}/cancel: Cancel a folder scan
+
+Listings and searches of the media folders are served by the persistent
+file index (services/file_index_service.py) when FILE_INDEX_ENABLED is set.
 """
 
 from fastapi import APIRouter, Depends, Request, HTTPException, Query
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from datetime import datetime
 from pathlib import Path
+import asyncio
+import json
 import os
 import logging
 
 from app.models.settings import Settings
 from app.models.file_entry import FileEntry
+from app.models.file_index import FileIndexEntry
+from app.config import config
 from app.database import get_db
 from app.services.duplicate_check_service import DuplicateCheckService
+from app.services.directory_scan_service import ScanJob, get_directory_scanner
+from app.services.file_index_service import get_file_entry_flags, get_file_index
 
 logger = logging.getLogger(__name__)
 
@@ -209,6 +223,71 @@ def get_directory_contents(path: str, offset: int = 0, limit: int = 0) -> tuple:
     return all_items, total
 
 
+# Maximum number of search results
+SEARCH_LIMIT = 200
+
+
+def _index_item(entry: FileIndexEntry) -> dict:
+    """Item dict (as built by _get_cached_directory) of a file index entry."""
+    modified = entry.modified
+    return {
+        'name': entry.name,
+        'path': entry.path,
+        'parent': entry.parent,
+        'is_dir': entry.is_dir,
+        'size': entry.size,
+        'size_formatted': format_size(entry.size) if not entry.is_dir else '-',
+        'modified': modified,
+        'modified_formatted': modified.strftime('%Y-%m-%d %H:%M'),
+        'type': 'folder' if entry.is_dir else get_file_type(entry.name),
+        'extension': entry.extension,
+    }
+
+
+def _flag_file_entries(db: Session, items: List[dict]) -> List[dict]:
+    """Add the file entry (id and status) of files already in the queue / history."""
+    flags = get_file_entry_flags(db, [item['path'] for item in items if not item['is_dir']])
+    for item in items:
+        file_entry_id, status = flags.get(item['path'], (None, None))
+        item['file_entry_id'] = file_entry_id
+        item['file_entry_status'] = status.value if status else None
+    return items
+
+
+async def _use_file_index(db: Session, settings: Settings, path: str, refresh: bool) -> bool:
+    """
+    Whether a folder can be served by the file index.
+
+    With ``refresh``, the folder is re-listed first if its mtime changed.
+    """
+    if not config.FILE_INDEX_ENABLED:
+        return False
+    index = get_file_index()
+    index.set_roots([sanitize_path(settings.input_media_path), sanitize_path(settings.output_dir)])
+    if index.root_of(path) is None:
+        return False
+    if refresh:
+        return await asyncio.to_thread(index.refresh_directory, path, db)
+    return index.is_listed(db, path)
+
+
+async def list_directory(db: Session, settings: Settings, path: str, offset: int = 0, limit: int = 0) -> tuple:
+    """
+    Get a page of a directory, with the queue flags of its files.
+
+    Served by the file index (the first page re-lists the folder if it
+    changed), or by a direct listing outside the indexed folders.
+    Returns (items, total_count).
+    """
+    if await _use_file_index(db, settings, path, refresh=offset == 0):
+        entries, total = get_file_index().list_directory(db, path, offset=offset, limit=limit)
+        items = [_index_item(entry) for entry in entries]
+    else:
+        items, total = get_directory_contents(path, offset=offset, limit=limit)
+        items = [dict(item) for item in items]
+    return _flag_file_entries(db, items), total
+
+
 def get_breadcrumbs(path: str, base_path: str) -> List[dict]:
     """
     Generate breadcrumb navigation from path.
@@ -298,7 +377,7 @@ async def filemanager_page(
             )
 
         # Get directory contents (paginated)
-        items, total_count = get_directory_contents(current_path, offset=0, limit=PAGE_SIZE)
+        items, total_count = await list_directory(db, settings, current_path, offset=0, limit=PAGE_SIZE)
         breadcrumbs = get_breadcrumbs(current_path, base_path)
 
         # Get parent path
@@ -362,7 +441,7 @@ async def browse_directory(
             </div>
             """
 
-        items, total_count = get_directory_contents(path, offset=0, limit=PAGE_SIZE)
+        items, total_count = await list_directory(db, settings, path, offset=0, limit=PAGE_SIZE)
         breadcrumbs = get_breadcrumbs(path, base_path)
 
         parent_path = str(Path(path).parent)
@@ -399,21 +478,35 @@ async def search_items(
     q: str = Query(..., description="Search query"),
     db: Session = Depends(get_db)
 ):
-    """Return matching items as JSON for client-side search."""
+    """
+    Return matching items as JSON for client-side search.
+
+    Searches the whole tree under ``path`` when it is served by the file
+    index (names starting with the query first), otherwise the names of
+    the directory itself.
+    """
     settings = Settings.get_settings(db)
     if not is_path_allowed(path, settings):
         return []
 
-    all_items = _get_cached_directory(path)
-    query = q.lower()
-    results = [
-        {"name": item["name"], "path": item["path"], "is_dir": item["is_dir"],
-         "type": item["type"], "size_formatted": item["size_formatted"],
-         "modified_formatted": item["modified_formatted"], "extension": item["extension"]}
-        for item in all_items
-        if query in item["name"].lower()
+    if await _use_file_index(db, settings, path, refresh=False):
+        items = [_index_item(entry) for entry in get_file_index().search(db, q, under=path, limit=SEARCH_LIMIT)]
+    else:
+        query = q.lower()
+        items = [dict(item) for item in _get_cached_directory(path) if query in item["name"].lower()]
+
+    # Only results from sub-folders show their folder
+    folder = os.path.normpath(path)
+    for item in items:
+        if item.get("parent") == folder:
+            item["parent"] = None
+
+    keys = ("name", "path", "parent", "is_dir", "type", "size_formatted", "modified_formatted", "extension",
+            "file_entry_id", "file_entry_status")
+    return [
+        {key: item.get(key) for key in keys}
+        for item in _flag_file_entries(db, items[:SEARCH_LIMIT])
     ]
-    return results
 
 
 @router.get("/api/filemanager/load-more", response_class=HTMLResponse)
@@ -432,7 +525,7 @@ async def load_more_items(
         if not is_path_allowed(path, settings):
             return ""
 
-        items, total_count = get_directory_contents(path, offset=offset, limit=PAGE_SIZE)
+        items, total_count = await list_directory(db, settings, path, offset=offset, limit=PAGE_SIZE)
         has_more = (offset + len(items)) < total_count
         next_offset = offset + PAGE_SIZE
 
@@ -460,6 +553,10 @@ async def scan_path(
     """
     Trigger a scan on a file or folder.
     Creates FileEntry records for media files.
+
+    A file is added immediately. A folder is scanned by a background job:
+    the response carries its job_id, progress is read from
+    /api/filemanager/scan/{job_id} or its /stream.
     """
     try:
         settings = Settings.get_settings(db)
@@ -486,18 +583,9 @@ async def scan_path(
             else:
                 raise HTTPException(status_code=400, detail="Only video files can be scanned")
         else:
-            # Directory scan - find all video files
-            for file_path in target.rglob('*'):
-                if file_path.is_file() and get_file_type(file_path.name) == 'video':
-                    try:
-                        entry = FileEntry.create_or_get(db, str(file_path))
-                        if entry:
-                            created_entries.append(file_path.name)
-                        else:
-                            skipped_entries.append(file_path.name)
-                    except Exception as e:
-                        logger.warning(f"Error creating entry for {file_path}: {e}")
-                        skipped_entries.append(file_path.name)
+            # Directory scan - walk the tree in the background
+            job = get_directory_scanner().start(str(target), VIDEO_EXTENSIONS)
+            return {"status": "started", **job.to_dict()}
 
         message = f"Scan complete: {len(created_entries)} file(s) added to queue"
         if skipped_entries:
@@ -583,3 +671,63 @@ async def check_duplicate(
     except Exception as e:
         logger.error(f"Error checking duplicates for {path}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# Interval between progress checks of a scan stream (seconds)
+SCAN_STREAM_INTERVAL = 0.5
+SCAN_STREAM_HEARTBEAT = 15.0
+
+
+def _get_scan_job(job_id: str) -> ScanJob:
+    job = get_directory_scanner().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Scan job not found: {job_id}")
+    return job
+
+
+async def _scan_event_stream(request: Request, job: ScanJob):
+    """Yield Server-Sent Events with the progress of a scan until it finishes."""
+    version = -1
+    idle = 0.0
+    while not await request.is_disconnected():
+        if job.finished:
+            yield f"event: done\ndata: {json.dumps(job.to_dict())}\n\n"
+            return
+        if job.version != version:
+            version = job.version
+            idle = 0.0
+            yield f"event: progress\ndata: {json.dumps(job.to_dict())}\n\n"
+        elif idle >= SCAN_STREAM_HEARTBEAT:
+            idle = 0.0
+            yield ": keep-alive\n\n"
+        await asyncio.sleep(SCAN_STREAM_INTERVAL)
+        idle += SCAN_STREAM_INTERVAL
+
+
+@router.get("/api/filemanager/scan/{job_id}")
+async def get_scan_progress(job_id: str):
+    """Return the progress of a folder scan."""
+    return _get_scan_job(job_id).to_dict()
+
+
+@router.get("/api/filemanager/scan/{job_id}/stream")
+async def stream_scan_progress(request: Request, job_id: str):
+    """
+    Stream the progress of a folder scan as Server-Sent Events.
+
+    Sends a "progress" event whenever the counters change and a final
+    "done" event when the scan completes, fails or is cancelled.
+    """
+    job = _get_scan_job(job_id)
+    return StreamingResponse(
+        _scan_event_stream(request, job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/api/filemanager/scan/{job_id}/cancel")
+async def cancel_scan(job_id: str):
+    """Cancel a folder scan; files already added stay in the queue."""
+    _get_scan_job(job_id)
+    return get_directory_scanner().cancel(job_id).to_dict()
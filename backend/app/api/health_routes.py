@@ -7,6 +7,10 @@ Endpoints:
 - /health/live: Liveness probe - is the application running?
 - /health/ready: Readiness probe - is the application ready to receive traffic?
 - /health/detailed: Detailed health status of all dependencies
+- /health/pipeline: Queue worker and pipeline resource pool usage
+- /health/http: Shared HTTP client pool usage
+- /health/library-index: Radarr/Sonarr library index status
+- /health/mediainfo-cache: MediaInfo extraction cache hit/miss counters
 """
 
 import logging
@@ -95,6 +99,71 @@ async def detailed_health(db: Session = Depends(get_db)):
     return result
 
 
+@router.get("/pipeline")
+async def pipeline_status():
+    """
+    Queue worker and pipeline resource pool status.
+
+    Shows how many files are in flight and, per resource class (hashing,
+    ffmpeg, tmdb, tracker:<slug>), the limit and active/waiting counts.
+
+    Returns:
+        JSON object with queue worker status and resource pool usage
+    """
+    from app.workers.queue_worker import get_queue_worker
+
+    return get_queue_worker().get_status()
+
+
+@router.get("/http")
+async def http_pool_status():
+    """
+    Shared HTTP client pool status.
+
+    Shows the connection limits and, per upstream host, the number of
+    requests sent, borrowers in flight and open/idle keep-alive connections.
+
+    Returns:
+        JSON object with HTTP client pool statistics
+    """
+    from app.services.http_client_pool import get_http_client_pool
+
+    return get_http_client_pool().get_stats()
+
+
+@router.get("/library-index")
+async def library_index_status():
+    """
+    Radarr/Sonarr media library index status.
+
+    Shows, per indexed library, the number of files, the snapshot age and
+    how many lookups, full builds and webhook refreshes were served.
+
+    Returns:
+        JSON object with media library index statistics
+    """
+    from app.services.media_library_index import get_media_library_index
+
+    return get_media_library_index().get_stats()
+
+
+@router.get("/mediainfo-cache")
+async def mediainfo_cache_status():
+    """
+    MediaInfo extraction cache status.
+
+    Shows the number of cached files in memory and in the database, and
+    how many extractions were served from the cache (hits) or parsed the
+    file (misses).
+
+    Returns:
+        JSON object with MediaInfo cache statistics
+    """
+    from app.services.mediainfo_cache import get_mediainfo_cache
+
+    return get_mediainfo_cache().get_stats()
+
+
 @router.get("/services/{service_name}")
 async def service_health(service_name: str, db: Session = Depends(get_db)):
     """
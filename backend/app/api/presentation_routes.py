@@ -355,7 +355,8 @@ async def generate_presentation(
         bbcode = await generator.generate_from_template(
             template_content=template.content,
             file_path=data.file_path,
-            tmdb_data=tmdb_metadata
+            tmdb_data=tmdb_metadata,
+            template_id=template.id
         )
 
         logger.info(f"Successfully generated BBCode presentation ({len(bbcode)} chars)")
@@ -33,6 +33,7 @@ from ..models.c411_category import C411Category
 from ..models.bbcode_template import BBCodeTemplate
 from ..models.naming_template import NamingTemplate
 from ..adapters.tracker_factory import TrackerFactory
+from ..adapters.adapter_pool import invalidate_tracker_adapter
 from ..models.settings import Settings
 from ..services.configurable_uploader import (
     get_upload_templates,
@@ -683,6 +684,9 @@ async def update_tracker(
     if not tracker:
         raise HTTPException(status_code=404, detail="Tracker not found")
 
+    # Next upload / check starts a new session with the new settings
+    invalidate_tracker_adapter(tracker_id)
+
     logger.info(f"Updated tracker: {tracker.name}")
 
     return TrackerResponse(**tracker.to_dict(mask_secrets=True))
@@ -713,6 +717,8 @@ async def delete_tracker(
     if not deleted:
         raise HTTPException(status_code=404, detail="Tracker not found")
 
+    invalidate_tracker_adapter(tracker_id)
+
     logger.info(f"Deleted tracker: {tracker_id}")
 
     return {"message": "Tracker deleted successfully"}
@@ -1285,6 +1291,7 @@ async def set_tracker_upload_config(
 
     # Update tracker
     tracker = Tracker.update(db, tracker_id, upload_config=config)
+    invalidate_tracker_adapter(tracker_id)
 
     logger.info(f"Updated upload config for tracker {tracker.name}")
 
@@ -1318,6 +1325,7 @@ async def delete_tracker_upload_config(
         raise HTTPException(status_code=404, detail="Tracker not found")
 
     tracker = Tracker.update(db, tracker_id, upload_config=None)
+    invalidate_tracker_adapter(tracker_id)
 
     logger.info(f"Removed upload config for tracker {tracker.name}")
 
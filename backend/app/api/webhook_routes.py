@@ -0,0 +1,91 @@
+"""
+Radarr/Sonarr Webhook Routes
+
+This module receives Radarr and Sonarr "Connect → Webhook" notifications and
+refreshes the matching movie/series in the media library index, so sceneName
+lookups see new imports without waiting for the index TTL.
+
+Endpoints:
+    POST /api/webhooks/radarr - Radarr webhook (Download, Rename, deletes)
+    POST /api/webhooks/sonarr - Sonarr webhook (Download, Rename, deletes)
+
+The payload is only used to know which movie/series changed: the new state
+is always fetched from Radarr/Sonarr with the configured API key.
+"""
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional
+import logging
+
+from app.database import get_db
+from app.models.settings import Settings
+from app.services.media_library_index import get_media_library_index
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
+
+# Events that add, move or remove files on disk
+RADARR_FILE_EVENTS = {'Download', 'Rename', 'MovieDelete', 'MovieFileDelete'}
+SONARR_FILE_EVENTS = {'Download', 'Rename', 'SeriesDelete', 'EpisodeFileDelete'}
+
+
+async def _handle_webhook(client: Any, payload: Dict[str, Any], events: set, group_key: str) -> Dict[str, Any]:
+    """Refresh the movie/series referenced by a webhook payload."""
+    event_type = payload.get('eventType')
+    if event_type not in events:
+        return {'status': 'ignored', 'event': event_type}
+
+    group = (payload.get(group_key) or {}).get('id')
+    index = get_media_library_index()
+    if group is None:
+        # Unknown item: fall back to a full rebuild on the next lookup
+        index.invalidate(client)
+        return {'status': 'invalidated', 'event': event_type}
+
+    await index.refresh_group(client, group)
+    logger.info(f"{client.library_kind} webhook: refreshed {group_key} {group} ({event_type})")
+    return {'status': 'refreshed', 'event': event_type, group_key: group}
+
+
+def _not_configured(service: str) -> Dict[str, Any]:
+    return {'status': 'ignored', 'message': f'{service} is not configured'}
+
+
+@router.post("/radarr")
+async def radarr_webhook(request: Request, db: Session = Depends(get_db)):
+    """
+    Receive a Radarr webhook notification.
+
+    Returns:
+        JSON with the action taken ('refreshed', 'invalidated' or 'ignored')
+    """
+    settings: Optional[Settings] = Settings.get_settings(db)
+    if not settings or not settings.radarr_url or not settings.radarr_api_key:
+        return _not_configured('Radarr')
+
+    from app.services.radarr_client import RadarrClient
+
+    client = RadarrClient(settings.radarr_url, settings.radarr_api_key)
+    payload = await request.json()
+    return await _handle_webhook(client, payload, RADARR_FILE_EVENTS, 'movie')
+
+
+@router.post("/sonarr")
+async def sonarr_webhook(request: Request, db: Session = Depends(get_db)):
+    """
+    Receive a Sonarr webhook notification.
+
+    Returns:
+        JSON with the action taken ('refreshed', 'invalidated' or 'ignored')
+    """
+    settings: Optional[Settings] = Settings.get_settings(db)
+    if not settings or not settings.sonarr_url or not settings.sonarr_api_key:
+        return _not_configured('Sonarr')
+
+    from app.services.sonarr_client import SonarrClient
+
+    client = SonarrClient(settings.sonarr_url, settings.sonarr_api_key)
+    payload = await request.json()
+    return await _handle_webhook(client, payload, SONARR_FILE_EVENTS, 'series')
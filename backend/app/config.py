@@ -60,6 +60,23 @@ class Config:
         "DATABASE_URL",
         f"sqlite:///{_db_path}"
     )
+    # Async database layer: async engine (aiosqlite / asyncpg) for routes and
+    # grouped, off-loop pipeline checkpoint writes
+    ASYNC_DATABASE_ENABLED = os.getenv("ASYNC_DATABASE_ENABLED", "true").lower() == "true"
+    # Connection pool (file databases and servers; in-memory SQLite is not pooled)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+    # SQLite profile, applied with PRAGMAs on every new connection
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    # Time (ms) a connection waits for a lock before "database is locked"
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "10000"))
+    # Page cache per connection (KiB)
+    SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+    # Memory-mapped I/O size (bytes), 0 to disable
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
 
     # =============================================================================
     # EXTERNAL SERVICES
@@ -116,9 +133,101 @@ class Config:
     # TMDB cache TTL (days)
     TMDB_CACHE_TTL_DAYS = int(os.getenv("TMDB_CACHE_TTL_DAYS", "30"))
 
+    # TMDB title search results (hours); searches that found nothing expire sooner
+    TMDB_SEARCH_CACHE_TTL_HOURS = int(os.getenv("TMDB_SEARCH_CACHE_TTL_HOURS", "72"))
+    TMDB_SEARCH_NEGATIVE_CACHE_TTL_HOURS = int(os.getenv("TMDB_SEARCH_NEGATIVE_CACHE_TTL_HOURS", "6"))
+
     # Tag cache TTL (days)
     TAG_CACHE_TTL_DAYS = int(os.getenv("TAG_CACHE_TTL_DAYS", "7"))
 
+    # Cloudflare clearance lifetime (seconds) when cf_clearance has no expiry
+    CLOUDFLARE_CLEARANCE_TTL = int(os.getenv("CLOUDFLARE_CLEARANCE_TTL", "1800"))
+
+    # Radarr/Sonarr library index: full rebuild interval (seconds)
+    MEDIA_LIBRARY_INDEX_TTL = int(os.getenv("MEDIA_LIBRARY_INDEX_TTL", "900"))
+    # Minimum snapshot age (seconds) before a lookup miss triggers a rebuild
+    MEDIA_LIBRARY_INDEX_MISS_REFRESH = int(os.getenv("MEDIA_LIBRARY_INDEX_MISS_REFRESH", "60"))
+
+    # Tracker duplicate check results (seconds); "not found" expires sooner
+    DUPLICATE_CACHE_TTL = int(os.getenv("DUPLICATE_CACHE_TTL", "3600"))
+    DUPLICATE_NEGATIVE_CACHE_TTL = int(os.getenv("DUPLICATE_NEGATIVE_CACHE_TTL", "900"))
+    DUPLICATE_CACHE_MAX_ENTRIES = int(os.getenv("DUPLICATE_CACHE_MAX_ENTRIES", "2048"))
+    # Per-tracker timeout of a duplicate check (seconds)
+    DUPLICATE_CHECK_TIMEOUT = float(os.getenv("DUPLICATE_CHECK_TIMEOUT", "30"))
+
+    # Parsed MediaInfo results kept in memory (all are persisted in the database)
+    MEDIAINFO_CACHE_MAX_ENTRIES = int(os.getenv("MEDIAINFO_CACHE_MAX_ENTRIES", "512"))
+
+    # Compiled BBCode / NFO templates kept in memory
+    TEMPLATE_CACHE_MAX_ENTRIES = int(os.getenv("TEMPLATE_CACHE_MAX_ENTRIES", "128"))
+
+    # Parsed release names kept in memory
+    RELEASE_PARSER_CACHE_MAX_ENTRIES = int(os.getenv("RELEASE_PARSER_CACHE_MAX_ENTRIES", "4096"))
+
+    # File manager index of the media folders (listings and search read the database)
+    FILE_INDEX_ENABLED = os.getenv("FILE_INDEX_ENABLED", "true").lower() == "true"
+    # Incremental refresh interval (seconds): only folders whose mtime changed are listed
+    FILE_INDEX_REFRESH_INTERVAL = int(os.getenv("FILE_INDEX_REFRESH_INTERVAL", "300"))
+    # Full refresh interval (seconds): every folder is listed, catching files modified in place
+    FILE_INDEX_FULL_REFRESH_INTERVAL = int(os.getenv("FILE_INDEX_FULL_REFRESH_INTERVAL", "86400"))
+    # Refresh folders on inotify / file system events (local disks; not reported by most network shares)
+    FILE_INDEX_WATCH = os.getenv("FILE_INDEX_WATCH", "false").lower() == "true"
+
+    # =============================================================================
+    # PIPELINE CONCURRENCY
+    # =============================================================================
+    # Number of files processed by the queue worker at the same time
+    PIPELINE_MAX_CONCURRENT = int(os.getenv("PIPELINE_MAX_CONCURRENT", "4"))
+
+    # Per-resource limits shared by all running pipelines (see processors/resource_pools.py)
+    PIPELINE_HASHING_CONCURRENCY = int(os.getenv("PIPELINE_HASHING_CONCURRENCY", "1"))
+    PIPELINE_FFMPEG_CONCURRENCY = int(os.getenv("PIPELINE_FFMPEG_CONCURRENCY", "2"))
+    PIPELINE_TMDB_CONCURRENCY = int(os.getenv("PIPELINE_TMDB_CONCURRENCY", "4"))
+    # Applied to each tracker independently
+    PIPELINE_TRACKER_CONCURRENCY = int(os.getenv("PIPELINE_TRACKER_CONCURRENCY", "1"))
+    # Maximum time (seconds) for one tracker's upload (auth, duplicate check, upload)
+    PIPELINE_TRACKER_UPLOAD_TIMEOUT = float(os.getenv("PIPELINE_TRACKER_UPLOAD_TIMEOUT", "600"))
+
+    # =============================================================================
+    # SCREENSHOTS
+    # =============================================================================
+    # Each capture holds one PIPELINE_FFMPEG_CONCURRENCY slot (captures run concurrently)
+    # Output format: png, jpg or webp (webp needs ffmpeg built with libwebp)
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png").lower()
+    # Capture the nearest keyframe before each timestamp (fast seek, no decoding past it)
+    SCREENSHOT_KEYFRAME_SEEK = os.getenv("SCREENSHOT_KEYFRAME_SEEK", "false").lower() == "true"
+    # Downscale wider screenshots to this width (0 = original size)
+    SCREENSHOT_MAX_WIDTH = int(os.getenv("SCREENSHOT_MAX_WIDTH", "0"))
+
+    # =============================================================================
+    # HTTP CLIENT POOL
+    # =============================================================================
+    # Connection limits of each per-host client (see services/http_client_pool.py)
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    # Seconds an idle keep-alive connection is kept open
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    # Negotiate HTTP/2 when the 'h2' package is installed (httpx[http2])
+    HTTP_ENABLE_HTTP2 = os.getenv("HTTP_ENABLE_HTTP2", "true").lower() == "true"
+
+    # =============================================================================
+    # TRACKER ADAPTER POOL
+    # =============================================================================
+    # Pooled tracker adapters (authenticated sessions) unused for this long are closed (seconds)
+    TRACKER_ADAPTER_IDLE_TIMEOUT = float(os.getenv("TRACKER_ADAPTER_IDLE_TIMEOUT", "1800"))
+    # Tracker sessions are authenticated again after this age (seconds)
+    TRACKER_SESSION_MAX_AGE = float(os.getenv("TRACKER_SESSION_MAX_AGE", "21600"))
+
+    # =============================================================================
+    # LOGGING
+    # =============================================================================
+    # Also write logs to this rotating file (empty = web UI and console only)
+    LOG_FILE = os.getenv("LOG_FILE", "")
+    # One JSON object per line (with correlation IDs) instead of plain text
+    LOG_FILE_JSON = os.getenv("LOG_FILE_JSON", "true").lower() == "true"
+    LOG_FILE_MAX_BYTES = int(os.getenv("LOG_FILE_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_FILE_BACKUP_COUNT = int(os.getenv("LOG_FILE_BACKUP_COUNT", "5"))
+
     # =============================================================================
     # TIMEZONE
     # =============================================================================
@@ -172,6 +281,7 @@ class Config:
             "circuit_breaker_max_failures": cls.CIRCUIT_BREAKER_MAX_FAILURES,
             "circuit_breaker_open_duration": cls.CIRCUIT_BREAKER_OPEN_DURATION,
             "max_retries": cls.MAX_RETRIES,
+            "pipeline_max_concurrent": cls.PIPELINE_MAX_CONCURRENT,
             "timezone": cls.TIMEZONE,
         }
 
@@ -2,13 +2,41 @@
 Database Configuration for Seedarr v2.0
 
 This module provides database connection and session management.
+
+SQLite databases get a production profile through PRAGMAs set on every new
+connection (WAL, synchronous, busy timeout, cache, mmap, temp store; see
+app.config), so queue-worker writes and dashboard reads no longer serialize
+on "database is locked".
+
+Besides the synchronous engine used by most of the application, an async
+layer is available when ASYNC_DATABASE_ENABLED is set:
+    - get_async_db(): FastAPI dependency yielding an AsyncSession
+      (aiosqlite / asyncpg); without an async engine it degrades to a
+      ThreadedSession, a synchronous session run in worker threads
+    - commit_checkpoint(): commits a synchronous session, writing the changed
+      columns of the given rows through the CheckpointWriter, which groups
+      the writes of concurrent pipelines into one transaction on a
+      background thread, so the write (and its fsync) does not block the
+      event loop
+    - execute_checkpoint(): runs other writes (e.g. statistics increments)
+      in the same grouped transactions
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import copy
+import importlib.util
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, event, inspect, update
+from sqlalchemy.engine import URL, Connection, Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
 import os
 from app.config import Config
 
+logger = logging.getLogger(__name__)
+
 # Database configuration - use Config for consistency
 DATABASE_URL = Config.DATABASE_URL
 
@@ -18,16 +46,79 @@ if db_dir and not os.path.exists(db_dir):
     try:
         os.makedirs(db_dir, exist_ok=True)
     except PermissionError:
-        import logging
         logging.warning(f"Cannot create database directory '{db_dir}' - ensure it exists with proper permissions")
 
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    """Check whether a URL is an in-memory SQLite database."""
+    return url.get_backend_name() == 'sqlite' and (not url.database or url.database == ':memory:')
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None) -> None:
+    """
+    Apply the SQLite profile from app.config to a new DBAPI connection.
+
+    Registered as a "connect" event listener on SQLite engines.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {int(Config.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA journal_mode = {Config.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous = {Config.SQLITE_SYNCHRONOUS}")
+        # Negative cache_size is in KiB
+        cursor.execute(f"PRAGMA cache_size = -{int(Config.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size = {int(Config.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA temp_store = {Config.SQLITE_TEMP_STORE}")
+    finally:
+        cursor.close()
+
+
+def engine_options(url: Any) -> Dict[str, Any]:
+    """
+    Get the create_engine() options for a database URL.
+
+    Args:
+        url: Database URL (string or sqlalchemy URL)
+
+    Returns:
+        Keyword arguments for create_engine() / create_async_engine()
+    """
+    url = make_url(url)
+    options: Dict[str, Any] = {}
+    if url.get_backend_name() == 'sqlite':
+        options['connect_args'] = {
+            "check_same_thread": False,
+            "timeout": Config.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        }
+    if not _is_memory_sqlite(url):
+        options['pool_size'] = Config.DB_POOL_SIZE
+        options['max_overflow'] = Config.DB_MAX_OVERFLOW
+    return options
+
+
+def _configure_engine(sync_engine: Engine) -> None:
+    """Register the SQLite profile on an engine (no-op for other databases)."""
+    if sync_engine.url.get_backend_name() == 'sqlite':
+        event.listen(sync_engine, "connect", apply_sqlite_pragmas)
+
+
 # SQLAlchemy engine and session
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith('sqlite') else {}
-)
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+_configure_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async driver per backend: (drivername, importable module)
+ASYNC_DRIVERS = {
+    'sqlite': ('sqlite+aiosqlite', 'aiosqlite'),
+    'postgresql': ('postgresql+asyncpg', 'asyncpg'),
+}
+
+# Async engines and checkpoint writers by database URL, created on first use
+_async_engines: Dict[str, Any] = {}
+_checkpoint_writers: Dict[str, 'CheckpointWriter'] = {}
+_async_sessionmaker = None
+
 
 def get_db():
     """
@@ -41,3 +132,371 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def to_async_url(url: Any) -> Optional[URL]:
+    """
+    Get the async driver URL of a database URL.
+
+    Args:
+        url: Database URL (string or sqlalchemy URL)
+
+    Returns:
+        URL using aiosqlite / asyncpg, or None if the async engine is
+        disabled, the driver is not installed or the database is in-memory
+        (an async connection would open a different, empty database)
+    """
+    if not Config.ASYNC_DATABASE_ENABLED:
+        return None
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None or importlib.util.find_spec(driver[1]) is None:
+        return None
+    if _is_memory_sqlite(url):
+        return None
+    return url.set(drivername=driver[0])
+
+
+def get_async_engine(url: Any = None):
+    """
+    Get the async engine of a database (the application database by default).
+
+    Args:
+        url: Database URL (string or sqlalchemy URL)
+
+    Returns:
+        AsyncEngine, or None if no async engine is available for the URL
+    """
+    async_url = to_async_url(url if url is not None else DATABASE_URL)
+    if async_url is None:
+        return None
+    key = async_url.render_as_string(hide_password=False)
+    if key not in _async_engines:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        async_engine = create_async_engine(async_url, **engine_options(async_url))
+        _configure_engine(async_engine.sync_engine)
+        _async_engines[key] = async_engine
+        logger.info(f"Async database engine created ({async_url.drivername})")
+    return _async_engines[key]
+
+
+class ThreadedSession:
+    """
+    Awaitable facade over a synchronous Session (async engine unavailable).
+
+    Exposes the AsyncSession methods used by the routes; each call runs in
+    a worker thread, and results are buffered there so iterating them does
+    not touch the database from the event loop. In-memory SQLite is used
+    inline: its connections are per thread, another thread would see an
+    empty database.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+        self._offload = not _is_memory_sqlite(session.get_bind().url)
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        if self._offload:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    async def execute(self, statement: Any, *args, **kwargs) -> Any:
+        def execute() -> Any:
+            return self.sync_session.execute(statement, *args, **kwargs).freeze()
+        return (await self._run(execute))()
+
+    async def scalar(self, statement: Any, *args, **kwargs) -> Any:
+        return await self._run(self.sync_session.scalar, statement, *args, **kwargs)
+
+    async def scalars(self, statement: Any, *args, **kwargs) -> Any:
+        return (await self.execute(statement, *args, **kwargs)).scalars()
+
+    async def get(self, entity: Any, ident: Any, **kwargs) -> Any:
+        return await self._run(self.sync_session.get, entity, ident, **kwargs)
+
+    async def commit(self) -> None:
+        await self._run(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await self._run(self.sync_session.close)
+
+
+async def get_async_db() -> AsyncIterator[Any]:
+    """
+    FastAPI dependency for async database sessions.
+
+    Without an async engine (ASYNC_DATABASE_ENABLED off, aiosqlite / asyncpg
+    not installed, in-memory database), yields a ThreadedSession instead so
+    the routes keep working.
+
+    Yields:
+        SQLAlchemy AsyncSession, or ThreadedSession
+    """
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        async_engine = get_async_engine()
+        if async_engine is None:
+            db = ThreadedSession(SessionLocal())
+            try:
+                yield db
+            finally:
+                await db.close()
+            return
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        _async_sessionmaker = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async with _async_sessionmaker() as db:
+        yield db
+
+
+# (table name, primary key values)
+RowKey = Tuple[str, Tuple[Any, ...]]
+
+
+class CheckpointWriter:
+    """
+    Group commit of checkpoint UPDATEs for one database.
+
+    Concurrent pipelines submit row updates; all updates submitted while a
+    transaction is being written go into the next one, so N concurrent
+    checkpoints cost one transaction (and one fsync) instead of N. Updates
+    of the same row within a batch are merged, later values winning.
+    Operations submitted with execute() (e.g. statistics increments) run in
+    the same transactions, in submission order.
+
+    Transactions run on a single background thread with their own pooled
+    connection: a lock is never held across an await, where a synchronous
+    writer blocking the event loop could wait on it. If a batch fails, its
+    rows and operations are retried one by one so a single bad write only
+    fails its caller.
+    """
+
+    def __init__(self, sync_engine: Engine):
+        self.engine = sync_engine
+        self._pending: List[Tuple[Optional[RowKey], Any, asyncio.Future]] = []
+        self._flushing: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-checkpoint")
+        self.transactions = 0
+        self.updates = 0
+        self.operations = 0
+
+    async def update(self, row_key: RowKey, table: Any, where: list, values: Dict[Any, Any]) -> None:
+        """
+        Write one row update in the next grouped transaction.
+
+        Args:
+            row_key: (table name, primary key values) used to merge updates
+            table: Table to update
+            where: Primary key conditions
+            values: Column -> value mapping
+
+        Raises:
+            Exception: The database error if the row could not be written
+        """
+        await self._submit(row_key, (table, where, values))
+
+    async def execute(self, operation: Callable[[Connection], Any]) -> None:
+        """
+        Run a write operation in the next grouped transaction.
+
+        Args:
+            operation: Called with the transaction's Connection; must only
+                write through it (it may be run again if the batch fails)
+
+        Raises:
+            Exception: The database error if the operation failed
+        """
+        await self._submit(None, operation)
+
+    async def _submit(self, row_key: Optional[RowKey], work: Any) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row_key, work, future))
+        if self._flushing is None or self._flushing.done() or self._flushing.get_loop() is not loop:
+            self._flushing = asyncio.ensure_future(self._flush())
+        # Shield so a cancelled caller does not cancel the batch of the others
+        await asyncio.shield(future)
+
+    async def _flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                results = await loop.run_in_executor(self._executor, self._write, batch)
+            except Exception as e:
+                results = [e] * len(batch)
+            for (*_, future), error in zip(batch, results):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    def _write(self, batch: list) -> List[Optional[BaseException]]:
+        """Write a batch in one transaction; fall back to one per row / operation on error."""
+        # Row updates are merged by row key, operations each get their own unit
+        units: Dict[Any, Any] = {}
+        keys = []
+        for i, (row_key, work, _) in enumerate(batch):
+            key = row_key if row_key is not None else ('operation', i)
+            keys.append(key)
+            if key in units:
+                units[key][2].update(work[2])
+            elif row_key is None:
+                units[key] = work
+            else:
+                table, where, values = work
+                units[key] = (table, where, dict(values))
+
+        try:
+            with self.engine.begin() as conn:
+                for unit in units.values():
+                    self._apply(conn, unit)
+            self._count(*units.values())
+            return [None] * len(batch)
+        except Exception as e:
+            if len(units) == 1:
+                return [e] * len(batch)
+            logger.warning(f"Grouped checkpoint write failed ({e}), retrying {len(units)} writes one by one")
+
+        errors: Dict[Any, Optional[BaseException]] = {}
+        for key, unit in units.items():
+            try:
+                with self.engine.begin() as conn:
+                    self._apply(conn, unit)
+                self._count(unit)
+                errors[key] = None
+            except Exception as e:
+                errors[key] = e
+        return [errors[key] for key in keys]
+
+    @staticmethod
+    def _apply(conn: Connection, unit: Any) -> None:
+        if callable(unit):
+            unit(conn)
+        else:
+            table, where, values = unit
+            conn.execute(update(table).where(*where).values(values))
+
+    def _count(self, *units: Any) -> None:
+        """Count one committed transaction and its writes."""
+        self.transactions += 1
+        operations = sum(1 for unit in units if callable(unit))
+        self.operations += operations
+        self.updates += len(units) - operations
+
+    def close(self) -> None:
+        """Stop the background thread."""
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {
+            'transactions': self.transactions,
+            'updates': self.updates,
+            'operations': self.operations,
+            'pending': len(self._pending),
+        }
+
+
+def get_checkpoint_writer(sync_engine: Any) -> Optional[CheckpointWriter]:
+    """
+    Get the CheckpointWriter of an engine.
+
+    Args:
+        sync_engine: Synchronous engine the session is bound to
+
+    Returns:
+        CheckpointWriter, or None if the async layer is disabled, the
+        database is in-memory (a pooled connection from another thread would
+        open a different database) or sync_engine is not an Engine
+    """
+    if not Config.ASYNC_DATABASE_ENABLED or not isinstance(sync_engine, Engine):
+        return None
+    if _is_memory_sqlite(sync_engine.url):
+        return None
+    key = sync_engine.url.render_as_string(hide_password=False)
+    if key not in _checkpoint_writers:
+        _checkpoint_writers[key] = CheckpointWriter(sync_engine)
+    return _checkpoint_writers[key]
+
+
+async def commit_checkpoint(db: Session, *instances: Any) -> None:
+    """
+    Commit a session without blocking the event loop on the given rows.
+
+    The changed columns of each instance are written with one UPDATE in the
+    next grouped transaction of the CheckpointWriter, then expired in the
+    session so they are not written again. Columns changed by another
+    coroutine while the UPDATE ran, new objects and any other pending
+    change are committed synchronously, so the result is always the same
+    as db.commit().
+
+    Args:
+        db: Synchronous SQLAlchemy session holding the instances
+        *instances: Persistent ORM objects to write asynchronously
+    """
+    writer = get_checkpoint_writer(db.get_bind())
+    if writer is not None:
+        for instance in instances:
+            await _write_changes(writer, db, instance)
+    db.commit()
+
+
+async def execute_checkpoint(db: Session, operation: Callable[[Connection], Any]) -> None:
+    """
+    Run a write operation without blocking the event loop.
+
+    The operation runs in the next grouped transaction of the session's
+    CheckpointWriter; without one (async layer disabled, in-memory database)
+    it runs on the session's connection and the session is committed.
+
+    Args:
+        db: Synchronous SQLAlchemy session
+        operation: Called with a Connection; must only write through it
+    """
+    writer = get_checkpoint_writer(db.get_bind())
+    if writer is not None:
+        await writer.execute(operation)
+        return
+    operation(db.connection())
+    db.commit()
+
+
+async def _write_changes(writer: CheckpointWriter, db: Session, instance: Any) -> None:
+    state = inspect(instance, raiseerr=False)
+    if state is None or not state.persistent:
+        return
+    mapper = state.mapper
+    changes = {
+        attr.key: copy.deepcopy(getattr(instance, attr.key))
+        for attr in state.attrs
+        if attr.key in mapper.column_attrs and attr.history.has_changes()
+    }
+    if not changes:
+        return
+
+    values = {mapper.column_attrs[key].columns[0]: value for key, value in changes.items()}
+    where = [column == value for column, value in zip(mapper.primary_key, state.identity)]
+    await writer.update((mapper.local_table.name, tuple(state.identity)), mapper.local_table, where, values)
+
+    # Drop the pending changes that were written; keep the ones made meanwhile
+    written = [key for key, value in changes.items() if getattr(instance, key) == value]
+    if written:
+        db.expire(instance, written)
+
+
+async def dispose_async_engines() -> None:
+    """Stop the checkpoint writers and close the async engines (application shutdown)."""
+    global _async_sessionmaker
+    for writer in _checkpoint_writers.values():
+        await asyncio.to_thread(writer.close)
+    _checkpoint_writers.clear()
+    for async_engine in _async_engines.values():
+        await async_engine.dispose()
+    _async_engines.clear()
+    _async_sessionmaker = None
@@ -32,8 +32,10 @@ from app.database import engine, get_db
 from app.models.settings import Settings
 from app.services.log_store import setup_log_store_handler
 from app.services.structured_logging import (
-    set_request_id, clear_context, generate_request_id
+    set_request_id, clear_context, generate_request_id,
+    add_queued_handler, setup_json_logging, stop_log_listeners
 )
+from app.config import config
 
 # Configure logging - capture ALL logs including uvicorn
 # Set up logging to capture all application and server logs for the web UI
@@ -45,6 +47,10 @@ if not root_logger.handlers:
         level=logging.DEBUG,  # Capture all log levels
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
+    # Console output is written by the background log listener too
+    console_handler = root_logger.handlers[0]
+    root_logger.removeHandler(console_handler)
+    add_queued_handler(console_handler)
 else:
     root_logger.setLevel(logging.DEBUG)  # Set to DEBUG to capture everything
 
@@ -52,6 +58,17 @@ else:
 # This will capture logs from ALL modules including uvicorn, fastapi, etc.
 setup_log_store_handler(logger_name=None, level=logging.DEBUG)
 
+# Optional persistent log file, written by the same background listener
+if config.LOG_FILE:
+    setup_json_logging(
+        logger_name=None,
+        level=logging.INFO,
+        json_output=config.LOG_FILE_JSON,
+        log_file=config.LOG_FILE,
+        max_bytes=config.LOG_FILE_MAX_BYTES,
+        backup_count=config.LOG_FILE_BACKUP_COUNT
+    )
+
 # Also explicitly attach handler to uvicorn loggers to ensure they're captured
 for uvicorn_logger_name in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
     uvicorn_logger = logging.getLogger(uvicorn_logger_name)
@@ -249,6 +266,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠ Queue worker failed to start: {e}")
 
+    # Start file manager index refresh (background)
+    if config.FILE_INDEX_ENABLED:
+        try:
+            from app.services.file_index_service import start_file_index
+            await start_file_index()
+            logger.info("✓ File index refresh started")
+        except Exception as e:
+            logger.warning(f"⚠ File index failed to start: {e}")
+
     logger.info("✓ Application startup complete")
     logger.info("=" * 60)
 
@@ -272,6 +298,41 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠ Queue worker shutdown error: {e}")
 
+    # Stop file manager index refresh
+    try:
+        from app.services.file_index_service import stop_file_index
+        await stop_file_index()
+    except Exception as e:
+        logger.warning(f"⚠ File index shutdown error: {e}")
+
+    # Stop piece hashing process pool
+    try:
+        from app.services.piece_hasher import shutdown_hasher_pool
+        shutdown_hasher_pool()
+    except Exception as e:
+        logger.warning(f"⚠ Piece hasher shutdown error: {e}")
+
+    # Close pooled tracker adapters (authenticated sessions)
+    try:
+        from app.adapters.adapter_pool import close_tracker_adapters
+        await close_tracker_adapters()
+    except Exception as e:
+        logger.warning(f"⚠ Tracker adapter pool shutdown error: {e}")
+
+    # Close shared HTTP clients (keep-alive connections)
+    try:
+        from app.services.http_client_pool import close_http_clients
+        await close_http_clients()
+    except Exception as e:
+        logger.warning(f"⚠ HTTP client pool shutdown error: {e}")
+
+    # Close async database connections
+    try:
+        from app.database import dispose_async_engines
+        await dispose_async_engines()
+    except Exception as e:
+        logger.warning(f"⚠ Async database engine shutdown error: {e}")
+
     # Stop hot reload watcher in development mode
     if hot_reload:
         logger.info("Stopping hot reload file watcher...")
@@ -283,6 +344,9 @@ async def lifespan(app: FastAPI):
 
     logger.info("✓ Shutdown complete")
 
+    # Handle the queued log records; later records are handled synchronously
+    stop_log_listeners()
+
 
 # OpenAPI Tags Metadata
 tags_metadata = [
@@ -400,7 +464,7 @@ static_dir = "static" if os.path.exists("static") else "backend/static"
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 # Register API routes
-from app.api import settings_routes, dashboard_routes, filemanager_routes, tracker_routes, prowlarr_routes, health_routes, batch_routes, statistics_routes, template_routes, presentation_routes, wizard_routes, config_schema_routes
+from app.api import settings_routes, dashboard_routes, filemanager_routes, tracker_routes, prowlarr_routes, health_routes, batch_routes, statistics_routes, template_routes, presentation_routes, wizard_routes, config_schema_routes, webhook_routes
 
 # Register settings routes directly (routes already include /api prefix where needed)
 app.include_router(settings_routes.router, tags=["settings"])
@@ -438,6 +502,9 @@ app.include_router(wizard_routes.router, tags=["wizard"])
 # Register config schema routes (YAML editor)
 app.include_router(config_schema_routes.router, tags=["config-schemas"])
 
+# Register Radarr/Sonarr webhook routes (media library index refresh)
+app.include_router(webhook_routes.router)
+
 # Root endpoint with wizard redirect
 @app.get("/")
 async def root():
@@ -4,8 +4,10 @@ Database models for Seedarr v2.0
 
 from .base import Base
 from .tmdb_cache import TMDBCache
+from .tmdb_search_cache import TMDBSearchCache
 from .tags import Tags
 from .file_entry import FileEntry, Status
+from .file_entry_status_count import FileEntryStatusCount
 from .settings import Settings
 from .tracker import Tracker
 from .categories import Categories
@@ -14,9 +16,13 @@ from .processing_queue import ProcessingQueue, QueuePriority, QueueStatus
 from .bbcode_template import BBCodeTemplate
 from .naming_template import NamingTemplate
 from .nfo_template import NFOTemplate
+from .cloudflare_clearance import CloudflareClearance
+from .mediainfo_cache import MediaInfoCacheEntry
+from .file_index import FileIndexEntry
 
 __all__ = [
-    'Base', 'TMDBCache', 'Tags', 'FileEntry', 'Status', 'Settings',
+    'Base', 'TMDBCache', 'TMDBSearchCache', 'Tags', 'FileEntry', 'Status', 'FileEntryStatusCount', 'Settings',
     'Tracker', 'Categories', 'C411Category', 'ProcessingQueue', 'QueuePriority', 'QueueStatus',
-    'BBCodeTemplate', 'NamingTemplate', 'NFOTemplate'
+    'BBCodeTemplate', 'NamingTemplate', 'NFOTemplate', 'CloudflareClearance',
+    'MediaInfoCacheEntry', 'FileIndexEntry'
 ]
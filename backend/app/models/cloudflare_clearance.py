@@ -0,0 +1,112 @@
+"""
+CloudflareClearance Database Model for Seedarr v2.0
+
+This module defines the CloudflareClearance model for persisting the cookies
+obtained from FlareSolverr, so a solved Cloudflare challenge survives
+application restarts instead of costing another 5-20 second solve.
+
+Features:
+    - One row per tracker domain
+    - Stores the solved cookies and the user agent they are bound to
+      (cf_clearance is only valid with the user agent that solved it)
+    - Expiration taken from the cf_clearance cookie
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.orm import Session
+from typing import Optional, List, Dict, Any
+
+from .base import Base
+
+
+class CloudflareClearance(Base):
+    """
+    Database model for cached Cloudflare clearance cookies.
+
+    Table Structure:
+        - id: Primary key (auto-increment)
+        - domain: Tracker domain (unique, e.g. "lacale.example.com")
+        - cookies: JSON array of FlareSolverr cookie dicts
+        - user_agent: User agent used by FlareSolverr for the solve
+        - solved_at: Timestamp of the solve
+        - expires_at: Timestamp when the clearance expires
+    """
+
+    __tablename__ = 'cloudflare_clearances'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    domain = Column(String(255), nullable=False, unique=True, index=True)
+    cookies = Column(JSON, nullable=False, default=list)
+    user_agent = Column(String(500), nullable=True)
+    solved_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)
+
+    def is_expired(self) -> bool:
+        """Check if the clearance has expired."""
+        return datetime.utcnow() >= self.expires_at
+
+    @classmethod
+    def get_valid(cls, db: Session, domain: str) -> Optional['CloudflareClearance']:
+        """
+        Get the clearance of a domain if not expired.
+
+        Args:
+            db: SQLAlchemy database session
+            domain: Tracker domain
+
+        Returns:
+            CloudflareClearance if found and not expired, None otherwise
+        """
+        entry = db.query(cls).filter(cls.domain == domain).first()
+        if entry is None or entry.is_expired():
+            return None
+        return entry
+
+    @classmethod
+    def upsert(
+        cls,
+        db: Session,
+        domain: str,
+        cookies: List[Dict[str, Any]],
+        user_agent: Optional[str],
+        expires_at: datetime
+    ) -> 'CloudflareClearance':
+        """
+        Insert or replace the clearance of a domain.
+
+        Args:
+            db: SQLAlchemy database session
+            domain: Tracker domain
+            cookies: FlareSolverr cookie dicts
+            user_agent: User agent bound to the cookies
+            expires_at: Expiration timestamp
+
+        Returns:
+            Stored CloudflareClearance entry
+        """
+        entry = db.query(cls).filter(cls.domain == domain).first()
+        if entry is None:
+            entry = cls(domain=domain)
+            db.add(entry)
+        entry.cookies = cookies
+        entry.user_agent = user_agent
+        entry.solved_at = datetime.utcnow()
+        entry.expires_at = expires_at
+        db.commit()
+        return entry
+
+    @classmethod
+    def invalidate(cls, db: Session, domain: str) -> None:
+        """
+        Delete the clearance of a domain.
+
+        Args:
+            db: SQLAlchemy database session
+            domain: Tracker domain
+        """
+        db.query(cls).filter(cls.domain == domain).delete()
+        db.commit()
+
+    def __repr__(self) -> str:
+        return f"<CloudflareClearance(domain='{self.domain}', expires_at={self.expires_at})>"
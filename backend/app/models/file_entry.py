@@ -27,10 +27,10 @@ Features:
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, JSON
-from sqlalchemy.orm import Session
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum as SQLEnum, JSON, Index, insert, select, update
+from sqlalchemy.orm import Session, validates
 from sqlalchemy.orm.attributes import flag_modified
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import enum
 import json
 
@@ -70,6 +70,24 @@ class TrackerStatus(enum.Enum):
     RETRYING = "retrying"            # Currently being retried
 
 
+# Statuses in which a file is done with the pipeline (history vs. queue)
+TERMINAL_STATUSES = (Status.UPLOADED, Status.FAILED)
+
+
+# Fields cleared when a FAILED entry is scanned again, so it is re-processed
+RESCAN_RESET_VALUES = {
+    'status': Status.PENDING,
+    'error_message': None,
+    'scanned_at': None,
+    'analyzed_at': None,
+    'renamed_at': None,
+    'metadata_generated_at': None,
+    'uploaded_at': None,
+    'torrent_path': None,
+    'nfo_path': None,
+}
+
+
 class FileEntry(Base):
     """
     Database model for tracking files through the processing pipeline.
@@ -85,6 +103,9 @@ class FileEntry(Base):
         - error_message: Error details if status is FAILED
         - created_at: Entry creation timestamp
         - updated_at: Last modification timestamp
+        - is_terminal: Denormalized "status in (UPLOADED, FAILED)", kept in
+          sync on every status change so queue and history queries use one
+          index range instead of NOT IN / multi-value IN scans
 
         Pipeline Checkpoints (timestamps):
         - scanned_at: File scan completion time
@@ -122,6 +143,7 @@ class FileEntry(Base):
     # File information
     file_path = Column(String(1000), nullable=False, unique=True)
     status = Column(SQLEnum(Status), nullable=False, default=Status.PENDING)
+    is_terminal = Column(Boolean, nullable=False, default=False)
 
     # Error tracking
     error_message = Column(Text, nullable=True)
@@ -206,6 +228,12 @@ class FileEntry(Base):
         self.created_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
 
+    @validates('status')
+    def _sync_is_terminal(self, key: str, status: Status) -> Status:
+        """Keep the denormalized is_terminal flag in sync with status."""
+        self.is_terminal = status in TERMINAL_STATUSES
+        return status
+
     # Checkpoint helper methods
 
     def is_scanned(self) -> bool:
@@ -269,6 +297,31 @@ class FileEntry(Base):
         self.status = Status.FAILED
         self.updated_at = datetime.utcnow()
 
+    def get_processing_seconds(self, finished_at: Optional[datetime] = None) -> float:
+        """
+        Get the time the file spent in the pipeline.
+
+        Measured from the creation of the entry to finished_at, without the
+        time it waited for user approval.
+
+        Args:
+            finished_at: End of processing (default: now)
+
+        Returns:
+            Processing time in seconds (0 if unknown)
+        """
+        if self.created_at is None:
+            return 0.0
+        finished_at = finished_at or datetime.utcnow()
+        seconds = (finished_at - self.created_at).total_seconds()
+        if self.approval_requested_at and self.approval_requested_at < finished_at:
+            # Still waiting (e.g. rejected) if not approved since the request
+            resumed_at = finished_at
+            if self.approved_at and self.approved_at >= self.approval_requested_at:
+                resumed_at = min(self.approved_at, finished_at)
+            seconds -= (resumed_at - self.approval_requested_at).total_seconds()
+        return max(seconds, 0.0)
+
     def reset_from_checkpoint(self, checkpoint: Status) -> None:
         """
         Reset file entry to retry from a specific checkpoint.
@@ -356,19 +409,61 @@ class FileEntry(Base):
             db.refresh(entry)
         elif entry.status == Status.FAILED and reset_failed:
             # Reset failed entry so it can be re-processed
-            entry.status = Status.PENDING
-            entry.error_message = None
-            entry.scanned_at = None
-            entry.analyzed_at = None
-            entry.renamed_at = None
-            entry.metadata_generated_at = None
-            entry.uploaded_at = None
-            entry.torrent_path = None
-            entry.nfo_path = None
+            for attribute, value in RESCAN_RESET_VALUES.items():
+                setattr(entry, attribute, value)
             db.commit()
             db.refresh(entry)
         return entry
 
+    @classmethod
+    def create_or_reset_many(
+        cls,
+        db: Session,
+        file_paths: List[str],
+        reset_failed: bool = True
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Bulk version of create_or_get for directory scans.
+
+        Existing paths are looked up with one IN query, new entries are
+        inserted in one statement and FAILED entries are reset in one UPDATE,
+        all committed in a single transaction. Keep ``file_paths`` within the
+        bound parameter limit of the database (a few hundred paths).
+
+        Args:
+            db: SQLAlchemy database session
+            file_paths: File paths
+            reset_failed: If True, reset FAILED entries to PENDING
+
+        Returns:
+            (created, reset, skipped) file paths
+        """
+        file_paths = list(dict.fromkeys(file_paths))
+        existing = db.execute(
+            select(cls.id, cls.file_path, cls.status).where(cls.file_path.in_(file_paths))
+        ).all()
+        known = {row.file_path for row in existing}
+        created = [path for path in file_paths if path not in known]
+        to_reset = [row for row in existing if row.status == Status.FAILED and reset_failed]
+        reset = [row.file_path for row in to_reset]
+        reset_paths = set(reset)
+        skipped = [row.file_path for row in existing if row.file_path not in reset_paths]
+
+        now = datetime.utcnow()
+        if created:
+            db.execute(insert(cls), [
+                {'file_path': path, 'status': Status.PENDING, 'created_at': now, 'updated_at': now}
+                for path in created
+            ])
+        if to_reset:
+            db.execute(
+                update(cls)
+                .where(cls.id.in_([row.id for row in to_reset]))
+                .values(is_terminal=False, updated_at=now, **RESCAN_RESET_VALUES)
+            )
+        db.commit()
+        return created, reset, skipped
+
     # ============================================================================
     # Metadata helper methods
     # ============================================================================
@@ -584,7 +679,8 @@ class FileEntry(Base):
         torrent_id: Optional[str] = None,
         torrent_url: Optional[str] = None,
         error: Optional[str] = None,
-        retry_count: int = 0
+        retry_count: int = 0,
+        duration: Optional[float] = None
     ) -> None:
         """
         Set the status for a specific tracker.
@@ -596,6 +692,7 @@ class FileEntry(Base):
             torrent_url: Torrent URL if successfully uploaded
             error: Error message if failed
             retry_count: Number of retry attempts
+            duration: Duration of the upload attempt in seconds, if measured
         """
         statuses = self.get_tracker_statuses()
         # Preserve existing extra fields (release_dir, media_file, hardlink_method, qbit_status)
@@ -608,6 +705,8 @@ class FileEntry(Base):
             'retry_count': retry_count,
             'updated_at': datetime.utcnow().isoformat()
         }
+        if duration is not None:
+            updated['duration'] = round(duration, 3)
         # Merge: keep extra fields from existing, overwrite with new upload fields
         for key in ('release_dir', 'media_file', 'hardlink_method', 'hardlink_error', 'qbit_status'):
             if key in existing:
@@ -905,3 +1004,12 @@ class FileEntry(Base):
             f"<FileEntry(id={self.id}, path='{self.file_path}', "
             f"status={self.status.value})>"
         )
+
+
+# Indexes for the dashboard, queue, history and statistics queries
+Index('idx_file_entries_status_updated_at', FileEntry.status, FileEntry.updated_at)
+Index('idx_file_entries_status_uploaded_at', FileEntry.status, FileEntry.uploaded_at)
+Index('idx_file_entries_status_approval_requested_at', FileEntry.status, FileEntry.approval_requested_at)
+Index('idx_file_entries_created_at_status', FileEntry.created_at, FileEntry.status)
+Index('idx_file_entries_terminal_updated_at', FileEntry.is_terminal, FileEntry.updated_at)
+Index('idx_file_entries_updated_at', FileEntry.updated_at)
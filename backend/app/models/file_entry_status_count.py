@@ -0,0 +1,163 @@
+"""
+FileEntryStatusCount Database Model for Seedarr v2.0
+
+This module defines the FileEntryStatusCount model, a denormalized count of
+file entries per status. Dashboard and history pages show all-time totals
+(success rate, completed / failed jobs); reading them from this table is a
+handful of rows instead of counting the whole file_entries history.
+
+Features:
+    - One row per status with the number of file entries in it
+    - Maintained by database triggers on file_entries, so every write path
+      (ORM flushes, checkpoint UPDATEs, bulk statements) keeps it exact
+    - Triggers are installed and the counts rebuilt when missing (SQLite and
+      PostgreSQL)
+"""
+
+from sqlalchemy import Column, Integer, String, event, func, inspect, text
+from sqlalchemy.orm import Session
+from typing import Dict
+
+from .base import Base
+from .file_entry import FileEntry, Status
+
+
+# Trigger DDL per dialect; each list is executed in order
+STATUS_COUNT_TRIGGERS = {
+    'sqlite': [
+        """
+        CREATE TRIGGER IF NOT EXISTS file_entries_status_count_insert
+        AFTER INSERT ON file_entries
+        BEGIN
+            INSERT INTO file_entry_status_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS file_entries_status_count_update
+        AFTER UPDATE OF status ON file_entries
+        WHEN OLD.status IS NOT NEW.status
+        BEGIN
+            UPDATE file_entry_status_counts SET count = count - 1 WHERE status = OLD.status;
+            INSERT INTO file_entry_status_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS file_entries_status_count_delete
+        AFTER DELETE ON file_entries
+        BEGIN
+            UPDATE file_entry_status_counts SET count = count - 1 WHERE status = OLD.status;
+        END
+        """,
+    ],
+    'postgresql': [
+        """
+        CREATE OR REPLACE FUNCTION file_entries_status_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE file_entry_status_counts SET count = count - 1 WHERE status = OLD.status::text;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO file_entry_status_counts (status, count) VALUES (NEW.status::text, 1)
+                ON CONFLICT (status) DO UPDATE SET count = file_entry_status_counts.count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER file_entries_status_count
+        AFTER INSERT OR DELETE OR UPDATE OF status ON file_entries
+        FOR EACH ROW EXECUTE FUNCTION file_entries_status_count()
+        """,
+    ],
+}
+
+# Query returning a row when the triggers are installed, per dialect
+_TRIGGER_EXISTS = {
+    'sqlite': "SELECT 1 FROM sqlite_master WHERE type = 'trigger' "
+              "AND name = 'file_entries_status_count_insert'",
+    'postgresql': "SELECT 1 FROM pg_trigger WHERE tgname = 'file_entries_status_count'",
+}
+
+REBUILD_STATUS_COUNTS = [
+    "DELETE FROM file_entry_status_counts",
+    "INSERT INTO file_entry_status_counts (status, count) "
+    "SELECT status, COUNT(*) FROM file_entries GROUP BY status",
+]
+
+
+class FileEntryStatusCount(Base):
+    """
+    Database model for the number of file entries per status.
+
+    Table Structure:
+        - status: Status name as stored in file_entries.status (primary key)
+        - count: Number of file entries with this status
+    """
+
+    __tablename__ = 'file_entry_status_counts'
+
+    status = Column(String(20), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    @classmethod
+    def get_counts(cls, db: Session) -> Dict[Status, int]:
+        """
+        Get the number of file entries per status.
+
+        Args:
+            db: SQLAlchemy database session
+
+        Returns:
+            Dictionary mapping Status to count (statuses without entries omitted)
+        """
+        if db.get_bind().dialect.name not in STATUS_COUNT_TRIGGERS:
+            # No triggers on this database: count the entries instead
+            return dict(
+                db.query(FileEntry.status, func.count(FileEntry.id))
+                .group_by(FileEntry.status)
+                .all()
+            )
+        return {
+            Status[row.status]: row.count
+            for row in db.query(cls).all()
+            if row.status in Status.__members__ and row.count > 0
+        }
+
+    def __repr__(self) -> str:
+        return f"<FileEntryStatusCount(status='{self.status}', count={self.count})>"
+
+
+def install_status_count_triggers(connection) -> bool:
+    """
+    Install the status count triggers and rebuild the counts, if missing.
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+
+    Returns:
+        True if the triggers were installed, False if already present or
+        the dialect is not supported (counts are then not maintained)
+    """
+    dialect = connection.dialect.name
+    if dialect not in STATUS_COUNT_TRIGGERS:
+        return False
+    if connection.execute(text(_TRIGGER_EXISTS[dialect])).first():
+        return False
+
+    for statement in STATUS_COUNT_TRIGGERS[dialect] + REBUILD_STATUS_COUNTS:
+        connection.execute(text(statement))
+    return True
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _install_triggers_after_create(target, connection, **kw):
+    """Install the triggers when the tables are created (init / create_all)."""
+    schema = inspect(connection)
+    if schema.has_table('file_entries') and schema.has_table('file_entry_status_counts'):
+        install_status_count_triggers(connection)
@@ -0,0 +1,74 @@
+"""
+FileIndexEntry Database Model for Seedarr v2.0
+
+This module defines the FileIndexEntry model, a persistent index of the
+files and folders under the media roots browsed by the file manager, so
+listings and searches read the database instead of stat-ing the NAS.
+
+Features:
+    - One row per file or folder: path, parent folder, name, size, mtime,
+      inode and extension
+    - Folder rows remember the folder mtime at which their children were
+      last listed; a folder whose mtime has not changed is not listed again
+    - Listing index (parent, folders first, name) serves paginated pages
+    - Lowercase name index serves prefix searches across the whole tree
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, Index
+
+from .base import Base
+
+
+class FileIndexEntry(Base):
+    """
+    Database model for an indexed file or folder.
+
+    Table Structure:
+        - id: Primary key (auto-increment)
+        - path: Full path (unique)
+        - parent: Path of the containing folder
+        - root: Media root the entry was indexed under
+        - name: File or folder name
+        - name_lower: Lowercase name, for case-insensitive search and sorting
+        - extension: Lowercase extension of files ('' for folders)
+        - is_dir: Whether the entry is a folder
+        - size: st_size (0 for folders)
+        - mtime_ns: st_mtime_ns
+        - inode: st_ino
+        - listed_mtime_ns: Folder mtime when its children were last listed
+          (None until the folder has been listed, 0 when it was modified
+          while being listed)
+        - indexed_at: Last time the row was written
+    """
+
+    __tablename__ = 'file_index'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    path = Column(String(1000), nullable=False, unique=True)
+    parent = Column(String(1000), nullable=False)
+    root = Column(String(1000), nullable=False)
+    name = Column(String(500), nullable=False)
+    name_lower = Column(String(500), nullable=False)
+    extension = Column(String(20), nullable=False, default='')
+    is_dir = Column(Boolean, nullable=False, default=False)
+    size = Column(BigInteger, nullable=False, default=0)
+    mtime_ns = Column(BigInteger, nullable=False, default=0)
+    inode = Column(BigInteger, nullable=True)
+    listed_mtime_ns = Column(BigInteger, nullable=True)
+    indexed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    @property
+    def modified(self) -> datetime:
+        """Modification time as a local datetime."""
+        return datetime.fromtimestamp(self.mtime_ns / 1e9)
+
+    def __repr__(self) -> str:
+        return f"<FileIndexEntry(path='{self.path}', is_dir={self.is_dir})>"
+
+
+# Folder listings: WHERE parent = ? ORDER BY is_dir DESC, name_lower
+Index('ix_file_index_parent_listing', FileIndexEntry.parent, FileIndexEntry.is_dir.desc(), FileIndexEntry.name_lower)
+# Prefix search on names
+Index('ix_file_index_name_lower', FileIndexEntry.name_lower)
+Index('ix_file_index_root', FileIndexEntry.root)
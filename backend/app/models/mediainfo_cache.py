@@ -0,0 +1,129 @@
+"""
+MediaInfoCacheEntry Database Model for Seedarr v2.0
+
+This module defines the MediaInfoCacheEntry model for persisting parsed
+MediaInfo data, so a release is parsed once instead of once per pipeline
+stage and tracker, and retries after a restart do not re-read the file.
+
+Features:
+    - One row per file identity (device, inode): hardlinked copies share it
+    - Stores file size and mtime; a row whose size or mtime no longer match
+      the file on disk is stale and replaced on the next extraction
+    - Parsed MediaInfoData stored as JSON
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, JSON, UniqueConstraint
+from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any
+
+from .base import Base
+
+
+class MediaInfoCacheEntry(Base):
+    """
+    Database model for cached MediaInfo extraction results.
+
+    Table Structure:
+        - id: Primary key (auto-increment)
+        - device: st_dev of the media file
+        - inode: st_ino of the media file
+        - file_size: st_size when the file was parsed
+        - mtime_ns: st_mtime_ns when the file was parsed
+        - file_name: Name of the file that was parsed
+        - data: MediaInfoData as a JSON dict
+        - created_at: Timestamp of the extraction
+    """
+
+    __tablename__ = 'mediainfo_cache'
+    __table_args__ = (
+        UniqueConstraint('device', 'inode', name='uq_mediainfo_cache_device_inode'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    device = Column(BigInteger, nullable=False)
+    inode = Column(BigInteger, nullable=False)
+    file_size = Column(BigInteger, nullable=False)
+    mtime_ns = Column(BigInteger, nullable=False)
+    file_name = Column(String(500), nullable=True)
+    data = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    @classmethod
+    def get_valid(
+        cls,
+        db: Session,
+        device: int,
+        inode: int,
+        file_size: int,
+        mtime_ns: int
+    ) -> Optional['MediaInfoCacheEntry']:
+        """
+        Get the entry of a file if it still matches its size and mtime.
+
+        A stale entry (the file was replaced or modified) is deleted.
+
+        Args:
+            db: SQLAlchemy database session
+            device: st_dev of the file
+            inode: st_ino of the file
+            file_size: Current st_size of the file
+            mtime_ns: Current st_mtime_ns of the file
+
+        Returns:
+            MediaInfoCacheEntry if found and current, None otherwise
+        """
+        entry = db.query(cls).filter(cls.device == device, cls.inode == inode).first()
+        if entry is None:
+            return None
+        if entry.file_size != file_size or entry.mtime_ns != mtime_ns:
+            db.delete(entry)
+            db.commit()
+            return None
+        return entry
+
+    @classmethod
+    def upsert(
+        cls,
+        db: Session,
+        device: int,
+        inode: int,
+        file_size: int,
+        mtime_ns: int,
+        file_name: Optional[str],
+        data: Dict[str, Any]
+    ) -> 'MediaInfoCacheEntry':
+        """
+        Insert or replace the entry of a file.
+
+        Args:
+            db: SQLAlchemy database session
+            device: st_dev of the file
+            inode: st_ino of the file
+            file_size: st_size of the parsed file
+            mtime_ns: st_mtime_ns of the parsed file
+            file_name: Name of the parsed file
+            data: MediaInfoData as a dict
+
+        Returns:
+            Stored MediaInfoCacheEntry
+        """
+        entry = db.query(cls).filter(cls.device == device, cls.inode == inode).first()
+        if entry is None:
+            entry = cls(device=device, inode=inode)
+            db.add(entry)
+        entry.file_size = file_size
+        entry.mtime_ns = mtime_ns
+        entry.file_name = file_name
+        entry.data = data
+        entry.created_at = datetime.utcnow()
+        db.commit()
+        return entry
+
+    @classmethod
+    def count(cls, db: Session) -> int:
+        """Get the number of cached files."""
+        return db.query(cls).count()
+
+    def __repr__(self) -> str:
+        return f"<MediaInfoCacheEntry(file_name='{self.file_name}', device={self.device}, inode={self.inode})>"
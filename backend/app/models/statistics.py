@@ -8,11 +8,17 @@ Features:
 - Per-tracker breakdown
 - Success/failure tracking
 - Processing time metrics
+
+Rollups are updated incrementally with atomic increments (add()), so
+concurrent pipelines never lose an update and dashboards only read the
+pre-aggregated rows. StatisticsService.rebuild_rollups() recomputes them
+from the file_entries history.
 """
 
 from datetime import datetime, date
 from typing import List, Dict, Any, Optional
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, func
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Date, DateTime, Index, func, insert, update
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 from app.models.base import Base
@@ -22,12 +28,12 @@ class DailyStatistics(Base):
     """
     Daily aggregated statistics model.
 
-    Tracks daily upload metrics including:
-    - Total uploads attempted
+    Tracks, per day (UTC) on which files finished the pipeline:
+    - Total files finished (uploaded or failed)
     - Successful uploads
     - Failed uploads
-    - Average processing time
-    - Breakdown by tracker
+    - Processing time (creation to outcome, excluding the wait for approval)
+    - Bytes of the files processed
     """
 
     __tablename__ = 'daily_statistics'
@@ -45,7 +51,7 @@ class DailyStatistics(Base):
     total_processing_time_seconds = Column(Float, nullable=False, default=0)
 
     # File size metrics
-    total_bytes_processed = Column(Integer, nullable=False, default=0)
+    total_bytes_processed = Column(BigInteger, nullable=False, default=0)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -83,6 +89,56 @@ class DailyStatistics(Base):
 
         return stats
 
+    @classmethod
+    def add(
+        cls,
+        conn: Connection,
+        target_date: date,
+        successful: int = 0,
+        failed: int = 0,
+        processing_time_seconds: float = 0.0,
+        bytes_processed: int = 0
+    ) -> None:
+        """
+        Atomically add results to the rollup row of a day (created if missing).
+
+        Args:
+            conn: Connection, in the caller's transaction
+            target_date: Day of the results
+            successful: Number of successful uploads to add
+            failed: Number of failed uploads to add
+            processing_time_seconds: Total processing time to add
+            bytes_processed: Total bytes to add
+        """
+        total = successful + failed
+        now = datetime.utcnow()
+        result = conn.execute(
+            update(cls).where(cls.date == target_date).values({
+                cls.total_uploads: cls.total_uploads + total,
+                cls.successful_uploads: cls.successful_uploads + successful,
+                cls.failed_uploads: cls.failed_uploads + failed,
+                cls.total_processing_time_seconds: cls.total_processing_time_seconds + processing_time_seconds,
+                cls.avg_processing_time_seconds: (
+                    (cls.total_processing_time_seconds + processing_time_seconds)
+                    / func.nullif(cls.total_uploads + total, 0)
+                ),
+                cls.total_bytes_processed: cls.total_bytes_processed + bytes_processed,
+                cls.updated_at: now,
+            })
+        )
+        if result.rowcount == 0:
+            conn.execute(insert(cls).values(
+                date=target_date,
+                total_uploads=total,
+                successful_uploads=successful,
+                failed_uploads=failed,
+                total_processing_time_seconds=processing_time_seconds,
+                avg_processing_time_seconds=processing_time_seconds / total if total else None,
+                total_bytes_processed=bytes_processed,
+                created_at=now,
+                updated_at=now,
+            ))
+
     @classmethod
     def record_upload(
         cls,
@@ -100,26 +156,16 @@ class DailyStatistics(Base):
             processing_time_seconds: Time taken to process
             bytes_processed: Size of file processed
         """
-        stats = cls.get_or_create_for_date(db)
-
-        stats.total_uploads += 1
-        if success:
-            stats.successful_uploads += 1
-        else:
-            stats.failed_uploads += 1
-
-        if processing_time_seconds:
-            stats.total_processing_time_seconds += processing_time_seconds
-            # Recalculate average
-            stats.avg_processing_time_seconds = (
-                stats.total_processing_time_seconds / stats.total_uploads
-            )
-
-        stats.total_bytes_processed += bytes_processed
-        stats.updated_at = datetime.utcnow()
-
+        cls.add(
+            db.connection(),
+            datetime.utcnow().date(),
+            successful=1 if success else 0,
+            failed=0 if success else 1,
+            processing_time_seconds=processing_time_seconds or 0.0,
+            bytes_processed=bytes_processed
+        )
         db.commit()
-        return stats
+        return db.query(cls).filter(cls.date == datetime.utcnow().date()).first()
 
     @classmethod
     def get_range(cls, db: Session, start_date: date, end_date: date) -> List['DailyStatistics']:
@@ -148,7 +194,9 @@ class DailyStatistics(Base):
             func.sum(cls.total_uploads).label('total'),
             func.sum(cls.successful_uploads).label('successful'),
             func.sum(cls.failed_uploads).label('failed'),
-            func.avg(cls.avg_processing_time_seconds).label('avg_time'),
+            (
+                func.sum(cls.total_processing_time_seconds) / func.nullif(func.sum(cls.total_uploads), 0)
+            ).label('avg_time'),
             func.sum(cls.total_bytes_processed).label('total_bytes')
         ).filter(
             cls.date >= start_date,
@@ -174,7 +222,9 @@ class TrackerStatistics(Base):
     """
     Per-tracker statistics model.
 
-    Tracks upload metrics broken down by tracker.
+    Tracks upload metrics broken down by tracker and day (UTC). Processing
+    time is the duration of the upload to the tracker; timed_uploads counts
+    the uploads it is known for (not recorded before it was measured).
     """
 
     __tablename__ = 'tracker_statistics'
@@ -191,6 +241,7 @@ class TrackerStatistics(Base):
     # Processing metrics
     avg_processing_time_seconds = Column(Float, nullable=True)
     total_processing_time_seconds = Column(Float, nullable=False, default=0)
+    timed_uploads = Column(Integer, nullable=False, default=0)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -230,6 +281,63 @@ class TrackerStatistics(Base):
 
         return stats
 
+    @classmethod
+    def add(
+        cls,
+        conn: Connection,
+        target_date: date,
+        tracker_name: str,
+        successful: int = 0,
+        failed: int = 0,
+        processing_time_seconds: float = 0.0,
+        timed_uploads: int = 0
+    ) -> None:
+        """
+        Atomically add upload results to a tracker's rollup row of a day.
+
+        Args:
+            conn: Connection, in the caller's transaction
+            target_date: Day of the results
+            tracker_name: Tracker slug
+            successful: Number of successful uploads to add
+            failed: Number of failed uploads to add
+            processing_time_seconds: Total upload time of the timed uploads
+            timed_uploads: Number of uploads processing_time_seconds covers
+        """
+        total = successful + failed
+        now = datetime.utcnow()
+        values = {
+            cls.total_uploads: cls.total_uploads + total,
+            cls.successful_uploads: cls.successful_uploads + successful,
+            cls.failed_uploads: cls.failed_uploads + failed,
+            cls.updated_at: now,
+        }
+        if timed_uploads:
+            values.update({
+                cls.total_processing_time_seconds: cls.total_processing_time_seconds + processing_time_seconds,
+                cls.timed_uploads: cls.timed_uploads + timed_uploads,
+                cls.avg_processing_time_seconds: (
+                    (cls.total_processing_time_seconds + processing_time_seconds)
+                    / (cls.timed_uploads + timed_uploads)
+                ),
+            })
+        result = conn.execute(
+            update(cls).where(cls.date == target_date, cls.tracker_name == tracker_name).values(values)
+        )
+        if result.rowcount == 0:
+            conn.execute(insert(cls).values(
+                date=target_date,
+                tracker_name=tracker_name,
+                total_uploads=total,
+                successful_uploads=successful,
+                failed_uploads=failed,
+                total_processing_time_seconds=processing_time_seconds if timed_uploads else 0.0,
+                timed_uploads=timed_uploads,
+                avg_processing_time_seconds=processing_time_seconds / timed_uploads if timed_uploads else None,
+                created_at=now,
+                updated_at=now,
+            ))
+
     @classmethod
     def record_upload(
         cls,
@@ -239,23 +347,18 @@ class TrackerStatistics(Base):
         processing_time_seconds: float = None
     ):
         """Record an upload for a specific tracker."""
-        stats = cls.get_or_create(db, tracker_name)
-
-        stats.total_uploads += 1
-        if success:
-            stats.successful_uploads += 1
-        else:
-            stats.failed_uploads += 1
-
-        if processing_time_seconds:
-            stats.total_processing_time_seconds += processing_time_seconds
-            stats.avg_processing_time_seconds = (
-                stats.total_processing_time_seconds / stats.total_uploads
-            )
-
-        stats.updated_at = datetime.utcnow()
+        today = datetime.utcnow().date()
+        cls.add(
+            db.connection(),
+            today,
+            tracker_name,
+            successful=1 if success else 0,
+            failed=0 if success else 1,
+            processing_time_seconds=processing_time_seconds or 0.0,
+            timed_uploads=1 if processing_time_seconds is not None else 0
+        )
         db.commit()
-        return stats
+        return db.query(cls).filter(cls.date == today, cls.tracker_name == tracker_name).first()
 
     @classmethod
     def get_tracker_summary(cls, db: Session, days: int = 30) -> List[Dict[str, Any]]:
@@ -269,7 +372,9 @@ class TrackerStatistics(Base):
             func.sum(cls.total_uploads).label('total'),
             func.sum(cls.successful_uploads).label('successful'),
             func.sum(cls.failed_uploads).label('failed'),
-            func.avg(cls.avg_processing_time_seconds).label('avg_time')
+            (
+                func.sum(cls.total_processing_time_seconds) / func.nullif(func.sum(cls.timed_uploads), 0)
+            ).label('avg_time')
         ).filter(
             cls.date >= start_date,
             cls.date <= end_date
@@ -286,3 +391,7 @@ class TrackerStatistics(Base):
             }
             for r in results
         ]
+
+
+# One rollup row per tracker and day (created by migration 015)
+Index('ix_tracker_statistics_date_tracker', TrackerStatistics.date, TrackerStatistics.tracker_name, unique=True)
@@ -0,0 +1,111 @@
+"""
+TMDBSearchCache Database Model for Seedarr v2.0
+
+This module defines the TMDBSearchCache model for persisting TMDB
+/search/{movie|tv} results, so the episodes of a season, retries and
+parallel workers looking up the same title share one search request.
+
+Features:
+    - One row per normalized (content type, language, year, title) query
+    - Stores the search results (empty list when TMDB found nothing)
+    - Own TTL, shorter for "nothing found" results
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.orm import Session
+from typing import Optional, List, Dict, Any
+
+from .base import Base
+
+
+class TMDBSearchCache(Base):
+    """
+    Database model for cached TMDB search results.
+
+    Table Structure:
+        - id: Primary key (auto-increment)
+        - query_key: Normalized search key (unique)
+        - results: JSON array of TMDB search result objects
+        - cached_at: Timestamp of the search
+        - expires_at: Timestamp when the entry expires
+    """
+
+    __tablename__ = 'tmdb_search_cache'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    query_key = Column(String(600), nullable=False, unique=True, index=True)
+    results = Column(JSON, nullable=False, default=list)
+    cached_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def is_expired(self) -> bool:
+        """Check if the entry has expired."""
+        return datetime.utcnow() >= self.expires_at
+
+    @classmethod
+    def get_valid(cls, db: Session, query_key: str) -> Optional['TMDBSearchCache']:
+        """
+        Get the results of a search if not expired.
+
+        Args:
+            db: SQLAlchemy database session
+            query_key: Normalized search key
+
+        Returns:
+            TMDBSearchCache if found and not expired, None otherwise
+        """
+        entry = db.query(cls).filter(cls.query_key == query_key).first()
+        if entry is None or entry.is_expired():
+            return None
+        return entry
+
+    @classmethod
+    def upsert(
+        cls,
+        db: Session,
+        query_key: str,
+        results: List[Dict[str, Any]],
+        expires_at: datetime
+    ) -> 'TMDBSearchCache':
+        """
+        Insert or replace the results of a search.
+
+        Args:
+            db: SQLAlchemy database session
+            query_key: Normalized search key
+            results: TMDB search result objects
+            expires_at: Expiration timestamp
+
+        Returns:
+            Stored TMDBSearchCache entry
+        """
+        entry = db.query(cls).filter(cls.query_key == query_key).first()
+        if entry is None:
+            entry = cls(query_key=query_key)
+            db.add(entry)
+        entry.results = results
+        entry.cached_at = datetime.utcnow()
+        entry.expires_at = expires_at
+        db.commit()
+        return entry
+
+    @classmethod
+    def cleanup_expired(cls, db: Session) -> int:
+        """
+        Delete all expired entries.
+
+        Args:
+            db: SQLAlchemy database session
+
+        Returns:
+            Number of expired entries deleted
+        """
+        expired_count = db.query(cls).filter(
+            cls.expires_at <= datetime.utcnow()
+        ).delete()
+        db.commit()
+        return expired_count
+
+    def __repr__(self) -> str:
+        return f"<TMDBSearchCache(query_key='{self.query_key}', results={len(self.results or [])})>"
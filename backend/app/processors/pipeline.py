@@ -27,23 +27,33 @@ Features:
     - Supports async/await for non-blocking operations
 """
 
+import asyncio
 import logging
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
+from ..config import config
+from ..database import commit_checkpoint
 from ..models.file_entry import FileEntry, Status, TrackerStatus
-from ..services.exceptions import TrackerAPIError, CloudflareBypassError, NetworkRetryableError, retry_on_network_error
+from ..services.exceptions import (
+    TrackerAPIError, CloudflareBypassError, NetworkRetryableError, RateLimitExceeded, retry_on_network_error
+)
 from ..services.nfo_validator import NFOValidator
 from ..services.nfo_generator import get_nfo_generator
 from ..services.metadata_mapper import MetadataMapper
 from ..services.options_mapper import OptionsMapper, get_options_mapper
 # C411OptionsMapper removed - all options mapping now via ConfigAdapter + OptionsMapper
 from ..adapters.tracker_adapter import TrackerAdapter
+from ..adapters.adapter_pool import get_adapter_pool
 from ..adapters.tracker_config_loader import get_config_loader
 from ..services.statistics_service import get_statistics_service
+from ..services.duplicate_check_service import check_duplicate_cached, get_duplicate_cache
+from ..services.rate_limiter import acquire_rate_limit, get_rate_limiter
+from .resource_pools import get_resource_pools, tracker_resource, HASHING, TMDB
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +68,9 @@ class ProcessingPipeline:
 
     Architecture:
         - Sequential stage processing with checkpoint validation
+        - Heavy stages (hashing, screenshots, TMDB, tracker uploads) hold a slot
+          of a shared resource pool, so stages of concurrently processed files
+          overlap within per-resource limits (see resource_pools.py)
         - Database-backed state persistence
         - Idempotent design allows safe retries
         - Comprehensive error handling and logging
@@ -156,7 +169,7 @@ class ProcessingPipeline:
                 if not file_entry.is_pending_approval():
                     # Set to pending approval and STOP pipeline
                     file_entry.mark_pending_approval()
-                    self.db.commit()
+                    await commit_checkpoint(self.db, file_entry)
                     logger.info("⏸ Pipeline paused - waiting for user approval")
                     logger.info(f"  Release: {file_entry.release_name}")
                     logger.info(f"  TMDB ID: {file_entry.tmdb_id}")
@@ -205,7 +218,8 @@ class ProcessingPipeline:
             error_msg = f"Pipeline failed at stage {file_entry.status.value} (retryable): {e}"
             logger.error(error_msg)
             file_entry.mark_failed(error_msg)
-            self.db.commit()
+            await commit_checkpoint(self.db, file_entry)
+            await get_statistics_service(self.db).record_file_finished(file_entry)
             # Re-raise as-is to allow upstream retry logic to handle it
             raise
 
@@ -214,7 +228,8 @@ class ProcessingPipeline:
             error_msg = f"Pipeline failed at stage {file_entry.status.value}: {e}"
             logger.error(error_msg)
             file_entry.mark_failed(error_msg)
-            self.db.commit()
+            await commit_checkpoint(self.db, file_entry)
+            await get_statistics_service(self.db).record_file_finished(file_entry)
             raise
 
         except Exception as e:
@@ -222,7 +237,8 @@ class ProcessingPipeline:
             error_msg = f"Unexpected error in pipeline at stage {file_entry.status.value}: {type(e).__name__}: {e}"
             logger.error(error_msg, exc_info=True)
             file_entry.mark_failed(error_msg)
-            self.db.commit()
+            await commit_checkpoint(self.db, file_entry)
+            await get_statistics_service(self.db).record_file_finished(file_entry)
             raise TrackerAPIError(error_msg) from e
 
     async def _scan_stage(self, file_entry: FileEntry) -> None:
@@ -317,7 +333,7 @@ class ProcessingPipeline:
 
         # Mark checkpoint and update status
         file_entry.mark_scanned()
-        self.db.commit()
+        await commit_checkpoint(self.db, file_entry)
         logger.debug(f"Scan checkpoint set at: {file_entry.scanned_at}")
 
     async def _analyze_stage(self, file_entry: FileEntry) -> None:
@@ -472,7 +488,8 @@ class ProcessingPipeline:
             from app.services.tmdb_cache_service import TMDBCacheService
             tmdb_service = TMDBCacheService(self.db)
             is_tv = mapping_result['parsed_metadata'].get('is_tv_show', False)
-            tmdb_data = await tmdb_service.search_and_get_metadata(str(file_path), is_tv_show=is_tv)
+            async with get_resource_pools().slot(TMDB):
+                tmdb_data = await tmdb_service.search_and_get_metadata(str(file_path), is_tv_show=is_tv)
 
             if tmdb_data:
                 # Store TMDB data in file_entry
@@ -513,7 +530,7 @@ class ProcessingPipeline:
 
         # Mark checkpoint and update status
         file_entry.mark_analyzed()
-        self.db.commit()
+        await commit_checkpoint(self.db, file_entry)
         logger.debug(f"Analysis checkpoint set at: {file_entry.analyzed_at}")
 
     def _infer_audio_language(self, filename: str, track_index: int, total_tracks: int) -> str:
@@ -580,6 +597,7 @@ class ProcessingPipeline:
         from app.models.settings import Settings
         from app.models.tracker import Tracker
         from ..services.hardlink_manager import get_hardlink_manager, HardlinkError
+        from ..services.file_preparation import FilePreparation
         from ..services.screenshot_generator import get_screenshot_generator, ScreenshotError
 
         logger.debug(f"Executing prepare files stage for: {file_entry.file_path}")
@@ -597,12 +615,17 @@ class ProcessingPipeline:
         hardlink_manager = get_hardlink_manager()
         output_dir = settings.resolve_path(settings.output_dir) if settings else None
 
+        # Shared by all targets: copies run in a worker thread, and every
+        # target that cannot be hardlinked to the source is hardlinked to a
+        # copy already made, so the file crosses a device boundary once
+        preparation = FilePreparation(str(file_path))
+
         # Step 1: Create main release structure (for screenshots/NFO)
         logger.info(f"Creating main release structure (hardlink_enabled={hardlink_enabled})...")
         try:
             if hardlink_enabled:
-                structure = hardlink_manager.create_release_structure(
-                    source_file=str(file_path),
+                structure = await hardlink_manager.prepare_release_structure(
+                    preparation=preparation,
                     release_name=release_name,
                     output_dir=output_dir
                 )
@@ -642,8 +665,8 @@ class ProcessingPipeline:
             tracker_output_dir = settings.resolve_path(tracker.hardlink_dir) or output_dir or str(file_path.parent)
 
             try:
-                tracker_result = hardlink_manager.create_tracker_release(
-                    source_file=str(file_path),
+                tracker_result = await hardlink_manager.prepare_tracker_release(
+                    preparation=preparation,
                     release_name=tracker_release_name,
                     output_dir=tracker_output_dir,
                     hardlink_enabled=hardlink_enabled,
@@ -686,11 +709,14 @@ class ProcessingPipeline:
             screenshot_generator = get_screenshot_generator()
 
             if screenshot_generator.is_available():
+                # Captures run concurrently, each holding an FFMPEG pool slot;
+                # the duration found by MediaInfo spares an ffprobe run
                 screenshot_paths = await screenshot_generator.generate_screenshots(
                     video_path=str(file_path),
                     output_dir=structure['screens_dir'],
                     release_name=release_name,
-                    count=4
+                    count=4,
+                    duration=(file_entry.mediainfo_data or {}).get('duration')
                 )
 
                 file_entry.set_screenshot_paths(screenshot_paths)
@@ -725,7 +751,7 @@ class ProcessingPipeline:
 
         # Mark checkpoint and update status
         file_entry.mark_preparing()
-        self.db.commit()
+        await commit_checkpoint(self.db, file_entry)
         logger.debug(f"Prepare files checkpoint set at: {file_entry.preparing_at}")
 
     async def _rename_stage(self, file_entry: FileEntry) -> None:
@@ -1000,7 +1026,7 @@ class ProcessingPipeline:
 
         # Mark checkpoint and update status
         file_entry.mark_renamed()
-        self.db.commit()
+        await commit_checkpoint(self.db, file_entry)
         logger.debug(f"Rename checkpoint set at: {file_entry.renamed_at}")
 
     async def _metadata_generation_stage(self, file_entry: FileEntry) -> None:
@@ -1233,15 +1259,16 @@ class ProcessingPipeline:
                     if per_tracker_media and os.path.exists(per_tracker_media):
                         tracker_file_paths[tracker.slug] = per_tracker_media
 
-                torrent_paths = await torrent_generator.generate_all(
-                    db=self.db,
-                    file_path=torrent_source_path,
-                    release_name=release_name,
-                    output_dir=torrent_base,
-                    tracker_release_names=tracker_release_names if tracker_release_names else None,
-                    tracker_output_dirs=tracker_output_dirs,
-                    tracker_file_paths=tracker_file_paths if tracker_file_paths else None
-                )
+                async with get_resource_pools().slot(HASHING):
+                    torrent_paths = await torrent_generator.generate_all(
+                        db=self.db,
+                        file_path=torrent_source_path,
+                        release_name=release_name,
+                        output_dir=torrent_base,
+                        tracker_release_names=tracker_release_names if tracker_release_names else None,
+                        tracker_output_dirs=tracker_output_dirs,
+                        tracker_file_paths=tracker_file_paths if tracker_file_paths else None
+                    )
 
                 if not torrent_paths:
                     raise TrackerAPIError(
@@ -1287,14 +1314,15 @@ class ProcessingPipeline:
             default_torrent_dir = os.path.join(torrent_base, 'default')
             os.makedirs(default_torrent_dir, exist_ok=True)
             try:
-                torrent_path = await torrent_generator.generate_single_tracker_torrent(
-                    file_path=torrent_source_path,
-                    announce_url=settings.announce_url,
-                    release_name=release_name,
-                    source_flag="seedarr",
-                    piece_size_strategy="auto",
-                    output_dir=default_torrent_dir
-                )
+                async with get_resource_pools().slot(HASHING):
+                    torrent_path = await torrent_generator.generate_single_tracker_torrent(
+                        file_path=torrent_source_path,
+                        announce_url=settings.announce_url,
+                        release_name=release_name,
+                        source_flag="seedarr",
+                        piece_size_strategy="auto",
+                        output_dir=default_torrent_dir
+                    )
 
                 file_entry.torrent_path = torrent_path
                 file_entry.set_torrent_path_for_tracker("default", torrent_path)
@@ -1332,7 +1360,7 @@ class ProcessingPipeline:
 
         # Mark checkpoint and update status
         file_entry.mark_metadata_generated()
-        self.db.commit()
+        await commit_checkpoint(self.db, file_entry)
 
         torrent_count = len(file_entry.get_torrent_paths())
         logger.info(
@@ -1345,8 +1373,8 @@ class ProcessingPipeline:
         """
         Stage 5: Upload to all enabled trackers.
 
-        This stage uploads the torrent to all enabled trackers:
-        - Loop through upload-enabled trackers
+        This stage uploads the torrent to all enabled trackers concurrently:
+        - Run one upload task per upload-enabled tracker
         - Authenticate with each tracker
         - Upload tracker-specific .torrent file
         - Track upload results per tracker
@@ -1356,7 +1384,8 @@ class ProcessingPipeline:
         - Uses TrackerFactory to get adapters for enabled trackers
         - Each tracker gets its specific .torrent file
         - Upload results stored per tracker in file_entry.upload_results
-        - Continues with other trackers if one fails
+        - Continues with other trackers if one fails or exceeds
+          PIPELINE_TRACKER_UPLOAD_TIMEOUT
 
         Args:
             file_entry: FileEntry to upload
@@ -1478,13 +1507,16 @@ class ProcessingPipeline:
                     file_entry.tracker_statuses = statuses
                     from sqlalchemy.orm.attributes import flag_modified
                     flag_modified(file_entry, 'tracker_statuses')
-        self.db.commit()
+        await commit_checkpoint(self.db, file_entry)
 
         # Create qBittorrent client for injection
         from ..services.qbittorrent_client import get_qbittorrent_client_from_settings
         qbit_client = get_qbittorrent_client_from_settings(settings)
+        qbit_injections: List[Dict[str, Any]] = []
 
-        for tracker in trackers:
+        async def _upload_to_tracker(tracker: Tracker) -> None:
+            """Authenticate, check duplicates and upload to one tracker."""
+            started = time.monotonic()
             logger.info(f"\n{'='*50}")
             logger.info(f"Uploading to tracker: {tracker.name}")
             logger.info(f"{'='*50}")
@@ -1565,9 +1597,9 @@ class ProcessingPipeline:
                     torrent_data = f.read()
                 logger.info(f"Loaded torrent: {torrent_path} ({len(torrent_data)} bytes)")
 
-                # Authenticate with tracker
+                # Authenticate with tracker (once per pooled session)
                 logger.info(f"Authenticating with {tracker.name}...")
-                authenticated = await adapter.authenticate()
+                authenticated = await get_adapter_pool().authenticate(adapter)
 
                 if not authenticated:
                     raise TrackerAPIError(
@@ -1579,7 +1611,8 @@ class ProcessingPipeline:
                 # Check for duplicates before upload
                 logger.info(f"Checking for duplicates on {tracker.name}...")
                 try:
-                    duplicate_result = await adapter.check_duplicate(
+                    duplicate_result = await check_duplicate_cached(
+                        tracker, adapter,
                         tmdb_id=tmdb_id,
                         imdb_id=file_entry.imdb_id if hasattr(file_entry, 'imdb_id') else None,
                         release_name=tracker_release_name,
@@ -1601,8 +1634,8 @@ class ProcessingPipeline:
                             status=TrackerStatus.SKIPPED_DUPLICATE.value,
                             error=f"EXACT duplicate: {len(exact_matches)} release(s) with same size"
                         )
-                        self.db.commit()
-                        continue  # Skip to next tracker - exact duplicate found
+                        await commit_checkpoint(self.db, file_entry)
+                        return  # Skip this tracker - exact duplicate found
 
                     # Similar releases (same movie, different quality) - just warn but allow upload
                     if duplicate_result.get('is_duplicate'):
@@ -1620,29 +1653,21 @@ class ProcessingPipeline:
                 except Exception as e:
                     logger.warning(f"Duplicate check failed for {tracker.name}: {e}, proceeding anyway")
 
-                # Per-tracker qBittorrent injection
+                # Per-tracker qBittorrent injection (sent in one batch after the loop)
                 inject_to_qbit = bool(tracker.inject_to_qbit) if tracker.inject_to_qbit is not None else True
                 qbit_status = 'skipped'
 
                 if inject_to_qbit and qbit_client:
-                    logger.info(f"Injecting torrent into qBittorrent for {tracker.name}...")
-                    try:
-                        # Use per-tracker release dir as save_path
-                        tracker_data = file_entry.get_tracker_status(tracker.slug) or {}
-                        save_path = tracker_data.get('release_dir') or file_entry.release_dir or str(Path(file_entry.file_path).parent)
-
-                        result = await qbit_client.inject_torrent(
-                            torrent_path=torrent_path,
-                            save_path=save_path,
-                            category="Seedarr",
-                            tags=tracker.name,
-                            skip_checking=True,
-                        )
-                        qbit_status = 'success' if result.get('success') else 'failed'
-                        logger.info(f"✓ Torrent injected to qBittorrent for {tracker.name}")
-                    except Exception as e:
-                        qbit_status = 'failed'
-                        logger.warning(f"qBittorrent injection failed for {tracker.name}: {e}")
+                    # Use per-tracker release dir as save_path
+                    tracker_data = file_entry.get_tracker_status(tracker.slug) or {}
+                    save_path = tracker_data.get('release_dir') or file_entry.release_dir or str(Path(file_entry.file_path).parent)
+                    qbit_injections.append({
+                        'tracker': tracker,
+                        'torrent_path': torrent_path,
+                        'save_path': save_path,
+                        'tags': tracker.name,
+                    })
+                    qbit_status = 'pending'
                 elif not inject_to_qbit:
                     qbit_status = 'manual'
                     logger.info(f"qBittorrent injection disabled for {tracker.name} - manual injection required")
@@ -1718,15 +1743,27 @@ class ProcessingPipeline:
                     upload_kwargs['description'] = bbcode_description
                     logger.info(f"BBCode description generated ({len(bbcode_description)} chars)")
 
-                result = await adapter.upload_torrent(**upload_kwargs)
+                async with get_resource_pools().slot(tracker_resource(tracker.slug)):
+                    # Never upload unthrottled: a token that cannot be had within the
+                    # limiter timeout fails this tracker with a retryable error
+                    # (RateLimitExceeded, raised by the bucket or here)
+                    rate_limit_service = tracker_resource(tracker.slug)
+                    if not await acquire_rate_limit(rate_limit_service):
+                        raise RateLimitExceeded(
+                            rate_limit_service,
+                            get_rate_limiter().get_bucket(rate_limit_service).time_until_available
+                        )
+                    result = await adapter.upload_torrent(**upload_kwargs)
 
                 if result.get('success'):
                     # Store upload result with SUCCESS status
+                    duration = time.monotonic() - started
                     file_entry.set_tracker_status(
                         tracker_slug=tracker.slug,
                         status=TrackerStatus.SUCCESS.value,
                         torrent_id=str(result['torrent_id']),
-                        torrent_url=result['torrent_url']
+                        torrent_url=result['torrent_url'],
+                        duration=duration
                     )
 
                     # Also set legacy fields for first successful upload
@@ -1741,68 +1778,84 @@ class ProcessingPipeline:
                         f"{result['torrent_url']}"
                     )
 
+                    # Cached "no duplicate" results of this tracker are now stale
+                    get_duplicate_cache().invalidate(tracker.id)
+
                     # Record statistics for successful upload
-                    stats_service = get_statistics_service(self.db)
-                    stats_service.record_upload(
-                        success=True,
-                        tracker_name=tracker.slug,
-                        bytes_processed=file_entry.file_size or 0
-                    )
+                    await get_statistics_service(self.db).record_tracker_upload(tracker.slug, True, duration)
                 else:
                     error_msg = result.get('message', 'Unknown error')
                     logger.error(f"✗ Upload to {tracker.name} failed: {error_msg}")
+                    duration = time.monotonic() - started
                     file_entry.set_tracker_status(
                         tracker_slug=tracker.slug,
                         status=TrackerStatus.FAILED.value,
-                        error=error_msg
+                        error=error_msg,
+                        duration=duration
                     )
 
                     # Record statistics for failed upload
-                    stats_service = get_statistics_service(self.db)
-                    stats_service.record_upload(
-                        success=False,
-                        tracker_name=tracker.slug,
-                        bytes_processed=file_entry.file_size or 0
-                    )
+                    await get_statistics_service(self.db).record_tracker_upload(tracker.slug, False, duration)
 
-                self.db.commit()
+                await commit_checkpoint(self.db, file_entry)
 
             except (TrackerAPIError, CloudflareBypassError, NetworkRetryableError) as e:
                 error_msg = getattr(e, 'message', str(e))
                 logger.error(f"✗ Upload to {tracker.name} failed: {e}")
+                if isinstance(e, CloudflareBypassError) or getattr(e, 'status_code', None) in (401, 403):
+                    # Session rejected: start a new one for the next file
+                    get_adapter_pool().invalidate(tracker.id)
+                duration = time.monotonic() - started
                 file_entry.set_tracker_status(
                     tracker_slug=tracker.slug,
                     status=TrackerStatus.FAILED.value,
-                    error=error_msg
+                    error=error_msg,
+                    duration=duration
                 )
                 # Record statistics for failed upload
-                stats_service = get_statistics_service(self.db)
-                stats_service.record_upload(
-                    success=False,
-                    tracker_name=tracker.slug,
-                    bytes_processed=file_entry.file_size or 0
-                )
-                self.db.commit()
-                # Continue with other trackers
-                continue
+                await get_statistics_service(self.db).record_tracker_upload(tracker.slug, False, duration)
+                await commit_checkpoint(self.db, file_entry)
+                return
 
             except Exception as e:
                 error_msg = f"{type(e).__name__}: {e}"
                 logger.error(f"✗ Unexpected error uploading to {tracker.name}: {error_msg}")
+                duration = time.monotonic() - started
                 file_entry.set_tracker_status(
                     tracker_slug=tracker.slug,
                     status=TrackerStatus.FAILED.value,
-                    error=error_msg
+                    error=error_msg,
+                    duration=duration
                 )
                 # Record statistics for failed upload
-                stats_service = get_statistics_service(self.db)
-                stats_service.record_upload(
-                    success=False,
-                    tracker_name=tracker.slug,
-                    bytes_processed=file_entry.file_size or 0
+                await get_statistics_service(self.db).record_tracker_upload(tracker.slug, False, duration)
+                await commit_checkpoint(self.db, file_entry)
+                return
+
+        async def _upload_with_timeout(tracker: Tracker) -> None:
+            try:
+                await asyncio.wait_for(_upload_to_tracker(tracker), timeout=upload_timeout)
+            except asyncio.TimeoutError:
+                error_msg = f"Upload timed out after {upload_timeout:.0f}s"
+                logger.error(f"✗ Upload to {tracker.name} failed: {error_msg}")
+                file_entry.set_tracker_status(
+                    tracker_slug=tracker.slug,
+                    status=TrackerStatus.FAILED.value,
+                    error=error_msg,
+                    duration=upload_timeout
                 )
-                self.db.commit()
-                continue
+                # Record statistics for failed upload
+                await get_statistics_service(self.db).record_tracker_upload(tracker.slug, False, upload_timeout)
+                await commit_checkpoint(self.db, file_entry)
+
+        # Upload to all trackers concurrently; each tracker commits its own
+        # status as soon as it finishes, so a slow tracker does not hold the others
+        upload_timeout = config.PIPELINE_TRACKER_UPLOAD_TIMEOUT
+        await asyncio.gather(*[_upload_with_timeout(tracker) for tracker in trackers])
+
+        # Inject the torrents of all non-duplicate trackers into qBittorrent at once
+        if qbit_injections:
+            await self._inject_qbit_batch(file_entry, qbit_client, qbit_injections)
 
         # Report results using granular statuses
         successful_trackers = file_entry.get_successful_trackers()
@@ -1821,7 +1874,8 @@ class ProcessingPipeline:
         # Mark as uploaded if at least one succeeded
         if successful_trackers:
             file_entry.mark_uploaded()
-            self.db.commit()
+            await commit_checkpoint(self.db, file_entry)
+            await get_statistics_service(self.db).record_file_finished(file_entry)
             logger.info(f"✓ Upload stage completed ({len(successful_trackers)} tracker(s))")
         elif skipped_trackers and not failed_trackers:
             # All trackers were skipped due to duplicates - this is not a failure
@@ -1898,7 +1952,8 @@ class ProcessingPipeline:
                 torrent_url=result['torrent_url']
             )
             file_entry.mark_uploaded()
-            self.db.commit()
+            await commit_checkpoint(self.db, file_entry)
+            await get_statistics_service(self.db).record_file_finished(file_entry)
         else:
             raise TrackerAPIError(f"Upload failed: {result.get('message')}")
 
@@ -1958,6 +2013,49 @@ class ProcessingPipeline:
         except QBittorrentError as e:
             raise TrackerAPIError(str(e)) from e
 
+    async def _inject_qbit_batch(
+        self,
+        file_entry: FileEntry,
+        qbit_client,
+        injections: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Inject the per-tracker torrents of a release into qBittorrent in one batch.
+
+        Failures are logged and recorded as qbit_status, they do not fail the upload.
+
+        Args:
+            file_entry: FileEntry being uploaded
+            qbit_client: QBittorrentClient instance
+            injections: Dicts with 'tracker', 'torrent_path', 'save_path' and 'tags' keys
+        """
+        tracker_names = ', '.join(item['tracker'].name for item in injections)
+        logger.info(f"Injecting {len(injections)} torrent(s) into qBittorrent ({tracker_names})...")
+
+        try:
+            results = await qbit_client.inject_torrents(
+                [{k: item[k] for k in ('torrent_path', 'save_path', 'tags')} for item in injections],
+                category="Seedarr",
+                skip_checking=True,
+            )
+        except Exception as e:
+            logger.warning(f"qBittorrent injection failed for {tracker_names}: {e}")
+            results = [{'success': False}] * len(injections)
+
+        statuses = file_entry.get_tracker_statuses()
+        for item, result in zip(injections, results):
+            tracker = item['tracker']
+            if result.get('success'):
+                logger.info(f"✓ Torrent injected to qBittorrent for {tracker.name}")
+            elif result.get('message'):
+                logger.warning(f"qBittorrent injection failed for {tracker.name}: {result['message']}")
+            if tracker.slug in statuses:
+                statuses[tracker.slug]['qbit_status'] = 'success' if result.get('success') else 'failed'
+        file_entry.tracker_statuses = statuses
+        from sqlalchemy.orm.attributes import flag_modified
+        flag_modified(file_entry, 'tracker_statuses')
+        await commit_checkpoint(self.db, file_entry)
+
     def reset_checkpoint(self, file_entry: FileEntry, from_stage: Status) -> None:
         """
         Reset file entry to retry from a specific checkpoint.
@@ -2405,7 +2503,8 @@ class ProcessingPipeline:
                     template.content,
                     media_data,
                     tmdb_data_obj,
-                    extra_variables=extra_vars if extra_vars else None
+                    extra_variables=extra_vars if extra_vars else None,
+                    template_id=template.id
                 )
             else:
                 # Use built-in default generator
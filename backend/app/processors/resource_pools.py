@@ -0,0 +1,162 @@
+"""
+Resource Pools for the ProcessingPipeline
+
+The queue worker runs several files through ProcessingPipeline at once. Each
+file still goes through its stages in order, but the heavy resources are
+shared between files through bounded pools, so stages of different files
+overlap: file B can be hashed while file A is uploading, and screenshots of
+file C can be captured meanwhile.
+
+Each resource class has its own concurrency limit; files waiting for a busy
+resource queue on its pool (FIFO) while files at other stages keep running.
+
+Resource Classes:
+    - "hashing": .torrent piece hashing (CPU/disk bound)
+    - "ffmpeg": ffmpeg / ffprobe processes (one slot per screenshot capture)
+    - "tmdb": TMDB lookups
+    - "tracker:<slug>": uploads to one tracker (one pool per tracker)
+
+Limits are configured through environment variables (see app.config):
+    PIPELINE_HASHING_CONCURRENCY, PIPELINE_FFMPEG_CONCURRENCY,
+    PIPELINE_TMDB_CONCURRENCY, PIPELINE_TRACKER_CONCURRENCY
+
+Usage Example:
+    >>> pools = get_resource_pools()
+    >>> async with pools.slot(HASHING):
+    ...     await torrent_generator.generate_all(...)
+    >>> async with pools.slot(tracker_resource("lacale")):
+    ...     await adapter.upload_torrent(...)
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# Resource class names
+HASHING = "hashing"
+FFMPEG = "ffmpeg"
+TMDB = "tmdb"
+TRACKER_PREFIX = "tracker:"
+
+
+def tracker_resource(tracker_slug: str) -> str:
+    """Return the resource name of a tracker's upload pool."""
+    return f"{TRACKER_PREFIX}{tracker_slug}"
+
+
+class ResourcePools:
+    """
+    Named, bounded concurrency pools shared by all running pipelines.
+
+    Pools are created lazily on first use. Tracker pools all use the same
+    per-tracker limit, so each tracker is throttled independently.
+    """
+
+    def __init__(self, limits: Dict[str, int], tracker_limit: int = 1):
+        """
+        Initialize resource pools.
+
+        Args:
+            limits: Concurrency limit per resource class
+            tracker_limit: Concurrency limit applied to every tracker pool
+        """
+        self.limits = {name: max(1, int(limit)) for name, limit in limits.items()}
+        self.tracker_limit = max(1, int(tracker_limit))
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._active: Dict[str, int] = {}
+        self._waiting: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_limit(self, resource: str) -> int:
+        """Get the concurrency limit of a resource."""
+        if resource.startswith(TRACKER_PREFIX):
+            return self.tracker_limit
+        return self.limits.get(resource, 1)
+
+    def _get_semaphore(self, resource: str) -> asyncio.Semaphore:
+        # asyncio primitives are bound to one event loop; start fresh if the
+        # loop changed (e.g. between test cases)
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores.clear()
+            self._active.clear()
+            self._waiting.clear()
+
+        semaphore = self._semaphores.get(resource)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.get_limit(resource))
+            self._semaphores[resource] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, resource: str) -> AsyncIterator[None]:
+        """
+        Hold one slot of a resource pool for the duration of the block.
+
+        Args:
+            resource: Resource name (e.g. HASHING or tracker_resource(slug))
+        """
+        semaphore = self._get_semaphore(resource)
+
+        if semaphore.locked():
+            logger.info(f"Waiting for {resource} slot ({self.get_limit(resource)} in use)")
+
+        self._waiting[resource] = self._waiting.get(resource, 0) + 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting[resource] -= 1
+
+        self._active[resource] = self._active.get(resource, 0) + 1
+        try:
+            yield
+        finally:
+            self._active[resource] -= 1
+            semaphore.release()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get pool usage statistics.
+
+        Returns:
+            Dictionary mapping resource name to limit/active/waiting counts
+        """
+        resources = set(self.limits) | set(self._semaphores)
+        return {
+            resource: {
+                "limit": self.get_limit(resource),
+                "active": self._active.get(resource, 0),
+                "waiting": self._waiting.get(resource, 0),
+            }
+            for resource in sorted(resources)
+        }
+
+
+# Global resource pools instance
+_resource_pools: Optional[ResourcePools] = None
+
+
+def get_resource_pools() -> ResourcePools:
+    """
+    Get the process-wide ResourcePools instance.
+
+    Returns:
+        ResourcePools configured from app.config
+    """
+    global _resource_pools
+    if _resource_pools is None:
+        _resource_pools = ResourcePools(
+            limits={
+                HASHING: config.PIPELINE_HASHING_CONCURRENCY,
+                FFMPEG: config.PIPELINE_FFMPEG_CONCURRENCY,
+                TMDB: config.PIPELINE_TMDB_CONCURRENCY,
+            },
+            tracker_limit=config.PIPELINE_TRACKER_CONCURRENCY,
+        )
+    return _resource_pools
@@ -138,6 +138,10 @@ class BatchService:
 
         logger.info(f"Batch {batch_id} started, added {added} files to queue")
 
+        if added:
+            from app.workers.queue_worker import notify_queue_worker
+            notify_queue_worker()
+
         return {
             'success': True,
             'batch_id': batch_id,
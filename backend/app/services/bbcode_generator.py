@@ -18,12 +18,12 @@ Example output:
     ...
 """
 
-import re
 import logging
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Callable, List, Union
 from dataclasses import dataclass
 
 from .nfo_generator import MediaInfoData, NFOGenerator, get_nfo_generator
+from .template_engine import TemplateVariables, compile_template
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +179,34 @@ class BBCodeGenerator:
         "vostfr": "VOSTFR",
     }
 
+    # Variables of the TMDB section when there is no TMDB data
+    EMPTY_TMDB_VARIABLES = {
+        "title": "Titre",
+        "original_title": "",
+        "year": "",
+        "release_date": "",
+        "poster_url": "https://via.placeholder.com/500x750?text=No+Image",
+        "backdrop_url": "",
+        "rating": "0",
+        "rating_10": "0/10",
+        "genres": "",
+        "overview": "",
+        "tagline": "",
+        "runtime": "",
+        "country": "",
+        "director": "",
+        "tmdb_id": "",
+        "imdb_id": "",
+        "tmdb_url": "",
+        "trailer_url": "",
+        "cast_names": "",
+        **{
+            f"cast_{i}_{field}": ""
+            for i in range(1, 7)
+            for field in ("name", "character", "photo", "card")
+        },
+    }
+
     def __init__(self):
         """Initialize BBCodeGenerator."""
         self.nfo_generator = get_nfo_generator()
@@ -722,105 +750,116 @@ class BBCodeGenerator:
         self,
         media_data: MediaInfoData,
         tmdb_data: Optional[TMDBData] = None
-    ) -> Dict[str, str]:
+    ) -> TemplateVariables:
         """
-        Build a dictionary of template variables from media and TMDB data.
+        Build the template variables from media and TMDB data.
+
+        Values are computed on first access, so rendering a template only
+        builds the variables it references (audio/subtitle tables, quality
+        and source detection are skipped when unused).
 
         Args:
             media_data: MediaInfoData object with technical information
             tmdb_data: Optional TMDBData object with movie/show metadata
 
         Returns:
-            Dictionary mapping variable names to their values
+            Mapping of variable names to their values
         """
-        variables = {}
-
-        # TMDB variables
         if tmdb_data:
-            # Poster URL handling
-            poster_url = tmdb_data.poster_url
-            if poster_url and not poster_url.startswith("http"):
-                poster_url = f"https://image.tmdb.org/t/p/w500{poster_url}"
-
-            # Backdrop URL handling
-            backdrop_url = tmdb_data.backdrop_url
-            if backdrop_url and not backdrop_url.startswith("http"):
-                backdrop_url = f"https://image.tmdb.org/t/p/w1280{backdrop_url}"
-
-            variables["title"] = tmdb_data.title or "Titre"
-            variables["original_title"] = tmdb_data.original_title or tmdb_data.title or ""
-            variables["year"] = str(tmdb_data.year) if tmdb_data.year else ""
-            variables["release_date"] = tmdb_data.release_date or ""
-            variables["poster_url"] = poster_url or "https://via.placeholder.com/500x750?text=No+Image"
-            variables["backdrop_url"] = backdrop_url or ""
-            variables["rating"] = str(tmdb_data.vote_average) if tmdb_data.vote_average else "0"
-            variables["rating_10"] = f"{tmdb_data.vote_average}/10" if tmdb_data.vote_average else "0/10"
-            variables["genres"] = ", ".join(tmdb_data.genres) if tmdb_data.genres else ""
-            variables["overview"] = tmdb_data.overview or ""
-            variables["tagline"] = tmdb_data.tagline or ""
-            variables["runtime"] = tmdb_data.runtime_formatted or ""
-            variables["country"] = tmdb_data.country or ""
-            variables["director"] = tmdb_data.director or ""
-            variables["tmdb_id"] = tmdb_data.tmdb_id or ""
-            variables["imdb_id"] = tmdb_data.imdb_id or ""
-            variables["tmdb_url"] = tmdb_data.tmdb_url or f"https://www.themoviedb.org/movie/{tmdb_data.tmdb_id}" if tmdb_data.tmdb_id else ""
-            variables["trailer_url"] = tmdb_data.trailer_url or ""
-
-            # Cast names list
-            cast_names = []
-            for i, cast_member in enumerate(tmdb_data.cast[:6] if tmdb_data.cast else []):
-                cast_names.append(cast_member.name)
-            variables["cast_names"] = ", ".join(cast_names)
-
-            # Cast variables (6 actors)
-            for i in range(1, 7):
-                if tmdb_data.cast and len(tmdb_data.cast) >= i:
-                    cast_member = tmdb_data.cast[i - 1]
-                    variables[f"cast_{i}_name"] = cast_member.name
-                    variables[f"cast_{i}_character"] = cast_member.character
-                    variables[f"cast_{i}_photo"] = cast_member.photo_url
-                    # Card: inline format - just photo (name can be added separately or via cast_names)
-                    # No line breaks to allow horizontal display when cards are placed together
-                    variables[f"cast_{i}_card"] = f"[img]{cast_member.photo_url}[/img]"
-                else:
-                    variables[f"cast_{i}_name"] = ""
-                    variables[f"cast_{i}_character"] = ""
-                    variables[f"cast_{i}_photo"] = ""
-                    variables[f"cast_{i}_card"] = ""
+            values = {}
+            providers = self._tmdb_variable_providers(tmdb_data)
         else:
-            variables["title"] = "Titre"
-            variables["original_title"] = ""
-            variables["year"] = ""
-            variables["release_date"] = ""
-            variables["poster_url"] = "https://via.placeholder.com/500x750?text=No+Image"
-            variables["backdrop_url"] = ""
-            variables["rating"] = "0"
-            variables["rating_10"] = "0/10"
-            variables["genres"] = ""
-            variables["overview"] = ""
-            variables["tagline"] = ""
-            variables["runtime"] = ""
-            variables["country"] = ""
-            variables["director"] = ""
-            variables["tmdb_id"] = ""
-            variables["imdb_id"] = ""
-            variables["tmdb_url"] = ""
-            variables["trailer_url"] = ""
-            variables["cast_names"] = ""
-            # Empty cast variables (6 actors)
-            for i in range(1, 7):
-                variables[f"cast_{i}_name"] = ""
-                variables[f"cast_{i}_character"] = ""
-                variables[f"cast_{i}_photo"] = ""
-                variables[f"cast_{i}_card"] = ""
+            values = dict(self.EMPTY_TMDB_VARIABLES)
+            providers = {}
 
         # MediaInfo variables
-        variables["quality"] = self._get_quality_string(media_data)
-        variables["format"] = media_data.format or "MKV"
-        variables["video_codec"] = media_data.video_tracks[0].format if media_data.video_tracks else ""
-        variables["video_bitrate"] = media_data.video_tracks[0].bitrate if media_data.video_tracks else ""
+        video = media_data.video_tracks[0] if media_data.video_tracks else None
+        providers.update({
+            "quality": lambda: self._get_quality_string(media_data),
+            "format": lambda: media_data.format or "MKV",
+            "video_codec": lambda: video.format if video else "",
+            "video_bitrate": lambda: video.bitrate if video else "",
+            "resolution": lambda: self._get_resolution_string(media_data),
+            "hdr": lambda: self._get_hdr_string(media_data),
+            "duration": lambda: media_data.duration or "",
+            "audio_list": lambda: "\n".join(self._get_audio_codec_list(media_data)),
+            "audio_table": lambda: self._build_audio_table(media_data),
+            "languages": lambda: self._get_languages_string(media_data),
+            "subtitles": lambda: self._get_subtitles_string(media_data),
+            "subtitles_table": lambda: self._build_subtitles_table(media_data),
+            "file_size": lambda: media_data.file_size or "",
+            "source": lambda: self._detect_source_from_filename(media_data.file_name),
+        })
+        values["file_count"] = "1"  # Default, will be updated by pipeline for multi-file releases
 
-        # Resolution: prefer MediaInfo but fallback to filename detection
+        # Release info (extracted from filename)
+        file_name = media_data.file_name or ""
+        base_name = file_name.rsplit(".", 1)[0] if "." in file_name else file_name
+        values["release_name"] = base_name
+        # Extract team from release name (after last hyphen)
+        values["release_team"] = base_name.rsplit("-", 1)[-1] if "-" in base_name else ""
+
+        return TemplateVariables(values, providers)
+
+    def _tmdb_variable_providers(self, tmdb_data: TMDBData) -> Dict[str, Callable[[], str]]:
+        """Build the providers of the TMDB template variables."""
+        def poster_url() -> str:
+            url = tmdb_data.poster_url
+            if url and not url.startswith("http"):
+                url = f"https://image.tmdb.org/t/p/w500{url}"
+            return url or "https://via.placeholder.com/500x750?text=No+Image"
+
+        def backdrop_url() -> str:
+            url = tmdb_data.backdrop_url
+            if url and not url.startswith("http"):
+                url = f"https://image.tmdb.org/t/p/w1280{url}"
+            return url or ""
+
+        providers = {
+            "title": lambda: tmdb_data.title or "Titre",
+            "original_title": lambda: tmdb_data.original_title or tmdb_data.title or "",
+            "year": lambda: str(tmdb_data.year) if tmdb_data.year else "",
+            "release_date": lambda: tmdb_data.release_date or "",
+            "poster_url": poster_url,
+            "backdrop_url": backdrop_url,
+            "rating": lambda: str(tmdb_data.vote_average) if tmdb_data.vote_average else "0",
+            "rating_10": lambda: f"{tmdb_data.vote_average}/10" if tmdb_data.vote_average else "0/10",
+            "genres": lambda: ", ".join(tmdb_data.genres) if tmdb_data.genres else "",
+            "overview": lambda: tmdb_data.overview or "",
+            "tagline": lambda: tmdb_data.tagline or "",
+            "runtime": lambda: tmdb_data.runtime_formatted or "",
+            "country": lambda: tmdb_data.country or "",
+            "director": lambda: tmdb_data.director or "",
+            "tmdb_id": lambda: tmdb_data.tmdb_id or "",
+            "imdb_id": lambda: tmdb_data.imdb_id or "",
+            "tmdb_url": lambda: (
+                tmdb_data.tmdb_url or f"https://www.themoviedb.org/movie/{tmdb_data.tmdb_id}"
+                if tmdb_data.tmdb_id else ""
+            ),
+            "trailer_url": lambda: tmdb_data.trailer_url or "",
+            # Cast names list
+            "cast_names": lambda: ", ".join(member.name for member in (tmdb_data.cast or [])[:6]),
+        }
+
+        # Cast variables (6 actors)
+        cast = tmdb_data.cast or []
+        for i in range(1, 7):
+            if len(cast) >= i:
+                member = cast[i - 1]
+                providers[f"cast_{i}_name"] = lambda member=member: member.name
+                providers[f"cast_{i}_character"] = lambda member=member: member.character
+                providers[f"cast_{i}_photo"] = lambda member=member: member.photo_url
+                # Card: inline format - just photo (name can be added separately or via cast_names)
+                # No line breaks to allow horizontal display when cards are placed together
+                providers[f"cast_{i}_card"] = lambda member=member: f"[img]{member.photo_url}[/img]"
+            else:
+                for field in ("name", "character", "photo", "card"):
+                    providers[f"cast_{i}_{field}"] = lambda: ""
+
+        return providers
+
+    def _get_resolution_string(self, media_data: MediaInfoData) -> str:
+        """Resolution (WxH): prefer MediaInfo but fallback to filename detection."""
         if media_data.video_tracks and media_data.video_tracks[0].width and media_data.video_tracks[0].height:
             width = media_data.video_tracks[0].width
             height = media_data.video_tracks[0].height
@@ -831,38 +870,14 @@ class BBCodeGenerator:
                 height = filename_height
                 width = int(height * 16 / 9)
                 logger.debug(f"Resolution adjusted from MediaInfo to filename: {width}x{height}")
-            variables["resolution"] = f"{width}x{height}"
-        else:
-            # Fallback to filename detection
-            filename_height, _, _ = self._detect_resolution_from_filename(media_data.file_name)
-            if filename_height:
-                width = int(filename_height * 16 / 9)
-                variables["resolution"] = f"{width}x{filename_height}"
-            else:
-                variables["resolution"] = ""
-
-        variables["hdr"] = self._get_hdr_string(media_data)
-        variables["duration"] = media_data.duration or ""
-        variables["audio_list"] = "\n".join(self._get_audio_codec_list(media_data))
-        variables["audio_table"] = self._build_audio_table(media_data)
-        variables["languages"] = self._get_languages_string(media_data)
-        variables["subtitles"] = self._get_subtitles_string(media_data)
-        variables["subtitles_table"] = self._build_subtitles_table(media_data)
-        variables["file_size"] = media_data.file_size or ""
-        variables["file_count"] = "1"  # Default, will be updated by pipeline for multi-file releases
-        variables["source"] = self._detect_source_from_filename(media_data.file_name)
+            return f"{width}x{height}"
 
-        # Release info (extracted from filename)
-        file_name = media_data.file_name or ""
-        base_name = file_name.rsplit(".", 1)[0] if "." in file_name else file_name
-        variables["release_name"] = base_name
-        # Extract team from release name (after last hyphen)
-        if "-" in base_name:
-            variables["release_team"] = base_name.rsplit("-", 1)[-1]
-        else:
-            variables["release_team"] = ""
-
-        return variables
+        # Fallback to filename detection
+        filename_height, _, _ = self._detect_resolution_from_filename(media_data.file_name)
+        if filename_height:
+            width = int(filename_height * 16 / 9)
+            return f"{width}x{filename_height}"
+        return ""
 
     def _detect_source_from_filename(self, filename: str) -> str:
         """Detect media source from filename."""
@@ -908,16 +923,21 @@ class BBCodeGenerator:
         template_content: str,
         media_data: MediaInfoData,
         tmdb_data: Optional[TMDBData] = None,
-        extra_variables: Optional[Dict[str, str]] = None
+        extra_variables: Optional[Dict[str, str]] = None,
+        template_id: Optional[int] = None
     ) -> str:
         """
         Render a BBCode template by replacing placeholders with actual data.
 
+        The template is compiled once (see template_engine.py) and rendered
+        in a single pass; only the variables it references are computed.
+
         Args:
             template_content: BBCode template with {{placeholder}} syntax
             media_data: MediaInfoData object with technical information
             tmdb_data: Optional TMDBData object with movie/show metadata
             extra_variables: Optional dict of additional variables to override/add
+            template_id: ID of the stored template (compiled template cache key)
 
         Returns:
             Rendered BBCode string with placeholders replaced
@@ -928,36 +948,14 @@ class BBCodeGenerator:
         if extra_variables:
             variables.update(extra_variables)
 
-        result = template_content
-
-        # Process conditional blocks {{#var}}...{{/var}}
-        # If variable is non-empty, keep the content; otherwise remove the block
-        def replace_conditional(match):
-            var_name = match.group(1)
-            content = match.group(2)
-            value = variables.get(var_name, "")
-            if value:
-                return content
-            return ""
-
-        result = re.sub(
-            r'\{\{#(\w+)\}\}([\s\S]*?)\{\{/\1\}\}',
-            replace_conditional,
-            result
-        )
-
-        # Replace all {{variable}} placeholders
-        for var_name, var_value in variables.items():
-            pattern = r'\{\{' + re.escape(var_name) + r'\}\}'
-            result = re.sub(pattern, str(var_value), result)
-
-        return result
+        return compile_template(template_content, template_id).render(variables)
 
     async def generate_from_template(
         self,
         template_content: str,
         file_path: str,
-        tmdb_data: Optional[Dict[str, Any]] = None
+        tmdb_data: Optional[Dict[str, Any]] = None,
+        template_id: Optional[int] = None
     ) -> str:
         """
         Generate BBCode from a template and media file.
@@ -966,6 +964,7 @@ class BBCodeGenerator:
             template_content: BBCode template with {{placeholder}} syntax
             file_path: Path to the media file
             tmdb_data: Optional dictionary with TMDB metadata
+            template_id: ID of the stored template (compiled template cache key)
 
         Returns:
             Rendered BBCode string
@@ -989,7 +988,7 @@ class BBCodeGenerator:
                 cast=self._convert_cast_from_dict(tmdb_data.get("cast", [])),
             )
 
-        return self.render_template(template_content, media_data, tmdb)
+        return self.render_template(template_content, media_data, tmdb, template_id=template_id)
 
     def preview_template(
         self,
@@ -1004,6 +1003,16 @@ class BBCodeGenerator:
         Returns:
             Rendered BBCode string with sample data
         """
+        sample_media, sample_tmdb = self.get_sample_data()
+        return self.render_template(template_content, sample_media, sample_tmdb)
+
+    def get_sample_data(self) -> tuple[MediaInfoData, TMDBData]:
+        """
+        Get the sample media and TMDB data used by template previews.
+
+        Returns:
+            Tuple of (MediaInfoData, TMDBData)
+        """
         # Create sample cast data (Harry Potter and the Order of the Phoenix)
         sample_cast = [
             CastMember(
@@ -1112,7 +1121,7 @@ class BBCodeGenerator:
             subtitle_tracks=[sample_sub_fr, sample_sub_en],
         )
 
-        return self.render_template(template_content, sample_media, sample_tmdb)
+        return sample_media, sample_tmdb
 
 
 # Singleton instance
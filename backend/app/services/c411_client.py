@@ -61,6 +61,7 @@ import re
 from typing import Dict, Any, Optional, List, Union
 
 from .exceptions import TrackerAPIError, NetworkRetryableError, retry_on_network_error
+from .http_client_pool import pooled_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -210,13 +211,13 @@ class C411Client:
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.tracker_url) as client:
                 # Try to access the upload endpoint - we expect 405 Method Not Allowed
                 # if credentials are valid (since it only accepts POST)
                 url = f"{self.tracker_url}{self.UPLOAD_ENDPOINT}"
                 headers = self._get_headers()
 
-                response = await client.get(url, headers=headers)
+                response = await client.get(url, headers=headers, timeout=self.timeout)
 
                 logger.debug(f"C411 validation response: {response.status_code}")
 
@@ -339,7 +340,7 @@ class C411Client:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.tracker_url) as client:
                 # Prepare multipart form data
                 files = {
                     "torrent": (
@@ -401,7 +402,8 @@ class C411Client:
                     f"{self.tracker_url}{self.UPLOAD_ENDPOINT}",
                     headers=self._get_headers(),
                     files=files,
-                    data=data
+                    data=data,
+                    timeout=self.timeout
                 )
 
                 logger.debug(f"C411 response status: {response.status_code}")
@@ -526,10 +528,11 @@ class C411Client:
         logger.info("Fetching C411 categories...")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.tracker_url) as client:
                 response = await client.get(
                     f"{self.tracker_url}{self.CATEGORIES_ENDPOINT}",
-                    headers=self._get_headers()
+                    headers=self._get_headers(),
+                    timeout=self.timeout
                 )
 
                 if response.status_code != 200:
@@ -594,7 +597,7 @@ class C411Client:
         logger.info(f"Searching C411 via Torznab API: query={query}, type={search_type}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.tracker_url) as client:
                 # Build Torznab search parameters
                 params = {
                     "apikey": self.api_key,
@@ -618,7 +621,7 @@ class C411Client:
                 url = f"{self.tracker_url}{self.TORZNAB_ENDPOINT}"
                 logger.debug(f"Torznab search URL: {url} with params: {params}")
 
-                response = await client.get(url, params=params)
+                response = await client.get(url, params=params, timeout=self.timeout)
 
                 logger.debug(f"C411 Torznab response: {response.status_code}")
 
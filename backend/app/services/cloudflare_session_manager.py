@@ -12,6 +12,9 @@ Features:
     - Automatic retry with exponential backoff
     - Health check monitoring
     - Comprehensive error handling with typed exceptions
+    - Clearance cache (ClearanceCache): solved cookies and user agent reused per
+      domain until cf_clearance expires, concurrent solves coalesced into one,
+      persisted in the database, invalidated when a challenge page comes back
 
 Circuit Breaker States:
     - CLOSED: Normal operation, requests go through
@@ -21,7 +24,8 @@ Circuit Breaker States:
 Usage:
     manager = CloudflareSessionManager(
         flaresolverr_url="http://localhost:8191",
-        max_timeout=60000
+        max_timeout=60000,
+        clearance_cache=get_clearance_cache()
     )
 
     # Get authenticated session with cookies
@@ -37,9 +41,12 @@ Usage:
 import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable, Mapping
+from urllib.parse import urlparse
 import requests
 from requests import Session
 
@@ -60,6 +67,232 @@ class CircuitBreakerState(Enum):
     HALF_OPEN = "half_open"  # Testing service recovery
 
 
+# Treat a clearance as expired slightly before Cloudflare does
+CLEARANCE_EXPIRY_MARGIN = timedelta(seconds=60)
+
+# Markers of a Cloudflare challenge/interstitial page
+_CHALLENGE_MARKERS = ("Just a moment...", "cf-chl", "challenge-platform", "cf_chl_opt")
+
+
+def clearance_domain(url: str) -> str:
+    """Get the cache key (domain) of a tracker URL."""
+    return (urlparse(url).hostname or url).lower()
+
+
+def is_cloudflare_challenge(
+    status_code: int,
+    headers: Mapping[str, str],
+    body: Optional[str] = None
+) -> bool:
+    """
+    Check whether a response is a Cloudflare challenge page.
+
+    Args:
+        status_code: HTTP status code
+        headers: Response headers (case-insensitive mapping)
+        body: Response body text, if available
+
+    Returns:
+        True if Cloudflare answered with a challenge instead of the content
+    """
+    if headers.get('cf-mitigated', '').lower() == 'challenge':
+        return True
+    if status_code not in (403, 503) or 'cloudflare' not in headers.get('server', '').lower():
+        return False
+    return body is not None and any(marker in body[:20000] for marker in _CHALLENGE_MARKERS)
+
+
+@dataclass
+class Clearance:
+    """Cookies solved by FlareSolverr for a domain, with the user agent they are bound to."""
+    cookies: List[Dict[str, Any]]
+    user_agent: Optional[str]
+    expires_at: datetime
+
+    def is_valid(self) -> bool:
+        return datetime.utcnow() < self.expires_at - CLEARANCE_EXPIRY_MARGIN
+
+    @classmethod
+    def from_solution(cls, solution: Dict[str, Any]) -> 'Clearance':
+        """Build a clearance from a FlareSolverr solution, expiring with cf_clearance."""
+        cookies = solution.get('cookies') or []
+        expires_at = datetime.utcnow() + timedelta(seconds=config.CLOUDFLARE_CLEARANCE_TTL)
+        for cookie in cookies:
+            expires = cookie.get('expires')
+            if cookie.get('name') == 'cf_clearance' and isinstance(expires, (int, float)) and expires > 0:
+                expires_at = datetime.utcfromtimestamp(expires)
+        return cls(cookies=cookies, user_agent=solution.get('userAgent'), expires_at=expires_at)
+
+
+class ClearanceCache:
+    """
+    Per-domain cache of Cloudflare clearances shared by all session managers.
+
+    Concurrent callers needing the same domain are coalesced onto one
+    in-flight FlareSolverr solve. Entries are persisted through
+    session_factory (a callable returning a SQLAlchemy session) when given.
+
+    Lookups from the event loop only touch memory (get()); database loads
+    (aget()) and writes run on a single persistence thread, in order, so
+    the loop never blocks on the database. Writes are write-behind when
+    called from the event loop.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None):
+        self.session_factory = session_factory
+        self._entries: Dict[str, Clearance] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.solves = 0
+
+    def get(self, domain: str) -> Optional[Clearance]:
+        """
+        Get the valid clearance of a domain from memory (no database I/O).
+
+        Args:
+            domain: Tracker domain
+
+        Returns:
+            Clearance if cached and not expired, None otherwise
+        """
+        clearance = self._entries.get(domain)
+        if clearance is not None and not clearance.is_valid():
+            self._entries.pop(domain, None)
+            return None
+        return clearance
+
+    async def aget(self, domain: str) -> Optional[Clearance]:
+        """
+        Get the valid clearance of a domain (memory first, then database).
+
+        The database is read on the persistence thread.
+
+        Args:
+            domain: Tracker domain
+
+        Returns:
+            Clearance if cached and not expired, None otherwise
+        """
+        clearance = self.get(domain)
+        if clearance is None and self.session_factory is not None:
+            loop = asyncio.get_running_loop()
+            clearance = await loop.run_in_executor(self._get_db_executor(), self._load, domain)
+            if clearance is not None and clearance.is_valid() and domain not in self._entries:
+                self._entries[domain] = clearance
+            clearance = self.get(domain)
+        return clearance
+
+    def store(self, domain: str, clearance: Clearance) -> None:
+        """Store the clearance of a domain (memory, then database write-behind)."""
+        self._entries[domain] = clearance
+        self._persist(lambda db, model: model.upsert(
+            db, domain, clearance.cookies, clearance.user_agent, clearance.expires_at
+        ))
+
+    def invalidate(self, domain: str) -> None:
+        """Drop the clearance of a domain (e.g. after a challenge page)."""
+        if self._entries.pop(domain, None) is not None:
+            logger.info(f"Cloudflare clearance invalidated for {domain}")
+        self._persist(lambda db, model: model.invalidate(db, domain))
+
+    async def flush(self) -> None:
+        """Wait for pending database writes."""
+        if self._db_executor is not None:
+            await asyncio.get_running_loop().run_in_executor(self._db_executor, lambda: None)
+
+    async def get_or_solve(self, domain: str, solve: Callable[[], Any]) -> Clearance:
+        """
+        Get the clearance of a domain, solving it once if missing.
+
+        Args:
+            domain: Tracker domain
+            solve: Coroutine function returning a fresh Clearance
+
+        Returns:
+            Valid Clearance for the domain
+        """
+        clearance = await self.aget(domain)
+        if clearance is not None:
+            self.hits += 1
+            logger.info(f"Reusing cached Cloudflare clearance for {domain}")
+            return clearance
+
+        task = self._inflight.get(domain)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._solve_and_store(domain, solve))
+            self._inflight[domain] = task
+        else:
+            logger.info(f"Waiting for in-flight Cloudflare solve for {domain}")
+
+        # Shield so a cancelled waiter does not cancel the solve for the others
+        return await asyncio.shield(task)
+
+    async def _solve_and_store(self, domain: str, solve: Callable[[], Any]) -> Clearance:
+        try:
+            clearance = await solve()
+            self.solves += 1
+            self.store(domain, clearance)
+            return clearance
+        finally:
+            self._inflight.pop(domain, None)
+
+    def _get_db_executor(self) -> ThreadPoolExecutor:
+        # One worker: writes and loads run in submission order
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cf-clearance")
+        return self._db_executor
+
+    def _persist(self, operation: Callable[[Any, Any], Any]) -> None:
+        """Run a database write on the persistence thread (inline outside the event loop)."""
+        if self.session_factory is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from a worker thread (e.g. a requests hook): already off the loop
+            self._with_db(operation)
+            return
+        self._get_db_executor().submit(self._with_db, operation)
+
+    def _load(self, domain: str) -> Optional[Clearance]:
+        def load(db, model) -> Optional[Clearance]:
+            entry = model.get_valid(db, domain)
+            if entry is None:
+                return None
+            return Clearance(cookies=entry.cookies or [], user_agent=entry.user_agent, expires_at=entry.expires_at)
+
+        return self._with_db(load)
+
+    def _with_db(self, operation: Callable[[Any, Any], Any]) -> Any:
+        """Run operation(db, CloudflareClearance) in a short-lived session, if persistence is enabled."""
+        if self.session_factory is None:
+            return None
+        from app.models.cloudflare_clearance import CloudflareClearance
+
+        db = None
+        try:
+            db = self.session_factory()
+            return operation(db, CloudflareClearance)
+        except Exception as e:
+            if db is not None:
+                db.rollback()
+            logger.warning(f"Cloudflare clearance persistence failed: {e}")
+            return None
+        finally:
+            if db is not None:
+                db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            'domains': sorted(self._entries),
+            'hits': self.hits,
+            'solves': self.solves,
+            'in_flight': sorted(self._inflight),
+        }
+
+
 class CloudflareSessionManager:
     """
     Manages Cloudflare bypass using FlareSolverr service with circuit breaker pattern.
@@ -89,7 +322,8 @@ class CloudflareSessionManager:
     def __init__(
         self,
         flaresolverr_url: str,
-        max_timeout: int = None
+        max_timeout: int = None,
+        clearance_cache: Optional[ClearanceCache] = None
     ):
         """
         Initialize CloudflareSessionManager.
@@ -97,9 +331,12 @@ class CloudflareSessionManager:
         Args:
             flaresolverr_url: FlareSolverr service URL (e.g., http://localhost:8191)
             max_timeout: Maximum timeout for FlareSolverr requests in milliseconds (default: from config)
+            clearance_cache: Optional shared ClearanceCache (see get_clearance_cache());
+                without it, every get_session() call solves the challenge
         """
         self.flaresolverr_url = flaresolverr_url.rstrip('/')
         self.max_timeout = max_timeout or config.FLARESOLVERR_TIMEOUT
+        self.clearance_cache = clearance_cache
 
         # Circuit breaker state (using centralized configuration)
         self.circuit_state = CircuitBreakerState.CLOSED
@@ -178,7 +415,8 @@ class CloudflareSessionManager:
 
         This method delegates the Cloudflare challenge solving to FlareSolverr,
         extracts the cookies, and returns a configured requests.Session object
-        ready for authenticated tracker API calls.
+        ready for authenticated tracker API calls. With a clearance cache, a
+        valid clearance of the same domain is reused instead of solving again.
 
         Args:
             tracker_url: Target tracker URL to bypass Cloudflare for
@@ -194,6 +432,79 @@ class CloudflareSessionManager:
             session = await manager.get_session("https://lacale.example.com")
             response = session.get("https://lacale.example.com/api/upload")
         """
+        domain = clearance_domain(tracker_url)
+
+        if self.clearance_cache is not None:
+            clearance = await self.clearance_cache.get_or_solve(
+                domain, lambda: self._solve(tracker_url)
+            )
+        else:
+            clearance = await self._solve(tracker_url)
+
+        return self._build_session(domain, clearance)
+
+    def invalidate(self, tracker_url: str) -> None:
+        """
+        Drop the cached clearance of a tracker (e.g. after a challenge page).
+
+        Args:
+            tracker_url: Tracker URL
+        """
+        if self.clearance_cache is not None:
+            self.clearance_cache.invalidate(clearance_domain(tracker_url))
+
+    def _build_session(self, domain: str, clearance: Clearance) -> Session:
+        """
+        Create a requests.Session from a clearance.
+
+        The session uses the user agent that solved the challenge and drops
+        the cached clearance when a response turns out to be a challenge page.
+        """
+        session = Session()
+        for cookie in clearance.cookies:
+            if 'name' in cookie and 'value' in cookie:
+                session.cookies.set(cookie['name'], cookie['value'])
+                logger.debug(f"Applied cookie: {cookie['name']}")
+            else:
+                logger.warning(f"Skipping malformed cookie: {cookie}")
+
+        if clearance.user_agent:
+            session.headers['User-Agent'] = clearance.user_agent
+
+        if self.clearance_cache is not None:
+            cache = self.clearance_cache
+
+            def invalidate_on_challenge(response, *args, **kwargs):
+                # Only read the body (it may be streamed) of a possible challenge page
+                body = None
+                if (
+                    response.status_code in (403, 503)
+                    and 'cloudflare' in response.headers.get('server', '').lower()
+                ):
+                    body = response.text
+                if is_cloudflare_challenge(response.status_code, response.headers, body):
+                    logger.warning(f"Cloudflare challenge returned by {domain}, clearance expired")
+                    cache.invalidate(domain)
+                return response
+
+            session.hooks['response'].append(invalidate_on_challenge)
+
+        return session
+
+    async def _solve(self, tracker_url: str) -> Clearance:
+        """
+        Solve the Cloudflare challenge of a URL with FlareSolverr.
+
+        Args:
+            tracker_url: Target tracker URL
+
+        Returns:
+            Clearance with the solved cookies and user agent
+
+        Raises:
+            CloudflareBypassError: If FlareSolverr fails to solve challenge
+            NetworkRetryableError: If network/timeout errors occur
+        """
         # Check circuit breaker state
         self._check_circuit_breaker()
 
@@ -244,15 +555,6 @@ class CloudflareSessionManager:
 
             cookies = solution['cookies']
 
-            # Create session and apply cookies
-            session = Session()
-            for cookie in cookies:
-                if 'name' in cookie and 'value' in cookie:
-                    session.cookies.set(cookie['name'], cookie['value'])
-                    logger.debug(f"Applied cookie: {cookie['name']}")
-                else:
-                    logger.warning(f"Skipping malformed cookie: {cookie}")
-
             # Record success
             self._record_success()
 
@@ -261,7 +563,7 @@ class CloudflareSessionManager:
                 f"({len(cookies)} cookies extracted)"
             )
 
-            return session
+            return Clearance.from_solution(solution)
 
         except requests.exceptions.Timeout as e:
             error_msg = f"FlareSolverr request timeout after {self.max_timeout}ms"
@@ -383,3 +685,21 @@ class CloudflareSessionManager:
             f"circuit_state={self.circuit_state.value}, "
             f"failures={self.failure_count}/{self.max_failures})>"
         )
+
+
+# Global clearance cache instance
+_clearance_cache: Optional[ClearanceCache] = None
+
+
+def get_clearance_cache() -> ClearanceCache:
+    """
+    Get the process-wide ClearanceCache, persisted in the application database.
+
+    Returns:
+        ClearanceCache instance
+    """
+    global _clearance_cache
+    if _clearance_cache is None:
+        from app.database import SessionLocal
+        _clearance_cache = ClearanceCache(session_factory=SessionLocal)
+    return _clearance_cache
@@ -29,6 +29,8 @@ import httpx
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from .http_client_pool import pooled_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -448,13 +450,14 @@ class ConfigurableUploader:
         logger.debug(f"Form data keys: {list(data_dict.keys())}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(url) as client:
                 response = await client.post(
                     url,
                     headers=headers,
                     params=params,
                     data=form_data,
-                    files=files_dict
+                    files=files_dict,
+                    timeout=self.timeout
                 )
 
                 return self._parse_response(response, release_data)
@@ -519,12 +522,13 @@ class ConfigurableUploader:
         logger.info(f"Uploading JSON to {url}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(url) as client:
                 response = await client.post(
                     url,
                     headers=headers,
                     params=params,
-                    json=json_body
+                    json=json_body,
+                    timeout=self.timeout
                 )
 
                 return self._parse_response(response, release_data)
@@ -654,13 +658,14 @@ class ConfigurableUploader:
             headers = self._build_auth_headers()
             params = self._build_auth_params()
 
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with pooled_http_client(self.tracker_url) as client:
                 # Try the base URL first
                 response = await client.get(
                     self.tracker_url,
                     headers=headers,
                     params=params,
-                    follow_redirects=True
+                    follow_redirects=True,
+                    timeout=10
                 )
 
                 if response.status_code < 400:
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-import httpx
+from app.services.http_client_pool import pooled_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -72,8 +72,8 @@ async def _check_prowlarr(url: str, api_key: str) -> None:
 
 async def _check_flaresolverr(url: str) -> None:
     try:
-        async with httpx.AsyncClient(timeout=8) as client:
-            r = await client.get(f"{url.rstrip('/')}/health")
+        async with pooled_http_client(url) as client:
+            r = await client.get(f"{url.rstrip('/')}/health", timeout=8)
         if r.status_code == 200:
             _set('flaresolverr', True, 'FlareSolverr opérationnel')
         else:
@@ -86,16 +86,21 @@ async def _check_qbittorrent(host: str, username: Optional[str] = None, password
     try:
         qb_url = host if host.startswith(('http://', 'https://')) else f"http://{host}"
         base = qb_url.rstrip('/')
-        async with httpx.AsyncClient(timeout=8) as client:
-            r = await client.get(f"{base}/api/v2/app/version")
+        async with pooled_http_client(base) as client:
+            r = await client.get(f"{base}/api/v2/app/version", timeout=8)
             if r.status_code == 403 and username:
                 # qBittorrent requires authentication
                 login = await client.post(
                     f"{base}/api/v2/auth/login",
-                    data={"username": username, "password": password or ""}
+                    data={"username": username, "password": password or ""},
+                    timeout=8
                 )
                 if login.text == "Ok.":
-                    r = await client.get(f"{base}/api/v2/app/version")
+                    r = await client.get(
+                        f"{base}/api/v2/app/version",
+                        cookies=login.cookies,
+                        timeout=8
+                    )
                 else:
                     _set('qbittorrent', False, 'Identifiants invalides')
                     return
@@ -110,10 +115,11 @@ async def _check_qbittorrent(host: str, username: Optional[str] = None, password
 
 async def _check_tmdb(api_key: str) -> None:
     try:
-        async with httpx.AsyncClient(timeout=8) as client:
+        async with pooled_http_client("https://api.themoviedb.org") as client:
             r = await client.get(
                 "https://api.themoviedb.org/3/configuration",
-                params={"api_key": api_key}
+                params={"api_key": api_key},
+                timeout=8
             )
         if r.status_code == 200:
             _set('tmdb', True, 'TMDB API opérationnelle')
@@ -0,0 +1,254 @@
+"""
+Directory Scan Service for Seedarr v2.0
+
+Runs file manager folder scans as background jobs, so adding a large
+library to the queue does not block the web server.
+
+Features:
+    - Tree walked with os.scandir in a worker thread (file types come from
+      the directory listing, no stat per file)
+    - Existing paths checked with one IN query per chunk, new entries
+      inserted and FAILED entries reset in one transaction per chunk
+    - Progress snapshots for polling and Server-Sent Events
+    - Cancellable at any point of the walk (chunks already added are kept)
+    - Names of the added files parsed in the worker thread (parse_many), so
+      processing them later starts from the release parser cache
+    - One running job per directory: scanning it again returns that job
+
+Usage Example:
+    scanner = get_directory_scanner()
+    job = scanner.start("/media/movies", VIDEO_EXTENSIONS)
+    ...
+    scanner.cancel(job.id)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.file_entry import FileEntry
+from app.services.release_parser import get_release_parser
+
+logger = logging.getLogger(__name__)
+
+# Paths per IN query / insert (well below the SQLite bound parameter limit)
+SCAN_BATCH_SIZE = 500
+
+# Names of added files kept for the scan report
+SCAN_REPORT_NAMES = 50
+
+# Finished jobs kept for late progress requests
+MAX_FINISHED_JOBS = 20
+
+
+@dataclass
+class ScanJob:
+    """Progress of a background directory scan."""
+    id: str
+    path: str
+    status: str = 'running'  # running, completed, cancelled, failed
+    directories: int = 0
+    files_found: int = 0
+    created: int = 0
+    reset: int = 0
+    skipped: int = 0
+    error: Optional[str] = None
+    created_names: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    # Incremented on every progress change, so streams only send changes
+    version: int = 0
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status != 'running'
+
+    @property
+    def message(self) -> str:
+        added = self.created + self.reset
+        if self.status == 'running':
+            return (
+                f"Scanning: {self.directories} folder(s), {self.files_found} video file(s) found, "
+                f"{added} added to queue"
+            )
+        if self.status == 'failed':
+            return f"Scan failed: {self.error}"
+
+        message = f"Scan {'cancelled' if self.status == 'cancelled' else 'complete'}: {added} file(s) added to queue"
+        if self.skipped:
+            message += f", {self.skipped} skipped (already in queue)"
+        return message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Progress snapshot for the API."""
+        return {
+            'job_id': self.id,
+            'path': self.path,
+            'status': self.status,
+            'message': self.message,
+            'directories': self.directories,
+            'files_found': self.files_found,
+            'created': self.created,
+            'reset': self.reset,
+            'skipped': self.skipped,
+            'created_names': list(self.created_names),
+            'error': self.error,
+            'elapsed': round((self.finished_at or time.time()) - self.started_at, 1),
+        }
+
+
+class DirectoryScanner:
+    """
+    Registry and runner of background directory scans.
+
+    Jobs are started from the event loop; the walk and the database writes
+    run in a worker thread with their own session.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = SCAN_BATCH_SIZE
+    ):
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self._jobs: Dict[str, ScanJob] = {}
+
+    def start(self, path: str, extensions: Iterable[str]) -> ScanJob:
+        """
+        Start scanning ``path`` for files with the given extensions.
+
+        Returns the running job of ``path`` if there is one.
+        """
+        path = os.path.normpath(path)
+        for job in self._jobs.values():
+            if job.path == path and not job.finished:
+                return job
+
+        self._prune()
+        job = ScanJob(id=uuid.uuid4().hex[:12], path=path)
+        self._jobs[job.id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run(job, frozenset(e.lower() for e in extensions)))
+        logger.info(f"Scan started for {path} (job {job.id})")
+        return job
+
+    def get(self, job_id: str) -> Optional[ScanJob]:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[ScanJob]:
+        """Ask a running job to stop; entries already added are kept."""
+        job = self._jobs.get(job_id)
+        if job is not None and not job.finished:
+            job.cancel_event.set()
+        return job
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs."""
+        finished = [job for job in self._jobs.values() if job.finished]
+        for job in sorted(finished, key=lambda j: j.started_at)[:max(0, len(finished) - MAX_FINISHED_JOBS + 1)]:
+            del self._jobs[job.id]
+
+    async def _run(self, job: ScanJob, extensions: frozenset) -> None:
+        try:
+            await asyncio.to_thread(self._scan, job, extensions)
+            job.status = 'cancelled' if job.cancel_event.is_set() else 'completed'
+        except Exception as e:
+            logger.error(f"Error scanning path {job.path}: {e}")
+            job.error = str(e)
+            job.status = 'failed'
+        job.finished_at = time.time()
+        job.version += 1
+        logger.info(
+            f"Scan {job.status} for {job.path}: {job.created + job.reset} new, {job.skipped} skipped "
+            f"in {job.finished_at - job.started_at:.1f}s"
+        )
+
+    def _scan(self, job: ScanJob, extensions: frozenset) -> None:
+        """Walk the tree and add the files chunk by chunk (worker thread)."""
+        if self._session_factory is None:
+            from app.database import SessionLocal
+            self._session_factory = SessionLocal
+
+        db = self._session_factory()
+        try:
+            chunk = []
+            for file_path in self._walk(job, extensions):
+                chunk.append(file_path)
+                if len(chunk) >= self.batch_size:
+                    self._store(db, job, chunk)
+                    chunk = []
+            if chunk and not job.cancel_event.is_set():
+                self._store(db, job, chunk)
+        finally:
+            db.close()
+
+    def _walk(self, job: ScanJob, extensions: frozenset) -> Iterator[str]:
+        """
+        Yield the matching files under the job path.
+
+        Symlinked directories are not followed (like Path.rglob), which also
+        protects against link loops.
+        """
+        pending = [job.path]
+        while pending and not job.cancel_event.is_set():
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as scanner:
+                    for entry in scanner:
+                        if job.cancel_event.is_set():
+                            return
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                                job.files_found += 1
+                                yield entry.path
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning(f"Cannot scan {directory}: {e}")
+            job.directories += 1
+            job.version += 1
+
+    def _store(self, db: Session, job: ScanJob, paths: List[str]) -> None:
+        """Add one chunk of files, retrying once if a concurrent scan added some."""
+        try:
+            created, reset, skipped = FileEntry.create_or_reset_many(db, paths)
+        except IntegrityError:
+            db.rollback()
+            created, reset, skipped = FileEntry.create_or_reset_many(db, paths)
+
+        job.created += len(created)
+        job.reset += len(reset)
+        job.skipped += len(skipped)
+        added_names = [os.path.basename(p) for p in created + reset]
+        room = SCAN_REPORT_NAMES - len(job.created_names)
+        if room > 0:
+            job.created_names.extend(added_names[:room])
+        # Parse the new names here, off the event loop: the pipeline's
+        # metadata and TMDB stages then read them from the parser cache
+        get_release_parser().parse_many(added_names)
+        job.version += 1
+
+
+# Global scanner instance
+_directory_scanner: Optional[DirectoryScanner] = None
+
+
+def get_directory_scanner() -> DirectoryScanner:
+    """Get the global directory scanner."""
+    global _directory_scanner
+    if _directory_scanner is None:
+        _directory_scanner = DirectoryScanner()
+    return _directory_scanner
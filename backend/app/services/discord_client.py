@@ -16,6 +16,8 @@ from datetime import datetime
 
 import httpx
 
+from .http_client_pool import pooled_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,10 +83,11 @@ class DiscordClient:
             payload['embeds'] = [embed]
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.webhook_url) as client:
                 response = await client.post(
                     self.webhook_url,
-                    json=payload
+                    json=payload,
+                    timeout=self.timeout
                 )
 
                 if response.status_code == 204:
@@ -4,19 +4,25 @@ Duplicate Check Service
 Centralized service for checking duplicate releases across trackers.
 
 Features:
-- Multi-tracker duplicate checking
+- Multi-tracker duplicate checking, run concurrently with a per-tracker timeout
 - Cascade search strategy (TMDB -> IMDB -> Release name)
-- Result caching to avoid repeated API calls
+- Process-wide TTL/LRU result cache shared by the pipeline and the API,
+  including "no duplicate" results (shorter TTL)
 - Aggregated results across all enabled trackers
 """
 
+import asyncio
+import copy
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 
 from sqlalchemy.orm import Session
 
+from app.config import config
 from app.models.tracker import Tracker
 from app.models.file_entry import FileEntry
 from app.adapters.tracker_factory import TrackerFactory
@@ -68,50 +74,295 @@ class AggregatedDuplicateResult:
         }
 
 
+DuplicateCacheKey = Tuple[Any, ...]
+
+
+class DuplicateResultCache:
+    """
+    Process-wide cache of tracker duplicate check results.
+
+    Entries are adapter.check_duplicate() result dicts keyed by tracker and
+    search parameters. Results with duplicates live for `ttl` seconds,
+    "nothing found" results for `negative_ttl` seconds; errors are never
+    cached. The least recently used entry is evicted past `max_entries`.
+    Concurrent checks of the same key share a single tracker request.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        self.ttl = ttl if ttl is not None else config.DUPLICATE_CACHE_TTL
+        self.negative_ttl = negative_ttl if negative_ttl is not None else config.DUPLICATE_NEGATIVE_CACHE_TTL
+        self.max_entries = max_entries if max_entries is not None else config.DUPLICATE_CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[DuplicateCacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[DuplicateCacheKey, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        tracker_id: int,
+        tmdb_id: Optional[str] = None,
+        imdb_id: Optional[str] = None,
+        release_name: Optional[str] = None,
+        quality: Optional[str] = None,
+        file_size: Optional[int] = None
+    ) -> DuplicateCacheKey:
+        """Build the cache key (quality and file_size change the filtered result)."""
+        return (
+            tracker_id,
+            str(tmdb_id) if tmdb_id else '',
+            imdb_id or '',
+            release_name or '',
+            (quality or '').lower(),
+            file_size or 0,
+        )
+
+    def get(self, key: DuplicateCacheKey) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached result if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def store(self, key: DuplicateCacheKey, result: Dict[str, Any]) -> None:
+        """Cache a result, with the negative TTL if no duplicate was found."""
+        ttl = self.ttl if result.get('is_duplicate') else self.negative_ttl
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, tracker_id: Optional[int] = None) -> int:
+        """
+        Drop cached results of one tracker (or all trackers).
+
+        Returns:
+            Number of entries removed
+        """
+        if tracker_id is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        keys = [key for key in self._entries if key[0] == tracker_id]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    async def get_or_check(
+        self,
+        key: DuplicateCacheKey,
+        check: Callable[[], Awaitable[Dict[str, Any]]],
+        use_cache: bool = True,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result of a key, or run the check once for all callers.
+
+        A check that outlives `timeout` keeps running in the background and
+        still populates the cache for the next caller.
+
+        Args:
+            key: Cache key from make_key()
+            check: Coroutine factory calling adapter.check_duplicate()
+            use_cache: If False, ignore cached results (the new one is stored)
+            timeout: Seconds to wait for the check (defaults to DUPLICATE_CHECK_TIMEOUT)
+
+        Raises:
+            TimeoutError: The check did not finish within the timeout
+            Exception: Errors raised by the check
+        """
+        if use_cache:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+        self.misses += 1
+
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.get_running_loop().create_task(check())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._on_done(key, t))
+
+        timeout = config.DUPLICATE_CHECK_TIMEOUT if timeout is None else timeout
+        result = await asyncio.wait_for(asyncio.shield(task), timeout)
+        return copy.deepcopy(result)
+
+    def _on_done(self, key: DuplicateCacheKey, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # A failed check returned as a result (with an 'error') is not cached either
+        if not task.cancelled() and task.exception() is None and not task.result().get('error'):
+            self.store(key, task.result())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'negative_ttl_seconds': self.negative_ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'in_flight': len(self._inflight),
+        }
+
+
+# Global cache instance
+_duplicate_cache: Optional[DuplicateResultCache] = None
+
+
+def get_duplicate_cache() -> DuplicateResultCache:
+    """Get the global DuplicateResultCache instance."""
+    global _duplicate_cache
+    if _duplicate_cache is None:
+        _duplicate_cache = DuplicateResultCache()
+    return _duplicate_cache
+
+
+async def check_duplicate_cached(
+    tracker: Tracker,
+    adapter: Any,
+    tmdb_id: Optional[str] = None,
+    imdb_id: Optional[str] = None,
+    release_name: Optional[str] = None,
+    quality: Optional[str] = None,
+    file_size: Optional[int] = None,
+    use_cache: bool = True,
+    timeout: Optional[float] = None,
+    cache: Optional[DuplicateResultCache] = None
+) -> Dict[str, Any]:
+    """
+    Call adapter.check_duplicate() through a result cache.
+
+    Args:
+        tracker: Tracker being checked
+        adapter: Tracker adapter of that tracker
+        tmdb_id, imdb_id, release_name, quality, file_size: check_duplicate() arguments
+        use_cache: Whether cached results may be returned
+        timeout: Per-tracker timeout in seconds
+        cache: Result cache (defaults to the process-wide cache)
+
+    Returns:
+        check_duplicate() result dictionary
+    """
+    key = DuplicateResultCache.make_key(tracker.id, tmdb_id, imdb_id, release_name, quality, file_size)
+
+    kwargs: Dict[str, Any] = {
+        'tmdb_id': tmdb_id,
+        'imdb_id': imdb_id,
+        'release_name': release_name,
+        'quality': quality,
+    }
+    if file_size is not None:
+        # Only some adapters support exact size matching
+        kwargs['file_size'] = file_size
+
+    def check() -> Awaitable[Dict[str, Any]]:
+        return adapter.check_duplicate(**kwargs)
+
+    cache = cache or get_duplicate_cache()
+    return await cache.get_or_check(key, check, use_cache=use_cache, timeout=timeout)
+
+
 class DuplicateCheckService:
     """
     Service for checking duplicate releases across trackers.
 
     Provides:
     - Single tracker duplicate checks
-    - Multi-tracker aggregate checks
-    - Result caching
+    - Concurrent multi-tracker aggregate checks
+    - Result caching (process-wide, see DuplicateResultCache)
     - File entry result persistence
     """
 
-    def __init__(self, db: Session, cache_ttl_minutes: int = 60):
+    def __init__(self, db: Session, cache: Optional[DuplicateResultCache] = None):
         """
         Initialize duplicate check service.
 
         Args:
             db: Database session
-            cache_ttl_minutes: How long to cache results
+            cache: Result cache (defaults to the process-wide cache)
         """
         self.db = db
-        self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
-        self._cache: Dict[str, DuplicateResult] = {}
-        self._cache_times: Dict[str, datetime] = {}
+        self.cache = cache or get_duplicate_cache()
+
+    def _get_adapter(self, tracker: Tracker) -> Any:
+        """Create the adapter of a tracker."""
+        from app.models.settings import Settings
+        settings = Settings.get_settings(self.db)
+        factory = TrackerFactory(
+            self.db,
+            flaresolverr_url=settings.flaresolverr_url
+        )
+        return factory.get_adapter(tracker)
 
-    def _cache_key(
+    async def _check_tracker(
         self,
-        tracker_id: int,
-        tmdb_id: Optional[str] = None,
-        imdb_id: Optional[str] = None,
-        release_name: Optional[str] = None
-    ) -> str:
-        """Generate cache key."""
-        return f"{tracker_id}:{tmdb_id or ''}:{imdb_id or ''}:{release_name or ''}"
-
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached result is still valid."""
-        if cache_key not in self._cache_times:
-            return False
-        return datetime.utcnow() - self._cache_times[cache_key] < self.cache_ttl
-
-    def _update_cache(self, cache_key: str, result: DuplicateResult) -> None:
-        """Update cache with result."""
-        self._cache[cache_key] = result
-        self._cache_times[cache_key] = datetime.utcnow()
+        tracker: Tracker,
+        adapter: Any,
+        tmdb_id: Optional[str],
+        imdb_id: Optional[str],
+        release_name: Optional[str],
+        quality: Optional[str],
+        use_cache: bool,
+        timeout: Optional[float] = None
+    ) -> DuplicateResult:
+        """Run a cached duplicate check on one tracker."""
+        try:
+            result = await check_duplicate_cached(
+                tracker, adapter,
+                tmdb_id=tmdb_id,
+                imdb_id=imdb_id,
+                release_name=release_name,
+                quality=quality,
+                use_cache=use_cache,
+                timeout=timeout,
+                cache=self.cache
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Duplicate check timed out for tracker {tracker.name}")
+            return DuplicateResult(
+                tracker_id=tracker.id,
+                tracker_name=tracker.name,
+                is_duplicate=False,
+                search_method="none",
+                error="Duplicate check timed out",
+                checked_at=datetime.utcnow()
+            )
+        except Exception as e:
+            logger.error(f"Duplicate check failed for tracker {tracker.name}: {e}")
+            return DuplicateResult(
+                tracker_id=tracker.id,
+                tracker_name=tracker.name,
+                is_duplicate=False,
+                search_method="none",
+                error=str(e),
+                checked_at=datetime.utcnow()
+            )
+
+        return DuplicateResult(
+            tracker_id=tracker.id,
+            tracker_name=tracker.name,
+            is_duplicate=result.get('is_duplicate', False),
+            search_method=result.get('search_method', 'none'),
+            existing_torrents=result.get('existing_torrents', []),
+            message=result.get('message', ''),
+            error=result.get('error'),
+            checked_at=datetime.utcnow()
+        )
 
     async def check_single_tracker(
         self,
@@ -136,12 +387,6 @@ class DuplicateCheckService:
         Returns:
             DuplicateResult for the tracker
         """
-        # Check cache
-        cache_key = self._cache_key(tracker_id, tmdb_id, imdb_id, release_name)
-        if use_cache and self._is_cache_valid(cache_key):
-            logger.debug(f"Using cached duplicate check result for tracker {tracker_id}")
-            return self._cache[cache_key]
-
         # Get tracker
         tracker = self.db.query(Tracker).filter(Tracker.id == tracker_id).first()
         if not tracker:
@@ -156,13 +401,7 @@ class DuplicateCheckService:
 
         # Get adapter
         try:
-            from app.models.settings import Settings
-            settings = Settings.get_settings(self.db)
-            factory = TrackerFactory(
-                self.db,
-                flaresolverr_url=settings.flaresolverr_url
-            )
-            adapter = factory.get_adapter(tracker)
+            adapter = self._get_adapter(tracker)
         except Exception as e:
             logger.error(f"Failed to create adapter for tracker {tracker.name}: {e}")
             return DuplicateResult(
@@ -174,40 +413,9 @@ class DuplicateCheckService:
                 checked_at=datetime.utcnow()
             )
 
-        # Perform duplicate check
-        try:
-            result = await adapter.check_duplicate(
-                tmdb_id=tmdb_id,
-                imdb_id=imdb_id,
-                release_name=release_name,
-                quality=quality
-            )
-
-            duplicate_result = DuplicateResult(
-                tracker_id=tracker_id,
-                tracker_name=tracker.name,
-                is_duplicate=result.get('is_duplicate', False),
-                search_method=result.get('search_method', 'none'),
-                existing_torrents=result.get('existing_torrents', []),
-                message=result.get('message', ''),
-                checked_at=datetime.utcnow()
-            )
-
-            # Cache result
-            self._update_cache(cache_key, duplicate_result)
-
-            return duplicate_result
-
-        except Exception as e:
-            logger.error(f"Duplicate check failed for tracker {tracker.name}: {e}")
-            return DuplicateResult(
-                tracker_id=tracker_id,
-                tracker_name=tracker.name,
-                is_duplicate=False,
-                search_method="none",
-                error=str(e),
-                checked_at=datetime.utcnow()
-            )
+        return await self._check_tracker(
+            tracker, adapter, tmdb_id, imdb_id, release_name, quality, use_cache
+        )
 
     async def check_all_trackers(
         self,
@@ -216,11 +424,15 @@ class DuplicateCheckService:
         release_name: Optional[str] = None,
         quality: Optional[str] = None,
         tracker_ids: Optional[List[int]] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        timeout: Optional[float] = None
     ) -> AggregatedDuplicateResult:
         """
         Check for duplicates across all (or specified) trackers.
 
+        Trackers are queried concurrently; a tracker that does not answer
+        within `timeout` seconds is reported with an error.
+
         Args:
             tmdb_id: TMDB ID to search for
             imdb_id: IMDB ID to search for
@@ -228,6 +440,7 @@ class DuplicateCheckService:
             quality: Quality filter
             tracker_ids: Specific trackers to check (None = all enabled)
             use_cache: Whether to use cached results
+            timeout: Per-tracker timeout (defaults to DUPLICATE_CHECK_TIMEOUT)
 
         Returns:
             AggregatedDuplicateResult with results from all trackers
@@ -252,20 +465,27 @@ class DuplicateCheckService:
                 checked_at=datetime.utcnow()
             )
 
-        # Check each tracker
+        # Create adapters up front: the database session is not shared across tasks
+        checks = []
+        for tracker in trackers:
+            try:
+                adapter = self._get_adapter(tracker)
+            except Exception as e:
+                logger.error(f"Failed to create adapter for tracker {tracker.name}: {e}")
+                checks.append(self._adapter_error(tracker, e))
+                continue
+            checks.append(self._check_tracker(
+                tracker, adapter, tmdb_id, imdb_id, release_name, quality, use_cache, timeout
+            ))
+
+        # Check all trackers concurrently
+        results = await asyncio.gather(*checks)
+
         results_by_tracker = {}
         total_duplicates = 0
         trackers_with_dupes = 0
 
-        for tracker in trackers:
-            result = await self.check_single_tracker(
-                tracker_id=tracker.id,
-                tmdb_id=tmdb_id,
-                imdb_id=imdb_id,
-                release_name=release_name,
-                quality=quality,
-                use_cache=use_cache
-            )
+        for tracker, result in zip(trackers, results):
             results_by_tracker[tracker.name] = result
 
             if result.is_duplicate:
@@ -281,6 +501,17 @@ class DuplicateCheckService:
             checked_at=datetime.utcnow()
         )
 
+    @staticmethod
+    async def _adapter_error(tracker: Tracker, error: Exception) -> DuplicateResult:
+        return DuplicateResult(
+            tracker_id=tracker.id,
+            tracker_name=tracker.name,
+            is_duplicate=False,
+            search_method="none",
+            error=f"Failed to create adapter: {str(error)}",
+            checked_at=datetime.utcnow()
+        )
+
     async def check_file_entry(
         self,
         file_entry: FileEntry,
@@ -320,20 +551,28 @@ class DuplicateCheckService:
         tracker_id: int,
         tmdb_id: Optional[str] = None,
         imdb_id: Optional[str] = None,
-        release_name: Optional[str] = None
+        release_name: Optional[str] = None,
+        quality: Optional[str] = None,
+        file_size: Optional[int] = None
     ) -> Optional[DuplicateResult]:
-        """Get cached result if available and valid."""
-        cache_key = self._cache_key(tracker_id, tmdb_id, imdb_id, release_name)
-        if self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
-        return None
+        """Get cached result if available and valid (same arguments as the check)."""
+        key = DuplicateResultCache.make_key(tracker_id, tmdb_id, imdb_id, release_name, quality, file_size)
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        tracker = self.db.query(Tracker).filter(Tracker.id == tracker_id).first()
+        return DuplicateResult(
+            tracker_id=tracker_id,
+            tracker_name=tracker.name if tracker else "Unknown",
+            is_duplicate=cached.get('is_duplicate', False),
+            search_method=cached.get('search_method', 'none'),
+            existing_torrents=cached.get('existing_torrents', []),
+            message=cached.get('message', '')
+        )
 
     def clear_cache(self) -> int:
         """Clear all cached results. Returns count of cleared entries."""
-        count = len(self._cache)
-        self._cache.clear()
-        self._cache_times.clear()
-        return count
+        return self.cache.invalidate()
 
 
 def get_duplicate_check_service(db: Session) -> DuplicateCheckService:
@@ -0,0 +1,473 @@
+"""
+File Index Service for Seedarr v2.0
+
+Keeps the file_index table in sync with the media folders of the file
+manager (input_media_path and output_dir) and serves folder listings and
+searches from it, so browsing a NAS no longer stats every entry of every
+folder on each visit.
+
+Features:
+    - Incremental refresh: one stat per folder, only folders whose mtime
+      changed since they were last listed are listed again
+    - Periodic full refresh, which also catches files modified in place
+    - On-demand refresh of a browsed folder, so a page is never older than
+      the folder's mtime
+    - Optional file system watcher (watchfiles / inotify) refreshing the
+      folders that changed
+    - Paginated listings, prefix and substring search across the tree
+    - Queue flags: which files already have a FileEntry
+
+Usage Example:
+    index = get_file_index()
+    index.set_roots([settings.input_media_path, settings.output_dir])
+    index.refresh_directory(path, db)
+    rows, total = index.list_directory(db, path, offset=0, limit=20)
+"""
+
+import asyncio
+import logging
+import os
+import stat
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.models.file_entry import FileEntry, Status
+from app.models.file_index import FileIndexEntry
+from app.models.settings import Settings
+from app.models.validators import sanitize_path
+
+logger = logging.getLogger(__name__)
+
+# Paths per IN query when flagging queued files
+FLAG_BATCH_SIZE = 500
+
+# A folder modified this recently (ns) may change again within the same mtime
+# tick: it is listed again on the next refresh instead of being trusted
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+def _is_under(path: str, folder: str) -> bool:
+    """Whether ``path`` is inside ``folder`` (both normalized)."""
+    return path.startswith(folder.rstrip(os.sep) + os.sep)
+
+
+def _subtree_range(folder: str) -> Tuple[str, str]:
+    """Bounds of the paths inside ``folder``: prefix <= path < upper."""
+    prefix = folder.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+class FileIndex:
+    """
+    Persistent index of the media folders.
+
+    Writes are serialized by a lock, so the background refresh and the
+    on-demand refresh of browsed folders can run at the same time.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        self._session_factory = session_factory
+        self.roots: List[str] = []
+        self._write_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._watcher: Optional[asyncio.Task] = None
+
+    def _session(self) -> Session:
+        if self._session_factory is None:
+            from app.database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    # ------------------------------------------------------------------
+    # Roots
+    # ------------------------------------------------------------------
+
+    def set_roots(self, roots: Iterable[Optional[str]]) -> List[str]:
+        """Set the indexed folders; folders inside another root are skipped."""
+        normalized = sorted({os.path.normpath(root) for root in roots if root})
+        self.roots = [
+            root for root in normalized
+            if not any(_is_under(root, other) for other in normalized if other != root)
+        ]
+        return self.roots
+
+    def load_roots(self) -> List[str]:
+        """Set the roots from the file manager settings."""
+        db = self._session()
+        try:
+            settings = Settings.get_settings(db)
+            return self.set_roots([
+                sanitize_path(settings.input_media_path),
+                sanitize_path(settings.output_dir),
+            ])
+        finally:
+            db.close()
+
+    def root_of(self, path: str) -> Optional[str]:
+        """Get the root containing ``path``, None if it is not indexed."""
+        path = os.path.normpath(path)
+        for root in self.roots:
+            if path == root or _is_under(path, root):
+                return root
+        return None
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the index of every root up to date.
+
+        Args:
+            full: List every folder, not only folders whose mtime changed
+
+        Returns:
+            Counts of listed / unchanged folders and added / updated /
+            removed entries
+        """
+        counts = {'listed': 0, 'unchanged': 0, 'added': 0, 'updated': 0, 'removed': 0}
+        db = self._session()
+        try:
+            with self._write_lock:
+                result = db.execute(
+                    delete(FileIndexEntry).where(FileIndexEntry.root.notin_(self.roots)),
+                    execution_options={'synchronize_session': False}
+                )
+                counts['removed'] += result.rowcount
+                db.commit()
+
+            for root in list(self.roots):
+                pending = [root]
+                while pending:
+                    directory = pending.pop()
+                    pending.extend(self._refresh_directory(db, root, directory, full, counts) or [])
+        finally:
+            db.close()
+        return counts
+
+    def refresh_directory(self, path: str, db: Optional[Session] = None) -> bool:
+        """
+        Re-list one folder if its mtime changed since it was last listed.
+
+        Args:
+            path: Folder path
+            db: Session to use (a new session by default)
+
+        Returns:
+            True if the folder is listed in the index, False if it is not
+            under a root or cannot be read
+        """
+        path = os.path.normpath(path)
+        root = self.root_of(path)
+        if root is None:
+            return False
+
+        session = db or self._session()
+        try:
+            counts = {'listed': 0, 'unchanged': 0, 'added': 0, 'updated': 0, 'removed': 0}
+            return self._refresh_directory(session, root, path, False, counts) is not None
+        finally:
+            if db is None:
+                session.close()
+
+    def _refresh_directory(
+        self,
+        db: Session,
+        root: str,
+        directory: str,
+        full: bool,
+        counts: Dict[str, int]
+    ) -> Optional[List[str]]:
+        """
+        Refresh the children of one folder.
+
+        Returns:
+            Paths of the subfolders, or None if the folder is gone or unreadable
+        """
+        row = db.execute(
+            select(FileIndexEntry).where(FileIndexEntry.path == directory)
+        ).scalar_one_or_none()
+
+        try:
+            st = os.stat(directory)
+            if not stat.S_ISDIR(st.st_mode):
+                raise NotADirectoryError(directory)
+        except OSError:
+            if row is not None:
+                with self._write_lock:
+                    self._remove(db, directory, counts)
+                    db.commit()
+            return None
+
+        if row is not None and not full and row.listed_mtime_ns == st.st_mtime_ns:
+            counts['unchanged'] += 1
+            return list(db.scalars(
+                select(FileIndexEntry.path).where(FileIndexEntry.parent == directory, FileIndexEntry.is_dir == True)
+            ))
+
+        # List outside the lock: reading a large folder on a NAS is slow
+        listed_at_ns = time.time_ns()
+        try:
+            listing = self._list(root, directory)
+        except OSError as e:
+            logger.warning(f"Cannot index {directory}: {e}")
+            return None
+
+        now = datetime.utcnow()
+        with self._write_lock:
+            existing = {
+                entry.path: entry
+                for entry in db.scalars(select(FileIndexEntry).where(FileIndexEntry.parent == directory))
+            }
+            new = [values for path, values in listing.items() if path not in existing]
+            if new:
+                db.execute(insert(FileIndexEntry), new)
+                counts['added'] += len(new)
+
+            for path, entry in existing.items():
+                values = listing.get(path)
+                if values is None:
+                    self._remove(db, path, counts)
+                elif (entry.is_dir, entry.size, entry.mtime_ns, entry.inode) != (
+                    values['is_dir'], values['size'], values['mtime_ns'], values['inode']
+                ):
+                    if entry.is_dir and not values['is_dir']:
+                        self._remove(db, path, counts, keep_self=True)
+                    for key in ('is_dir', 'size', 'mtime_ns', 'inode', 'extension'):
+                        setattr(entry, key, values[key])
+                    entry.indexed_at = now
+                    counts['updated'] += 1
+
+            if row is None:
+                parent = os.path.dirname(directory)
+                name = os.path.basename(directory) or directory
+                row = FileIndexEntry(
+                    path=directory, parent=parent, root=root, name=name, name_lower=name.lower(),
+                    extension='', is_dir=True, size=0
+                )
+                db.add(row)
+                counts['added'] += 1
+            row.mtime_ns = st.st_mtime_ns
+            row.inode = st.st_ino or None
+            racy = st.st_mtime_ns >= listed_at_ns - RACY_MTIME_WINDOW_NS
+            row.listed_mtime_ns = 0 if racy else st.st_mtime_ns
+            row.indexed_at = now
+            db.commit()
+
+        counts['listed'] += 1
+        return [path for path, values in listing.items() if values['is_dir']]
+
+    @staticmethod
+    def _list(root: str, directory: str) -> Dict[str, Dict[str, Any]]:
+        """Read a folder: row values of its entries by path."""
+        now = datetime.utcnow()
+        listing = {}
+        with os.scandir(directory) as scanner:
+            for entry in scanner:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                name = entry.name
+                listing[entry.path] = {
+                    'path': entry.path,
+                    'parent': directory,
+                    'root': root,
+                    'name': name,
+                    'name_lower': name.lower(),
+                    'extension': '' if is_dir else os.path.splitext(name)[1].lower()[:20],
+                    'is_dir': is_dir,
+                    'size': 0 if is_dir else st.st_size,
+                    'mtime_ns': st.st_mtime_ns,
+                    'inode': st.st_ino or None,
+                    'listed_mtime_ns': None,
+                    'indexed_at': now,
+                }
+        return listing
+
+    @staticmethod
+    def _remove(db: Session, path: str, counts: Dict[str, int], keep_self: bool = False) -> None:
+        """Delete an entry and everything under it."""
+        prefix, upper = _subtree_range(path)
+        subtree = and_(FileIndexEntry.path >= prefix, FileIndexEntry.path < upper)
+        result = db.execute(
+            delete(FileIndexEntry).where(subtree if keep_self else or_(FileIndexEntry.path == path, subtree)),
+            execution_options={'synchronize_session': False}
+        )
+        counts['removed'] += result.rowcount
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def is_listed(db: Session, path: str) -> bool:
+        """Whether the children of a folder are in the index."""
+        return db.scalar(
+            select(FileIndexEntry.listed_mtime_ns).where(FileIndexEntry.path == os.path.normpath(path))
+        ) is not None
+
+    @staticmethod
+    def list_directory(db: Session, path: str, offset: int = 0, limit: int = 0) -> Tuple[List[FileIndexEntry], int]:
+        """
+        Get a page of a folder, folders first then by name.
+
+        Args:
+            db: Database session
+            path: Folder path
+            offset: Entries to skip
+            limit: Page size (0 for all entries)
+
+        Returns:
+            (entries, total number of entries in the folder)
+        """
+        path = os.path.normpath(path)
+        total = db.scalar(select(func.count()).select_from(FileIndexEntry).where(FileIndexEntry.parent == path))
+        query = (
+            select(FileIndexEntry)
+            .where(FileIndexEntry.parent == path)
+            .order_by(FileIndexEntry.is_dir.desc(), FileIndexEntry.name_lower, FileIndexEntry.id)
+            .offset(offset)
+        )
+        if limit > 0:
+            query = query.limit(limit)
+        return list(db.scalars(query)), total
+
+    @staticmethod
+    def search(db: Session, query: str, under: Optional[str] = None, limit: int = 200) -> List[FileIndexEntry]:
+        """
+        Find entries by name (case-insensitive) anywhere under a folder.
+
+        Names starting with the query come first (read from the name index),
+        then names containing it.
+        """
+        q = query.strip().lower()
+        if not q:
+            return []
+
+        scope = []
+        if under:
+            prefix, upper = _subtree_range(os.path.normpath(under))
+            scope = [FileIndexEntry.path >= prefix, FileIndexEntry.path < upper]
+
+        starts_with = and_(
+            FileIndexEntry.name_lower >= q,
+            FileIndexEntry.name_lower < q[:-1] + chr(ord(q[-1]) + 1)
+        )
+        results = list(db.scalars(
+            select(FileIndexEntry).where(starts_with, *scope).order_by(FileIndexEntry.name_lower).limit(limit)
+        ))
+        if len(results) < limit:
+            pattern = '%' + q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            results.extend(db.scalars(
+                select(FileIndexEntry)
+                .where(FileIndexEntry.name_lower.like(pattern, escape='\\'), ~starts_with, *scope)
+                .order_by(FileIndexEntry.is_dir.desc(), FileIndexEntry.name_lower)
+                .limit(limit - len(results))
+            ))
+        return results
+
+    # ------------------------------------------------------------------
+    # Background refresh
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background refresh (and the watcher if enabled)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh and the watcher."""
+        tasks = [task for task in (self._task, self._watcher) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = self._watcher = None
+
+    async def _run(self) -> None:
+        last_full = time.monotonic()
+        watched: List[str] = []
+        while True:
+            try:
+                roots = await asyncio.to_thread(self.load_roots)
+                full = time.monotonic() - last_full >= config.FILE_INDEX_FULL_REFRESH_INTERVAL
+                started = time.monotonic()
+                counts = await asyncio.to_thread(self.refresh, full)
+                if full:
+                    last_full = started
+                logger.info(
+                    f"File index {'fully ' if full else ''}refreshed in {time.monotonic() - started:.1f}s: "
+                    f"{counts['listed']} folder(s) listed, {counts['unchanged']} unchanged, "
+                    f"{counts['added']} added, {counts['updated']} updated, {counts['removed']} removed"
+                )
+
+                if config.FILE_INDEX_WATCH and (roots != watched or self._watcher is None or self._watcher.done()):
+                    if self._watcher is not None:
+                        self._watcher.cancel()
+                    self._watcher = asyncio.create_task(self._watch(roots)) if roots else None
+                    watched = roots
+            except Exception as e:
+                logger.warning(f"⚠ File index refresh error: {e}")
+            await asyncio.sleep(config.FILE_INDEX_REFRESH_INTERVAL)
+
+    async def _watch(self, roots: List[str]) -> None:
+        """Refresh the folders reported by file system events."""
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            logger.warning("⚠ watchfiles not installed, file index watcher disabled")
+            return
+
+        try:
+            async for changes in awatch(*roots, watch_filter=None, recursive=True):
+                for directory in {os.path.dirname(path) for _, path in changes}:
+                    await asyncio.to_thread(self.refresh_directory, directory)
+        except Exception as e:
+            logger.warning(f"⚠ File index watcher stopped: {e}")
+
+
+def get_file_entry_flags(db: Session, paths: List[str]) -> Dict[str, Tuple[int, Status]]:
+    """
+    Find the files that already have a FileEntry.
+
+    Returns:
+        {file path: (file entry id, status)} for the paths in the queue / history
+    """
+    flags = {}
+    for i in range(0, len(paths), FLAG_BATCH_SIZE):
+        rows = db.execute(
+            select(FileEntry.file_path, FileEntry.id, FileEntry.status)
+            .where(FileEntry.file_path.in_(paths[i:i + FLAG_BATCH_SIZE]))
+        )
+        flags.update((row.file_path, (row.id, row.status)) for row in rows)
+    return flags
+
+
+# Global file index instance
+_file_index: Optional[FileIndex] = None
+
+
+def get_file_index() -> FileIndex:
+    """Get the global file index."""
+    global _file_index
+    if _file_index is None:
+        _file_index = FileIndex()
+    return _file_index
+
+
+async def start_file_index() -> None:
+    """Start the background refresh of the global file index."""
+    await get_file_index().start()
+
+
+async def stop_file_index() -> None:
+    """Stop the background refresh of the global file index."""
+    await get_file_index().stop()
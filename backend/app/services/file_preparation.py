@@ -0,0 +1,347 @@
+"""
+File Preparation Service for Seedarr v2.0
+
+This module places the media file of a release in the main release folder
+and in each tracker's folder without blocking the event loop. Hardlinks are
+free, but a copy across a filesystem boundary of a 50 GB remux takes
+minutes; it used to run with shutil.copy2 inside the event loop, once for
+the main release and once more per tracker.
+
+Placement strategy (per target):
+    1. Hardlink to the source file
+    2. Hardlink to a copy already made for this release (a tracker folder
+       on the same filesystem as the main release folder)
+    3. Copy, only when allowed, in a worker thread
+
+    So a release is copied across a device boundary at most once per
+    target filesystem; every other target is hardlinked from that copy.
+
+Copy methods (fastest first, falling back when unsupported):
+    - reflink:          FICLONE ioctl, copy-on-write clone (Btrfs, XFS)
+    - copy_file_range:  in-kernel copy, server-side on NFS 4.2 / SMB3
+    - sendfile:         in-kernel copy through the page cache
+    - buffered:         readinto() / write() with a large reused buffer
+
+    The copy is written to "{target}.partial" and renamed once complete,
+    so an interrupted copy never leaves a truncated media file behind.
+
+Progress:
+    Copy progress is published to an in-process registry keyed by source
+    path, so the dashboard can display a copy percentage while the prepare
+    stage runs (see get_copy_progress()).
+
+Usage Example:
+    >>> preparation = FilePreparation("/media/Movie.mkv")
+    >>> await preparation.place("/output/Movie/Movie.mkv")
+    'copy_file_range'
+    >>> await preparation.place("/output/tracker/Movie/Movie.mkv", allow_copy=False)
+    'hardlink'
+"""
+
+import asyncio
+import errno
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+
+# ioctl request number of FICLONE (linux/fs.h: _IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+# Bytes per copy_file_range / sendfile call (progress granularity)
+KERNEL_CHUNK_BYTES = 64 * MiB
+
+# Size of the buffer used by the buffered copy
+BUFFER_BYTES = 8 * MiB
+
+# Errors meaning "this copy method is not available here", not a failed copy
+UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+    errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTTY,
+}
+
+# Suffix of a copy in progress
+PARTIAL_SUFFIX = '.partial'
+
+# Progress callback: (copied_bytes, total_bytes)
+ProgressCallback = Callable[[int, int], None]
+
+# In-flight copy progress: source path -> (copied_bytes, total_bytes)
+_progress: Dict[str, Tuple[int, int]] = {}
+_progress_lock = threading.Lock()
+
+
+def _set_progress(file_path: str, copied: int, total: int) -> None:
+    with _progress_lock:
+        _progress[file_path] = (copied, total)
+
+
+def _clear_progress(file_path: str) -> None:
+    with _progress_lock:
+        _progress.pop(file_path, None)
+
+
+def get_copy_progress(file_path: str) -> Optional[float]:
+    """
+    Get copy progress for a source file currently being copied.
+
+    Args:
+        file_path: Path of the source file being copied
+
+    Returns:
+        Percentage (0-100), or None if the file is not being copied
+    """
+    with _progress_lock:
+        entry = _progress.get(file_path)
+    if entry is None:
+        return None
+    copied, total = entry
+    return round(100.0 * copied / total, 1) if total else 100.0
+
+
+class _Unsupported(Exception):
+    """Raised by a copy method that is not available for this pair of files."""
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone the whole source file (copy-on-write). Returns False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in UNSUPPORTED_ERRNOS:
+            return False
+        raise
+
+
+def _copy_file_range_chunk(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile_chunk(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    # sendfile writes at the current position of the destination
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _kernel_copy(copy_chunk, src_fd: int, dst_fd: int, offset: int, total: int, report) -> int:
+    """
+    Copy [offset, total) with an in-kernel copy function.
+
+    Returns:
+        Offset reached (total when complete)
+
+    Raises:
+        _Unsupported: With the offset reached, if the method is unavailable
+    """
+    while offset < total:
+        try:
+            copied = copy_chunk(src_fd, dst_fd, offset, min(KERNEL_CHUNK_BYTES, total - offset))
+        except OSError as e:
+            if e.errno in UNSUPPORTED_ERRNOS:
+                raise _Unsupported(offset) from e
+            raise
+        if copied == 0:
+            # Some filesystems report "nothing copied" instead of an error
+            raise _Unsupported(offset)
+        offset += copied
+        report(offset)
+    return offset
+
+
+def _buffered_copy(src, dst, offset: int, total: int, report) -> None:
+    """Copy [offset, end of file) with a reused buffer."""
+    buffer = bytearray(BUFFER_BYTES)
+    view = memoryview(buffer)
+    src.seek(offset)
+    dst.seek(offset)
+    while True:
+        n = src.readinto(buffer)
+        if not n:
+            break
+        dst.write(view[:n])
+        offset += n
+        report(min(offset, total))
+
+
+def _copy_contents(src, dst, total: int, report) -> str:
+    """Copy the contents of src to dst with the fastest available method."""
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+
+    if _reflink(src_fd, dst_fd):
+        report(total)
+        return 'reflink'
+
+    offset = 0
+    for method, copy_chunk in (
+        ('copy_file_range', _copy_file_range_chunk if hasattr(os, 'copy_file_range') else None),
+        ('sendfile', _sendfile_chunk if hasattr(os, 'sendfile') else None),
+    ):
+        if copy_chunk is None:
+            continue
+        try:
+            _kernel_copy(copy_chunk, src_fd, dst_fd, offset, total, report)
+            return method
+        except _Unsupported as e:
+            # Resume from where the method stopped
+            offset = e.args[0]
+            logger.debug(f"{method} unavailable at offset {offset}, trying next copy method")
+
+    _buffered_copy(src, dst, offset, total, report)
+    return 'buffered'
+
+
+def copy_file(
+    source: str,
+    target: str,
+    progress_callback: Optional[ProgressCallback] = None
+) -> str:
+    """
+    Copy a file with its permission bits and times (like shutil.copy2).
+
+    This call blocks until the copy is complete; run it with
+    asyncio.to_thread() from async code.
+
+    Args:
+        source: Path to the source file
+        target: Path of the copy (replaced if it exists)
+        progress_callback: Optional callable receiving (copied_bytes, total_bytes)
+
+    Returns:
+        Copy method used: 'reflink', 'copy_file_range', 'sendfile' or 'buffered'
+
+    Raises:
+        OSError: If the copy fails (the partial copy is removed)
+    """
+    source = str(source)
+    target = str(target)
+    partial = target + PARTIAL_SUFFIX
+    total = os.path.getsize(source)
+
+    def report(copied: int) -> None:
+        _set_progress(source, copied, total)
+        if progress_callback:
+            progress_callback(copied, total)
+
+    report(0)
+    try:
+        with open(source, 'rb', buffering=0) as src, open(partial, 'wb', buffering=0) as dst:
+            method = _copy_contents(src, dst, total, report)
+        shutil.copystat(source, partial)
+        os.replace(partial, target)
+    except BaseException:
+        try:
+            os.unlink(partial)
+        except OSError:
+            pass
+        raise
+    finally:
+        _clear_progress(source)
+
+    return method
+
+
+def _is_same_file(file1: Path, file2: Path) -> bool:
+    try:
+        stat1 = file1.stat()
+        stat2 = file2.stat()
+        return stat1.st_dev == stat2.st_dev and stat1.st_ino == stat2.st_ino
+    except OSError:
+        return False
+
+
+class FilePreparation:
+    """
+    Places one source file in several release folders.
+
+    Every target is hardlinked to the source or to a copy already made by
+    this preparation; the file is only copied when no hardlink is possible.
+    Placements are serialized, so concurrent callers never copy twice.
+
+    Attributes:
+        source: Source media file
+        copies: Copies made so far (hardlink sources for the next targets)
+    """
+
+    def __init__(self, source_file: str, progress_callback: Optional[ProgressCallback] = None):
+        """
+        Initialize FilePreparation.
+
+        Args:
+            source_file: Path to the source media file
+            progress_callback: Optional callable receiving (copied_bytes, total_bytes)
+        """
+        self.source = Path(source_file)
+        self.copies: List[Path] = []
+        self.progress_callback = progress_callback
+        self._lock = asyncio.Lock()
+
+    async def place(self, target: str, allow_copy: bool = True) -> str:
+        """
+        Place the source file at target.
+
+        Args:
+            target: Path of the media file to create
+            allow_copy: Whether to copy when no hardlink is possible
+
+        Returns:
+            'hardlink', or the copy method used (see copy_file())
+
+        Raises:
+            FileNotFoundError: If the source file doesn't exist
+            OSError: If no hardlink is possible and allow_copy is False
+                (the hardlink error), or if the copy fails
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._place, Path(target), allow_copy)
+
+    def _place(self, target: Path, allow_copy: bool) -> str:
+        if not self.source.exists():
+            raise FileNotFoundError(f"Source file not found: {self.source}")
+
+        candidates = [self.source] + self.copies
+
+        if target.exists():
+            if any(_is_same_file(candidate, target) for candidate in candidates):
+                logger.info(f"Target already linked to source: {target}")
+                return 'hardlink'
+            logger.warning(f"Removing existing file to replace: {target}")
+            target.unlink()
+
+        link_error: Optional[OSError] = None
+        for candidate in candidates:
+            try:
+                os.link(str(candidate), str(target))
+                if candidate != self.source:
+                    logger.info(f"✓ Created hardlink to copy {candidate}: {target.name}")
+                else:
+                    logger.info(f"✓ Created hardlink: {target.name}")
+                return 'hardlink'
+            except OSError as e:
+                if link_error is None:
+                    link_error = e
+
+        if not allow_copy:
+            raise link_error
+
+        logger.warning(
+            f"Hardlink failed ({link_error}), falling back to copy. "
+            f"This will use additional disk space."
+        )
+        method = copy_file(str(self.source), str(target), self.progress_callback)
+        self.copies.append(target)
+        logger.info(f"✓ Created copy ({method}, hardlink unavailable): {target.name}")
+        return method
@@ -9,6 +9,9 @@ Features:
     - Create release folder structure with hardlinks
     - Per-tracker release structure creation with configurable output dirs
     - Automatic fallback to copy if cross-filesystem (controlled by hardlink_fallback_copy)
+    - Async preparation (prepare_* methods): copies run in a worker thread
+      with reflink / copy_file_range, and a release crosses a device
+      boundary at most once (see app.services.file_preparation)
     - Toggle system: hardlink_enabled controls whether hardlinks are attempted
     - Support for NFO and screenshot subfolder creation
     - Cleanup utilities for old release structures
@@ -36,6 +39,8 @@ import shutil
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from app.services.file_preparation import FilePreparation
+
 logger = logging.getLogger(__name__)
 
 
@@ -273,6 +278,149 @@ class HardlinkManager:
                 logger.error(error_msg)
                 raise HardlinkError(error_msg) from copy_err
 
+    async def prepare_release_structure(
+        self,
+        preparation: FilePreparation,
+        release_name: str,
+        output_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of create_release_structure() sharing copies across targets.
+
+        The media file is hardlinked to the source, or to a copy already made
+        by the preparation; otherwise it is copied in a worker thread.
+
+        Args:
+            preparation: FilePreparation of the source media file
+            release_name: The release name (folder and file name)
+            output_dir: Output directory (uses default_output_dir if not specified)
+
+        Returns:
+            Same dictionary as create_release_structure(), plus
+            'copy_method' (None when hardlinked)
+
+        Raises:
+            HardlinkError: If neither hardlink nor copy succeeds
+            FileNotFoundError: If source file doesn't exist
+        """
+        source_path = preparation.source
+
+        if not source_path.exists():
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+
+        base_output = output_dir or self.default_output_dir or str(source_path.parent)
+
+        release_dir = Path(base_output) / release_name
+        release_dir.mkdir(parents=True, exist_ok=True)
+        screens_dir = release_dir / "screens"
+        screens_dir.mkdir(exist_ok=True)
+        logger.info(f"Created release directory: {release_dir}")
+
+        media_file = release_dir / f"{release_name}{source_path.suffix.lower()}"
+
+        try:
+            method = await preparation.place(str(media_file))
+        except FileNotFoundError:
+            raise
+        except OSError as e:
+            error_msg = f"Both hardlink and copy failed for {media_file}: {e}"
+            logger.error(error_msg)
+            raise HardlinkError(error_msg) from e
+
+        hardlink_used = method == 'hardlink'
+        logger.info(
+            f"✓ Release structure created: {release_name} "
+            f"(hardlink={'yes' if hardlink_used else f'no ({method} copy)'})"
+        )
+
+        return {
+            'release_dir': str(release_dir),
+            'media_file': str(media_file),
+            'nfo_path': str(release_dir / f"{release_name}.nfo"),
+            'screens_dir': str(screens_dir),
+            'hardlink_used': hardlink_used,
+            'copy_method': None if hardlink_used else method,
+            'source_file': str(source_path)
+        }
+
+    async def prepare_tracker_release(
+        self,
+        preparation: FilePreparation,
+        release_name: str,
+        output_dir: str,
+        hardlink_enabled: bool = True,
+        fallback_copy: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of create_tracker_release() sharing copies across targets.
+
+        The media file is hardlinked to the source or to a copy already made
+        by the preparation (e.g. for the main release on the same filesystem),
+        so it is only copied when neither is possible.
+
+        Args:
+            preparation: FilePreparation of the source media file
+            release_name: The release name (folder and file name)
+            output_dir: Output directory for this tracker
+            hardlink_enabled: Whether to attempt hardlink creation
+            fallback_copy: Whether to fallback to copy if hardlink fails
+
+        Returns:
+            Same dictionary as create_tracker_release(), plus
+            'copy_method' (None unless method is 'copy')
+
+        Raises:
+            HardlinkError: If hardlink fails and fallback_copy is False
+            FileNotFoundError: If source file doesn't exist
+        """
+        source_path = preparation.source
+
+        if not source_path.exists():
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+
+        if not hardlink_enabled:
+            logger.info(f"Hardlinks disabled - using source file directly: {source_path.name}")
+            return {
+                'release_dir': str(source_path.parent),
+                'media_file': str(source_path),
+                'hardlink_used': False,
+                'method': 'direct',
+                'copy_method': None,
+                'source_file': str(source_path),
+            }
+
+        release_dir = Path(output_dir) / release_name
+        release_dir.mkdir(parents=True, exist_ok=True)
+        media_file = release_dir / f"{release_name}{source_path.suffix.lower()}"
+
+        try:
+            method = await preparation.place(str(media_file), allow_copy=fallback_copy)
+        except FileNotFoundError:
+            raise
+        except OSError as e:
+            if not fallback_copy:
+                error_msg = (
+                    f"Hardlink creation failed and copy fallback is disabled. "
+                    f"Source: {source_path}, Target: {media_file}. "
+                    f"Error: {e}. "
+                    f"Ensure source and target are on the same filesystem, "
+                    f"or enable 'Copy fallback' in settings."
+                )
+            else:
+                error_msg = f"Both hardlink and copy failed for {media_file}: {e}"
+            logger.error(error_msg)
+            raise HardlinkError(error_msg) from e
+
+        hardlink_used = method == 'hardlink'
+        return {
+            'release_dir': str(release_dir),
+            'media_file': str(media_file),
+            'hardlink_used': hardlink_used,
+            'method': 'hardlink' if hardlink_used else 'copy',
+            'copy_method': None if hardlink_used else method,
+            'source_file': str(source_path),
+        }
+
     @staticmethod
     def detect_os_info() -> Dict[str, Any]:
         """
@@ -457,7 +605,9 @@ class HardlinkManager:
 
         if result['has_screens_dir']:
             # Count screenshots
-            screen_files = list(screens_dir.glob("*.png")) + list(screens_dir.glob("*.jpg"))
+            screen_files = [
+                file for pattern in ("*.png", "*.jpg", "*.webp") for file in screens_dir.glob(pattern)
+            ]
             result['screen_count'] = len(screen_files)
 
         return result
@@ -0,0 +1,254 @@
+"""
+Shared HTTP Client Pool for Seedarr v2.0
+
+This module provides one pooled, keep-alive httpx.AsyncClient per upstream
+host, shared by every integration (qBittorrent, Radarr, Sonarr, Prowlarr,
+trackers, Discord, health checks). Opening a fresh AsyncClient per call costs
+a TCP (+TLS) handshake for every request; with a shared client, the request
+bursts of the upload stage and duplicate checks reuse warm connections.
+
+Features:
+    - One client per origin (scheme, host, port), created lazily
+    - Configurable connection limits and keep-alive expiry (see app.config)
+    - HTTP/2 negotiated when the optional 'h2' package is installed
+    - Stateless clients: response cookies are never persisted, so callers
+      sharing a host do not leak sessions into each other (pass cookies
+      explicitly, as QBittorrentClient does)
+    - Per-host statistics (requests sent, borrowers, open/idle connections)
+
+Usage Example:
+    Clients are shared, so callers borrow them (without closing them) and
+    pass their timeout per request:
+    >>> async with pooled_http_client(self.base_url) as client:
+    ...     response = await client.get(url, timeout=self.timeout)
+
+Shutdown:
+    close_http_clients() is awaited from main.lifespan on shutdown.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# Default timeout for requests that do not pass their own
+DEFAULT_TIMEOUT = 30.0
+
+# (scheme, host, port)
+Origin = Tuple[str, str, int]
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that never stores response cookies in the shared jar."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 ('h2' package installed)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _origin(url: str) -> Origin:
+    """
+    Get the origin (scheme, host, port) of a URL.
+
+    Raises:
+        ValueError: If the URL has no scheme or host
+    """
+    parsed = httpx.URL(url)
+    if not parsed.scheme or not parsed.host:
+        raise ValueError(f"Invalid URL for HTTP client: {url!r}")
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return parsed.scheme, parsed.host, port
+
+
+class HttpClientPool:
+    """
+    Registry of shared httpx.AsyncClient instances, one per upstream host.
+
+    Clients are bound to the event loop they were created on; if the loop
+    changes (e.g. between test cases), clients of the old loop are dropped.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True
+    ):
+        """
+        Initialize the client pool.
+
+        Args:
+            max_connections: Maximum concurrent connections per host
+            max_keepalive_connections: Maximum idle keep-alive connections per host
+            keepalive_expiry: Seconds before an idle connection is closed
+            http2: Negotiate HTTP/2 when the 'h2' package is available
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _http2_available()
+        self._clients: Dict[Origin, httpx.AsyncClient] = {}
+        self._requests: Dict[Origin, int] = {}
+        self._in_use: Dict[Origin, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """
+        Get the shared client for the host of a URL.
+
+        The returned client must not be closed by the caller.
+
+        Args:
+            url: Any URL on the upstream host (base URL or full request URL)
+
+        Returns:
+            Shared httpx.AsyncClient for that host
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._clients:
+                logger.debug("Event loop changed, dropping shared HTTP clients")
+            self._loop = loop
+            self._clients.clear()
+            self._requests.clear()
+            self._in_use.clear()
+
+        origin = _origin(url)
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = self._create_client(origin)
+            self._clients[origin] = client
+            self._requests.setdefault(origin, 0)
+            logger.debug(f"Created shared HTTP client for {origin[0]}://{origin[1]}:{origin[2]}")
+        return client
+
+    @asynccontextmanager
+    async def borrow(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Borrow the shared client for the host of a URL for the duration of the block.
+
+        The client stays open when the block exits.
+
+        Args:
+            url: Any URL on the upstream host
+        """
+        client = self.get_client(url)
+        origin = _origin(url)
+        self._in_use[origin] = self._in_use.get(origin, 0) + 1
+        try:
+            yield client
+        finally:
+            self._in_use[origin] = self._in_use.get(origin, 1) - 1
+
+    def _create_client(self, origin: Origin) -> httpx.AsyncClient:
+        async def count_request(request: httpx.Request) -> None:
+            self._requests[origin] = self._requests.get(origin, 0) + 1
+
+        return httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=self.limits,
+            http2=self.http2,
+            cookies=CookieJar(policy=_RejectAllCookiesPolicy()),
+            event_hooks={"request": [count_request]},
+        )
+
+    async def aclose(self) -> None:
+        """Close all shared clients and their connections."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+        if clients:
+            logger.info(f"✓ Closed {len(clients)} shared HTTP client(s)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with pool limits and, per host, requests sent,
+            borrowers in flight and open/idle connection counts
+        """
+        hosts = {}
+        for origin, client in self._clients.items():
+            connections = _pool_connections(client)
+            hosts[f"{origin[0]}://{origin[1]}:{origin[2]}"] = {
+                "requests": self._requests.get(origin, 0),
+                "in_use": self._in_use.get(origin, 0),
+                "connections": len(connections),
+                "idle_connections": sum(1 for c in connections if c.is_idle()),
+                "closed": client.is_closed,
+            }
+
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "hosts": hosts,
+        }
+
+
+def _pool_connections(client: httpx.AsyncClient) -> list:
+    """Get the open connections of a client's connection pool (best effort)."""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    return list(getattr(pool, "connections", []) or [])
+
+
+# Global client pool instance
+_http_client_pool: Optional[HttpClientPool] = None
+
+
+def get_http_client_pool() -> HttpClientPool:
+    """
+    Get the process-wide HttpClientPool instance.
+
+    Returns:
+        HttpClientPool configured from app.config
+    """
+    global _http_client_pool
+    if _http_client_pool is None:
+        _http_client_pool = HttpClientPool(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+            http2=config.HTTP_ENABLE_HTTP2,
+        )
+    return _http_client_pool
+
+
+def pooled_http_client(url: str):
+    """
+    Borrow the shared client for the host of a URL.
+
+    Args:
+        url: Any URL on the upstream host
+
+    Returns:
+        Async context manager yielding the shared httpx.AsyncClient
+    """
+    return get_http_client_pool().borrow(url)
+
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients (call on application shutdown)."""
+    if _http_client_pool is not None:
+        await _http_client_pool.aclose()
@@ -5,22 +5,29 @@ Provides a centralized logging system that captures application logs
 and makes them available for the web UI.
 
 Features:
-- Custom logging handler that stores logs in memory
-- Configurable maximum log entries (prevents memory overflow)
-- Log filtering by level
+- Custom logging handler that stores logs in memory, run on a background
+  queue listener so logging calls do not wait for formatting or storage
+- Configurable maximum log entries (fixed-size ring buffer)
+- Monotonic sequence numbers, so clients fetch only entries after a cursor
+- Secondary indexes by level, request_id and file_entry_id: filtered reads
+  cost the number of entries returned, not the size of the store
+- Async waiters for push streaming (Server-Sent Events)
 - Log clearing and export functionality
 - Thread-safe operations
 - Structured logging with correlation IDs (request_id, file_entry_id)
 - JSON export for machine parsing
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime
 from collections import deque
 from threading import Lock
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict, field
+from typing import List, Optional, Dict, Any, Set, Tuple
+from dataclasses import dataclass, field, fields
+
+from app.services.structured_logging import add_queued_handler, get_queued_handlers, get_record_context
 
 
 @dataclass
@@ -33,12 +40,24 @@ class LogEntry:
     request_id: Optional[str] = None
     file_entry_id: Optional[int] = None
     extra_data: Dict[str, Any] = field(default_factory=dict)
+    seq: int = 0
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for template rendering."""
-        result = asdict(self)
-        # Remove None values for cleaner output
-        return {k: v for k, v in result.items() if v is not None and v != {}}
+        """
+        Convert to dictionary for template rendering.
+
+        Entries are not modified once stored, so the dictionary is built once
+        and shared by all readers (do not mutate it).
+        """
+        if self._dict is None:
+            # Remove None values for cleaner output
+            self._dict = {
+                f.name: getattr(self, f.name)
+                for f in fields(self)
+                if f.init and getattr(self, f.name) is not None and getattr(self, f.name) != {}
+            }
+        return self._dict
 
     def to_json(self) -> str:
         """Convert to JSON string for machine parsing."""
@@ -49,8 +68,11 @@ class LogStore:
     """
     Singleton log store that maintains logs in memory.
 
-    Thread-safe implementation using a deque with max length
-    to prevent unbounded memory growth.
+    Entries live in a fixed-size ring buffer addressed by sequence number
+    (seq % capacity), so "entries after N" is a direct slice. Per-level,
+    per-request and per-file deques of sequence numbers are kept in step
+    with the buffer; the oldest entry is always at the left of each of its
+    index deques, so eviction is O(1).
     """
 
     _instance: Optional['LogStore'] = None
@@ -68,10 +90,23 @@ class LogStore:
         if self._initialized:
             return
 
-        self._entries: deque = deque(maxlen=max_entries)
+        self._capacity = max_entries
+        self._buffer: List[Optional[LogEntry]] = [None] * max_entries
+        # Entries first_seq..last_seq are stored (none when first_seq > last_seq)
+        self._first_seq = 1
+        self._last_seq = 0
+        self._by_level: Dict[str, deque] = {}
+        self._by_request_id: Dict[str, deque] = {}
+        self._by_file_entry_id: Dict[int, deque] = {}
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
         self._entry_lock = Lock()
         self._initialized = True
 
+    @property
+    def latest_seq(self) -> int:
+        """Sequence number of the last entry added (0 if none yet)."""
+        return self._last_seq
+
     def add_entry(
         self,
         level: str,
@@ -79,11 +114,17 @@ class LogStore:
         logger_name: str = "",
         request_id: Optional[str] = None,
         file_entry_id: Optional[int] = None,
-        extra_data: Optional[Dict[str, Any]] = None
+        extra_data: Optional[Dict[str, Any]] = None,
+        created: Optional[float] = None
     ) -> None:
-        """Add a log entry to the store with optional structured fields."""
+        """
+        Add a log entry to the store with optional structured fields.
+
+        ``created`` is the POSIX time the message was logged (defaults to now).
+        """
+        logged_at = datetime.fromtimestamp(created) if created is not None else datetime.now()
         entry = LogEntry(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=logged_at.strftime("%Y-%m-%d %H:%M:%S"),
             level=level.upper(),
             message=message,
             logger_name=logger_name,
@@ -92,44 +133,173 @@ class LogStore:
             extra_data=extra_data or {}
         )
         with self._entry_lock:
-            self._entries.append(entry)
+            entry.seq = self._last_seq + 1
+            if entry.seq - self._first_seq >= self._capacity:
+                self._evict_oldest()
+            self._buffer[entry.seq % self._capacity] = entry
+            self._last_seq = entry.seq
+            for index, key in self._index_keys(entry):
+                if key not in index:
+                    index[key] = deque()
+                index[key].append(entry.seq)
+            waiters = list(self._waiters)
+
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop closed; its waiter is gone
+                pass
+
+    def _index_keys(self, entry: LogEntry) -> List[Tuple[Dict[Any, deque], Any]]:
+        keys = [(self._by_level, entry.level)]
+        if entry.request_id is not None:
+            keys.append((self._by_request_id, entry.request_id))
+        if entry.file_entry_id is not None:
+            keys.append((self._by_file_entry_id, entry.file_entry_id))
+        return keys
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest entry (lock held)."""
+        oldest = self._buffer[self._first_seq % self._capacity]
+        self._buffer[self._first_seq % self._capacity] = None
+        self._first_seq += 1
+        if oldest is None:
+            return
+        for index, key in self._index_keys(oldest):
+            seqs = index[key]
+            seqs.popleft()
+            if not seqs:
+                del index[key]
 
-    def get_entries(self, limit: int = 1000) -> List[Dict[str, Any]]:  # Increased from 500 to 1000
-        """Get recent log entries as dictionaries."""
+    def _select(
+        self,
+        limit: int,
+        after: int,
+        level: Optional[str],
+        request_id: Optional[str],
+        file_entry_id: Optional[int],
+        oldest_first: bool = False
+    ) -> List[LogEntry]:
+        """
+        Entries matching the filters with seq > after, most recent first (lock held).
+
+        The newest ``limit`` entries, or with ``oldest_first`` the ``limit``
+        entries right after the cursor.
+        """
+        after = max(after, self._first_seq - 1)
+        filters = []
+        if level is not None:
+            filters.append(self._by_level.get(level.upper(), ()))
+        if request_id is not None:
+            filters.append(self._by_request_id.get(request_id, ()))
+        if file_entry_id is not None:
+            filters.append(self._by_file_entry_id.get(file_entry_id, ()))
+
+        # Walk the smallest index (or the whole buffer) from the newest entry,
+        # or from the cursor for oldest_first
+        if filters:
+            index = min(filters, key=len)
+            seqs = iter(index) if oldest_first else reversed(index)
+        elif oldest_first:
+            seqs = range(after + 1, self._last_seq + 1)
+        else:
+            seqs = range(self._last_seq, after, -1)
+        selected = []
+        for seq in seqs:
+            if seq <= after:
+                if oldest_first:
+                    continue
+                break
+            if len(selected) >= limit:
+                break
+            entry = self._buffer[seq % self._capacity]
+            if (
+                (level is None or entry.level == level.upper())
+                and (request_id is None or entry.request_id == request_id)
+                and (file_entry_id is None or entry.file_entry_id == file_entry_id)
+            ):
+                selected.append(entry)
+        return selected[::-1] if oldest_first else selected
+
+    def get_entries(
+        self,
+        limit: int = 1000,  # Increased from 500 to 1000
+        after: int = 0,
+        level: Optional[str] = None,
+        request_id: Optional[str] = None,
+        file_entry_id: Optional[int] = None,
+        oldest_first: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recent log entries as dictionaries, most recent first.
+
+        Args:
+            limit: Maximum number of entries
+            after: Only return entries with a sequence number above this cursor
+            level: Only return entries of this level ('all' or None for any)
+            request_id: Only return entries of this request
+            file_entry_id: Only return entries of this file entry
+            oldest_first: With more than ``limit`` matching entries, return
+                the oldest ones after ``after`` instead of the newest, so a
+                reader following the cursor misses none of them
+
+        Returns:
+            List of entry dictionaries (each with its 'seq')
+        """
+        if level is not None and level.lower() == 'all':
+            level = None
         with self._entry_lock:
-            entries = list(self._entries)
-        # Return most recent first, limited
-        return [e.to_dict() for e in reversed(entries)][:limit]
+            entries = self._select(limit, after, level, request_id, file_entry_id, oldest_first)
+        return [e.to_dict() for e in entries]
 
     def get_filtered_entries(self, level: str, limit: int = 1000) -> List[Dict[str, Any]]:  # Increased from 500 to 1000
         """Get log entries filtered by level."""
-        if level.lower() == 'all':
-            return self.get_entries(limit)
+        return self.get_entries(limit, level=level)
 
-        with self._entry_lock:
-            entries = list(self._entries)
+    async def wait_for_entries(self, after: int, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until an entry with a sequence number above ``after`` is added.
 
-        filtered = [e for e in entries if e.level.lower() == level.lower()]
-        return [e.to_dict() for e in reversed(filtered)][:limit]
+        Args:
+            after: Cursor (sequence number) already seen by the caller
+            timeout: Maximum time to wait in seconds (None: no limit)
+
+        Returns:
+            True if newer entries are available, False on timeout
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._entry_lock:
+            if self._last_seq > after:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._entry_lock:
+                self._waiters.discard(waiter)
+        return self._last_seq > after
 
     def clear(self) -> int:
-        """Clear all log entries. Returns count of cleared entries."""
+        """Clear all log entries (sequence numbers keep increasing). Returns count of cleared entries."""
         with self._entry_lock:
-            count = len(self._entries)
-            self._entries.clear()
+            count = self._last_seq - self._first_seq + 1
+            self._buffer = [None] * self._capacity
+            self._first_seq = self._last_seq + 1
+            self._by_level.clear()
+            self._by_request_id.clear()
+            self._by_file_entry_id.clear()
         return count
 
     def get_stats(self) -> Dict[str, Any]:
         """Get log statistics."""
         with self._entry_lock:
-            entries = list(self._entries)
+            total = self._last_seq - self._first_seq + 1
+            counts = {level: len(seqs) for level, seqs in self._by_level.items()}
 
-        total = len(entries)
-        errors = sum(1 for e in entries if e.level == 'ERROR')
-        warnings = sum(1 for e in entries if e.level == 'WARNING')
-        info = sum(1 for e in entries if e.level == 'INFO')
-        success = sum(1 for e in entries if e.level == 'SUCCESS')
-        debug = sum(1 for e in entries if e.level == 'DEBUG')
+        errors = counts.get('ERROR', 0)
 
         # Calculate success rate (non-error percentage)
         success_rate = ((total - errors) / total * 100) if total > 0 else 100
@@ -137,10 +307,10 @@ class LogStore:
         return {
             "total": total,
             "errors": errors,
-            "warnings": warnings,
-            "info": info,
-            "success": success,
-            "debug": debug,
+            "warnings": counts.get('WARNING', 0),
+            "info": counts.get('INFO', 0),
+            "success": counts.get('SUCCESS', 0),
+            "debug": counts.get('DEBUG', 0),
             "success_rate": round(success_rate, 1)
         }
 
@@ -190,19 +360,11 @@ class LogStore:
 
     def get_entries_by_request_id(self, request_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get log entries filtered by request ID."""
-        with self._entry_lock:
-            entries = list(self._entries)
-
-        filtered = [e for e in entries if e.request_id == request_id]
-        return [e.to_dict() for e in reversed(filtered)][:limit]
+        return self.get_entries(limit, request_id=request_id)
 
     def get_entries_by_file_entry_id(self, file_entry_id: int, limit: int = 100) -> List[Dict[str, Any]]:
         """Get log entries filtered by file entry ID."""
-        with self._entry_lock:
-            entries = list(self._entries)
-
-        filtered = [e for e in entries if e.file_entry_id == file_entry_id]
-        return [e.to_dict() for e in reversed(filtered)][:limit]
+        return self.get_entries(limit, file_entry_id=file_entry_id)
 
 
 class LogStoreHandler(logging.Handler):
@@ -210,7 +372,8 @@ class LogStoreHandler(logging.Handler):
     Custom logging handler that sends logs to the LogStore.
 
     Attach this handler to Python's logging system to capture
-    application logs for the web UI.
+    application logs for the web UI (setup_log_store_handler runs it on a
+    background queue listener).
 
     Supports structured logging with correlation IDs from context.
     """
@@ -231,11 +394,6 @@ class LogStoreHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         """Process a log record and add it to the store."""
         try:
-            # Import here to avoid circular imports
-            from app.services.structured_logging import (
-                get_request_id, get_file_entry_id, get_extra_context
-            )
-
             level = self.level_map.get(record.levelno, 'INFO')
 
             # Include logger name in message for better context
@@ -249,10 +407,8 @@ class LogStoreHandler(logging.Handler):
                 if level == 'INFO':
                     level = 'SUCCESS'
 
-            # Get correlation IDs from context
-            request_id = get_request_id()
-            file_entry_id = get_file_entry_id()
-            extra_context = get_extra_context()
+            # Get correlation IDs captured when the record was logged
+            request_id, file_entry_id, extra_context = get_record_context(record)
 
             # Also check for extra_data in record (from StructuredLogAdapter)
             extra_data = {}
@@ -267,7 +423,8 @@ class LogStoreHandler(logging.Handler):
                 logger_name=record.name,
                 request_id=request_id,
                 file_entry_id=file_entry_id,
-                extra_data=extra_data if extra_data else None
+                extra_data=extra_data if extra_data else None,
+                created=record.created
             )
         except Exception:
             self.handleError(record)
@@ -292,6 +449,9 @@ def setup_log_store_handler(logger_name: str = None, level: int = logging.INFO)
     """
     Set up the log store handler on a logger.
 
+    The handler runs on the logger's background queue listener: logging calls
+    only enqueue the record.
+
     Args:
         logger_name: Name of logger to attach to. None for root logger.
         level: Minimum log level to capture.
@@ -305,7 +465,7 @@ def setup_log_store_handler(logger_name: str = None, level: int = logging.INFO)
     if _handler_initialized:
         # Find and return existing handler
         target_logger = logging.getLogger(logger_name) if logger_name else logging.getLogger()
-        for existing in target_logger.handlers:
+        for existing in target_logger.handlers + list(get_queued_handlers(logger_name)):
             if isinstance(existing, LogStoreHandler):
                 return existing
 
@@ -315,14 +475,14 @@ def setup_log_store_handler(logger_name: str = None, level: int = logging.INFO)
         target_logger = logging.getLogger()
 
     # Avoid duplicate handlers - check all handlers including root
-    for existing in target_logger.handlers:
+    for existing in target_logger.handlers + list(get_queued_handlers(logger_name)):
         if isinstance(existing, LogStoreHandler):
             _handler_initialized = True
             return existing
 
     # Also check root logger if we're not already on it
     if logger_name:
-        for existing in logging.getLogger().handlers:
+        for existing in logging.getLogger().handlers + list(get_queued_handlers()):
             if isinstance(existing, LogStoreHandler):
                 _handler_initialized = True
                 return existing
@@ -337,7 +497,7 @@ def setup_log_store_handler(logger_name: str = None, level: int = logging.INFO)
     if target_logger.level > level or target_logger.level == logging.NOTSET:
         target_logger.setLevel(level)
 
-    target_logger.addHandler(handler)
+    add_queued_handler(handler, logger_name)
     _handler_initialized = True
 
     # Add initial log entries to confirm logging is working and test all levels
@@ -2,8 +2,9 @@
 Media Analyzer Service for Seedarr v2.0
 
 This module handles MediaInfo analysis and .torrent file creation with
-non-blocking async performance. File hashing operations are offloaded to
-ProcessPoolExecutor to prevent blocking the event loop.
+non-blocking async performance. Piece hashing is split across a
+ProcessPoolExecutor (see piece_hasher) to use every CPU core without
+blocking the event loop.
 
 Key Features:
     - MediaInfo technical analysis extraction
@@ -12,9 +13,10 @@ Key Features:
     - Async-friendly design with no blocking operations >100ms
 
 Performance Optimization:
-    File hashing (CPU-intensive) is offloaded to ProcessPoolExecutor using
-    asyncio's run_in_executor(). This ensures the async event loop remains
-    responsive during large file processing.
+    Torrent creation runs in a worker thread; the CPU-intensive piece hashing
+    it triggers is fanned out over the shared piece hashing ProcessPoolExecutor
+    in piece-aligned ranges. This keeps the event loop responsive and uses all
+    cores on large files.
 
 Critical Requirements:
     - .torrent files MUST include source="lacale" flag (prevents re-download)
@@ -41,36 +43,27 @@ import logging
 import os
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Dict, Any
 from sqlalchemy.orm import Session
 
 from .exceptions import TrackerAPIError
+from .piece_hasher import get_hasher_pool, hash_pieces, shutdown_hasher_pool
 from .tmdb_cache_service import TMDBCacheService
 
 logger = logging.getLogger(__name__)
 
-# Global ProcessPoolExecutor for file hashing operations
-# This is shared across all MediaAnalyzer instances for efficiency
-_process_pool: Optional[ProcessPoolExecutor] = None
-
 
 def _get_process_pool() -> ProcessPoolExecutor:
     """
-    Get or create the global ProcessPoolExecutor for file hashing.
+    Get the global ProcessPoolExecutor used for file hashing.
 
-    Uses a global singleton pattern to avoid creating multiple process pools.
-    The pool is sized based on CPU count for optimal performance.
+    The pool is shared with the piece hasher (one worker per CPU core), so
+    MediaAnalyzer and TorrentGenerator never compete with separate pools.
 
     Returns:
         ProcessPoolExecutor instance
     """
-    global _process_pool
-    if _process_pool is None:
-        # Use max_workers=None to auto-detect CPU count
-        # For file hashing, we want one worker per CPU core
-        _process_pool = ProcessPoolExecutor(max_workers=None)
-        logger.info("✓ ProcessPoolExecutor initialized for file hashing operations")
-    return _process_pool
+    return get_hasher_pool()
 
 
 def _create_torrent_sync(
@@ -80,10 +73,10 @@ def _create_torrent_sync(
     source: str = "lacale"
 ) -> str:
     """
-    Synchronous torrent creation function (runs in ProcessPoolExecutor).
+    Synchronous torrent creation function (runs in a worker thread).
 
-    This function is executed in a separate process to avoid blocking the
-    event loop during CPU-intensive file hashing operations.
+    Piece hashing for single files is fanned out over the piece hashing
+    ProcessPoolExecutor; directories fall back to torf's own hasher.
 
     CRITICAL: This function MUST include source="lacale" flag to prevent
     torrent clients from re-downloading all content when the .torrent file
@@ -102,8 +95,8 @@ def _create_torrent_sync(
         Exception: If torrent creation fails (will be wrapped in TrackerAPIError)
 
     Note:
-        This function runs in a separate process, so it cannot access
-        the main process's logger or database session.
+        This function must not access the database session; it runs
+        outside the event loop thread.
     """
     try:
         import torf  # Import here to avoid issues with process serialization
@@ -120,7 +113,10 @@ def _create_torrent_sync(
 
         # Create .torrent file
         # This is CPU-intensive for large files (hashing all chunks)
-        torrent.generate()
+        if os.path.isfile(file_path):
+            torrent.metainfo['info']['pieces'] = hash_pieces(file_path, torrent.piece_size)
+        else:
+            torrent.generate()
 
         # Write to output path
         torrent.write(output_path)
@@ -233,14 +229,9 @@ class MediaAnalyzer:
         logger.info(f"Offloading file hashing to ProcessPoolExecutor (non-blocking)")
 
         try:
-            # Get process pool for file hashing
-            pool = _get_process_pool()
-
-            # Run CPU-intensive torrent creation in separate process
-            # This prevents blocking the async event loop during file hashing
-            loop = asyncio.get_event_loop()
-            result_path = await loop.run_in_executor(
-                pool,
+            # Run torrent creation in a worker thread; piece hashing itself
+            # is spread over the piece hashing process pool
+            result_path = await asyncio.to_thread(
                 _create_torrent_sync,
                 file_path,
                 announce_url,
@@ -398,9 +389,5 @@ def shutdown_process_pool():
         >>> # During application shutdown
         >>> shutdown_process_pool()
     """
-    global _process_pool
-    if _process_pool is not None:
-        logger.info("Shutting down ProcessPoolExecutor...")
-        _process_pool.shutdown(wait=True)
-        _process_pool = None
+    if shutdown_hasher_pool():
         logger.info("✓ ProcessPoolExecutor shutdown complete")
@@ -0,0 +1,271 @@
+"""
+Media Library Index for Seedarr v2.0
+
+This module keeps an in-memory index of the files managed by Radarr and
+Sonarr so that sceneName lookups no longer download the whole library for
+every scanned file.
+
+Features:
+    - One snapshot per (service, base_url, api_key), shared by all pipelines
+    - O(1) lookups by full path, basename and normalized basename
+    - Full rebuild when the snapshot is older than MEDIA_LIBRARY_INDEX_TTL
+    - Incremental refresh of a single movie / series from Radarr/Sonarr webhooks
+    - Single-flight rebuilds: concurrent lookups wait for one download
+
+Snapshots are copy-on-write: a refresh builds a new snapshot and swaps it in,
+so a batch scan holding a snapshot keeps a consistent view of the library.
+
+Usage Example:
+    index = get_media_library_index()
+    snapshot = await index.get_snapshot(radarr_client)
+    movies = snapshot.by_path(file_path)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# (group id, file path, record) — group is the movie id (Radarr) or series id (Sonarr)
+LibraryItem = Tuple[Any, str, Dict[str, Any]]
+
+
+def normalize_basename(name: str) -> str:
+    """Normalize a filename for cross-platform comparison.
+
+    Removes characters that Windows does not allow in filenames but Linux does
+    (primarily ':'), which causes mismatches when Radarr runs on Linux and
+    Seedarr reads the SMB-mounted path on Windows.
+    """
+    for ch in ':*?"<>|':
+        name = name.replace(ch, ' ')
+    return ' '.join(name.split()).lower()
+
+
+class LibrarySnapshot:
+    """
+    Immutable view of one Radarr/Sonarr library.
+
+    Records are grouped by movie/series id so a webhook can replace a single
+    group; path maps keep the library order of the records.
+    """
+
+    def __init__(self, groups: Dict[Any, List[Tuple[str, Dict[str, Any]]]], built_at: Optional[float] = None):
+        self.groups = groups
+        self.built_at = built_at if built_at is not None else time.monotonic()
+        self._by_path: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_basename: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_norm_basename: Dict[str, List[Dict[str, Any]]] = {}
+
+        for items in groups.values():
+            for path, record in items:
+                basename = os.path.basename(path)
+                self._by_path.setdefault(path, []).append(record)
+                self._by_basename.setdefault(basename, []).append(record)
+                self._by_norm_basename.setdefault(normalize_basename(basename), []).append(record)
+
+    @classmethod
+    def from_items(cls, items: Iterable[LibraryItem]) -> 'LibrarySnapshot':
+        groups: Dict[Any, List[Tuple[str, Dict[str, Any]]]] = {}
+        for group, path, record in items:
+            if path:
+                groups.setdefault(group, []).append((path, record))
+        return cls(groups)
+
+    def replace_group(self, group: Any, items: Iterable[LibraryItem]) -> 'LibrarySnapshot':
+        """Return a new snapshot where one movie/series is replaced (or removed if empty)."""
+        groups = dict(self.groups)
+        groups.pop(group, None)
+        entries = [(path, record) for _, path, record in items if path]
+        if entries:
+            groups[group] = entries
+        # Keep the TTL of the full build: an incremental update is not a full resync
+        return LibrarySnapshot(groups, built_at=self.built_at)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+    def __len__(self) -> int:
+        return len(self._by_path)
+
+    def by_path(self, path: str) -> List[Dict[str, Any]]:
+        return self._by_path.get(path, [])
+
+    def by_basename(self, basename: str) -> List[Dict[str, Any]]:
+        return self._by_basename.get(basename, [])
+
+    def by_norm_basename(self, basename: str) -> List[Dict[str, Any]]:
+        return self._by_norm_basename.get(normalize_basename(basename), [])
+
+
+@dataclass
+class _IndexState:
+    """Snapshot and rebuild bookkeeping of one library."""
+
+    snapshot: Optional[LibrarySnapshot] = None
+    lock: Optional[asyncio.Lock] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    builds: int = 0
+    incremental_updates: int = 0
+    lookups: int = 0
+    last_error: Optional[str] = None
+
+    def get_lock(self) -> asyncio.Lock:
+        # asyncio.Lock is bound to one event loop; recreate it if the loop changed
+        loop = asyncio.get_running_loop()
+        if self.lock is None or loop is not self.loop:
+            self.lock = asyncio.Lock()
+            self.loop = loop
+        return self.lock
+
+
+class MediaLibraryIndex:
+    """
+    Process-wide registry of Radarr/Sonarr library snapshots.
+
+    A client passed to get_snapshot() / refresh_group() must provide:
+        - library_kind: 'radarr' or 'sonarr'
+        - base_url, api_key
+        - async fetch_library_items() -> List[LibraryItem]
+        - async fetch_group_items(group) -> List[LibraryItem]
+
+    Attributes:
+        ttl: Seconds after which a snapshot is fully rebuilt
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else config.MEDIA_LIBRARY_INDEX_TTL
+        self._states: Dict[Tuple[str, str, str], _IndexState] = {}
+
+    @staticmethod
+    def _key(client: Any) -> Tuple[str, str, str]:
+        return (client.library_kind, client.base_url.rstrip('/'), client.api_key or '')
+
+    def _state(self, client: Any) -> _IndexState:
+        key = self._key(client)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _IndexState()
+        return state
+
+    async def get_snapshot(self, client: Any, max_age: Optional[float] = None) -> LibrarySnapshot:
+        """
+        Get the library snapshot of a client, rebuilding it if too old.
+
+        Args:
+            client: RadarrClient or SonarrClient
+            max_age: Maximum accepted snapshot age in seconds (defaults to ttl)
+
+        Returns:
+            Current LibrarySnapshot
+
+        Raises:
+            Exception: Errors of the library download when no snapshot exists yet
+        """
+        max_age = self.ttl if max_age is None else max_age
+        state = self._state(client)
+        state.lookups += 1
+
+        snapshot = state.snapshot
+        if snapshot is not None and snapshot.age <= max_age:
+            return snapshot
+
+        async with state.get_lock():
+            # Another caller may have rebuilt the snapshot while we waited
+            snapshot = state.snapshot
+            if snapshot is not None and snapshot.age <= max_age:
+                return snapshot
+
+            try:
+                items = await client.fetch_library_items()
+            except Exception as e:
+                state.last_error = str(e)
+                if snapshot is None:
+                    raise
+                logger.warning(
+                    f"{client.library_kind}: library refresh failed ({e}) — "
+                    f"keeping snapshot from {snapshot.age:.0f}s ago"
+                )
+                return snapshot
+
+            state.snapshot = LibrarySnapshot.from_items(items)
+            state.builds += 1
+            state.last_error = None
+            logger.debug(f"{client.library_kind}: indexed {len(state.snapshot)} file(s) from {client.base_url}")
+            return state.snapshot
+
+    async def refresh_group(self, client: Any, group: Any) -> None:
+        """
+        Re-fetch a single movie/series and swap it into the snapshot.
+
+        Does nothing if the library was never indexed (the next lookup will
+        build it). Falls back to invalidating the snapshot if the fetch fails.
+
+        Args:
+            client: RadarrClient or SonarrClient
+            group: Movie id (Radarr) or series id (Sonarr)
+        """
+        state = self._state(client)
+        if state.snapshot is None:
+            return
+
+        try:
+            items = await client.fetch_group_items(group)
+        except Exception as e:
+            logger.warning(f"{client.library_kind}: failed to refresh {group} ({e}) — invalidating index")
+            self.invalidate(client)
+            return
+
+        async with state.get_lock():
+            if state.snapshot is not None:
+                state.snapshot = state.snapshot.replace_group(group, items)
+                state.incremental_updates += 1
+
+    def invalidate(self, client: Optional[Any] = None) -> None:
+        """Drop the snapshot of a client, or every snapshot if client is None."""
+        if client is None:
+            for state in self._states.values():
+                state.snapshot = None
+            return
+        state = self._states.get(self._key(client))
+        if state is not None:
+            state.snapshot = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict with the ttl and, per library, size/age/build counters
+        """
+        libraries = {}
+        for (kind, base_url, _), state in self._states.items():
+            snapshot = state.snapshot
+            libraries[f"{kind}:{base_url}"] = {
+                'files': len(snapshot) if snapshot is not None else 0,
+                'age_seconds': round(snapshot.age, 1) if snapshot is not None else None,
+                'lookups': state.lookups,
+                'builds': state.builds,
+                'incremental_updates': state.incremental_updates,
+                'last_error': state.last_error,
+            }
+        return {'ttl_seconds': self.ttl, 'libraries': libraries}
+
+
+# Global index instance
+_media_library_index: Optional[MediaLibraryIndex] = None
+
+
+def get_media_library_index() -> MediaLibraryIndex:
+    """Get the global MediaLibraryIndex instance."""
+    global _media_library_index
+    if _media_library_index is None:
+        _media_library_index = MediaLibraryIndex()
+    return _media_library_index
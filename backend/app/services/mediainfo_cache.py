@@ -0,0 +1,270 @@
+"""
+MediaInfo Cache for Seedarr v2.0
+
+This module caches parsed MediaInfo data so a release is parsed once instead
+of once in the analysis stage, once for the NFO and once per tracker for the
+BBCode description. On network-mounted media each parse costs seconds of I/O.
+
+Features:
+    - Content-addressed: keyed on (device, inode, size, mtime_ns) of the file,
+      so hardlinked copies share an entry and a modified file misses
+    - Bounded in-memory LRU in front of the mediainfo_cache table, so entries
+      survive restarts and retries
+    - Single-flight: concurrent extractions of the same file share one parse
+    - Failed or empty parses are never cached
+
+Usage Example:
+    cache = get_mediainfo_cache()
+    media_data = await cache.get_or_extract(path, lambda: generator._parse_mediainfo(path))
+"""
+
+import asyncio
+import copy
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..config import config
+from .nfo_generator import MediaInfoData
+
+logger = logging.getLogger(__name__)
+
+# (st_dev, st_ino, st_size, st_mtime_ns)
+MediaInfoKey = Tuple[int, int, int, int]
+
+
+def file_identity(file_path: str) -> Optional[MediaInfoKey]:
+    """
+    Get the cache key of a file.
+
+    Args:
+        file_path: Path to the media file
+
+    Returns:
+        (device, inode, size, mtime_ns), or None if the file cannot be
+        stat'ed or the filesystem reports no inode numbers
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    if not st.st_ino:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _rename(data: MediaInfoData, parsed_name: Optional[str], file_path: str) -> MediaInfoData:
+    """Point the file name of data parsed from another link at file_path."""
+    if not parsed_name:
+        return data
+    parsed, requested = Path(parsed_name), Path(file_path)
+    if parsed.name == requested.name:
+        return data
+    if data.file_name == parsed.name:
+        data.file_name = requested.name
+    elif data.file_name == parsed.stem:
+        data.file_name = requested.stem
+    return data
+
+
+class MediaInfoCache:
+    """
+    Process-wide cache of MediaInfoData keyed on file identity.
+
+    Entries are persisted through session_factory (a callable returning a
+    SQLAlchemy session) when given; get_or_extract() runs the database
+    work in worker threads. Callers always receive a copy.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        max_entries: Optional[int] = None
+    ):
+        self.session_factory = session_factory
+        self.max_entries = max_entries if max_entries is not None else config.MEDIAINFO_CACHE_MAX_ENTRIES
+        # (device, inode) -> (key, file name that was parsed, data)
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[MediaInfoKey, str, MediaInfoData]]" = OrderedDict()
+        self._inflight: Dict[MediaInfoKey, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: MediaInfoKey) -> Optional[Tuple[str, MediaInfoData]]:
+        """
+        Get the cached data of a file identity (memory first, then database).
+
+        Args:
+            key: Cache key from file_identity()
+
+        Returns:
+            (parsed file name, MediaInfoData) if cached for this exact
+            size and mtime, None otherwise
+        """
+        cached = self._get_memory(key)
+        if cached is not None:
+            return cached
+        loaded = self._load(key)
+        if loaded is not None:
+            self._remember(key, *loaded)
+        return loaded
+
+    async def aget(self, key: MediaInfoKey) -> Optional[Tuple[str, MediaInfoData]]:
+        """Like get(), with the database lookup run in a worker thread."""
+        cached = self._get_memory(key)
+        if cached is not None:
+            return cached
+        loaded = await asyncio.to_thread(self._load, key)
+        if loaded is not None:
+            self._remember(key, *loaded)
+        return loaded
+
+    def store(self, key: MediaInfoKey, file_path: str, data: MediaInfoData) -> None:
+        """Cache the data of a file (memory and database)."""
+        self._remember(key, Path(file_path).name, data)
+        self._persist(key, file_path, data)
+
+    async def astore(self, key: MediaInfoKey, file_path: str, data: MediaInfoData) -> None:
+        """Like store(), with the database write run in a worker thread."""
+        self._remember(key, Path(file_path).name, data)
+        await asyncio.to_thread(self._persist, key, file_path, data)
+
+    async def get_or_extract(
+        self,
+        file_path: str,
+        extract: Callable[[], Awaitable[MediaInfoData]]
+    ) -> MediaInfoData:
+        """
+        Get the MediaInfo data of a file, parsing it once if not cached.
+
+        Args:
+            file_path: Path to the media file
+            extract: Coroutine function parsing the file
+
+        Returns:
+            MediaInfoData for the file
+        """
+        key = await asyncio.to_thread(file_identity, file_path)
+        if key is None:
+            return await extract()
+
+        cached = await self.aget(key)
+        if cached is not None:
+            self.hits += 1
+            logger.debug(f"MediaInfo cache hit: {Path(file_path).name}")
+            parsed_name, data = cached
+            return _rename(copy.deepcopy(data), parsed_name, file_path)
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._extract_and_store(key, file_path, extract))
+            self._inflight[key] = task
+        else:
+            logger.debug(f"Waiting for in-flight MediaInfo parse of {Path(file_path).name}")
+
+        # Shield so a cancelled waiter does not cancel the parse for the others
+        parsed_name, data = await asyncio.shield(task)
+        return _rename(copy.deepcopy(data), parsed_name, file_path)
+
+    async def _extract_and_store(
+        self,
+        key: MediaInfoKey,
+        file_path: str,
+        extract: Callable[[], Awaitable[MediaInfoData]]
+    ) -> Tuple[str, MediaInfoData]:
+        try:
+            data = await extract()
+            if data.format or data.video_tracks or data.audio_tracks:
+                await self.astore(key, file_path, data)
+            return Path(file_path).name, data
+        finally:
+            self._inflight.pop(key, None)
+
+    def _get_memory(self, key: MediaInfoKey) -> Optional[Tuple[str, MediaInfoData]]:
+        inode_key = key[:2]
+        entry = self._entries.get(inode_key)
+        if entry is None:
+            return None
+        if entry[0] == key:
+            self._entries.move_to_end(inode_key)
+            return entry[1], entry[2]
+        # The file was modified or replaced since it was parsed
+        del self._entries[inode_key]
+        self.invalidations += 1
+        return None
+
+    def _remember(self, key: MediaInfoKey, file_name: str, data: MediaInfoData) -> None:
+        inode_key = key[:2]
+        self._entries[inode_key] = (key, file_name, data)
+        self._entries.move_to_end(inode_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: MediaInfoKey) -> Optional[Tuple[str, MediaInfoData]]:
+        def load(db, model) -> Optional[Tuple[str, MediaInfoData]]:
+            entry = model.get_valid(db, *key)
+            if entry is None:
+                return None
+            return entry.file_name or '', MediaInfoData.from_dict(entry.data or {})
+
+        return self._with_db(load)
+
+    def _persist(self, key: MediaInfoKey, file_path: str, data: MediaInfoData) -> None:
+        file_name = Path(file_path).name
+        self._with_db(lambda db, model: model.upsert(
+            db, key[0], key[1], key[2], key[3], file_name, data.to_dict()
+        ))
+
+    def _with_db(self, operation: Callable[[Any, Any], Any]) -> Any:
+        """Run operation(db, MediaInfoCacheEntry) in a short-lived session, if persistence is enabled."""
+        if self.session_factory is None:
+            return None
+        from app.models.mediainfo_cache import MediaInfoCacheEntry
+
+        db = None
+        try:
+            db = self.session_factory()
+            return operation(db, MediaInfoCacheEntry)
+        except Exception as e:
+            if db is not None:
+                db.rollback()
+            logger.warning(f"MediaInfo cache persistence failed: {e}")
+            return None
+        finally:
+            if db is not None:
+                db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'entries_in_memory': len(self._entries),
+            'entries_persisted': self._with_db(lambda db, model: model.count(db)),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'invalidations': self.invalidations,
+            'in_flight': len(self._inflight),
+        }
+
+
+# Global MediaInfo cache instance
+_mediainfo_cache: Optional[MediaInfoCache] = None
+
+
+def get_mediainfo_cache() -> MediaInfoCache:
+    """
+    Get the process-wide MediaInfoCache, persisted in the application database.
+
+    Returns:
+        MediaInfoCache instance
+    """
+    global _mediainfo_cache
+    if _mediainfo_cache is None:
+        from app.database import SessionLocal
+        _mediainfo_cache = MediaInfoCache(session_factory=SessionLocal)
+    return _mediainfo_cache
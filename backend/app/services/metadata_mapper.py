@@ -7,7 +7,7 @@ using label matching, eliminating hardcoded values.
 
 Key Features:
     - Dynamic tag resolution from database (no hardcoded IDs)
-    - Regex-based filename parsing for metadata extraction
+    - Filename parsing through the shared release name parser (precompiled, memoized)
     - MediaInfo integration for accurate technical details
     - Flexible mapping rules with fuzzy matching
     - Support for both Films and TV Shows categories
@@ -34,6 +34,7 @@ from sqlalchemy.orm import Session
 
 from app.models.tags import Tags
 from app.models.categories import Categories
+from app.services.release_parser import get_release_parser
 
 logger = logging.getLogger(__name__)
 
@@ -57,110 +58,6 @@ class MetadataMapper:
         _tag_cache: In-memory cache of tag label -> tag_id mappings
     """
 
-    # ============================================================================
-    # Regex patterns for filename parsing
-    # ============================================================================
-
-    # Resolution patterns
-    RESOLUTION_PATTERNS = {
-        '2160p': [r'2160p', r'\b2160\b', r'4k', r'uhd'],
-        '1080p': [r'1080p', r'1080i', r'\b1080\b'],
-        '720p': [r'720p', r'\b720\b'],
-        '576p': [r'576p', r'576i'],
-        '480p': [r'480p', r'480i'],
-    }
-
-    # Source patterns (order matters - check more specific first)
-    SOURCE_PATTERNS = {
-        'BluRay': [r'blu[\-\.]?ray', r'bdrip', r'brrip'],
-        'WEB-DL': [r'web[\-\.]?dl', r'webdl'],
-        'WEBRip': [r'webrip', r'web[\-\.]?rip'],
-        'HDTV': [r'hdtv'],
-        'DVDRip': [r'dvdrip', r'dvd[\-\.]?rip'],
-        'HDRip': [r'hdrip', r'hd[\-\.]?rip'],
-        'CAM': [r'cam', r'camrip', r'hdcam'],
-        'TS': [r'telesync', r'hdts', r'\bts\b'],
-        'VOD': [r'\bvod\b'],
-        'mHD': [r'\bmhd\b'],
-    }
-
-    # REMUX detection (separated from source)
-    REMUX_PATTERNS = [r'remux', r'bdremux']
-
-    # REPACK detection
-    REPACK_PATTERNS = [r'repack', r'rerip']
-
-    # IMAX detection
-    IMAX_PATTERNS = [r'imax']
-
-    # Edition/type detection
-    EDITION_PATTERNS = {
-        'DOC': [r'\bdoc\b', r'\bdocu\b', r'documentary', r'documentaire'],
-        'INTEGRALE': [r'integrale', r'complete[\.\-\s]?series'],
-        'COLLECTION': [r'collection', r'saga'],
-    }
-
-    # Video codec patterns
-    CODEC_PATTERNS = {
-        'x265': [r'x265', r'hevc', r'h\.?265'],
-        'x264': [r'x264', r'avc', r'h\.?264'],
-        'AV1': [r'\bav1\b'],
-        'VP9': [r'vp9'],
-        'MPEG-2': [r'mpeg[\-\.]?2'],
-    }
-
-    # Audio codec patterns
-    AUDIO_PATTERNS = {
-        'Atmos': [r'atmos'],
-        'TrueHD': [r'truehd', r'true[\-\.]?hd'],
-        'DTS-HD MA': [r'dts[\-\.]?hd[\-\.]?ma', r'dts[\-\.]?hdma'],
-        'DTS-HD': [r'dts[\-\.]?hd'],
-        'DTS': [r'\bdts\b'],
-        'EAC3': [r'dd[\+p]', r'ddp', r'e[\-\.]?ac[\-\.]?3', r'eac3'],
-        'AC3': [r'dd5[\.\s]?1', r'ac[\-\.]?3[\-\.]?5[\.\s]?1', r'ac3'],
-        'AAC': [r'\baac\b'],
-        'FLAC': [r'\bflac\b'],
-        'MP3': [r'\bmp3\b'],
-    }
-
-    # HDR patterns
-    HDR_PATTERNS = {
-        'Dolby Vision': [r'dolby[\-\.\s]?vision', r'\bdv\b', r'dovi'],
-        'HDR10+': [r'hdr10[\+p]', r'hdr10plus'],
-        'HDR10': [r'hdr10', r'hdr[\-\.]?10'],
-        'HDR': [r'\bhdr\b'],
-        'SDR': [r'\bsdr\b'],
-    }
-
-    # Language patterns (French-focused for La Cale)
-    # IMPORTANT: MULTI must be checked BEFORE specific variants (VFF, VOF, etc.)
-    # because filenames like "MULTi VFF" should match MULTI as the language,
-    # with VFF detected separately as language_variant.
-    LANGUAGE_PATTERNS = {
-        'MULTI': [r'\bmulti\b', r'\bmulti\-?lang'],
-        'TRUEFRENCH': [r'truefrench'],
-        'VFF': [r'\bvff\b'],
-        'VOF': [r'\bvof\b'],
-        'VFQ': [r'\bvfq\b'],
-        'VFI': [r'\bvfi\b'],
-        'VF2': [r'\bvf2\b'],
-        'FRENCH': [r'\bfrench\b', r'\bvf\b'],
-        'VOSTFR': [r'vostfr', r'subfrench'],
-        'VO': [r'\bvo\b', r'\beng\b', r'\benglish\b'],
-    }
-
-    # TV Show detection patterns
-    TV_PATTERNS = [
-        r's\d{1,2}e\d{1,2}',  # S01E01
-        r's\d{1,2}[\.\-\s]?e\d{1,2}',  # S01.E01, S01-E01
-        r'\d{1,2}x\d{1,2}',  # 1x01
-        r'season[\.\-\s]?\d+',  # Season 1
-        r'saison[\.\-\s]?\d+',  # Saison 1 (French)
-        r'episode[\.\-\s]?\d+',  # Episode 1
-        r'complete[\.\-\s]?series',
-        r'integrale',
-    ]
-
     def __init__(self, db: Session):
         """
         Initialize MetadataMapper.
@@ -225,24 +122,6 @@ class MetadataMapper:
         logger.debug(f"No tag found for label: {label}")
         return None
 
-    def _match_pattern(self, text: str, patterns: Dict[str, List[str]]) -> Optional[str]:
-        """
-        Match text against pattern dictionary.
-
-        Args:
-            text: Text to search in (usually filename)
-            patterns: Dict of label -> list of regex patterns
-
-        Returns:
-            Matched label if found, None otherwise
-        """
-        text_lower = text.lower()
-        for label, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    return label
-        return None
-
     def is_tv_show(self, filename: str) -> bool:
         """
         Determine if filename represents a TV show.
@@ -253,17 +132,15 @@ class MetadataMapper:
         Returns:
             True if TV show patterns detected, False otherwise
         """
-        filename_lower = filename.lower()
-        for pattern in self.TV_PATTERNS:
-            if re.search(pattern, filename_lower, re.IGNORECASE):
-                logger.debug(f"TV show detected in: {filename}")
-                return True
-        return False
+        return get_release_parser().parse(filename)['is_tv_show']
 
     def parse_filename(self, filename: str) -> Dict[str, Optional[str]]:
         """
         Parse filename to extract metadata.
 
+        Parsing is delegated to the shared release name parser, which
+        memoizes results per name.
+
         Args:
             filename: Filename to parse
 
@@ -278,157 +155,12 @@ class MetadataMapper:
                 - hdr: "HDR10", "Dolby Vision", etc.
                 - language: "FRENCH", "MULTI", etc.
                 - is_tv_show: bool
+                - team: Release group if found
         """
-        # Detect REMUX, REPACK, IMAX flags
-        filename_lower = filename.lower()
-        remux = any(re.search(p, filename_lower) for p in self.REMUX_PATTERNS)
-        repack = any(re.search(p, filename_lower) for p in self.REPACK_PATTERNS)
-        imax = any(re.search(p, filename_lower) for p in self.IMAX_PATTERNS)
-
-        # Detect edition (DOC, INTEGRALE, COLLECTION)
-        edition = self._match_pattern(filename, self.EDITION_PATTERNS)
-
-        # Detect language and language variant (MULTI.VFF compound)
-        language = self._match_pattern(filename, self.LANGUAGE_PATTERNS)
-        language_variant = None
-        if language == 'MULTI':
-            # Check for compound MULTI + VFF/VOF/VFQ/VFI/VF2
-            variant_patterns = {
-                'VFF': [r'\bvff\b'],
-                'VOF': [r'\bvof\b'],
-                'VFQ': [r'\bvfq\b'],
-                'VFI': [r'\bvfi\b'],
-                'VF2': [r'\bvf2\b'],
-            }
-            language_variant = self._match_pattern(filename, variant_patterns)
-
-        # Extract title and year from filename
-        title, year = self._extract_title_and_year(filename)
-
-        result = {
-            'title': title,
-            'year': year,
-            'resolution': self._match_pattern(filename, self.RESOLUTION_PATTERNS),
-            'source': self._match_pattern(filename, self.SOURCE_PATTERNS),
-            'codec': self._match_pattern(filename, self.CODEC_PATTERNS),
-            'audio': self._match_pattern(filename, self.AUDIO_PATTERNS),
-            'hdr': self._match_pattern(filename, self.HDR_PATTERNS),
-            'language': language,
-            'language_variant': language_variant,
-            'is_tv_show': self.is_tv_show(filename),
-            'remux': remux,
-            'repack': repack,
-            'imax': imax,
-            'edition': edition,
-        }
-
+        result = get_release_parser().parse(filename)
         logger.debug(f"Parsed filename '{filename}': {result}")
         return result
 
-    def _extract_title_and_year(self, filename: str) -> Tuple[Optional[str], Optional[int]]:
-        """
-        Extract clean title and year from filename.
-
-        The title is everything before the year or technical indicators.
-        Handles formats like:
-        - "The.Hangover.Part.III.2013.VFF.1080p.BluRay.AC3.x265-HD2.mkv"
-        - "Movie Title 2024 1080p WEB-DL"
-        - "Show.Name.S01E05.720p.HDTV"
-        - "1917 (2019) VFF BLURAY HDRIP 1080 HEVC E-AC-3.mkv"  (numeric title)
-
-        Args:
-            filename: Filename to parse
-
-        Returns:
-            Tuple of (title, year) where either can be None
-        """
-        # Remove extension
-        name = re.sub(r'\.[a-zA-Z0-9]{2,4}$', '', filename)
-
-        # Replace dots and underscores with spaces for easier parsing
-        name_spaced = re.sub(r'[._]', ' ', name)
-
-        year = None
-        title = None
-
-        # Strategy 1: Year in parentheses - most reliable (e.g., "1917 (2019)")
-        paren_match = re.search(r'\((\d{4})\)', name_spaced)
-        if paren_match:
-            candidate_year = int(paren_match.group(1))
-            if 1900 <= candidate_year <= 2099:
-                year = candidate_year
-                # Title is everything before the opening parenthesis
-                title = name_spaced[:paren_match.start()].strip()
-
-        # Strategy 2: Year NOT at position 0 (avoid matching numeric titles like "1917")
-        if not year:
-            for year_match in re.finditer(r'\b(19\d{2}|20\d{2})\b', name_spaced):
-                if year_match.start() > 0:
-                    candidate_title = name_spaced[:year_match.start()].strip()
-                    if candidate_title:
-                        year = int(year_match.group(1))
-                        title = candidate_title
-                        break
-
-        # Strategy 3: Year at position 0, but followed by another year (e.g., "1917 2019 ...")
-        if not year:
-            all_years = list(re.finditer(r'\b(19\d{2}|20\d{2})\b', name_spaced))
-            if len(all_years) >= 2:
-                # First match is likely the title, second is the year
-                year = int(all_years[1].group(1))
-                title = name_spaced[:all_years[1].start()].strip()
-            elif len(all_years) == 1:
-                # Single year-like number - check if it's followed by technical indicators
-                # which would suggest it's a title, not a year
-                after_match = name_spaced[all_years[0].end():].strip()
-                technical_after = re.match(
-                    r'(FRENCH|MULTI|VFF|VFQ|VOSTFR|TRUEFRENCH|'
-                    r'BluRay|WEB|HDTV|HDRip|1080p?|720p?|2160p?|'
-                    r'x264|x265|HEVC|REMUX|REPACK)\b',
-                    after_match, re.IGNORECASE
-                )
-                if technical_after and all_years[0].start() == 0:
-                    # Year-like number at start followed by technical info = numeric title, no year
-                    title = all_years[0].group(1)
-                else:
-                    year = int(all_years[0].group(1))
-                    title = name_spaced[:all_years[0].start()].strip()
-
-        if not year and not title:
-            # No year found, try to find first technical indicator
-            # Common indicators: resolution, language, source, codec
-            indicators = [
-                r'\b(2160p|1080p|720p|480p|576p)\b',
-                r'\b(FRENCH|MULTI|MULTi|TRUEFRENCH|VFF|VFQ|VOSTFR|ENGLISH)\b',
-                r'\b(BluRay|WEB|HDTV|DVDRip|BDRip|WEBRip|HDRip)\b',
-                r'\b(x264|x265|H264|H265|HEVC|AVC|XviD)\b',
-                r'\b(REMUX|REPACK|PROPER|IMAX)\b',
-                r'\bS\d{1,2}(?:E\d{1,2})?\b',  # Season/Episode
-            ]
-
-            earliest_pos = len(name_spaced)
-            for pattern in indicators:
-                match = re.search(pattern, name_spaced, re.IGNORECASE)
-                if match and match.start() < earliest_pos:
-                    earliest_pos = match.start()
-
-            if earliest_pos < len(name_spaced):
-                title = name_spaced[:earliest_pos].strip()
-            else:
-                # Fallback: remove group tag (-GROUP at the end) and use as title
-                title = re.sub(r'\s*-\s*[A-Za-z0-9]+$', '', name_spaced).strip()
-
-        # Clean up title
-        if title:
-            # Remove parentheses left over from year extraction (e.g., "1917 (")
-            title = re.sub(r'[\(\)]+', '', title)
-            # Remove trailing dashes, dots, spaces
-            title = re.sub(r'[\s.\-]+$', '', title)
-            # Remove double spaces
-            title = re.sub(r'\s+', ' ', title)
-
-        return title if title else None, year
-
     def detect_source_from_mediainfo(self, mediainfo_dict: Dict[str, Any]) -> Optional[str]:
         """
         Detect source (BluRay, WEB-DL, DVDRip) from MediaInfo technical data.
@@ -15,7 +15,7 @@ import logging
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +76,23 @@ class MediaInfoData:
     audio_tracks: List[AudioTrack] = field(default_factory=list)
     subtitle_tracks: List[SubtitleTrack] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MediaInfoData':
+        """Build from a dict produced by to_dict(), ignoring unknown keys."""
+        def build(track_cls, values: Dict[str, Any]):
+            names = {f.name for f in fields(track_cls)}
+            return track_cls(**{k: v for k, v in values.items() if k in names})
+
+        media = build(cls, {k: v for k, v in data.items() if not k.endswith('_tracks')})
+        media.video_tracks = [build(VideoTrack, t) for t in data.get('video_tracks', [])]
+        media.audio_tracks = [build(AudioTrack, t) for t in data.get('audio_tracks', [])]
+        media.subtitle_tracks = [build(SubtitleTrack, t) for t in data.get('subtitle_tracks', [])]
+        return media
+
 
 class NFOGenerator:
     """
@@ -172,6 +189,9 @@ class NFOGenerator:
         """
         Extract MediaInfo data from a media file.
 
+        Results are served from the MediaInfo cache while the file is
+        unchanged, so stages and trackers share a single parse.
+
         Args:
             file_path: Path to the media file
 
@@ -182,6 +202,13 @@ class NFOGenerator:
             logger.warning("MediaInfo not available, returning empty data")
             return MediaInfoData(file_name=Path(file_path).name)
 
+        from .mediainfo_cache import get_mediainfo_cache
+        return await get_mediainfo_cache().get_or_extract(
+            file_path, lambda: self._parse_mediainfo(file_path)
+        )
+
+    async def _parse_mediainfo(self, file_path: str) -> MediaInfoData:
+        """Parse a media file with MediaInfo (uncached)."""
         try:
             from pymediainfo import MediaInfo
 
@@ -0,0 +1,264 @@
+"""
+Parallel Piece Hasher for Seedarr v2.0
+
+This module computes BitTorrent v1 piece hashes (SHA1) for large media files
+using every available CPU core. torf hashes pieces with a single reader
+thread, which leaves most cores idle on large 4K remuxes.
+
+How it works:
+    - The file is split into piece-aligned byte ranges (tasks)
+    - Each task is hashed in a ProcessPoolExecutor worker
+    - Workers read with large readinto() buffers and hash memoryview
+      slices, so no per-piece copies are made
+    - Digests are reassembled in piece order into the "pieces" blob
+      expected by torf (metainfo['info']['pieces'])
+
+Progress:
+    Hashing progress is published to an in-process registry keyed by file
+    path, so the dashboard can display a hash percentage while a torrent is
+    being created (see get_hash_progress()).
+
+Limitations:
+    Only single-file payloads are supported (pieces never span files).
+    Callers should fall back to torf.Torrent.generate() for directories.
+
+Usage Example:
+    >>> from app.services.piece_hasher import hash_pieces
+    >>> pieces = hash_pieces("/media/Movie.mkv", piece_size=16 * 1024 * 1024)
+    >>> torrent.metainfo['info']['pieces'] = pieces
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+
+# SHA1 digest length in bytes
+DIGEST_SIZE = 20
+
+# Target amount of data per pool task. Large enough to amortize IPC,
+# small enough to keep all workers busy and progress fine-grained.
+TASK_BYTES = 256 * MiB
+
+# Target size of the read buffer used inside a worker
+READ_BUFFER_BYTES = 32 * MiB
+
+# Files smaller than this are hashed inline (pool startup would dominate)
+PARALLEL_THRESHOLD = 64 * MiB
+
+# Progress callback: (hashed_bytes, total_bytes)
+ProgressCallback = Callable[[int, int], None]
+
+# Global ProcessPoolExecutor for piece hashing
+_hasher_pool: Optional[ProcessPoolExecutor] = None
+_hasher_pool_lock = threading.Lock()
+
+# In-flight hashing progress: file path -> (hashed_bytes, total_bytes)
+_progress: Dict[str, Tuple[int, int]] = {}
+_progress_lock = threading.Lock()
+
+
+def get_hasher_pool() -> ProcessPoolExecutor:
+    """
+    Get or create the global ProcessPoolExecutor used for piece hashing.
+
+    Returns:
+        ProcessPoolExecutor instance (one worker per CPU core)
+    """
+    global _hasher_pool
+    with _hasher_pool_lock:
+        if _hasher_pool is None:
+            _hasher_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+            logger.info("✓ ProcessPoolExecutor initialized for piece hashing")
+        return _hasher_pool
+
+
+def shutdown_hasher_pool() -> bool:
+    """
+    Shutdown the global piece hashing pool (call on application shutdown).
+
+    Returns:
+        True if a pool was running and has been shut down
+    """
+    global _hasher_pool
+    with _hasher_pool_lock:
+        if _hasher_pool is None:
+            return False
+        logger.info("Shutting down piece hashing pool...")
+        _hasher_pool.shutdown(wait=True)
+        _hasher_pool = None
+        return True
+
+
+def _hash_range(file_path: str, first_piece: int, piece_count: int, piece_size: int) -> bytes:
+    """
+    Hash a contiguous, piece-aligned range of a file (runs in a worker process).
+
+    Args:
+        file_path: Path to the file
+        first_piece: Index of the first piece in the range
+        piece_count: Number of pieces in the range
+        piece_size: Piece size in bytes
+
+    Returns:
+        Concatenated SHA1 digests for the pieces of the range
+    """
+    pieces_per_read = max(1, READ_BUFFER_BYTES // piece_size)
+    buffer = bytearray(pieces_per_read * piece_size)
+    view = memoryview(buffer)
+    digests = bytearray()
+    sha1 = hashlib.sha1
+
+    with open(file_path, 'rb', buffering=0) as f:
+        f.seek(first_piece * piece_size)
+        remaining = piece_count
+        while remaining > 0:
+            want = min(pieces_per_read, remaining) * piece_size
+            filled = 0
+            while filled < want:
+                n = f.readinto(view[filled:want])
+                if not n:
+                    break
+                filled += n
+            if filled == 0:
+                break
+
+            for offset in range(0, filled, piece_size):
+                digests += sha1(view[offset:min(offset + piece_size, filled)]).digest()
+            remaining -= (filled + piece_size - 1) // piece_size
+            if filled < want:
+                break
+
+    return bytes(digests)
+
+
+def _set_progress(file_path: str, hashed: int, total: int) -> None:
+    with _progress_lock:
+        _progress[file_path] = (hashed, total)
+
+
+def _clear_progress(file_path: str) -> None:
+    with _progress_lock:
+        _progress.pop(file_path, None)
+
+
+def get_hash_progress(file_path: str) -> Optional[float]:
+    """
+    Get hashing progress for a file currently being hashed.
+
+    Args:
+        file_path: Path of the file being hashed
+
+    Returns:
+        Percentage (0-100), or None if the file is not being hashed
+    """
+    with _progress_lock:
+        entry = _progress.get(file_path)
+    if entry is None:
+        return None
+    hashed, total = entry
+    return round(100.0 * hashed / total, 1) if total else 100.0
+
+
+def hash_pieces(
+    file_path: str,
+    piece_size: int,
+    progress_callback: Optional[ProgressCallback] = None,
+    executor: Optional[ProcessPoolExecutor] = None
+) -> bytes:
+    """
+    Compute the torrent "pieces" blob for a single file.
+
+    This call blocks until hashing is complete; run it with
+    asyncio.to_thread() from async code.
+
+    Args:
+        file_path: Path to the file to hash
+        piece_size: Piece size in bytes
+        progress_callback: Optional callable receiving (hashed_bytes, total_bytes)
+        executor: Optional process pool (defaults to the global hasher pool)
+
+    Returns:
+        Concatenated 20-byte SHA1 digests, one per piece, in piece order
+
+    Raises:
+        ValueError: If piece_size is not positive or the file is empty
+        OSError: If the file cannot be read
+    """
+    if piece_size <= 0:
+        raise ValueError(f"Invalid piece size: {piece_size}")
+
+    file_path = str(file_path)
+    total_size = os.path.getsize(file_path)
+    if total_size == 0:
+        raise ValueError(f"Cannot hash empty file: {file_path}")
+
+    piece_count = (total_size + piece_size - 1) // piece_size
+    _set_progress(file_path, 0, total_size)
+
+    try:
+        if total_size < PARALLEL_THRESHOLD:
+            pieces = _hash_range(file_path, 0, piece_count, piece_size)
+            _set_progress(file_path, total_size, total_size)
+            if progress_callback:
+                progress_callback(total_size, total_size)
+        else:
+            pieces = _hash_parallel(
+                file_path, total_size, piece_count, piece_size,
+                progress_callback, executor or get_hasher_pool()
+            )
+    finally:
+        _clear_progress(file_path)
+
+    if len(pieces) != piece_count * DIGEST_SIZE:
+        raise OSError(
+            f"Short read while hashing {file_path}: "
+            f"{len(pieces) // DIGEST_SIZE}/{piece_count} pieces"
+        )
+
+    return pieces
+
+
+def _hash_parallel(
+    file_path: str,
+    total_size: int,
+    piece_count: int,
+    piece_size: int,
+    progress_callback: Optional[ProgressCallback],
+    executor: ProcessPoolExecutor
+) -> bytes:
+    """Split the file into piece-aligned tasks and hash them in the pool."""
+    pieces_per_task = max(1, TASK_BYTES // piece_size)
+    ranges: List[Tuple[int, int]] = [
+        (first, min(pieces_per_task, piece_count - first))
+        for first in range(0, piece_count, pieces_per_task)
+    ]
+
+    futures = {
+        executor.submit(_hash_range, file_path, first, count, piece_size): index
+        for index, (first, count) in enumerate(ranges)
+    }
+
+    results: List[bytes] = [b''] * len(ranges)
+    hashed = 0
+    try:
+        for future in as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            first, count = ranges[index]
+            hashed += min(count * piece_size, total_size - first * piece_size)
+            _set_progress(file_path, hashed, total_size)
+            if progress_callback:
+                progress_callback(hashed, total_size)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+    return b''.join(results)
@@ -32,6 +32,7 @@ from urllib.parse import urljoin
 import httpx
 
 from .exceptions import NetworkRetryableError, retry_on_network_error
+from .http_client_pool import pooled_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -117,13 +118,14 @@ class ProwlarrClient:
         url = urljoin(self.base_url, endpoint)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(url) as client:
                 response = await client.request(
                     method=method,
                     url=url,
                     headers=self._get_headers(),
                     params=params,
-                    json=json_data
+                    json=json_data,
+                    timeout=self.timeout
                 )
 
                 # 5xx errors are retryable
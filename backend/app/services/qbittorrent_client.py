@@ -5,8 +5,9 @@ Dedicated module for all qBittorrent Web API interactions.
 Extracted from pipeline.py to provide a clean, reusable interface.
 
 Features:
-    - Authentication with session cookie management
+    - Persistent session: SID cookie reused, re-login only on 403
     - Torrent injection with configurable save path, category, and tags
+    - Batch injection of a release's per-tracker torrents
     - Tag management for existing torrents
     - Path mapping between Seedarr and qBittorrent mount points
     - Connection testing
@@ -14,12 +15,15 @@ Features:
 API Reference: https://github.com/qbittorrent/qBittorrent/wiki/WebUI-API-(qBittorrent-4.1)
 """
 
+import asyncio
 import logging
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 import httpx
 
+from .http_client_pool import pooled_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,68 +120,149 @@ class QBittorrentClient:
             QBittorrentError: On connection or API errors
             QBittorrentAuthError: On authentication failure
         """
-        if not self.host:
-            raise QBittorrentError("qBittorrent not configured: host is empty")
+        results = await self.inject_torrents(
+            [{'torrent_path': torrent_path, 'save_path': save_path, 'tags': tags}],
+            category=category,
+            skip_checking=skip_checking,
+            paused=paused,
+        )
+        if not results[0]['success']:
+            raise QBittorrentError(results[0]['message'])
+        return results[0]
 
-        if not torrent_path or not os.path.exists(torrent_path):
-            raise QBittorrentError(f"Torrent file not found: {torrent_path}")
+    async def inject_torrents(
+        self,
+        torrents: List[Dict[str, Any]],
+        category: str = "TP",
+        skip_checking: bool = True,
+        paused: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Inject several .torrent files (e.g. one per tracker) in batch.
 
-        # Apply path mapping
-        mapped_save_path = self.map_path(save_path)
+        Torrents sharing a save path are sent in a single /torrents/add
+        multipart request. When their tags differ, tags are applied afterwards
+        with one /torrents/addTags call per tag. Torrents of a group that were
+        already present (qBittorrent skips them, even on a partial "Ok.") are
+        tagged and categorised the same way. All requests reuse the persistent
+        qBittorrent session (no login per torrent).
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Authenticate
-                cookies = await self._authenticate(client)
+        Each torrent succeeds or fails on its own: an unreadable .torrent file
+        fails only its entry, a rejected request only its save path group.
 
-                # Read torrent file
-                with open(torrent_path, 'rb') as f:
-                    torrent_data = f.read()
+        Args:
+            torrents: List of dicts with 'torrent_path', 'save_path' and
+                optional 'tags' keys
+            category: qBittorrent category applied to all torrents
+            skip_checking: Skip hash verification
+            paused: Start in paused state
 
-                logger.info(
-                    f"Injecting torrent to qBittorrent: category={category}, "
-                    f"save_path={mapped_save_path}, tags={tags}"
-                )
+        Returns:
+            One result dict per torrent, in input order, with 'success',
+            'message', and 'already_exists' keys
 
-                # Build request
-                add_data = {
-                    "savepath": mapped_save_path,
-                    "category": category,
-                    "skip_checking": "true" if skip_checking else "false",
-                    "paused": "true" if paused else "false",
-                    "autoTMM": "false",
-                }
-                if tags:
-                    add_data["tags"] = tags
-
-                # Send torrent
-                response = await client.post(
-                    f"{self.host}/api/v2/torrents/add",
-                    cookies=cookies,
-                    files={"torrents": ("torrent.torrent", torrent_data, "application/x-bittorrent")},
+        Raises:
+            QBittorrentError: If qBittorrent is not configured
+            QBittorrentAuthError: On authentication failure
+        """
+        if not self.host:
+            raise QBittorrentError("qBittorrent not configured: host is empty")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(torrents)
+
+        # Read each .torrent on its own: a missing file only fails its tracker
+        contents: Dict[int, bytes] = {}
+        for index, item in enumerate(torrents):
+            torrent_path = item.get('torrent_path')
+            try:
+                if not torrent_path or not os.path.exists(torrent_path):
+                    raise QBittorrentError(f"Torrent file not found: {torrent_path}")
+                with open(torrent_path, 'rb') as f:
+                    contents[index] = f.read()
+            except (OSError, QBittorrentError) as e:
+                logger.warning(f"Cannot inject {torrent_path}: {e}")
+                results[index] = {'success': False, 'message': str(e), 'already_exists': False}
+
+        # Group torrents by (mapped) save path; each group is one add request
+        groups: Dict[str, List[int]] = {}
+        for index in contents:
+            mapped_save_path = self.map_path(torrents[index]['save_path'])
+            groups.setdefault(mapped_save_path, []).append(index)
+
+        session = self._get_session()
+
+        for mapped_save_path, indexes in groups.items():
+            group = [torrents[i] for i in indexes]
+            group_tags = {item.get('tags') for item in group}
+            shared_tags = group_tags.pop() if len(group_tags) == 1 else None
+
+            logger.info(
+                f"Injecting {len(group)} torrent(s) to qBittorrent: category={category}, "
+                f"save_path={mapped_save_path}, tags={shared_tags if shared_tags else [i.get('tags') for i in group]}"
+            )
+
+            add_data = {
+                "savepath": mapped_save_path,
+                "category": category,
+                "skip_checking": "true" if skip_checking else "false",
+                "paused": "true" if paused else "false",
+                "autoTMM": "false",
+            }
+            if shared_tags:
+                add_data["tags"] = shared_tags
+
+            files = [
+                ("torrents", (os.path.basename(torrents[i]['torrent_path']), contents[i], "application/x-bittorrent"))
+                for i in indexes
+            ]
+
+            try:
+                response = await session.request(
+                    "POST", "/api/v2/torrents/add",
+                    files=files,
                     data=add_data,
+                    timeout=30.0,
                 )
 
+                # qBittorrent answers "Fails." when none of the torrents could be added,
+                # and "Ok." when at least one was (already present ones are skipped)
+                response_lower = response.text.lower()
                 if response.text == "Ok.":
+                    already_exists = False
+                elif "already" in response_lower or response_lower == "fails.":
+                    logger.warning(f"Torrent(s) already exist in qBittorrent: {response.text}")
+                    already_exists = True
+                else:
+                    raise QBittorrentError(f"Failed to add torrent: {response.text}")
+
+                # Torrents already present did not receive the add options: tag and
+                # categorise them, and apply per-torrent tags of a mixed group
+                may_skip_existing = already_exists or len(group) > 1
+                if may_skip_existing or not shared_tags:
+                    await self._add_tags(session, group)
+                if may_skip_existing:
+                    await self._set_category(session, group, category)
+
+            except (httpx.HTTPError, QBittorrentError) as e:
+                if isinstance(e, QBittorrentAuthError):
+                    raise
+                message = f"qBittorrent connection error: {e}" if isinstance(e, httpx.HTTPError) else str(e)
+                logger.warning(f"qBittorrent injection failed for {mapped_save_path}: {message}")
+                for i in indexes:
+                    results[i] = {'success': False, 'message': message, 'already_exists': False}
+                continue
+
+            for i in indexes:
+                tags = torrents[i].get('tags')
+                if already_exists:
+                    message = 'Torrent already exists (tag updated)'
+                else:
                     tag_info = f" with tag {tags}" if tags else ""
                     logger.info(f"Torrent injected to qBittorrent (category={category}{tag_info})")
-                    return {'success': True, 'message': 'Torrent added', 'already_exists': False}
-
-                # Handle "already exists"
-                response_lower = response.text.lower()
-                if "already" in response_lower or response_lower == "fails.":
-                    logger.warning(f"Torrent already exists in qBittorrent: {response.text}")
+                    message = 'Torrent added'
+                results[i] = {'success': True, 'message': message, 'already_exists': already_exists}
 
-                    # Try to add tag to existing torrent
-                    if tags:
-                        await self._add_tag_to_existing(client, cookies, torrent_path, tags)
-
-                    return {'success': True, 'message': 'Torrent already exists (tag updated)', 'already_exists': True}
-
-                raise QBittorrentError(f"Failed to add torrent: {response.text}")
-
-        except httpx.HTTPError as e:
-            raise QBittorrentError(f"qBittorrent connection error: {e}") from e
+        return results
 
     async def test_connection(self) -> Dict[str, Any]:
         """
@@ -190,21 +275,17 @@ class QBittorrentClient:
             return {'success': False, 'message': 'qBittorrent host not configured'}
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                cookies = await self._authenticate(client)
-
-                # Get version info
-                version_response = await client.get(
-                    f"{self.host}/api/v2/app/version",
-                    cookies=cookies,
-                )
-                version = version_response.text if version_response.status_code == 200 else 'unknown'
+            # Get version info
+            version_response = await self._get_session().request(
+                "GET", "/api/v2/app/version", timeout=10.0
+            )
+            version = version_response.text if version_response.status_code == 200 else 'unknown'
 
-                return {
-                    'success': True,
-                    'message': f'Connected to qBittorrent {version}',
-                    'version': version,
-                }
+            return {
+                'success': True,
+                'message': f'Connected to qBittorrent {version}',
+                'version': version,
+            }
 
         except QBittorrentAuthError as e:
             return {'success': False, 'message': str(e)}
@@ -213,62 +294,187 @@ class QBittorrentClient:
         except Exception as e:
             return {'success': False, 'message': f'Error: {e}'}
 
-    async def _authenticate(self, client: httpx.AsyncClient) -> httpx.Cookies:
+    def _get_session(self) -> 'QBittorrentSession':
+        """Get the persistent session for this host and credentials."""
+        return get_qbittorrent_session(self.host, self.username, self.password)
+
+    async def _add_tags(self, session: 'QBittorrentSession', torrents: List[Dict[str, Any]]) -> None:
+        """
+        Add tags to torrents (identified by info hash from their .torrent file).
+
+        One /torrents/addTags request is sent per distinct tag value.
+
+        Args:
+            session: Authenticated qBittorrent session
+            torrents: Dicts with 'torrent_path' and optional 'tags' keys
+        """
+        hashes_by_tags: Dict[str, List[str]] = {}
+        for item in torrents:
+            if not item.get('tags'):
+                continue
+            infohash = _read_infohash(item['torrent_path'])
+            if infohash:
+                hashes_by_tags.setdefault(item['tags'], []).append(infohash)
+
+        for tags, hashes in hashes_by_tags.items():
+            try:
+                await session.request(
+                    "POST", "/api/v2/torrents/addTags",
+                    data={"hashes": "|".join(hashes), "tags": tags},
+                )
+                logger.info(f"Added tag '{tags}' to torrent(s) {', '.join(h[:8] for h in hashes)}...")
+            except Exception as e:
+                logger.warning(f"Could not add tag to existing torrent: {e}")
+
+    async def _set_category(
+        self,
+        session: 'QBittorrentSession',
+        torrents: List[Dict[str, Any]],
+        category: str
+    ) -> None:
+        """
+        Set the category of torrents (identified by info hash from their .torrent file).
+
+        Args:
+            session: Authenticated qBittorrent session
+            torrents: Dicts with a 'torrent_path' key
+            category: qBittorrent category
         """
-        Authenticate with qBittorrent and return session cookies.
+        hashes = [h for h in (_read_infohash(item['torrent_path']) for item in torrents) if h]
+        if not hashes:
+            return
+        try:
+            await session.request(
+                "POST", "/api/v2/torrents/setCategory",
+                data={"hashes": "|".join(hashes), "category": category},
+            )
+        except Exception as e:
+            logger.warning(f"Could not set category of existing torrent(s): {e}")
+
+
+def _read_infohash(torrent_path: str) -> Optional[str]:
+    """Return the lowercase info hash of a .torrent file, or None if unreadable."""
+    try:
+        import torf
+        return str(torf.Torrent.read(torrent_path).infohash).lower()
+    except Exception as e:
+        logger.warning(f"Could not read info hash of {torrent_path}: {e}")
+        return None
+
+
+class QBittorrentSession:
+    """
+    Long-lived authenticated qBittorrent Web API session.
+
+    The SID cookie is kept across requests and QBittorrentClient instances;
+    the session logs in on first use and again only when qBittorrent answers
+    403 (expired or invalidated SID). Concurrent re-logins are coalesced, as
+    qBittorrent bans IPs after repeated login attempts.
+    """
+
+    def __init__(self, host: str, username: str, password: str):
+        self.host = host
+        self.username = username
+        self.password = password
+        self.login_count = 0
+        self._cookie_header: Optional[str] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio.Lock is bound to one event loop; recreate it if the loop changed
+        loop = asyncio.get_running_loop()
+        if self._lock is None or loop is not self._loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send an authenticated request, re-authenticating once on 403.
 
         Args:
-            client: httpx AsyncClient instance
+            method: HTTP method
+            path: API path (e.g. "/api/v2/torrents/add")
+            **kwargs: Extra arguments for httpx.AsyncClient.request()
 
         Returns:
-            Session cookies for subsequent requests
+            httpx.Response
 
         Raises:
             QBittorrentAuthError: If authentication fails
+            httpx.HTTPError: On connection errors
         """
-        logger.debug(f"Authenticating with qBittorrent at {self.host}")
+        cookie_header = self._cookie_header or await self.login()
 
-        response = await client.post(
-            f"{self.host}/api/v2/auth/login",
-            data={"username": self.username, "password": self.password},
-        )
-
-        if response.text != "Ok.":
-            raise QBittorrentAuthError(f"qBittorrent authentication failed: {response.text}")
+        async with pooled_http_client(self.host) as client:
+            response = await client.request(
+                method, f"{self.host}{path}", headers={"Cookie": cookie_header}, **kwargs
+            )
+            if response.status_code == 403:
+                logger.debug("qBittorrent session expired, re-authenticating")
+                cookie_header = await self.login(stale=cookie_header)
+                response = await client.request(
+                    method, f"{self.host}{path}", headers={"Cookie": cookie_header}, **kwargs
+                )
 
-        logger.debug("Authenticated with qBittorrent")
-        return response.cookies
+        return response
 
-    async def _add_tag_to_existing(
-        self,
-        client: httpx.AsyncClient,
-        cookies: httpx.Cookies,
-        torrent_path: str,
-        tags: str,
-    ) -> None:
+    async def login(self, stale: Optional[str] = None) -> str:
         """
-        Add tags to an existing torrent (identified by info hash from .torrent file).
+        Authenticate and store the session cookie.
 
         Args:
-            client: Authenticated httpx client
-            cookies: Session cookies
-            torrent_path: Path to .torrent file (used to extract info hash)
-            tags: Tags to add
+            stale: Cookie that was rejected; if another task already replaced
+                it, the new cookie is returned without logging in again
+
+        Returns:
+            Cookie header value for subsequent requests
+
+        Raises:
+            QBittorrentAuthError: If authentication fails
         """
-        try:
-            import torf
-            t = torf.Torrent.read(torrent_path)
-            torrent_hash = str(t.infohash).lower()
-
-            await client.post(
-                f"{self.host}/api/v2/torrents/addTags",
-                cookies=cookies,
-                data={"hashes": torrent_hash, "tags": tags},
-            )
-            logger.info(f"Added tag '{tags}' to existing torrent {torrent_hash[:8]}...")
+        async with self._get_lock():
+            if self._cookie_header and self._cookie_header != stale:
+                return self._cookie_header
 
-        except Exception as e:
-            logger.warning(f"Could not add tag to existing torrent: {e}")
+            logger.debug(f"Authenticating with qBittorrent at {self.host}")
+            self._cookie_header = None
+            self.login_count += 1
+
+            async with pooled_http_client(self.host) as client:
+                response = await client.post(
+                    f"{self.host}/api/v2/auth/login",
+                    data={"username": self.username, "password": self.password},
+                )
+
+            if response.text != "Ok.":
+                raise QBittorrentAuthError(f"qBittorrent authentication failed: {response.text}")
+
+            self._cookie_header = "; ".join(f"{name}={value}" for name, value in response.cookies.items())
+            logger.debug("Authenticated with qBittorrent")
+            return self._cookie_header
+
+
+# Persistent sessions: (host, username, password) -> QBittorrentSession
+_sessions: Dict[Tuple[str, str, str], QBittorrentSession] = {}
+
+
+def get_qbittorrent_session(host: str, username: str, password: str) -> QBittorrentSession:
+    """
+    Get the process-wide session for a qBittorrent host and credentials.
+
+    Changing the credentials in settings yields a new session.
+
+    Returns:
+        QBittorrentSession instance
+    """
+    key = (host, username, password)
+    session = _sessions.get(key)
+    if session is None:
+        session = QBittorrentSession(host, username, password)
+        _sessions[key] = session
+    return session
 
 
 def get_qbittorrent_client_from_settings(settings) -> Optional[QBittorrentClient]:
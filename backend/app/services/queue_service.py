@@ -19,11 +19,17 @@ from app.models.processing_queue import (
     QueuePriority,
     QueueStatus
 )
-from app.models.file_entry import FileEntry, FileStatus
+from app.models.file_entry import FileEntry
 
 logger = logging.getLogger(__name__)
 
 
+def _notify_worker() -> None:
+    """Wake the queue worker so new pending items start immediately."""
+    from app.workers.queue_worker import notify_queue_worker
+    notify_queue_worker()
+
+
 class QueueService:
     """
     Service for managing the processing queue.
@@ -82,6 +88,8 @@ class QueueService:
         )
 
         logger.info(f"Added file {file_entry_id} to queue with priority {priority_enum.value}")
+        if queue_item.status == QueueStatus.PENDING:
+            _notify_worker()
         return queue_item
 
     def add_files_batch(
@@ -221,6 +229,7 @@ class QueueService:
 
         item.reset_for_retry(self.db)
         logger.info(f"Queue item {queue_id} reset for retry")
+        _notify_worker()
         return True
 
     def remove_item(self, queue_id: int) -> bool:
@@ -23,23 +23,14 @@ from urllib.parse import urljoin
 
 import httpx
 
+from ..config import config
 from .exceptions import NetworkRetryableError, retry_on_network_error
+from .http_client_pool import pooled_http_client
+from .media_library_index import LibrarySnapshot, get_media_library_index
 
 logger = logging.getLogger(__name__)
 
 
-def _norm(name: str) -> str:
-    """Normalize a filename for cross-platform comparison.
-
-    Removes characters that Windows does not allow in filenames but Linux does
-    (primarily ':'), which causes mismatches when Radarr runs on Linux and
-    Seedarr reads the SMB-mounted path on Windows.
-    """
-    for ch in ':*?"<>|':
-        name = name.replace(ch, ' ')
-    return ' '.join(name.split()).lower()
-
-
 def _extract_year(name: str) -> Optional[int]:
     """Extract the first 4-digit year (1900-2099) found in a string."""
     m = re.search(r'\b(19|20)\d{2}\b', name)
@@ -89,6 +80,9 @@ class RadarrClient:
         timeout: Request timeout in seconds
     """
 
+    # Identifies the library in MediaLibraryIndex
+    library_kind = 'radarr'
+
     def __init__(self, base_url: str, api_key: str, timeout: int = 30):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -107,12 +101,13 @@ class RadarrClient:
         url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(url) as client:
                 response = await client.request(
                     method=method,
                     url=url,
                     headers=self._get_headers(),
-                    params=params
+                    params=params,
+                    timeout=self.timeout
                 )
 
                 if response.status_code in (502, 503, 504):
@@ -203,6 +198,61 @@ class RadarrClient:
 
         return None
 
+    async def fetch_library_items(self) -> List[tuple]:
+        """
+        Get the (movie id, file path, movie) items indexed by MediaLibraryIndex.
+
+        Returns:
+            One item per movie with a file on disk
+        """
+        movies = await self.get_movies_with_files()
+        return [
+            (movie.get('id'), movie['movieFile'].get('path', ''), movie)
+            for movie in movies
+            if movie.get('movieFile')
+        ]
+
+    async def fetch_group_items(self, movie_id: int) -> List[tuple]:
+        """
+        Get the index items of a single movie (used by webhook refreshes).
+
+        Args:
+            movie_id: Radarr internal movie ID
+
+        Returns:
+            The movie item, or an empty list if the movie or its file was deleted
+        """
+        try:
+            movie = await self._request('GET', f'/api/v3/movie/{movie_id}')
+        except RadarrError as e:
+            if e.status_code == 404:
+                return []
+            raise
+        movie_file = movie.get('movieFile') if isinstance(movie, dict) else None
+        if not movie_file:
+            return []
+        return [(movie_id, movie_file.get('path', ''), movie)]
+
+    @staticmethod
+    def _match_movie(snapshot: LibrarySnapshot, file_path: str) -> Optional[tuple]:
+        """Return (movie, movie_file, via) for file_path, or None."""
+        # Pass 1: exact path match
+        for movie in snapshot.by_path(file_path):
+            return movie, movie['movieFile'], 'exact path'
+
+        # Pass 2: normalized basename match (handles Linux ':' vs Windows path differences)
+        # e.g. Radarr on Linux stores "Title : Subtitle (2005).mkv" but Windows SMB shows
+        # "Title  Subtitle (2005).mkv" because ':' is invalid on Windows.
+        matched_movie = None
+        for movie in snapshot.by_norm_basename(os.path.basename(file_path)):
+            movie_file = movie['movieFile']
+            matched_movie = (movie, movie_file, 'basename')
+            scene_name = movie_file.get('sceneName')
+            if scene_name and _year_ok(movie.get('year'), scene_name):
+                # Valid sceneName found directly
+                break
+        return matched_movie
+
     async def find_scene_name_by_path(self, file_path: str) -> tuple:
         """
         Find the original sceneName for a file managed by Radarr.
@@ -211,6 +261,10 @@ class RadarrClient:
         Falls back to basename comparison if exact path doesn't match
         (useful when Seedarr and Radarr use different mount paths).
 
+        The library is read from the shared MediaLibraryIndex snapshot; on a
+        miss the snapshot is rebuilt once if older than
+        MEDIA_LIBRARY_INDEX_MISS_REFRESH, to catch files imported since.
+
         Args:
             file_path: Absolute path to the media file as seen by Seedarr
 
@@ -220,14 +274,17 @@ class RadarrClient:
             found_in_radarr is True if the file was matched in Radarr (even without sceneName),
             which allows the caller to skip Sonarr for movie files.
         """
+        index = get_media_library_index()
         try:
-            movies = await self.get_movies_with_files()
+            snapshot = await index.get_snapshot(self)
+            match = self._match_movie(snapshot, file_path)
+            if match is None and snapshot.age > config.MEDIA_LIBRARY_INDEX_MISS_REFRESH:
+                snapshot = await index.get_snapshot(self, max_age=config.MEDIA_LIBRARY_INDEX_MISS_REFRESH)
+                match = self._match_movie(snapshot, file_path)
         except Exception as e:
             logger.warning(f"RadarrClient: failed to fetch movies: {e}")
             return None, False
 
-        file_basename = os.path.basename(file_path)
-
         async def _scene_with_history_fallback(movie: Dict, scene_name: Optional[str], via: str) -> Optional[str]:
             """Return a valid sceneName, falling back to import history if needed."""
             movie_year = movie.get('year')
@@ -252,39 +309,9 @@ class RadarrClient:
             )
             return None
 
-        # Pass 1: exact path match
-        for movie in movies:
-            movie_file = movie.get('movieFile')
-            if not movie_file:
-                continue
-            if movie_file.get('path') == file_path:
-                result = await _scene_with_history_fallback(
-                    movie, movie_file.get('sceneName'), 'exact path'
-                )
-                return result, True
-
-        # Pass 2: normalized basename match (handles Linux ':' vs Windows path differences)
-        # e.g. Radarr on Linux stores "Title : Subtitle (2005).mkv" but Windows SMB shows
-        # "Title  Subtitle (2005).mkv" because ':' is invalid on Windows.
-        norm_basename = _norm(file_basename)
-        matched_movie = None
-        for movie in movies:
-            movie_file = movie.get('movieFile')
-            if not movie_file:
-                continue
-            radarr_path = movie_file.get('path', '')
-            if _norm(os.path.basename(radarr_path)) == norm_basename:
-                matched_movie = (movie, movie_file)
-                scene_name = movie_file.get('sceneName')
-                if scene_name and _year_ok(movie.get('year'), scene_name):
-                    # Valid sceneName found directly
-                    break
-
-        if matched_movie:
-            movie, movie_file = matched_movie
-            result = await _scene_with_history_fallback(
-                movie, movie_file.get('sceneName'), 'basename'
-            )
+        if match:
+            movie, movie_file, via = match
+            result = await _scene_with_history_fallback(movie, movie_file.get('sceneName'), via)
             return result, True
 
         logger.debug(f"Radarr: no match found for '{file_path}'")
@@ -0,0 +1,488 @@
+"""
+Release Name Parser for Seedarr v2.0
+
+This module extracts metadata (title, year, resolution, source, codecs,
+languages, team, ...) from release names and file names. It is the single
+parser behind MetadataMapper.parse_filename, the team detection of
+UniversalRenamer and the TMDB title search.
+
+Features:
+    - Patterns compiled once at import and merged into one alternation per
+      label (one search per label instead of one re.search per pattern,
+      the name lowercased once)
+    - Field priorities preserved: when several labels match, the first one
+      listed in the pattern table wins, wherever it is in the name
+    - Results memoized per name (LRU), so the dashboard, the pipeline stages
+      and the per-tracker release names share one parse
+    - parse_many batch API for directory scans
+
+Usage Example:
+    >>> parser = get_release_parser()
+    >>> info = parser.parse("Dune.Part.Two.2024.MULTi.VFF.2160p.WEB-DL.DDP5.1.Atmos.x265-GRP.mkv")
+    >>> info['title'], info['year'], info['resolution'], info['audio'], info['team']
+    ('Dune Part Two', 2024, '2160p', 'Atmos', 'GRP')
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from ..config import config
+
+# ============================================================================
+# Pattern tables (order matters: the first label matching the name wins)
+# ============================================================================
+
+# Resolution patterns
+RESOLUTION_PATTERNS = {
+    '2160p': [r'2160p', r'\b2160\b', r'4k', r'uhd'],
+    '1080p': [r'1080p', r'1080i', r'\b1080\b'],
+    '720p': [r'720p', r'\b720\b'],
+    '576p': [r'576p', r'576i'],
+    '480p': [r'480p', r'480i'],
+}
+
+# Source patterns (order matters - check more specific first)
+SOURCE_PATTERNS = {
+    'BluRay': [r'blu[\-\.]?ray', r'bdrip', r'brrip'],
+    'WEB-DL': [r'web[\-\.]?dl', r'webdl'],
+    'WEBRip': [r'webrip', r'web[\-\.]?rip'],
+    'HDTV': [r'hdtv'],
+    'DVDRip': [r'dvdrip', r'dvd[\-\.]?rip'],
+    'HDRip': [r'hdrip', r'hd[\-\.]?rip'],
+    'CAM': [r'cam', r'camrip', r'hdcam'],
+    'TS': [r'telesync', r'hdts', r'\bts\b'],
+    'VOD': [r'\bvod\b'],
+    'mHD': [r'\bmhd\b'],
+}
+
+# REMUX detection (separated from source)
+REMUX_PATTERNS = [r'remux', r'bdremux']
+
+# REPACK detection
+REPACK_PATTERNS = [r'repack', r'rerip']
+
+# IMAX detection
+IMAX_PATTERNS = [r'imax']
+
+# Edition/type detection
+EDITION_PATTERNS = {
+    'DOC': [r'\bdoc\b', r'\bdocu\b', r'documentary', r'documentaire'],
+    'INTEGRALE': [r'integrale', r'complete[\.\-\s]?series'],
+    'COLLECTION': [r'collection', r'saga'],
+}
+
+# Video codec patterns
+CODEC_PATTERNS = {
+    'x265': [r'x265', r'hevc', r'h\.?265'],
+    'x264': [r'x264', r'avc', r'h\.?264'],
+    'AV1': [r'\bav1\b'],
+    'VP9': [r'vp9'],
+    'MPEG-2': [r'mpeg[\-\.]?2'],
+}
+
+# Audio codec patterns
+AUDIO_PATTERNS = {
+    'Atmos': [r'atmos'],
+    'TrueHD': [r'truehd', r'true[\-\.]?hd'],
+    'DTS-HD MA': [r'dts[\-\.]?hd[\-\.]?ma', r'dts[\-\.]?hdma'],
+    'DTS-HD': [r'dts[\-\.]?hd'],
+    'DTS': [r'\bdts\b'],
+    'EAC3': [r'dd[\+p]', r'ddp', r'e[\-\.]?ac[\-\.]?3', r'eac3'],
+    'AC3': [r'dd5[\.\s]?1', r'ac[\-\.]?3[\-\.]?5[\.\s]?1', r'ac3'],
+    'AAC': [r'\baac\b'],
+    'FLAC': [r'\bflac\b'],
+    'MP3': [r'\bmp3\b'],
+}
+
+# HDR patterns
+HDR_PATTERNS = {
+    'Dolby Vision': [r'dolby[\-\.\s]?vision', r'\bdv\b', r'dovi'],
+    'HDR10+': [r'hdr10[\+p]', r'hdr10plus'],
+    'HDR10': [r'hdr10', r'hdr[\-\.]?10'],
+    'HDR': [r'\bhdr\b'],
+    'SDR': [r'\bsdr\b'],
+}
+
+# Language patterns (French-focused for La Cale)
+# IMPORTANT: MULTI must be checked BEFORE specific variants (VFF, VOF, etc.)
+# because filenames like "MULTi VFF" should match MULTI as the language,
+# with VFF detected separately as language_variant.
+LANGUAGE_PATTERNS = {
+    'MULTI': [r'\bmulti\b', r'\bmulti\-?lang'],
+    'TRUEFRENCH': [r'truefrench'],
+    'VFF': [r'\bvff\b'],
+    'VOF': [r'\bvof\b'],
+    'VFQ': [r'\bvfq\b'],
+    'VFI': [r'\bvfi\b'],
+    'VF2': [r'\bvf2\b'],
+    'FRENCH': [r'\bfrench\b', r'\bvf\b'],
+    'VOSTFR': [r'vostfr', r'subfrench'],
+    'VO': [r'\bvo\b', r'\beng\b', r'\benglish\b'],
+}
+
+# Compound MULTI + VFF/VOF/VFQ/VFI/VF2
+LANGUAGE_VARIANT_PATTERNS = {
+    label: LANGUAGE_PATTERNS[label] for label in ('VFF', 'VOF', 'VFQ', 'VFI', 'VF2')
+}
+
+# TV Show detection patterns
+TV_PATTERNS = [
+    r's\d{1,2}e\d{1,2}',  # S01E01
+    r's\d{1,2}[\.\-\s]?e\d{1,2}',  # S01.E01, S01-E01
+    r'\d{1,2}x\d{1,2}',  # 1x01
+    r'season[\.\-\s]?\d+',  # Season 1
+    r'saison[\.\-\s]?\d+',  # Saison 1 (French)
+    r'episode[\.\-\s]?\d+',  # Episode 1
+    r'complete[\.\-\s]?series',
+    r'integrale',
+]
+
+
+class _FieldMatcher:
+    """
+    The patterns of a field, merged into one alternation per label.
+
+    Labels are tried in priority order and the first one matching anywhere
+    in the name wins, as with one re.search per pattern. (A single
+    alternation for the whole field returns the leftmost match instead,
+    and scanning it at every position to restore the priorities is slower
+    in CPython's re than a few searches.)
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]]):
+        self._labels = tuple(
+            (label, re.compile('|'.join(pattern_list))) for label, pattern_list in patterns.items()
+        )
+
+    def match(self, text: str) -> Optional[str]:
+        """Get the highest priority label matching text (lowercased), or None."""
+        for label, regex in self._labels:
+            if regex.search(text):
+                return label
+        return None
+
+
+def _any_of(patterns: List[str]) -> Pattern:
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+_RESOLUTION = _FieldMatcher(RESOLUTION_PATTERNS)
+_SOURCE = _FieldMatcher(SOURCE_PATTERNS)
+_EDITION = _FieldMatcher(EDITION_PATTERNS)
+_CODEC = _FieldMatcher(CODEC_PATTERNS)
+_AUDIO = _FieldMatcher(AUDIO_PATTERNS)
+_HDR = _FieldMatcher(HDR_PATTERNS)
+_LANGUAGE = _FieldMatcher(LANGUAGE_PATTERNS)
+_LANGUAGE_VARIANT = _FieldMatcher(LANGUAGE_VARIANT_PATTERNS)
+
+_REMUX = _any_of(REMUX_PATTERNS)
+_REPACK = _any_of(REPACK_PATTERNS)
+_IMAX = _any_of(IMAX_PATTERNS)
+_TV = _any_of(TV_PATTERNS)
+
+# Title / year extraction
+_TITLE_EXTENSION = re.compile(r'\.[a-zA-Z0-9]{2,4}$')
+_SEPARATORS = re.compile(r'[._]')
+_PAREN_YEAR = re.compile(r'\((\d{4})\)')
+_YEAR = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_TECHNICAL_AFTER_YEAR = re.compile(
+    r'(FRENCH|MULTI|VFF|VFQ|VOSTFR|TRUEFRENCH|'
+    r'BluRay|WEB|HDTV|HDRip|1080p?|720p?|2160p?|'
+    r'x264|x265|HEVC|REMUX|REPACK)\b',
+    re.IGNORECASE
+)
+# First technical indicator (resolution, language, source, codec, flags, season/episode)
+_TECHNICAL_INDICATOR = re.compile(
+    r'\b(2160p|1080p|720p|480p|576p)\b'
+    r'|\b(FRENCH|MULTI|MULTi|TRUEFRENCH|VFF|VFQ|VOSTFR|ENGLISH)\b'
+    r'|\b(BluRay|WEB|HDTV|DVDRip|BDRip|WEBRip|HDRip)\b'
+    r'|\b(x264|x265|H264|H265|HEVC|AVC|XviD)\b'
+    r'|\b(REMUX|REPACK|PROPER|IMAX)\b'
+    r'|\bS\d{1,2}(?:E\d{1,2})?\b',
+    re.IGNORECASE
+)
+_TRAILING_GROUP = re.compile(r'\s*-\s*[A-Za-z0-9]+$')
+_PARENTHESES = re.compile(r'[\(\)]+')
+_TRAILING_SEPARATORS = re.compile(r'[\s.\-]+$')
+_SPACES = re.compile(r'\s+')
+
+# Team extraction
+_TEAM_EXTENSION = re.compile(r'\.[^.]+$')
+_TRAILING_PARENTHETICAL = re.compile(r'\s*\([^)]*\)\s*$')
+_SCENE_TEAM = re.compile(r'-([A-Za-z0-9]+)$')
+# Codecs ending with "-something" that look like team tags (E-AC-3, DTS-HD, DTS-HD.MA, AC-3)
+_CODEC_TAIL = re.compile(r'E[\-\.]?AC[\-\.]?3$|DTS[\-\.]?HD(?:[\-\.]?MA)?$|AC[\-\.]?3$', re.IGNORECASE)
+_CODEC_DOT_TEAM = re.compile(
+    r'-(?:x264|x265|h264|h265|XviD|DivX|HEVC|AVC|VP9|AV1)\.([A-Za-z0-9]+)$',
+    re.IGNORECASE
+)
+_SPACED_TEAM = re.compile(r'\s+-\s*([A-Za-z0-9]+)$')
+_KNOWN_TEAM = re.compile(
+    r'(QTZ|YGG|FGT|AMIABLE|SPARKS|GECKOS|TP|FraMeSToR|BHD|DON|EPSiLON|FLUX|TEPES|ROVERS)$',
+    re.IGNORECASE
+)
+
+
+def extract_title_and_year(filename: str) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Extract clean title and year from filename.
+
+    The title is everything before the year or technical indicators.
+    Handles formats like:
+    - "The.Hangover.Part.III.2013.VFF.1080p.BluRay.AC3.x265-HD2.mkv"
+    - "Movie Title 2024 1080p WEB-DL"
+    - "Show.Name.S01E05.720p.HDTV"
+    - "1917 (2019) VFF BLURAY HDRIP 1080 HEVC E-AC-3.mkv"  (numeric title)
+
+    Args:
+        filename: Filename to parse
+
+    Returns:
+        Tuple of (title, year) where either can be None
+    """
+    # Remove extension, replace dots and underscores with spaces
+    name_spaced = _SEPARATORS.sub(' ', _TITLE_EXTENSION.sub('', filename))
+
+    year = None
+    title = None
+
+    # Strategy 1: Year in parentheses - most reliable (e.g., "1917 (2019)")
+    paren_match = _PAREN_YEAR.search(name_spaced)
+    if paren_match:
+        candidate_year = int(paren_match.group(1))
+        if 1900 <= candidate_year <= 2099:
+            year = candidate_year
+            # Title is everything before the opening parenthesis
+            title = name_spaced[:paren_match.start()].strip()
+
+    if not year:
+        all_years = list(_YEAR.finditer(name_spaced))
+
+        # Strategy 2: Year NOT at position 0 (avoid matching numeric titles like "1917")
+        for year_match in all_years:
+            if year_match.start() > 0:
+                candidate_title = name_spaced[:year_match.start()].strip()
+                if candidate_title:
+                    year = int(year_match.group(1))
+                    title = candidate_title
+                    break
+
+        # Strategy 3: Year at position 0, but followed by another year (e.g., "1917 2019 ...")
+        if not year:
+            if len(all_years) >= 2:
+                # First match is likely the title, second is the year
+                year = int(all_years[1].group(1))
+                title = name_spaced[:all_years[1].start()].strip()
+            elif len(all_years) == 1:
+                # Single year-like number followed by technical indicators
+                # suggests a title, not a year
+                after_match = name_spaced[all_years[0].end():].strip()
+                if _TECHNICAL_AFTER_YEAR.match(after_match) and all_years[0].start() == 0:
+                    title = all_years[0].group(1)
+                else:
+                    year = int(all_years[0].group(1))
+                    title = name_spaced[:all_years[0].start()].strip()
+
+    if not year and not title:
+        # No year found: the title ends at the first technical indicator
+        indicator = _TECHNICAL_INDICATOR.search(name_spaced)
+        if indicator:
+            title = name_spaced[:indicator.start()].strip()
+        else:
+            # Fallback: remove group tag (-GROUP at the end) and use as title
+            title = _TRAILING_GROUP.sub('', name_spaced).strip()
+
+    # Clean up title
+    if title:
+        # Remove parentheses left over from year extraction (e.g., "1917 (")
+        title = _PARENTHESES.sub('', title)
+        # Remove trailing dashes, dots, spaces
+        title = _TRAILING_SEPARATORS.sub('', title)
+        # Remove double spaces
+        title = _SPACES.sub(' ', title)
+
+    return title if title else None, year
+
+
+def extract_team(filename: str) -> Optional[str]:
+    """
+    Extract team/group name from a filename.
+
+    Looks for patterns like:
+    - -TEAM at the end (scene format: Movie.Name-TEAM.mkv)
+    - -x264.TEAM at the end (codec.team format)
+    - - TEAM at the end (space format: Movie Name - TEAM.mkv)
+    - a known team name glued to the end
+
+    Args:
+        filename: Filename (with extension) to extract team from
+
+    Returns:
+        Team name if found, None otherwise
+    """
+    # Remove extension
+    name = _TEAM_EXTENSION.sub('', filename)
+
+    # Strip trailing parenthetical content (e.g., "(Beauty and the Beast)")
+    # These are often alternate titles appended after the team tag
+    name = _TRAILING_PARENTHETICAL.sub('', name)
+
+    # Scene format "-TEAM", unless the suffix is actually part of a codec
+    match = _SCENE_TEAM.search(name)
+    if match and not _CODEC_TAIL.search(name[max(0, match.start() - 10):]):
+        return match.group(1)
+
+    # Codec.TEAM format "-x264.GHT", then space format " - TEAM"
+    match = _CODEC_DOT_TEAM.search(name) or _SPACED_TEAM.search(name)
+    if match:
+        return match.group(1)
+
+    # Common release groups at the end, even without separator
+    match = _KNOWN_TEAM.search(name)
+    if match:
+        return match.group(1).upper()
+
+    return None
+
+
+def is_tv_show(filename: str) -> bool:
+    """Check a name for TV show patterns (S01E01, 1x01, Season 1, ...)."""
+    return _TV.search(filename) is not None
+
+
+def parse_release_name(filename: str) -> Dict[str, Any]:
+    """
+    Parse a release name without the memoization of ReleaseNameParser.
+
+    Args:
+        filename: Release or file name
+
+    Returns:
+        Dictionary with extracted metadata:
+            - title: Clean title extracted from filename
+            - year: Release year if found
+            - resolution: "1080p", "2160p", etc.
+            - source: "BluRay", "WEB-DL", etc.
+            - codec: "x264", "x265", etc.
+            - audio: "DTS", "EAC3", "Atmos", etc.
+            - hdr: "HDR10", "Dolby Vision", etc.
+            - language: "FRENCH", "MULTI", etc.
+            - language_variant: "VFF", "VFQ", etc. with MULTI
+            - is_tv_show: bool
+            - remux, repack, imax: bool
+            - edition: "DOC", "INTEGRALE", "COLLECTION"
+            - team: Release group
+    """
+    lowered = filename.lower()
+    language = _LANGUAGE.match(lowered)
+    title, year = extract_title_and_year(filename)
+
+    return {
+        'title': title,
+        'year': year,
+        'resolution': _RESOLUTION.match(lowered),
+        'source': _SOURCE.match(lowered),
+        'codec': _CODEC.match(lowered),
+        'audio': _AUDIO.match(lowered),
+        'hdr': _HDR.match(lowered),
+        'language': language,
+        'language_variant': _LANGUAGE_VARIANT.match(lowered) if language == 'MULTI' else None,
+        'is_tv_show': _TV.search(lowered) is not None,
+        'remux': _REMUX.search(lowered) is not None,
+        'repack': _REPACK.search(lowered) is not None,
+        'imax': _IMAX.search(lowered) is not None,
+        'edition': _EDITION.match(lowered),
+        'team': extract_team(filename),
+    }
+
+
+class ReleaseNameParser:
+    """
+    Memoizing release name parser.
+
+    Parsed names are kept in an LRU; callers get their own copy of the
+    result, so a caller updating a field does not change the cached parse.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            parsed = self._entries.get(name)
+            if parsed is not None:
+                self._entries.move_to_end(name)
+                self.hits += 1
+                return parsed
+
+        parsed = parse_release_name(name)
+        with self._lock:
+            self.misses += 1
+            self._entries[name] = parsed
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return parsed
+
+    def parse(self, name: str) -> Dict[str, Any]:
+        """
+        Parse a release or file name (see parse_release_name).
+
+        Args:
+            name: Release or file name
+
+        Returns:
+            Parsed metadata (a copy, safe to modify)
+        """
+        return dict(self._get(name))
+
+    def parse_many(self, names: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of names, e.g. the files found by a directory scan.
+
+        Duplicate names are parsed once.
+
+        Args:
+            names: Release or file names
+
+        Returns:
+            Parsed metadata of each name, in order
+        """
+        parsed: Dict[str, Dict[str, Any]] = {}
+        results = []
+        for name in names:
+            if name not in parsed:
+                parsed[name] = self._get(name)
+            results.append(dict(parsed[name]))
+        return results
+
+    def clear(self) -> None:
+        """Forget all parsed names."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global parser instance
+_release_parser: Optional[ReleaseNameParser] = None
+
+
+def get_release_parser() -> ReleaseNameParser:
+    """Get the process-wide ReleaseNameParser instance."""
+    global _release_parser
+    if _release_parser is None:
+        _release_parser = ReleaseNameParser(max_entries=config.RELEASE_PARSER_CACHE_MAX_ENTRIES)
+    return _release_parser
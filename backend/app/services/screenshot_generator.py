@@ -6,10 +6,15 @@ using FFmpeg. Screenshots are captured at configurable timestamps (default: 15%,
 40%, 60%, 85% of video duration) to showcase different parts of the content.
 
 Features:
-    - Automatic video duration detection via ffprobe
+    - Video duration reused from MediaInfo when known, ffprobe otherwise
     - Configurable number of screenshots (default: 4)
     - Dynamic timestamp calculation based on video length
-    - Async subprocess execution for non-blocking operation
+    - Captures run concurrently, each ffmpeg process holding a slot of the
+      global "ffmpeg" resource pool (PIPELINE_FFMPEG_CONCURRENCY)
+    - Optional keyframe seeking: the nearest keyframe before each timestamp
+      is captured, so no frame has to be decoded past it
+    - PNG, JPEG or WebP output, optionally downscaled (smaller uploads to
+      image hosts)
     - Graceful degradation if FFmpeg is not available
 
 Requirements:
@@ -19,11 +24,12 @@ Requirements:
 Usage Example:
     generator = ScreenshotGenerator()
 
-    # Generate 4 screenshots
+    # Generate 4 screenshots, reusing the duration found by MediaInfo
     paths = await generator.generate_screenshots(
         video_path="/media/movie.mkv",
         output_dir="/output/screens",
-        release_name="Movie.2024.1080p.BluRay"
+        release_name="Movie.2024.1080p.BluRay",
+        duration=file_entry.mediainfo_data.get('duration')
     )
     # paths = [
     #     "/output/screens/Movie.2024.1080p.BluRay_001.png",
@@ -35,12 +41,52 @@ Usage Example:
 import asyncio
 import logging
 import os
+import re
 import shutil
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple, Union
+
+from ..config import config
 
 logger = logging.getLogger(__name__)
 
+# Output formats and their extra ffmpeg arguments
+OUTPUT_FORMATS = {
+    'png': [],
+    'jpg': ['-q:v', '2'],
+    'webp': ['-quality', '90'],
+}
+
+# "1h 52mn 03s" (NFOGenerator._format_duration), "45mn", "1 h 2 min 5 s", ...
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)\s*(h|mn|min|m|s)\b', re.IGNORECASE)
+_DURATION_UNITS = {'h': 3600, 'mn': 60, 'min': 60, 'm': 60, 's': 1}
+
+
+def parse_duration(value: Union[str, int, float, None]) -> Optional[float]:
+    """
+    Convert a stored duration to seconds.
+
+    Args:
+        value: Seconds (number or numeric string) or a MediaInfo duration
+            as stored by the analyze stage ("1h 52mn 03s")
+
+    Returns:
+        Duration in seconds, or None if unknown
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+
+    text = str(value).strip()
+    try:
+        seconds = float(text)
+    except ValueError:
+        parts = _DURATION_PART.findall(text)
+        seconds = sum(float(amount) * _DURATION_UNITS[unit.lower()] for amount, unit in parts)
+    return seconds if seconds > 0 else None
+
 
 class ScreenshotError(Exception):
     """Exception raised when screenshot generation fails."""
@@ -113,6 +159,14 @@ class ScreenshotGenerator:
         """
         return bool(self.ffmpeg_path and self.ffprobe_path)
 
+    @asynccontextmanager
+    async def _ffmpeg_slot(self) -> AsyncIterator[None]:
+        """Hold a slot of the global ffmpeg pool while a process runs."""
+        from app.processors.resource_pools import get_resource_pools, FFMPEG
+
+        async with get_resource_pools().slot(FFMPEG):
+            yield
+
     async def get_video_duration(self, video_path: str) -> float:
         """
         Get video duration in seconds using ffprobe.
@@ -143,13 +197,14 @@ class ScreenshotGenerator:
 
             logger.debug(f"Running ffprobe: {' '.join(cmd)}")
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            async with self._ffmpeg_slot():
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
 
-            stdout, stderr = await process.communicate()
+                stdout, stderr = await process.communicate()
 
             if process.returncode != 0:
                 error_msg = stderr.decode().strip() if stderr else "Unknown error"
@@ -174,13 +229,17 @@ class ScreenshotGenerator:
         release_name: str,
         count: int = 4,
         timestamps: Optional[List[float]] = None,
-        format: str = 'png'
+        format: Optional[str] = None,
+        duration: Union[str, int, float, None] = None,
+        keyframe_seek: Optional[bool] = None,
+        max_width: Optional[int] = None
     ) -> List[str]:
         """
         Generate screenshots from a video file.
 
         Screenshots are captured at specific timestamps (percentages of duration)
-        and saved to the output directory with sequential naming.
+        and saved to the output directory with sequential naming. Captures run
+        concurrently, limited by the global ffmpeg pool.
 
         Args:
             video_path: Path to the video file
@@ -188,7 +247,13 @@ class ScreenshotGenerator:
             release_name: Base name for screenshot files
             count: Number of screenshots to generate (default: 4)
             timestamps: Custom timestamp percentages (0.0-1.0), overrides count
-            format: Output format ('png' or 'jpg')
+            format: Output format ('png', 'jpg' or 'webp', default: SCREENSHOT_FORMAT)
+            duration: Known video duration (seconds, or the MediaInfo duration
+                stored by the analyze stage); ffprobe is only run without it
+            keyframe_seek: Capture the nearest keyframe before each timestamp
+                (default: SCREENSHOT_KEYFRAME_SEEK)
+            max_width: Downscale wider frames to this width, keeping the
+                aspect ratio (default: SCREENSHOT_MAX_WIDTH, 0 = original size)
 
         Returns:
             List of paths to generated screenshot files
@@ -202,6 +267,16 @@ class ScreenshotGenerator:
                 "Screenshots are optional; pipeline will continue without them."
             )
 
+        format = (format or config.SCREENSHOT_FORMAT).lower()
+        if format == 'jpeg':
+            format = 'jpg'
+        if format not in OUTPUT_FORMATS:
+            raise ScreenshotError(f"Unsupported screenshot format: {format}")
+        if keyframe_seek is None:
+            keyframe_seek = config.SCREENSHOT_KEYFRAME_SEEK
+        if max_width is None:
+            max_width = config.SCREENSHOT_MAX_WIDTH
+
         video_path = Path(video_path)
         output_path = Path(output_dir)
 
@@ -211,8 +286,11 @@ class ScreenshotGenerator:
         # Create output directory
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Get video duration
-        duration = await self.get_video_duration(str(video_path))
+        # Get video duration (MediaInfo already has it after the analyze stage)
+        known_duration = parse_duration(duration)
+        if known_duration:
+            logger.debug(f"Using known video duration: {known_duration:.0f}s")
+        duration = known_duration or await self.get_video_duration(str(video_path))
 
         # Determine timestamps
         if timestamps:
@@ -234,26 +312,35 @@ class ScreenshotGenerator:
         logger.info(
             f"Generating {len(time_timestamps)} screenshots at "
             f"{', '.join([f'{t:.0f}s' for t in time_timestamps])}"
+            f"{' (keyframes)' if keyframe_seek else ''}"
         )
 
-        # Generate screenshots
-        screenshot_paths = []
-        for i, timestamp in enumerate(time_timestamps, 1):
-            filename = f"{release_name}_{i:03d}.{format}"
-            output_file = output_path / filename
-
-            try:
-                await self._capture_frame(
-                    video_path=str(video_path),
-                    output_file=str(output_file),
-                    timestamp=timestamp
-                )
-                screenshot_paths.append(str(output_file))
-                logger.debug(f"Generated screenshot {i}/{len(time_timestamps)}: {filename}")
+        # Capture all frames concurrently (each ffmpeg process waits for a pool slot)
+        output_files = [
+            str(output_path / f"{release_name}_{i:03d}.{format}")
+            for i in range(1, len(time_timestamps) + 1)
+        ]
+        results = await asyncio.gather(*(
+            self._capture_frame(
+                video_path=str(video_path),
+                output_file=output_file,
+                timestamp=timestamp,
+                keyframe_seek=keyframe_seek,
+                max_width=max_width
+            )
+            for output_file, timestamp in zip(output_files, time_timestamps)
+        ), return_exceptions=True)
 
-            except Exception as e:
-                logger.error(f"Failed to capture screenshot at {timestamp}s: {e}")
+        screenshot_paths = []
+        for output_file, timestamp, result in zip(output_files, time_timestamps, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                logger.error(f"Failed to capture screenshot at {timestamp}s: {result}")
                 # Continue with remaining screenshots
+                continue
+            screenshot_paths.append(output_file)
+            logger.debug(f"Generated screenshot {len(screenshot_paths)}/{len(time_timestamps)}: {Path(output_file).name}")
 
         if not screenshot_paths:
             raise ScreenshotError("No screenshots were generated successfully")
@@ -261,42 +348,62 @@ class ScreenshotGenerator:
         logger.info(f"✓ Generated {len(screenshot_paths)} screenshots")
         return screenshot_paths
 
+    def _capture_command(
+        self,
+        video_path: str,
+        output_file: str,
+        timestamp: float,
+        keyframe_seek: bool = False,
+        max_width: int = 0
+    ) -> List[str]:
+        """Build the ffmpeg command line capturing one frame."""
+        cmd = [self.ffmpeg_path, '-y']  # Overwrite output
+        if keyframe_seek:
+            # Decode keyframes only and keep the one the seek lands on
+            cmd += ['-skip_frame', 'nokey', '-ss', str(timestamp), '-noaccurate_seek']
+        else:
+            cmd += ['-ss', str(timestamp)]  # Seek position
+        cmd += ['-i', video_path, '-vframes', '1']  # Single frame
+        if max_width:
+            # Never upscale; -2 keeps the aspect ratio with an even height
+            cmd += ['-vf', f"scale='min({int(max_width)},iw)':-2"]
+        cmd += OUTPUT_FORMATS[Path(output_file).suffix.lstrip('.').lower()]
+        cmd.append(output_file)
+        return cmd
+
     async def _capture_frame(
         self,
         video_path: str,
         output_file: str,
-        timestamp: float
+        timestamp: float,
+        keyframe_seek: bool = False,
+        max_width: int = 0
     ) -> None:
         """
         Capture a single frame from video.
 
         Args:
             video_path: Path to the video file
-            output_file: Path for output screenshot
+            output_file: Path for output screenshot (format from its extension)
             timestamp: Time position in seconds
+            keyframe_seek: Capture the nearest keyframe before timestamp
+            max_width: Maximum width of the screenshot (0 = original size)
 
         Raises:
             ScreenshotError: If capture fails
         """
-        cmd = [
-            self.ffmpeg_path,
-            '-y',  # Overwrite output
-            '-ss', str(timestamp),  # Seek position
-            '-i', video_path,
-            '-vframes', '1',  # Single frame
-            '-q:v', '2',  # Quality (2 = high for JPEG, ignored for PNG)
-            output_file
-        ]
+        cmd = self._capture_command(video_path, output_file, timestamp, keyframe_seek, max_width)
 
         logger.debug(f"Capturing frame at {timestamp}s -> {Path(output_file).name}")
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        async with self._ffmpeg_slot():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
 
-        _, stderr = await process.communicate()
+            _, stderr = await process.communicate()
 
         if process.returncode != 0:
             error_msg = stderr.decode().strip() if stderr else "Unknown error"
@@ -382,6 +489,13 @@ class ScreenshotGenerator:
             except Exception as e:
                 logger.warning(f"Failed to remove {file}: {e}")
 
+        for file in output_path.glob("*.webp"):
+            try:
+                file.unlink()
+                removed += 1
+            except Exception as e:
+                logger.warning(f"Failed to remove {file}: {e}")
+
         logger.info(f"Cleaned up {removed} screenshot files")
         return removed
 
@@ -23,7 +23,10 @@ from urllib.parse import urljoin
 
 import httpx
 
+from ..config import config
 from .exceptions import NetworkRetryableError, retry_on_network_error
+from .http_client_pool import pooled_http_client
+from .media_library_index import LibrarySnapshot, get_media_library_index
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +53,9 @@ class SonarrClient:
         timeout: Request timeout in seconds
     """
 
+    # Identifies the library in MediaLibraryIndex
+    library_kind = 'sonarr'
+
     def __init__(self, base_url: str, api_key: str, timeout: int = 30):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -68,12 +74,13 @@ class SonarrClient:
         url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(url) as client:
                 response = await client.request(
                     method=method,
                     url=url,
                     headers=self._get_headers(),
-                    params=params
+                    params=params,
+                    timeout=self.timeout
                 )
 
                 if response.status_code in (502, 503, 504):
@@ -162,43 +169,53 @@ class SonarrClient:
 
         return all_files
 
-    async def find_scene_name_by_path(self, file_path: str) -> Optional[str]:
+    async def fetch_library_items(self) -> List[tuple]:
         """
-        Find the original sceneName for a file managed by Sonarr.
+        Get the (series id, file path, episodeFile) items indexed by MediaLibraryIndex.
 
-        Matches file_path against episodeFile.path in Sonarr's database.
-        Falls back to basename comparison if exact path doesn't match.
+        Returns:
+            One item per episode file
+        """
+        episode_files = await self.get_all_episode_files()
+        return [(ep_file.get('seriesId'), ep_file.get('path', ''), ep_file) for ep_file in episode_files]
+
+    async def fetch_group_items(self, series_id: int) -> List[tuple]:
+        """
+        Get the index items of a single series (used by webhook refreshes).
 
         Args:
-            file_path: Absolute path to the media file as seen by Seedarr
+            series_id: Sonarr internal series ID
 
         Returns:
-            Original scene release name, or None if not found / no sceneName.
+            One item per episode file of the series (empty if it was deleted)
         """
         try:
-            episode_files = await self.get_all_episode_files()
-        except Exception as e:
-            logger.warning(f"SonarrClient: failed to fetch episode files: {e}")
-            return None
-
-        file_basename = os.path.basename(file_path)
-
+            files = await self._request('GET', '/api/v3/episodefile', params={'seriesId': series_id})
+        except SonarrError as e:
+            if e.status_code == 404:
+                return []
+            raise
+        if not isinstance(files, list):
+            return []
+        return [(series_id, ep_file.get('path', ''), ep_file) for ep_file in files]
+
+    @staticmethod
+    def _match_scene_name(snapshot: LibrarySnapshot, file_path: str) -> Optional[str]:
+        """Return the sceneName stored for file_path, or None."""
         # Pass 1: exact path match
-        for ep_file in episode_files:
-            if ep_file.get('path') == file_path:
-                scene_name = ep_file.get('sceneName')
-                if scene_name:
-                    logger.debug(f"Sonarr exact match for '{file_path}': sceneName='{scene_name}'")
-                    return scene_name
+        for ep_file in snapshot.by_path(file_path):
+            scene_name = ep_file.get('sceneName')
+            if scene_name:
+                logger.debug(f"Sonarr exact match for '{file_path}': sceneName='{scene_name}'")
+                return scene_name
 
         # Pass 2: basename match — collect all candidates, pick the most recently added
-        candidates = []
-        for ep_file in episode_files:
-            sonarr_path = ep_file.get('path', '')
-            if os.path.basename(sonarr_path) == file_basename:
-                scene_name = ep_file.get('sceneName')
-                if scene_name:
-                    candidates.append((ep_file.get('dateAdded', ''), scene_name))
+        file_basename = os.path.basename(file_path)
+        candidates = [
+            (ep_file.get('dateAdded', ''), ep_file['sceneName'])
+            for ep_file in snapshot.by_basename(file_basename)
+            if ep_file.get('sceneName')
+        ]
 
         if candidates:
             # Sort descending by dateAdded (ISO string comparison works for sorting)
@@ -210,5 +227,36 @@ class SonarrClient:
             )
             return scene_name
 
-        logger.debug(f"Sonarr: no match found for '{file_path}'")
         return None
+
+    async def find_scene_name_by_path(self, file_path: str) -> Optional[str]:
+        """
+        Find the original sceneName for a file managed by Sonarr.
+
+        Matches file_path against episodeFile.path in Sonarr's database.
+        Falls back to basename comparison if exact path doesn't match.
+
+        The library is read from the shared MediaLibraryIndex snapshot; on a
+        miss the snapshot is rebuilt once if older than
+        MEDIA_LIBRARY_INDEX_MISS_REFRESH, to catch files imported since.
+
+        Args:
+            file_path: Absolute path to the media file as seen by Seedarr
+
+        Returns:
+            Original scene release name, or None if not found / no sceneName.
+        """
+        index = get_media_library_index()
+        try:
+            snapshot = await index.get_snapshot(self)
+            scene_name = self._match_scene_name(snapshot, file_path)
+            if scene_name is None and snapshot.age > config.MEDIA_LIBRARY_INDEX_MISS_REFRESH:
+                snapshot = await index.get_snapshot(self, max_age=config.MEDIA_LIBRARY_INDEX_MISS_REFRESH)
+                scene_name = self._match_scene_name(snapshot, file_path)
+        except Exception as e:
+            logger.warning(f"SonarrClient: failed to fetch episode files: {e}")
+            return None
+
+        if scene_name is None:
+            logger.debug(f"Sonarr: no match found for '{file_path}'")
+        return scene_name
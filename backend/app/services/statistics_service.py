@@ -4,21 +4,25 @@ Statistics Service
 Service for tracking and retrieving upload statistics.
 
 Features:
-- Record upload results
+- Record upload results incrementally (daily and per-tracker rollups)
+- Rebuild the rollups from the file_entries history
 - Get daily/weekly/monthly statistics
 - Tracker breakdown
 - Dashboard metrics
 """
 
 import logging
-from datetime import date, timedelta
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Any, List
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import insert, or_
 
+from app.database import execute_checkpoint
 from app.models.statistics import DailyStatistics, TrackerStatistics
-from app.models.file_entry import FileEntry
+from app.models.file_entry import FileEntry, Status, TrackerStatus
+from app.models.file_entry_status_count import FileEntryStatusCount
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,7 @@ class StatisticsService:
 
     Provides methods for:
     - Recording upload results
+    - Rebuilding the rollups
     - Retrieving statistics
     - Generating dashboard data
     """
@@ -37,49 +42,174 @@ class StatisticsService:
         """Initialize statistics service."""
         self.db = db
 
-    def record_upload(
-        self,
-        success: bool,
-        tracker_name: str = None,
-        processing_time_seconds: float = None,
-        bytes_processed: int = 0
-    ):
+    async def record_file_finished(self, file_entry: FileEntry) -> None:
         """
-        Record an upload result.
+        Add a file that reached UPLOADED or FAILED to the daily rollup.
+
+        Records its outcome, processing time (creation to now, without the
+        wait for approval) and size on the current day (UTC). The increment
+        is written in the next grouped checkpoint transaction.
 
         Args:
-            success: Whether upload succeeded
-            tracker_name: Name of the tracker
-            processing_time_seconds: Processing time
-            bytes_processed: Size of processed file
+            file_entry: File entry that just finished the pipeline
         """
         try:
-            # Record daily statistics
-            DailyStatistics.record_upload(
-                self.db,
-                success=success,
-                processing_time_seconds=processing_time_seconds,
+            finished_at = datetime.utcnow()
+            success = file_entry.status == Status.UPLOADED
+            processing_time = file_entry.get_processing_seconds(finished_at)
+            bytes_processed = file_entry.file_size or 0
+
+            await execute_checkpoint(self.db, lambda conn: DailyStatistics.add(
+                conn,
+                finished_at.date(),
+                successful=1 if success else 0,
+                failed=0 if success else 1,
+                processing_time_seconds=processing_time,
                 bytes_processed=bytes_processed
-            )
+            ))
+            logger.debug(f"Recorded file statistics: success={success}, time={processing_time:.1f}s")
 
-            # Record tracker statistics if tracker specified
-            if tracker_name:
-                TrackerStatistics.record_upload(
-                    self.db,
-                    tracker_name=tracker_name,
-                    success=success,
-                    processing_time_seconds=processing_time_seconds
-                )
+        except Exception as e:
+            logger.error(f"Error recording statistics: {e}")
+
+    async def record_tracker_upload(self, tracker_name: str, success: bool, duration: float) -> None:
+        """
+        Add an upload attempt to a tracker's rollup of the current day (UTC).
 
+        Args:
+            tracker_name: Tracker slug
+            success: Whether the upload succeeded
+            duration: Duration of the upload attempt in seconds
+        """
+        try:
+            today = datetime.utcnow().date()
+            await execute_checkpoint(self.db, lambda conn: TrackerStatistics.add(
+                conn,
+                today,
+                tracker_name,
+                successful=1 if success else 0,
+                failed=0 if success else 1,
+                processing_time_seconds=duration,
+                timed_uploads=1
+            ))
             logger.debug(f"Recorded upload statistics: success={success}, tracker={tracker_name}")
 
         except Exception as e:
             logger.error(f"Error recording statistics: {e}")
 
+    def rebuild_rollups(self, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Rebuild the daily and tracker rollups from the file_entries history.
+
+        Each finished file counts once, with its current outcome, on the day
+        it was uploaded (or last updated, for failures). Tracker rollups count
+        the last successful or failed attempt of each tracker of each file;
+        attempts recorded before their duration was stored have no time.
+
+        Args:
+            batch_size: Number of file entries loaded at a time
+
+        Returns:
+            Number of files, daily rows and tracker rows written
+        """
+        daily: Dict[date, Dict[str, Any]] = defaultdict(lambda: {
+            'successful': 0, 'failed': 0, 'time': 0.0, 'bytes': 0
+        })
+        trackers: Dict[tuple, Dict[str, Any]] = defaultdict(lambda: {
+            'successful': 0, 'failed': 0, 'time': 0.0, 'timed': 0
+        })
+        files = 0
+
+        entries = self.db.query(FileEntry).filter(
+            or_(FileEntry.is_terminal == True, FileEntry.tracker_statuses.isnot(None))
+        ).order_by(FileEntry.id).yield_per(batch_size)
+
+        for entry in entries:
+            finished_at = entry.updated_at or entry.created_at
+            if entry.status == Status.UPLOADED and entry.uploaded_at:
+                finished_at = entry.uploaded_at
+
+            if entry.is_terminal and finished_at:
+                files += 1
+                day = daily[finished_at.date()]
+                day['successful' if entry.status == Status.UPLOADED else 'failed'] += 1
+                day['time'] += entry.get_processing_seconds(finished_at)
+                day['bytes'] += entry.file_size or 0
+
+            for tracker_name, data in (entry.tracker_statuses or {}).items():
+                outcome = data.get('status')
+                if outcome not in (TrackerStatus.SUCCESS.value, TrackerStatus.FAILED.value, 'error'):
+                    continue
+                attempted_at = finished_at
+                if data.get('updated_at'):
+                    try:
+                        attempted_at = datetime.fromisoformat(data['updated_at'])
+                    except (TypeError, ValueError):
+                        pass
+                if attempted_at is None:
+                    continue
+                stats = trackers[(attempted_at.date(), tracker_name)]
+                stats['successful' if outcome == TrackerStatus.SUCCESS.value else 'failed'] += 1
+                if data.get('duration') is not None:
+                    stats['time'] += float(data['duration'])
+                    stats['timed'] += 1
+
+        now = datetime.utcnow()
+        daily_rows = [
+            {
+                'date': day,
+                'total_uploads': s['successful'] + s['failed'],
+                'successful_uploads': s['successful'],
+                'failed_uploads': s['failed'],
+                'total_processing_time_seconds': s['time'],
+                'avg_processing_time_seconds': s['time'] / (s['successful'] + s['failed']),
+                'total_bytes_processed': s['bytes'],
+                'created_at': now,
+                'updated_at': now,
+            }
+            for day, s in daily.items()
+        ]
+        tracker_rows = [
+            {
+                'date': day,
+                'tracker_name': tracker_name,
+                'total_uploads': s['successful'] + s['failed'],
+                'successful_uploads': s['successful'],
+                'failed_uploads': s['failed'],
+                'total_processing_time_seconds': s['time'],
+                'timed_uploads': s['timed'],
+                'avg_processing_time_seconds': s['time'] / s['timed'] if s['timed'] else None,
+                'created_at': now,
+                'updated_at': now,
+            }
+            for (day, tracker_name), s in trackers.items()
+        ]
+
+        try:
+            self.db.query(DailyStatistics).delete()
+            self.db.query(TrackerStatistics).delete()
+            if daily_rows:
+                self.db.execute(insert(DailyStatistics), daily_rows)
+            if tracker_rows:
+                self.db.execute(insert(TrackerStatistics), tracker_rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        logger.info(
+            f"Rebuilt statistics from {files} files: "
+            f"{len(daily_rows)} daily rows, {len(tracker_rows)} tracker rows"
+        )
+        return {'files': files, 'daily_rows': len(daily_rows), 'tracker_rows': len(tracker_rows)}
+
     def get_dashboard_data(self, days: int = 30) -> Dict[str, Any]:
         """
         Get data for statistics dashboard.
 
+        Only reads the pre-aggregated rollups (see rebuild_rollups() to
+        fill them from the history of an existing database).
+
         Args:
             days: Number of days to include
 
@@ -96,17 +226,6 @@ class StatisticsService:
         # Get tracker breakdown
         tracker_breakdown = TrackerStatistics.get_tracker_summary(self.db, days)
 
-        # Calculate additional metrics from FileEntry if no recorded stats
-        if summary['total_uploads'] == 0:
-            # Try to calculate from file_entry table
-            historical = self._calculate_historical_stats(days)
-            if historical['total_uploads'] > 0:
-                summary = historical
-
-        # If no tracker breakdown stats, calculate from FileEntry.tracker_statuses
-        if not tracker_breakdown:
-            tracker_breakdown = self._calculate_tracker_breakdown_from_entries(days)
-
         return {
             'summary': summary,
             'timeline': timeline,
@@ -114,105 +233,10 @@ class StatisticsService:
             'period_days': days
         }
 
-    def _calculate_historical_stats(self, days: int) -> Dict[str, Any]:
-        """Calculate historical stats from FileEntry table."""
-        try:
-            end_date = date.today()
-            start_date = end_date - timedelta(days=days)
-
-            # Count by status
-            from app.models.file_entry import Status
-
-            total = self.db.query(func.count(FileEntry.id)).filter(
-                FileEntry.created_at >= start_date
-            ).scalar() or 0
-
-            successful = self.db.query(func.count(FileEntry.id)).filter(
-                FileEntry.created_at >= start_date,
-                FileEntry.status == Status.UPLOADED
-            ).scalar() or 0
-
-            failed = self.db.query(func.count(FileEntry.id)).filter(
-                FileEntry.created_at >= start_date,
-                FileEntry.status == Status.FAILED
-            ).scalar() or 0
-
-            return {
-                'period_days': days,
-                'total_uploads': total,
-                'successful_uploads': successful,
-                'failed_uploads': failed,
-                'success_rate': round((successful / total * 100) if total > 0 else 0, 1),
-                'avg_processing_time': None,
-                'total_bytes_processed': 0,
-                'source': 'historical'
-            }
-
-        except Exception as e:
-            logger.warning(f"Could not calculate historical stats: {e}")
-            return {
-                'period_days': days,
-                'total_uploads': 0,
-                'successful_uploads': 0,
-                'failed_uploads': 0,
-                'success_rate': 0,
-                'avg_processing_time': None,
-                'total_bytes_processed': 0
-            }
-
-    def _calculate_tracker_breakdown_from_entries(self, days: int) -> List[Dict[str, Any]]:
-        """Calculate tracker breakdown from FileEntry.tracker_statuses field."""
-        try:
-            end_date = date.today()
-            start_date = end_date - timedelta(days=days)
-
-            # Get all entries with tracker_statuses in the period
-            entries = self.db.query(FileEntry).filter(
-                FileEntry.created_at >= start_date,
-                FileEntry.tracker_statuses.isnot(None)
-            ).all()
-
-            # Aggregate by tracker
-            tracker_stats = {}
-            for entry in entries:
-                statuses = entry.tracker_statuses or {}
-                for tracker_slug, data in statuses.items():
-                    if tracker_slug not in tracker_stats:
-                        tracker_stats[tracker_slug] = {
-                            'tracker_name': tracker_slug,
-                            'total_uploads': 0,
-                            'successful_uploads': 0,
-                            'failed_uploads': 0
-                        }
-
-                    tracker_stats[tracker_slug]['total_uploads'] += 1
-                    status = data.get('status', '')
-                    if status == 'success':
-                        tracker_stats[tracker_slug]['successful_uploads'] += 1
-                    elif status in ('failed', 'error'):
-                        tracker_stats[tracker_slug]['failed_uploads'] += 1
-
-            # Calculate success rates and return as list
-            result = []
-            for slug, stats in tracker_stats.items():
-                total = stats['total_uploads']
-                successful = stats['successful_uploads']
-                stats['success_rate'] = round((successful / total * 100) if total > 0 else 0, 1)
-                stats['avg_processing_time'] = None
-                result.append(stats)
-
-            return result
-
-        except Exception as e:
-            logger.warning(f"Could not calculate tracker breakdown from entries: {e}")
-            return []
-
     def get_recent_activity(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent upload activity."""
-        from app.models.file_entry import FileEntry, Status
-
         recent = self.db.query(FileEntry).filter(
-            FileEntry.status.in_([Status.UPLOADED, Status.FAILED])
+            FileEntry.is_terminal == True
         ).order_by(FileEntry.updated_at.desc()).limit(limit).all()
 
         return [
@@ -227,16 +251,9 @@ class StatisticsService:
 
     def get_status_distribution(self) -> Dict[str, int]:
         """Get distribution of file entry statuses."""
-        from app.models.file_entry import FileEntry, Status
-
-        results = self.db.query(
-            FileEntry.status,
-            func.count(FileEntry.id)
-        ).group_by(FileEntry.status).all()
-
         return {
-            str(status.value if hasattr(status, 'value') else status): count
-            for status, count in results
+            status.value: count
+            for status, count in FileEntryStatusCount.get_counts(self.db).items()
         }
 
 
@@ -9,14 +9,20 @@ Features:
 - Request correlation via X-Request-ID
 - File entry correlation for pipeline tracking
 - Context propagation via contextvars
+- Non-blocking emission: handlers run on a background listener thread
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import threading
 import uuid
 from contextvars import ContextVar
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 
 # Context variables for correlation
@@ -74,6 +80,23 @@ def generate_request_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
+def get_record_context(record: logging.LogRecord) -> Tuple[Optional[str], Optional[int], Dict[str, Any]]:
+    """
+    Get the correlation context of a log record.
+
+    Records queued by ContextQueueHandler carry the context captured when they
+    were logged (the listener thread has its own context); other records use
+    the current context.
+
+    Returns:
+        (request_id, file_entry_id, extra_context)
+    """
+    context = getattr(record, 'correlation', None)
+    if context is None:
+        return get_request_id(), get_file_entry_id(), get_extra_context()
+    return context
+
+
 class JSONLogFormatter(logging.Formatter):
     """
     JSON formatter for structured logging output.
@@ -89,7 +112,7 @@ class JSONLogFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -99,17 +122,15 @@ class JSONLogFormatter(logging.Formatter):
         }
 
         # Add correlation IDs from context
-        request_id = get_request_id()
+        request_id, file_entry_id, extra_context = get_record_context(record)
         if request_id:
             log_data["request_id"] = request_id
 
-        file_entry_id = get_file_entry_id()
         if file_entry_id:
             log_data["file_entry_id"] = file_entry_id
 
         # Add extra context
         if self.include_extra:
-            extra_context = get_extra_context()
             if extra_context:
                 log_data["context"] = extra_context
 
@@ -222,25 +243,130 @@ class CorrelationContext:
         return False
 
 
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that defers formatting and storage to a listener thread.
+
+    The calling thread only merges the message arguments (so mutable objects
+    are rendered as they were when logged) and captures the correlation
+    context; formatting, exception rendering and I/O happen on the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Freeze the message and correlation context of the record."""
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        record.correlation = (get_request_id(), get_file_entry_id(), get_extra_context())
+        return record
+
+
+# Queue handler and listener per logger name (None for root logger)
+_log_queues: Dict[Optional[str], Tuple[ContextQueueHandler, logging.handlers.QueueListener]] = {}
+_log_queues_lock = threading.Lock()
+
+
+def add_queued_handler(handler: logging.Handler, logger_name: Optional[str] = None) -> logging.Handler:
+    """
+    Attach a handler to a logger through its background queue listener.
+
+    The first handler of a logger installs a ContextQueueHandler on it and
+    starts a listener thread; later handlers join that listener. Each handler
+    keeps its own level.
+
+    Args:
+        handler: Handler run on the listener thread
+        logger_name: Logger name (None for root logger)
+
+    Returns:
+        The handler
+    """
+    with _log_queues_lock:
+        if logger_name not in _log_queues:
+            queue_handler = ContextQueueHandler(queue.Queue())
+            listener = logging.handlers.QueueListener(queue_handler.queue, respect_handler_level=True)
+            listener.start()
+            logging.getLogger(logger_name).addHandler(queue_handler)
+            _log_queues[logger_name] = (queue_handler, listener)
+
+        queue_handler, listener = _log_queues[logger_name]
+        listener.handlers = listener.handlers + (handler,)
+        # Records below every handler level are dropped before being queued
+        queue_handler.setLevel(min(h.level for h in listener.handlers))
+    return handler
+
+
+def get_queued_handlers(logger_name: Optional[str] = None) -> Tuple[logging.Handler, ...]:
+    """Get the handlers run by the queue listener of a logger."""
+    with _log_queues_lock:
+        entry = _log_queues.get(logger_name)
+    return entry[1].handlers if entry else ()
+
+
+def flush_logs() -> None:
+    """Wait until the queued log records have been handled."""
+    with _log_queues_lock:
+        queues = [queue_handler.queue for queue_handler, _ in _log_queues.values()]
+    for log_queue in queues:
+        log_queue.join()
+
+
+def stop_log_listeners() -> None:
+    """
+    Stop the queue listeners after handling the queued records.
+
+    The handlers are attached directly to their loggers again, so records
+    logged afterwards (late shutdown messages) are handled synchronously.
+    """
+    with _log_queues_lock:
+        entries = list(_log_queues.items())
+        _log_queues.clear()
+
+    for logger_name, (queue_handler, listener) in entries:
+        target_logger = logging.getLogger(logger_name)
+        target_logger.removeHandler(queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            target_logger.addHandler(handler)
+
+
+atexit.register(stop_log_listeners)
+
+
 def setup_json_logging(
     logger_name: Optional[str] = None,
     level: int = logging.INFO,
-    json_output: bool = True
+    json_output: bool = True,
+    log_file: Optional[str] = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5
 ) -> logging.Handler:
     """
     Set up JSON logging for a logger.
 
+    The handler runs on the logger's background queue listener, so writing
+    the log line does not block the caller.
+
     Args:
         logger_name: Logger name (None for root logger)
         level: Minimum log level
         json_output: Whether to output JSON (True) or plain text (False)
+        log_file: Write to this rotating file instead of stderr
+        max_bytes: Size at which the log file is rotated
+        backup_count: Number of rotated log files kept
 
     Returns:
         The configured handler
     """
-    logger = logging.getLogger(logger_name) if logger_name else logging.getLogger()
-
-    handler = logging.StreamHandler()
+    if log_file:
+        directory = os.path.dirname(log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+        )
+    else:
+        handler = logging.StreamHandler()
     handler.setLevel(level)
 
     if json_output:
@@ -250,5 +376,4 @@ def setup_json_logging(
             '%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s'
         ))
 
-    logger.addHandler(handler)
-    return handler
+    return add_queued_handler(handler, logger_name)
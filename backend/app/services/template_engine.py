@@ -0,0 +1,295 @@
+"""
+Template Engine for Seedarr v2.0
+
+This module compiles the BBCode and NFO templates ({{variable}} placeholders
+and {{#variable}}...{{/variable}} conditional blocks) once into a tree of
+literal segments, placeholders and blocks, and renders the compiled form in
+a single pass.
+
+Features:
+    - Templates parsed once, compiled forms cached by template ID and
+      content hash (LRU, so edited templates never render stale content)
+    - Rendering cost linear in the template size, whatever the number of
+      variables
+    - Variables read through a mapping: lazily computed variables (see
+      BBCodeGenerator._build_template_variables) are only built when the
+      template references them
+    - Nested conditional blocks
+    - Unknown placeholders and unmatched block tags are kept as written
+
+Usage Example:
+    >>> compiled = compile_template("[b]{{title}}[/b]{{#year}} ({{year}}){{/year}}")
+    >>> compiled.render({"title": "Dune", "year": "2021"})
+    '[b]Dune[/b] (2021)'
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from ..config import config
+
+# {{name}}, {{#name}} or {{/name}}
+_TAG_PATTERN = re.compile(r'\{\{([#/]?)(\w+)\}\}')
+
+_MISSING = object()
+
+
+class _Placeholder:
+    """A {{name}} placeholder."""
+    __slots__ = ('name', 'text')
+
+    def __init__(self, name: str, text: str):
+        self.name = name
+        self.text = text
+
+
+class _Block:
+    """A {{#name}}...{{/name}} block, rendered when the variable is not empty."""
+    __slots__ = ('name', 'nodes')
+
+    def __init__(self, name: str, nodes: Tuple['_Node', ...]):
+        self.name = name
+        self.nodes = nodes
+
+
+_Node = Union[str, _Placeholder, _Block]
+
+
+class CompiledTemplate:
+    """
+    A parsed template.
+
+    Attributes:
+        nodes: Literal strings, placeholders and blocks, in template order
+        variables: Names of all variables referenced by the template
+    """
+    __slots__ = ('nodes', 'variables')
+
+    def __init__(self, nodes: Tuple[_Node, ...], variables: FrozenSet[str]):
+        self.nodes = nodes
+        self.variables = variables
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """
+        Render the template.
+
+        Args:
+            variables: Mapping of variable names to values (converted with str())
+
+        Returns:
+            Rendered text
+        """
+        out: List[str] = []
+        _render_nodes(self.nodes, variables, out)
+        return ''.join(out)
+
+
+def _render_nodes(nodes: Tuple[_Node, ...], variables: Mapping[str, Any], out: List[str]) -> None:
+    for node in nodes:
+        if node.__class__ is str:
+            out.append(node)
+        elif node.__class__ is _Placeholder:
+            value = variables.get(node.name, _MISSING)
+            out.append(node.text if value is _MISSING else str(value))
+        elif variables.get(node.name, ""):
+            _render_nodes(node.nodes, variables, out)
+
+
+def _freeze(nodes: List[_Node]) -> Tuple[_Node, ...]:
+    """Merge adjacent literal segments."""
+    merged: List[_Node] = []
+    for node in nodes:
+        if node.__class__ is str:
+            if not node:
+                continue
+            if merged and merged[-1].__class__ is str:
+                merged[-1] += node
+                continue
+        merged.append(node)
+    return tuple(merged)
+
+
+def parse_template(content: str) -> CompiledTemplate:
+    """
+    Parse a template into its compiled form.
+
+    A block is closed by the next {{/name}} of the same name; blocks left
+    open inside it, stray closing tags and unclosed blocks are kept as text.
+
+    Args:
+        content: Template text
+
+    Returns:
+        CompiledTemplate
+    """
+    variables = set()
+    nodes: List[_Node] = []
+    # (name, opening tag text, nodes of the parent)
+    open_blocks: List[Tuple[str, str, List[_Node]]] = []
+    position = 0
+
+    for match in _TAG_PATTERN.finditer(content):
+        if match.start() > position:
+            nodes.append(content[position:match.start()])
+        position = match.end()
+        kind, name = match.group(1), match.group(2)
+
+        if kind == '#':
+            open_blocks.append((name, match.group(0), nodes))
+            nodes = []
+        elif kind == '/' and any(block_name == name for block_name, _, _ in open_blocks):
+            while True:
+                block_name, tag, parent = open_blocks.pop()
+                if block_name == name:
+                    parent.append(_Block(name, _freeze(nodes)))
+                    variables.add(name)
+                    nodes = parent
+                    break
+                # Inner block left open: keep its tag as text
+                parent.append(tag)
+                parent.extend(nodes)
+                nodes = parent
+        elif kind == '/':
+            nodes.append(match.group(0))
+        else:
+            nodes.append(_Placeholder(name, match.group(0)))
+            variables.add(name)
+
+    if position < len(content):
+        nodes.append(content[position:])
+    while open_blocks:
+        _, tag, parent = open_blocks.pop()
+        parent.append(tag)
+        parent.extend(nodes)
+        nodes = parent
+
+    return CompiledTemplate(_freeze(nodes), frozenset(variables))
+
+
+class TemplateVariables(Mapping):
+    """
+    Template variables computed on first access.
+
+    Each variable is either a value or a provider (a callable without
+    arguments returning the value); providers are called once, when a
+    template first reads the variable.
+    """
+
+    def __init__(
+        self,
+        values: Optional[Dict[str, Any]] = None,
+        providers: Optional[Dict[str, Callable[[], Any]]] = None
+    ):
+        self._values: Dict[str, Any] = dict(values or {})
+        self._providers: Dict[str, Callable[[], Any]] = dict(providers or {})
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            provider = self._providers.pop(name)
+            value = self._values[name] = provider()
+            return value
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._values or name in self._providers
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._values
+        yield from (name for name in list(self._providers) if name not in self._values)
+
+    def __len__(self) -> int:
+        return len(self._values) + sum(1 for name in self._providers if name not in self._values)
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        """Set (or override) variables."""
+        for name, value in values.items():
+            self._values[name] = value
+            self._providers.pop(name, None)
+
+    @property
+    def computed(self) -> FrozenSet[str]:
+        """Names of the variables that have been set or computed."""
+        return frozenset(self._values)
+
+
+class TemplateCache:
+    """LRU cache of compiled templates, keyed by template ID and content hash."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[Optional[int], str], CompiledTemplate]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, content: str, template_id: Optional[int] = None) -> CompiledTemplate:
+        """
+        Get the compiled form of a template, parsing it on first use.
+
+        Args:
+            content: Template text
+            template_id: ID of the stored template (None for unsaved templates)
+
+        Returns:
+            CompiledTemplate
+        """
+        key = (template_id, hashlib.sha1(content.encode('utf-8')).hexdigest())
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+
+        compiled = parse_template(content)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = compiled
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop all compiled templates."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global template cache instance
+_template_cache: Optional[TemplateCache] = None
+
+
+def get_template_cache() -> TemplateCache:
+    """Get the process-wide TemplateCache instance."""
+    global _template_cache
+    if _template_cache is None:
+        _template_cache = TemplateCache(max_entries=config.TEMPLATE_CACHE_MAX_ENTRIES)
+    return _template_cache
+
+
+def compile_template(content: str, template_id: Optional[int] = None) -> CompiledTemplate:
+    """
+    Get the cached compiled form of a template.
+
+    Args:
+        content: Template text
+        template_id: ID of the stored template (None for unsaved templates)
+
+    Returns:
+        CompiledTemplate
+    """
+    return get_template_cache().get(content, template_id)
@@ -11,6 +11,8 @@ Key Features:
     - Automatic cache population on API fetch
     - Configurable TTL (default 30 days from Settings)
     - Automatic expiration handling
+    - Persisted /search results per normalized (title, year, type, language)
+      with single-flight requests, over the shared HTTP client pool
 
 Performance Benefits:
     - Expected cache hit rate: >90% for repeated lookups
@@ -29,19 +31,64 @@ Usage Example:
     >>> print(metadata['title'])  # Returns cached or fresh data
 """
 
+import asyncio
 import logging
 import os
+import re
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
 
+import httpx
+
+from app.config import config
 from app.models.tmdb_cache import TMDBCache
+from app.models.tmdb_search_cache import TMDBSearchCache
 from app.models.settings import Settings
 from app.services.exceptions import TrackerAPIError, NetworkRetryableError, retry_on_network_error
-from app.services.rate_limiter import rate_limited
+from app.services.http_client_pool import pooled_http_client
+from app.services.rate_limiter import acquire_rate_limit, rate_limited
 from app.utils.tmdb_auth import detect_tmdb_credential_type, format_tmdb_request
 
 logger = logging.getLogger(__name__)
 
+TMDB_API_BASE = "https://api.themoviedb.org/3"
+SEARCH_LANGUAGE = "fr-FR"
+
+# In-flight TMDB searches by query key, shared by all service instances
+_inflight_searches: Dict[str, asyncio.Task] = {}
+
+# Search cache counters for monitoring
+_search_stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+
+
+def make_search_key(title: str, year: Optional[int], search_type: str, language: str = SEARCH_LANGUAGE) -> str:
+    """
+    Build the search cache key of a TMDB title search.
+
+    Case, punctuation and whitespace are ignored, so "R.I.P.D." and
+    "r i p d" share an entry.
+
+    Args:
+        title: Searched title
+        year: Optional release / first air year
+        search_type: "movie" or "tv"
+        language: TMDB language of the results
+
+    Returns:
+        Normalized key string
+    """
+    normalized = ' '.join(re.sub(r'[\W_]+', ' ', title.casefold()).split())
+    return f"{search_type}|{language}|{year or ''}|{normalized}"
+
+
+def _get_inflight_search(key: str) -> Optional[asyncio.Task]:
+    """Get the pending search of a key started on the running loop, if any."""
+    task = _inflight_searches.get(key)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        return None
+    return task
+
 
 class TMDBCacheService:
     """
@@ -406,7 +453,9 @@ class TMDBCacheService:
         Search TMDB by title and optionally year.
 
         This method searches TMDB for a movie or TV show by title,
-        then fetches and caches the full metadata.
+        then fetches and caches the full metadata. Search results are
+        cached too, so repeated lookups of a title (e.g. every episode
+        of a season) send a single search request.
 
         Args:
             title: Movie or TV show title to search for
@@ -420,9 +469,109 @@ class TMDBCacheService:
             >>> result = await cache_service.search_by_title("R.I.P.D.", 2013)
             >>> print(result['tmdb_id'])  # "49009"
         """
-        import asyncio
-        import requests
+        search_type = "tv" if content_type.lower() in ["tv", "series", "show"] else "movie"
+
+        logger.info(f"Searching TMDB for: '{title}' ({year or 'any year'}), type={search_type}")
+
+        results = await self._search(search_type, title, year)
+        if not results:
+            if results is not None:
+                logger.warning(f"No TMDB results found for: '{title}'")
+            return None
+
+        # Take the first result (best match)
+        best_match = results[0]
+        tmdb_id = str(best_match.get('id'))
+
+        logger.info(f"Found TMDB match: {best_match.get('title', best_match.get('name'))} (ID: {tmdb_id})")
+
+        # Fetch full metadata and cache it
+        try:
+            return await self.get_metadata(tmdb_id)
+        except Exception as e:
+            logger.error(f"Unexpected error in TMDB search: {e}")
+            return None
+
+    async def _search(
+        self,
+        search_type: str,
+        query: str,
+        year: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run a TMDB /search request, served from the search cache when possible.
+
+        Identical searches in flight at the same time share one request.
+
+        Args:
+            search_type: "movie" or "tv"
+            query: Title to search for
+            year: Optional release / first air year
+
+        Returns:
+            List of TMDB result objects (empty if nothing matched),
+            or None if the search failed
+
+        Raises:
+            TrackerAPIError: If the TMDB credential is missing or invalid
+        """
+        key = make_search_key(query, year, search_type)
+
+        entry = TMDBSearchCache.get_valid(self.db, key)
+        if entry is not None:
+            _search_stats['hits'] += 1
+            logger.debug(f"TMDB search cache hit: {key}")
+            return list(entry.results or [])
+
+        _search_stats['misses'] += 1
+        task = _get_inflight_search(key)
+        if task is None:
+            # A refused token fails this search only, before a shared task exists
+            if not await acquire_rate_limit("tmdb"):
+                logger.warning(f"TMDB rate limit token refused, search skipped: {key}")
+                return None
+            # Another caller may have started the search while this one waited
+            task = _get_inflight_search(key)
+        if task is None:
+            task = asyncio.ensure_future(self._search_and_store(key, search_type, query, year))
+            _inflight_searches[key] = task
+        else:
+            _search_stats['coalesced'] += 1
+            logger.debug(f"Waiting for in-flight TMDB search: {key}")
+
+        # Shield so a cancelled waiter does not cancel the search for the others
+        results = await asyncio.shield(task)
+        return list(results) if results is not None else None
 
+    async def _search_and_store(
+        self,
+        key: str,
+        search_type: str,
+        query: str,
+        year: Optional[int]
+    ) -> Optional[List[Dict[str, Any]]]:
+        try:
+            results = await self._search_from_api(search_type, query, year)
+            if results is not None:
+                ttl_hours = config.TMDB_SEARCH_CACHE_TTL_HOURS if results else config.TMDB_SEARCH_NEGATIVE_CACHE_TTL_HOURS
+                try:
+                    TMDBSearchCache.upsert(
+                        self.db, key, results, datetime.utcnow() + timedelta(hours=ttl_hours)
+                    )
+                except Exception as e:
+                    self.db.rollback()
+                    logger.warning(f"Failed to cache TMDB search '{key}': {e}")
+            return results
+        finally:
+            _inflight_searches.pop(key, None)
+
+    async def _search_from_api(
+        self,
+        search_type: str,
+        query: str,
+        year: Optional[int]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Send a /search request to TMDB (rate limit token already acquired); return its results, or None on failure."""
         api_key = self._get_api_key()
 
         # Detect credential type and format request
@@ -431,48 +580,25 @@ class TMDBCacheService:
         except ValueError as e:
             raise TrackerAPIError(f"Invalid TMDB credential: {e}")
 
-        # TMDB search endpoint
-        search_type = "tv" if content_type.lower() in ["tv", "series", "show"] else "movie"
-        url = f"https://api.themoviedb.org/3/search/{search_type}"
+        url = f"{TMDB_API_BASE}/search/{search_type}"
 
         # Add search parameters
-        params['query'] = title
-        params['language'] = 'fr-FR'  # French language for search results
+        params['query'] = query
+        params['language'] = SEARCH_LANGUAGE  # French language for search results
         if year:
             params['year' if search_type == "movie" else 'first_air_date_year'] = year
 
-        logger.info(f"Searching TMDB for: '{title}' ({year or 'any year'}), type={search_type}")
-
         try:
-            response = await asyncio.to_thread(
-                requests.get,
-                url,
-                params=params,
-                headers=headers,
-                timeout=10
-            )
+            async with pooled_http_client(url) as client:
+                response = await client.get(url, params=params, headers=headers, timeout=10)
 
             if response.status_code != 200:
                 logger.warning(f"TMDB search failed with HTTP {response.status_code}")
                 return None
 
-            data = response.json()
-            results = data.get('results', [])
-
-            if not results:
-                logger.warning(f"No TMDB results found for: '{title}'")
-                return None
-
-            # Take the first result (best match)
-            best_match = results[0]
-            tmdb_id = str(best_match.get('id'))
-
-            logger.info(f"Found TMDB match: {best_match.get('title', best_match.get('name'))} (ID: {tmdb_id})")
-
-            # Fetch full metadata and cache it
-            return await self.get_metadata(tmdb_id)
+            return response.json().get('results', [])
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"TMDB search request failed: {e}")
             return None
         except Exception as e:
@@ -511,36 +637,17 @@ class TMDBCacheService:
             ...     "R.I.P.D. (2013) MULTi VFF 2160p.mkv"
             ... )
         """
-        import re
         from pathlib import Path
+        from app.services.release_parser import get_release_parser
 
         # filename can be a full path or just a filename
         file_path = Path(filename)
-        name_without_ext = file_path.stem
-
-        # Extract title and year from filename
-        # Pattern: "Title (Year)" or "Title.Year." or "Title 2013" or "Title_(Year)_"
-        patterns = [
-            r'^(.+?)\s*\((\d{4})\)',   # Title (2013) or Title_(2013)
-            r'^(.+?)\.(\d{4})\.',      # Title.2013.
-            r'^(.+?)_(\d{4})_',        # Title_2013_
-            r'^(.+?)\s+(\d{4})\s',     # Title 2013
-        ]
-
-        title = None
-        year = None
-
-        for pattern in patterns:
-            match = re.match(pattern, name_without_ext)
-            if match:
-                title = match.group(1).replace('.', ' ').replace('_', ' ').strip()
-                year = int(match.group(2))
-                break
 
-        if not title:
-            # Fallback: use the part before common release markers
-            title = re.split(r'[\.\s](2160p|1080p|720p|480p|BluRay|WEB|HDTV|MULTi|FRENCH|TRUEFRENCH|VFF|VOSTFR|REMUX)', name_without_ext, flags=re.IGNORECASE)[0]
-            title = title.replace('.', ' ').replace('_', ' ').strip()
+        # Extract title and year with the shared release name parser
+        # (same parse as the metadata mapping stage, memoized per name)
+        parsed = get_release_parser().parse(file_path.name)
+        title = parsed['title']
+        year = parsed['year']
 
         if not title:
             logger.warning(f"Could not extract title from filename: {filename}")
@@ -616,81 +723,40 @@ class TMDBCacheService:
             >>> for movie in results:
             ...     print(f"{movie['title']} ({movie['year']}) - ID: {movie['tmdb_id']}")
         """
-        import asyncio
-        import requests
-
         if not query or len(query) < 2:
             logger.warning("Search query too short (min 2 chars)")
             return []
 
-        api_key = self._get_api_key()
-
-        # Detect credential type and format request
-        try:
-            params, headers = format_tmdb_request(api_key)
-        except ValueError as e:
-            raise TrackerAPIError(f"Invalid TMDB credential: {e}")
-
-        # TMDB search endpoint
-        url = "https://api.themoviedb.org/3/search/movie"
-
-        # Add search parameters
-        params['query'] = query
-        params['language'] = 'fr-FR'  # French language for search results
-        if year:
-            params['year'] = year  # Use TMDB's year filter parameter
-
         logger.info(f"Searching TMDB autocomplete for: '{query}'" + (f" (year={year})" if year else ""))
 
-        try:
-            response = await asyncio.to_thread(
-                requests.get,
-                url,
-                params=params,
-                headers=headers,
-                timeout=10
-            )
-
-            if response.status_code != 200:
-                logger.warning(f"TMDB search failed with HTTP {response.status_code}")
-                return []
+        results = await self._search("movie", query, year)
+        if not results:
+            if results is not None:
+                logger.info(f"No TMDB results found for: '{query}'" + (f" (year={year})" if year else ""))
+            return []
 
-            data = response.json()
-            results = data.get('results', [])
+        # Convert results to simplified format
+        autocomplete_results = []
+        for movie in results[:limit]:
+            # Extract year from release_date
+            release_date = movie.get('release_date', '')
+            movie_year = None
+            if release_date and len(release_date) >= 4:
+                try:
+                    movie_year = int(release_date[:4])
+                except ValueError:
+                    pass
 
-            if not results:
-                logger.info(f"No TMDB results found for: '{query}'" + (f" (year={year})" if year else ""))
-                return []
-
-            # Convert results to simplified format
-            autocomplete_results = []
-            for movie in results[:limit]:
-                # Extract year from release_date
-                release_date = movie.get('release_date', '')
-                movie_year = None
-                if release_date and len(release_date) >= 4:
-                    try:
-                        movie_year = int(release_date[:4])
-                    except ValueError:
-                        pass
-
-                autocomplete_results.append({
-                    'tmdb_id': str(movie.get('id')),
-                    'title': movie.get('title', 'Unknown'),
-                    'original_title': movie.get('original_title', ''),
-                    'year': movie_year,
-                    'poster_path': movie.get('poster_path', ''),
-                })
-
-            logger.info(f"Found {len(autocomplete_results)} TMDB results for '{query}'")
-            return autocomplete_results
+            autocomplete_results.append({
+                'tmdb_id': str(movie.get('id')),
+                'title': movie.get('title', 'Unknown'),
+                'original_title': movie.get('original_title', ''),
+                'year': movie_year,
+                'poster_path': movie.get('poster_path', ''),
+            })
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"TMDB search request failed: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error in TMDB autocomplete search: {e}")
-            return []
+        logger.info(f"Found {len(autocomplete_results)} TMDB results for '{query}'")
+        return autocomplete_results
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -701,14 +767,14 @@ class TMDBCacheService:
                 - total_entries: Total number of cached entries
                 - expired_entries: Number of expired entries
                 - valid_entries: Number of valid (non-expired) entries
+                - search: Search cache hits, misses, coalesced and
+                  in-flight searches of this process
 
         Example:
             >>> stats = cache_service.get_cache_stats()
             >>> logger.info(f"Cache: {stats['valid_entries']} valid, "
             ...             f"{stats['expired_entries']} expired")
         """
-        from datetime import datetime
-
         total = self.db.query(TMDBCache).count()
         expired = self.db.query(TMDBCache).filter(
             TMDBCache.expires_at <= datetime.utcnow()
@@ -717,7 +783,11 @@ class TMDBCacheService:
         stats = {
             'total_entries': total,
             'expired_entries': expired,
-            'valid_entries': total - expired
+            'valid_entries': total - expired,
+            'search': {
+                **_search_stats,
+                'in_flight': len(_inflight_searches),
+            }
         }
 
         logger.debug(f"Cache stats: {stats}")
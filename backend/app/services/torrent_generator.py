@@ -11,6 +11,9 @@ Features:
     - Source flag support for unique hashes
     - Async torrent creation to avoid blocking
     - Batch generation for all enabled trackers
+    - Hash-once, sign-many: piece hashes are computed once per distinct
+      (content, piece size) and reused for every tracker sharing them
+    - Multi-core piece hashing for single files (see piece_hasher)
 
 Piece Size Strategies:
     - "auto": Automatic based on file size (torf defaults)
@@ -31,10 +34,12 @@ import asyncio
 import logging
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import torf
 
+from .piece_hasher import hash_pieces
+
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
     from ..models.tracker import Tracker
@@ -47,6 +52,28 @@ KiB = 1024
 MiB = 1024 * 1024
 GiB = 1024 * 1024 * 1024
 
+# Cache key for piece hashes: (st_dev, st_ino, st_size, st_mtime_ns, piece_size)
+PieceHashKey = Tuple[int, int, int, int, int]
+
+
+def _piece_hash_key(file_path: Path, piece_size: int) -> PieceHashKey:
+    """
+    Build the piece hash cache key for a file.
+
+    The key is based on the inode rather than the path, so hardlinked
+    copies (e.g. per-tracker hardlinks) resolve to the same key and share
+    their piece hashes.
+
+    Args:
+        file_path: Path to the media file
+        piece_size: Piece size in bytes
+
+    Returns:
+        Hashable cache key
+    """
+    st = file_path.stat()
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, piece_size)
+
 
 class TorrentGenerator:
     """
@@ -150,7 +177,8 @@ class TorrentGenerator:
         tracker: 'Tracker',
         release_name: str,
         output_dir: Optional[str] = None,
-        tracker_release_name: Optional[str] = None
+        tracker_release_name: Optional[str] = None,
+        piece_hashes: Optional[Dict[PieceHashKey, bytes]] = None
     ) -> str:
         """
         Generate a .torrent file for a specific tracker.
@@ -168,6 +196,10 @@ class TorrentGenerator:
             output_dir: Output directory (defaults to file's directory)
             tracker_release_name: Tracker-specific release name (from naming_template).
                                  If provided, used for torrent filename instead of release_name.
+            piece_hashes: Optional shared piece hash cache. When the file (by inode)
+                         was already hashed with the same piece size, the cached
+                         hashes are reused and the file is not read again.
+                         Newly computed hashes are stored in it.
 
         Returns:
             Path to the generated .torrent file
@@ -201,18 +233,26 @@ class TorrentGenerator:
         # Get file size for piece size calculation
         file_size = file_path.stat().st_size
 
-        # Calculate piece size based on tracker's strategy
+        # Calculate piece size based on tracker's strategy. "auto" is resolved
+        # here (same algorithm as torf) so it can be part of the hash cache key.
         piece_size = self.calculate_piece_size(
             file_size,
             tracker.piece_size_strategy or "auto"
-        )
+        ) or torf.Torrent.calculate_piece_size(file_size)
+
+        cache_key = None
+        cached_pieces = None
+        if piece_hashes is not None:
+            cache_key = _piece_hash_key(file_path, piece_size)
+            cached_pieces = piece_hashes.get(cache_key)
 
         logger.info(
             f"Generating torrent for {tracker.name}: "
             f"file={file_path.name}, "
             f"size={file_size / GiB:.2f} GB, "
-            f"piece_size={piece_size / KiB if piece_size else 'auto'} KiB, "
-            f"source={tracker.source_flag}"
+            f"piece_size={piece_size / KiB} KiB, "
+            f"source={tracker.source_flag}, "
+            f"cached_hashes={cached_pieces is not None}"
         )
 
         def create_torrent():
@@ -229,13 +269,17 @@ class TorrentGenerator:
                 torrent_kwargs['source'] = tracker.source_flag.strip()
 
             torrent = torf.Torrent(**torrent_kwargs)
-
-            # Set piece size if specified
-            if piece_size:
-                torrent.piece_size = piece_size
-
-            # Generate torrent (hashes the file - can be slow)
-            torrent.generate()
+            torrent.piece_size = piece_size
+
+            if cached_pieces is not None:
+                # Same content and piece size already hashed: only the
+                # announce URL, source and name differ in the info dict
+                torrent.metainfo['info']['pieces'] = cached_pieces
+            elif file_path.is_file():
+                # Hash pieces across all cores (can be slow for large files)
+                torrent.metainfo['info']['pieces'] = hash_pieces(str(file_path), piece_size)
+            else:
+                torrent.generate()
 
             # Write to file
             torrent.write(str(torrent_path), overwrite=True)
@@ -243,9 +287,15 @@ class TorrentGenerator:
             return torrent
 
         # Run torrent creation in thread pool
-        logger.info(f"Hashing file for {tracker.name} torrent (async)...")
+        if cached_pieces is None:
+            logger.info(f"Hashing file for {tracker.name} torrent (async)...")
+        else:
+            logger.info(f"Reusing piece hashes for {tracker.name} torrent")
         torrent = await asyncio.to_thread(create_torrent)
 
+        if cache_key is not None and cached_pieces is None:
+            piece_hashes[cache_key] = torrent.metainfo['info']['pieces']
+
         logger.info(
             f"Generated torrent for {tracker.name}: "
             f"{torrent_path.name} "
@@ -271,6 +321,10 @@ class TorrentGenerator:
         This method generates a .torrent file for each enabled tracker,
         with tracker-specific configurations (piece size, source flag, release name).
 
+        The payload is hashed once per distinct piece size: trackers sharing a
+        piece size (and hardlinked per-tracker copies sharing an inode) reuse
+        the same piece hashes, so only the info dict differs between them.
+
         Args:
             db: SQLAlchemy database session
             file_path: Path to the media file (default for all trackers)
@@ -319,6 +373,7 @@ class TorrentGenerator:
         # Generate torrents for each tracker
         torrent_paths = {}
         errors = []
+        piece_hashes: Dict[PieceHashKey, bytes] = {}
 
         for tracker in trackers:
             try:
@@ -342,7 +397,8 @@ class TorrentGenerator:
                     tracker=tracker,
                     release_name=release_name,
                     output_dir=tracker_out_dir,
-                    tracker_release_name=tracker_specific_name
+                    tracker_release_name=tracker_specific_name,
+                    piece_hashes=piece_hashes
                 )
                 torrent_paths[tracker.slug] = path
             except Exception as e:
@@ -358,7 +414,8 @@ class TorrentGenerator:
 
         logger.info(
             f"Generated {len(torrent_paths)} torrent(s): "
-            f"{list(torrent_paths.keys())}"
+            f"{list(torrent_paths.keys())} "
+            f"({len(piece_hashes)} hashing pass(es))"
         )
 
         return torrent_paths
@@ -427,7 +484,12 @@ class TorrentGenerator:
             if piece_size:
                 torrent.piece_size = piece_size
 
-            torrent.generate()
+            if file_path.is_file():
+                torrent.metainfo['info']['pieces'] = hash_pieces(
+                    str(file_path), torrent.piece_size
+                )
+            else:
+                torrent.generate()
             torrent.write(str(torrent_path), overwrite=True)
             return torrent
 
@@ -20,7 +20,7 @@ from sqlalchemy.orm import Session
 from app.models.categories import Categories
 from app.models.tags import Tags
 from app.models.settings import Settings
-from app.services.cloudflare_session_manager import CloudflareSessionManager
+from app.services.cloudflare_session_manager import CloudflareSessionManager, get_clearance_cache
 from app.services.lacale_client import LaCaleClient
 from app.services.exceptions import TrackerAPIError, NetworkRetryableError
 
@@ -52,7 +52,10 @@ class TrackerSyncService:
         if not self.settings.tracker_url or not self.settings.tracker_passkey:
             raise TrackerAPIError("Tracker URL and passkey must be configured")
 
-        self.session_manager = CloudflareSessionManager(self.settings.flaresolverr_url)
+        self.session_manager = CloudflareSessionManager(
+            self.settings.flaresolverr_url,
+            clearance_cache=get_clearance_cache()
+        )
         self.client = LaCaleClient(self.settings.tracker_url, self.settings.tracker_passkey)
 
     async def sync_all(self) -> Dict[str, Any]:
@@ -42,8 +42,16 @@ import unicodedata
 import logging
 from typing import Optional
 
+from app.services.release_parser import get_release_parser
+
 logger = logging.getLogger(__name__)
 
+# Scene format indicators (see has_scene_format)
+_EXTENSION = re.compile(r'\.[^.]+$')
+_SCENE_YEAR = re.compile(r'[\s.\(](19|20)\d{2}[\s.\)]?')
+_SCENE_RESOLUTION = re.compile(r'\b(720|1080|2160|4K)p?\b', re.I)
+_SCENE_TEAM = re.compile(r'\s*-\s*[A-Za-z0-9]+$')
+
 
 class UniversalRenamer:
     """
@@ -576,56 +584,7 @@ class UniversalRenamer:
         Returns:
             Team name if found, None otherwise
         """
-        # Remove extension
-        name = re.sub(r'\.[^.]+$', '', filename)
-
-        # Strip trailing parenthetical content (e.g., "(Beauty and the Beast)")
-        # These are often alternate titles appended after the team tag
-        name = re.sub(r'\s*\([^)]*\)\s*$', '', name)
-
-        # Known codec patterns that end with "-something" and look like team tags
-        # E-AC-3 -> "-3", DTS-HD -> "-HD", AC-3 -> "-3"
-        codec_tail_patterns = [
-            r'E[\-\.]?AC[\-\.]?3$',           # E-AC-3
-            r'DTS[\-\.]?HD(?:[\-\.]?MA)?$',   # DTS-HD, DTS-HD.MA
-            r'AC[\-\.]?3$',                    # AC-3
-        ]
-
-        # Pattern 1: Scene format "-TEAM" (no spaces)
-        match = re.search(r'-([A-Za-z0-9]+)$', name)
-        if match:
-            # Check if the matched suffix is actually part of a codec
-            # by looking at the full tail of the name including the match
-            tail = name[max(0, match.start() - 10):]  # Get enough context
-            is_false_positive = any(
-                re.search(pattern, tail, re.IGNORECASE)
-                for pattern in codec_tail_patterns
-            )
-            if not is_false_positive:
-                return match.group(1)
-
-        # Pattern 1b: Codec.TEAM format "-x264.GHT", "-x265.SPARKS", "-HEVC.FGT"
-        # When the team follows a known codec separated by a dot
-        match = re.search(
-            r'-(?:x264|x265|h264|h265|XviD|DivX|HEVC|AVC|VP9|AV1)\.([A-Za-z0-9]+)$',
-            name, re.IGNORECASE
-        )
-        if match:
-            return match.group(1)
-
-        # Pattern 2: Space format " - TEAM" or "- TEAM" or " -TEAM"
-        match = re.search(r'\s+-\s*([A-Za-z0-9]+)$', name)
-        if match:
-            return match.group(1)
-
-        # Pattern 3: Common release groups at end (even without separator)
-        # Known team patterns that might appear without clear separator
-        common_teams = r'(QTZ|YGG|FGT|AMIABLE|SPARKS|GECKOS|TP|FraMeSToR|BHD|DON|EPSiLON|FLUX|TEPES|ROVERS)$'
-        match = re.search(common_teams, name, re.I)
-        if match:
-            return match.group(1).upper()
-
-        return None
+        return get_release_parser().parse(filename)['team']
 
     def has_scene_format(self, filename: str) -> bool:
         """
@@ -644,14 +603,14 @@ class UniversalRenamer:
             True if filename appears to follow scene/release format
         """
         # Remove extension
-        name = re.sub(r'\.[^.]+$', '', filename)
+        name = _EXTENSION.sub('', filename)
 
         # Check for key indicators
         has_dots = '.' in name
-        has_year = bool(re.search(r'[\s.\(](19|20)\d{2}[\s.\)]?', name))
-        has_resolution = bool(re.search(r'\b(720|1080|2160|4K)p?\b', name, re.I))
+        has_year = bool(_SCENE_YEAR.search(name))
+        has_resolution = bool(_SCENE_RESOLUTION.search(name))
         # Team with or without spaces around hyphen
-        has_team = bool(re.search(r'\s*-\s*[A-Za-z0-9]+$', name))
+        has_team = bool(_SCENE_TEAM.search(name))
 
         # Consider scene format if has most indicators
         indicators = [has_dots, has_year, has_resolution, has_team]
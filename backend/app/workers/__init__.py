@@ -4,6 +4,6 @@ Background Workers
 This package contains background workers for async processing.
 """
 
-from .queue_worker import QueueWorker, get_queue_worker
+from .queue_worker import QueueWorker, get_queue_worker, notify_queue_worker
 
-__all__ = ['QueueWorker', 'get_queue_worker']
+__all__ = ['QueueWorker', 'get_queue_worker', 'notify_queue_worker']
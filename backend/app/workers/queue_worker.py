@@ -4,7 +4,9 @@ Queue Worker
 Background worker that processes items from the persistent queue.
 
 Features:
-- Async processing with configurable concurrency
+- Continuous-flow scheduling: a slot is refilled as soon as it frees up
+- Concurrency capped by a semaphore (max_concurrent)
+- In-process wake-up when items are enqueued (poll_interval is only a fallback)
 - Graceful shutdown support
 - Error handling with retry
 - Progress logging
@@ -13,40 +15,36 @@ Features:
 
 import asyncio
 import logging
-from typing import Optional, List, Tuple
-from datetime import datetime
-from functools import partial
+from typing import Optional, Set, Tuple
 
+from app.config import config
 from app.database import SessionLocal
-from app.models.processing_queue import ProcessingQueue, QueueStatus
+from app.models.processing_queue import ProcessingQueue
 from app.services.structured_logging import set_file_entry_id, clear_context
 
 logger = logging.getLogger(__name__)
 
 
-def _get_pending_items_sync(limit: int) -> List[Tuple[int, int, int]]:
+def _claim_next_item_sync(exclude_ids: Set[int]) -> Optional[Tuple[int, int, int]]:
     """
-    Get pending queue items (sync, runs in thread).
-
-    Returns list of (queue_id, file_entry_id, skip_approval) tuples.
-    """
-    db = SessionLocal()
-    try:
-        items = ProcessingQueue.get_pending(db, limit=limit)
-        return [(item.id, item.file_entry_id, item.skip_approval) for item in items]
-    finally:
-        db.close()
+    Claim the next pending queue item (sync, runs in thread).
 
+    Picks the highest-priority pending item not already being handled by
+    this worker and marks it as processing.
 
-def _mark_processing_sync(queue_id: int) -> bool:
-    """Mark item as processing (sync, runs in thread)."""
+    Returns:
+        (queue_id, file_entry_id, skip_approval) tuple, or None if the queue is empty
+    """
     db = SessionLocal()
     try:
-        item = ProcessingQueue.get_by_id(db, queue_id)
-        if not item or item.status != QueueStatus.PENDING:
-            return False
-        item.mark_processing(db)
-        return True
+        items = ProcessingQueue.get_pending(db, limit=len(exclude_ids) + 1)
+        for item in items:
+            if item.id in exclude_ids:
+                continue
+            claimed = (item.id, item.file_entry_id, item.skip_approval)
+            item.mark_processing(db)
+            return claimed
+        return None
     finally:
         db.close()
 
@@ -88,7 +86,11 @@ class QueueWorker:
     """
     Background worker for processing queue items.
 
-    Polls the queue and processes items using the pipeline.
+    Runs a continuous scheduler: whenever one of the max_concurrent slots
+    frees up, the next pending item is claimed and started immediately, so a
+    slow item never holds back the rest of the queue. The scheduler sleeps
+    until it is woken by notify() (called when items are enqueued) or until
+    poll_interval elapses, which catches items added by other processes.
     Uses asyncio.to_thread() for database operations to avoid blocking.
     """
 
@@ -103,7 +105,7 @@ class QueueWorker:
 
         Args:
             max_concurrent: Maximum concurrent processing tasks
-            poll_interval: Seconds between queue polls
+            poll_interval: Fallback seconds between queue polls when idle
             enabled: Whether worker is enabled
         """
         self.max_concurrent = max_concurrent
@@ -112,7 +114,10 @@ class QueueWorker:
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._active_items: set = set()
+        self._item_tasks: Set[asyncio.Task] = set()
 
     async def start(self) -> None:
         """Start the queue worker."""
@@ -125,7 +130,9 @@ class QueueWorker:
             return
 
         self._running = True
+        self._loop = asyncio.get_running_loop()
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._wakeup = asyncio.Event()
         self._task = asyncio.create_task(self._worker_loop())
         logger.info(f"Queue worker started (max_concurrent={self.max_concurrent})")
 
@@ -145,40 +152,73 @@ class QueueWorker:
                 pass
 
         # Wait for active items to complete (with timeout)
-        if self._active_items:
-            logger.info(f"Waiting for {len(self._active_items)} active items to complete...")
-            await asyncio.sleep(0)  # Let them make progress
+        if self._item_tasks:
+            logger.info(f"Waiting for {len(self._item_tasks)} active items to complete...")
+            _, still_running = await asyncio.wait(set(self._item_tasks), timeout=self.poll_interval)
+            if still_running:
+                logger.warning(f"{len(still_running)} queue item(s) still running at shutdown")
 
         logger.info("Queue worker stopped")
 
+    def notify(self) -> None:
+        """
+        Wake the scheduler so newly enqueued items start without polling delay.
+
+        Safe to call from any thread (e.g. sync FastAPI routes running in the
+        threadpool) and a no-op when the worker is not running.
+        """
+        if not self._running or self._wakeup is None or self._loop is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._wakeup.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _wait_for_work(self) -> None:
+        """Sleep until notified or until poll_interval elapses."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
     async def _worker_loop(self) -> None:
-        """Main worker loop."""
+        """Main scheduler loop: refill each free slot as soon as it opens."""
         logger.info("Queue worker loop started")
 
         while self._running:
             try:
-                # Get pending items in thread to avoid blocking
-                pending = await asyncio.to_thread(
-                    _get_pending_items_sync,
-                    self.max_concurrent
-                )
+                # Wait for a free slot
+                await self._semaphore.acquire()
 
-                if pending:
-                    # Process items concurrently
-                    tasks = []
-                    for queue_id, file_entry_id, skip_approval in pending:
-                        if queue_id not in self._active_items:
-                            task = asyncio.create_task(
-                                self._process_item(queue_id, file_entry_id, bool(skip_approval))
-                            )
-                            tasks.append(task)
-
-                    if tasks:
-                        # Run all tasks, don't wait for completion to continue polling
-                        await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Wait before next poll
-                await asyncio.sleep(self.poll_interval)
+                # Clear before querying so a notify() racing with the query
+                # is not lost
+                self._wakeup.clear()
+                try:
+                    claimed = await asyncio.to_thread(
+                        _claim_next_item_sync,
+                        set(self._active_items)
+                    )
+                except BaseException:
+                    self._semaphore.release()
+                    raise
+
+                if claimed is None:
+                    self._semaphore.release()
+                    await self._wait_for_work()
+                    continue
+
+                queue_id, file_entry_id, skip_approval = claimed
+                self._active_items.add(queue_id)
+                task = asyncio.create_task(
+                    self._process_item(queue_id, file_entry_id, bool(skip_approval))
+                )
+                self._item_tasks.add(task)
+                task.add_done_callback(self._on_item_done)
 
             except asyncio.CancelledError:
                 break
@@ -186,6 +226,11 @@ class QueueWorker:
                 logger.error(f"Error in queue worker loop: {e}")
                 await asyncio.sleep(self.poll_interval)
 
+    def _on_item_done(self, task: asyncio.Task) -> None:
+        """Release the slot held by a finished item."""
+        self._item_tasks.discard(task)
+        self._semaphore.release()
+
     async def _process_item(
         self,
         queue_id: int,
@@ -193,57 +238,51 @@ class QueueWorker:
         skip_approval: bool
     ) -> None:
         """
-        Process a single queue item.
+        Process a single, already claimed queue item.
+
+        The scheduler marks the item as processing before starting this task
+        and holds a semaphore slot until it finishes.
 
         Args:
             queue_id: Queue item ID
             file_entry_id: Associated file entry ID
             skip_approval: Whether to skip approval step
         """
-        async with self._semaphore:
-            self._active_items.add(queue_id)
-
-            try:
-                # Mark as processing (in thread)
-                started = await asyncio.to_thread(_mark_processing_sync, queue_id)
-                if not started:
-                    logger.debug(f"Queue item {queue_id} no longer pending")
-                    return
-
-                logger.info(f"Processing queue item {queue_id} (file_entry={file_entry_id})")
+        try:
+            logger.info(f"Processing queue item {queue_id} (file_entry={file_entry_id})")
 
-                # Set logging context
-                set_file_entry_id(file_entry_id)
+            # Set logging context
+            set_file_entry_id(file_entry_id)
 
-                # Get file path (in thread)
-                file_path = await asyncio.to_thread(_get_file_entry_path_sync, file_entry_id)
-                if not file_path:
-                    await asyncio.to_thread(_mark_failed_sync, queue_id, "File entry not found")
-                    return
+            # Get file path (in thread)
+            file_path = await asyncio.to_thread(_get_file_entry_path_sync, file_entry_id)
+            if not file_path:
+                await asyncio.to_thread(_mark_failed_sync, queue_id, "File entry not found")
+                return
 
-                # Process using pipeline
-                from app.processors.pipeline import process_file_by_id
+            # Process using pipeline
+            from app.processors.pipeline import process_file_by_id
 
-                result = await process_file_by_id(file_entry_id, skip_approval=skip_approval)
+            result = await process_file_by_id(file_entry_id, skip_approval=skip_approval)
 
-                if result.get('success'):
-                    await asyncio.to_thread(_mark_completed_sync, queue_id)
-                    logger.info(f"Queue item {queue_id} completed successfully")
-                else:
-                    error = result.get('error', 'Unknown error')
-                    await asyncio.to_thread(_mark_failed_sync, queue_id, error)
-                    logger.warning(f"Queue item {queue_id} failed: {error}")
+            if result.get('success'):
+                await asyncio.to_thread(_mark_completed_sync, queue_id)
+                logger.info(f"Queue item {queue_id} completed successfully")
+            else:
+                error = result.get('error', 'Unknown error')
+                await asyncio.to_thread(_mark_failed_sync, queue_id, error)
+                logger.warning(f"Queue item {queue_id} failed: {error}")
 
-            except Exception as e:
-                logger.error(f"Error processing queue item {queue_id}: {e}")
-                try:
-                    await asyncio.to_thread(_mark_failed_sync, queue_id, str(e))
-                except Exception:
-                    pass
+        except Exception as e:
+            logger.error(f"Error processing queue item {queue_id}: {e}")
+            try:
+                await asyncio.to_thread(_mark_failed_sync, queue_id, str(e))
+            except Exception:
+                pass
 
-            finally:
-                clear_context()
-                self._active_items.discard(queue_id)
+        finally:
+            clear_context()
+            self._active_items.discard(queue_id)
 
     @property
     def is_running(self) -> bool:
@@ -256,13 +295,16 @@ class QueueWorker:
         return len(self._active_items)
 
     def get_status(self) -> dict:
-        """Get worker status."""
+        """Get worker status, including shared pipeline resource pool usage."""
+        from app.processors.resource_pools import get_resource_pools
+
         return {
             "running": self._running,
             "enabled": self.enabled,
             "max_concurrent": self.max_concurrent,
             "active_count": self.active_count,
-            "poll_interval": self.poll_interval
+            "poll_interval": self.poll_interval,
+            "resources": get_resource_pools().get_stats()
         }
 
 
@@ -274,10 +316,20 @@ def get_queue_worker() -> QueueWorker:
     """Get the global queue worker instance."""
     global _queue_worker
     if _queue_worker is None:
-        _queue_worker = QueueWorker()
+        _queue_worker = QueueWorker(max_concurrent=config.PIPELINE_MAX_CONCURRENT)
     return _queue_worker
 
 
+def notify_queue_worker() -> None:
+    """
+    Wake the global queue worker after new work was enqueued.
+
+    Safe to call from any thread; does nothing if the worker was never started.
+    """
+    if _queue_worker is not None:
+        _queue_worker.notify()
+
+
 async def start_queue_worker() -> None:
     """Start the global queue worker."""
     worker = get_queue_worker()
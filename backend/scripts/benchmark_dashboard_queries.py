@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Dashboard / History Query Benchmark for Seedarr v2.0
+
+Seeds a SQLite database with a large synthetic job history and measures the
+response time of the dashboard, queue and history endpoints, served through
+FastAPI with the application SQLite profile.
+
+Usage:
+    # 500k jobs (default)
+    python backend/scripts/benchmark_dashboard_queries.py
+
+    # Custom history size / location / repetitions
+    python backend/scripts/benchmark_dashboard_queries.py --rows 1000000 --dir /mnt/media --repeat 50
+
+Note:
+    File paths are synthetic, so the per-row file size lookups of the pages
+    are cheap misses; results measure the database queries and rendering.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend directory to path for imports (the routes import "app.")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.api import dashboard_routes
+from app.database import apply_sqlite_pragmas, get_db
+from app.models.base import Base
+from app.models.file_entry import FileEntry, Status, TERMINAL_STATUSES
+
+# Roughly what a long-running instance accumulates: mostly uploads
+STATUS_WEIGHTS = {
+    Status.UPLOADED: 88,
+    Status.FAILED: 8,
+    Status.PENDING: 1,
+    Status.ANALYZED: 1,
+    Status.PENDING_APPROVAL: 1,
+    Status.METADATA_GENERATED: 1,
+}
+
+
+def seed(engine, rows: int) -> None:
+    """Insert ``rows`` jobs, one per minute going back from now."""
+    now = datetime.utcnow()
+    statuses = random.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()), k=rows)
+    batch = []
+    with engine.begin() as conn:
+        for i, status in enumerate(statuses):
+            updated_at = now - timedelta(minutes=i)
+            batch.append({
+                "file_path": f"/media/bench/Movie.{i}.2023.1080p.BluRay.x264-GRP.mkv",
+                "release_name": f"Movie.{i}.2023.1080p.BluRay.x264-GRP",
+                "status": status,
+                "is_terminal": status in TERMINAL_STATUSES,
+                "created_at": updated_at - timedelta(minutes=5),
+                "updated_at": updated_at,
+                "uploaded_at": updated_at if status == Status.UPLOADED else None,
+                "approval_requested_at": updated_at if status == Status.PENDING_APPROVAL else None,
+            })
+            if len(batch) == 10000:
+                conn.execute(insert(FileEntry), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(FileEntry), batch)
+        conn.execute(text("ANALYZE"))
+
+
+def measure(client: TestClient, method: str, url: str, repeat: int, **kwargs) -> list:
+    """Return the response times of ``repeat`` requests, in ms."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.request(method, url, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.text[:200]
+    return sorted(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dashboard and history queries")
+    parser.add_argument("--rows", type=int, default=500_000, help="Jobs in the history (default: 500000)")
+    parser.add_argument("--repeat", type=int, default=20, help="Requests per endpoint (default: 20)")
+    parser.add_argument("--dir", default=None, help="Directory of the benchmark database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+        Base.metadata.create_all(engine)
+
+        start = time.perf_counter()
+        seed(engine, args.rows)
+        print(f"Seeded {args.rows} jobs in {time.perf_counter() - start:.1f}s")
+
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = FastAPI()
+        app.include_router(dashboard_routes.router)
+        app.dependency_overrides[get_db] = override_get_db
+
+        with TestClient(app) as client:
+            # Cursor deep into the history, to check later pages stay as fast as the first
+            with session_factory() as db:
+                _, cursor = dashboard_routes._query_history_page(db, limit=args.rows // 2)
+
+            endpoints = [
+                ("GET", "/dashboard", {}),
+                ("GET", "/api/queue/refresh", {}),
+                ("GET", "/history", {}),
+                ("POST", "/api/history/filter", {"data": {"status": "failed"}}),
+                ("GET", "/api/history/page", {"params": {"cursor": cursor}}),
+            ]
+            for method, url, kwargs in endpoints:
+                timings = measure(client, method, url, args.repeat, **kwargs)
+                label = f"{method} {url}" + (" (middle of history)" if "params" in kwargs else "")
+                print(f"  {label:<48} p50 {statistics.median(timings):7.2f} ms   max {timings[-1]:7.2f} ms")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Event Loop Latency Benchmark for pipeline database writes
+
+Simulates concurrent pipelines writing checkpoints to a SQLite database
+while "requests" are served on the same event loop, and reports request
+latency with synchronous commits (self.db.commit(), the previous pipeline
+behaviour) and with app.database.commit_checkpoint() (async engine).
+
+Each pipeline loops over: change its FileEntry, checkpoint, sleep. Each
+request sleeps 5 ms and measures how late it wakes up, i.e. how long the
+event loop was blocked.
+
+Usage:
+    python backend/scripts/benchmark_db_event_loop.py
+
+    # More load / database on a slower disk
+    python backend/scripts/benchmark_db_event_loop.py --pipelines 8 --seconds 20 --dir /mnt/media
+
+    # With the application SQLite profile (WAL, synchronous=NORMAL, ...)
+    python backend/scripts/benchmark_db_event_loop.py --profile
+
+Note:
+    Without --profile the database uses SQLite defaults (rollback journal,
+    synchronous=FULL), so every commit is fsync'ed.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.database import apply_sqlite_pragmas, commit_checkpoint, dispose_async_engines
+from backend.app.models.base import Base
+from backend.app.models.file_entry import FileEntry
+
+REQUEST_SLEEP = 0.005
+
+
+async def pipeline(session_factory, index: int, use_async: bool, stop: asyncio.Event) -> int:
+    db = session_factory()
+    entry = FileEntry.create_or_get(db, f"/media/bench/Movie.{index}.mkv")
+    db.commit()
+    writes = 0
+    while not stop.is_set():
+        entry.release_name = f"Movie.{index}.{writes}.1080p.BluRay.x264-GRP"
+        entry.set_tracker_status("bench", "pending", retry_count=writes)
+        if use_async:
+            await commit_checkpoint(db, entry)
+        else:
+            db.commit()
+        writes += 1
+        await asyncio.sleep(0.001)
+    db.close()
+    return writes
+
+
+async def requests_probe(stop: asyncio.Event) -> list:
+    delays = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(REQUEST_SLEEP)
+        delays.append((time.perf_counter() - start - REQUEST_SLEEP) * 1000)
+    return delays
+
+
+async def run(session_factory, pipelines: int, seconds: float, use_async: bool) -> tuple:
+    stop = asyncio.Event()
+    tasks = [asyncio.create_task(pipeline(session_factory, i, use_async, stop)) for i in range(pipelines)]
+    probe = asyncio.create_task(requests_probe(stop))
+    await asyncio.sleep(seconds)
+    stop.set()
+    writes = sum(await asyncio.gather(*tasks))
+    delays = sorted(await probe)
+    if use_async:
+        await dispose_async_engines()
+    return writes, delays
+
+
+def report(label: str, writes: int, delays: list, seconds: float) -> None:
+    p95 = delays[int(len(delays) * 0.95)] if delays else 0.0
+    print(f"  {label:<20} {writes / seconds:8.1f} writes/s   "
+          f"request delay p50 {statistics.median(delays):6.2f} ms   "
+          f"p95 {p95:7.2f} ms   max {max(delays):7.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark event loop latency under pipeline DB writes")
+    parser.add_argument("--pipelines", type=int, default=4, help="Concurrent pipelines (default: 4)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duration of each run (default: 10)")
+    parser.add_argument("--dir", default=None, help="Directory of the benchmark database")
+    parser.add_argument("--profile", action="store_true", help="Apply the application SQLite profile")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        if args.profile:
+            event.listen(engine, "connect", apply_sqlite_pragmas)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+
+        profile = "application profile" if args.profile else "SQLite defaults"
+        print(f"{args.pipelines} pipelines, {args.seconds:.0f}s per run, {profile}, database: {url}")
+        writes, delays = asyncio.run(run(session_factory, args.pipelines, args.seconds, use_async=False))
+        report("sync commit", writes, delays, args.seconds)
+        writes, delays = asyncio.run(run(session_factory, args.pipelines, args.seconds, use_async=True))
+        report("commit_checkpoint", writes, delays, args.seconds)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Log Emission Benchmark for Seedarr v2.0
+
+Measures the time a logging call takes on the calling thread (the pipeline
+or the event loop) with the web UI log store handler and a JSON log file,
+attached directly to the logger and through the background queue listener.
+
+Usage:
+    # 20k messages per configuration (default)
+    python backend/scripts/benchmark_log_emission.py
+
+    # More messages / log file location
+    python backend/scripts/benchmark_log_emission.py --messages 100000 --dir /mnt/logs
+"""
+
+import argparse
+import logging
+import logging.handlers
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to path for imports (the log store imports "app.")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.log_store import LogStore, LogStoreHandler
+from app.services.structured_logging import (
+    CorrelationContext, JSONLogFormatter, add_queued_handler, flush_logs, stop_log_listeners
+)
+
+
+def make_handlers(log_file: Path) -> list:
+    """The log store handler and a rotating JSON file handler, as configured by the application."""
+    store_handler = LogStoreHandler(LogStore())
+    store_handler.setFormatter(logging.Formatter('%(message)s'))
+    file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=2)
+    file_handler.setFormatter(JSONLogFormatter())
+    return [store_handler, file_handler]
+
+
+def measure(logger: logging.Logger, messages: int) -> list:
+    """Per-call time (microseconds) of pipeline-like log calls."""
+    timings = []
+    with CorrelationContext(request_id="bench", file_entry_id=42):
+        for i in range(messages):
+            start = time.perf_counter()
+            logger.info("Uploading %s to %s (%d/%d)", f"Movie.{i}.2160p.mkv", "lacale", i, messages)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+    return sorted(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the cost of a logging call")
+    parser.add_argument("--messages", type=int, default=20_000, help="Messages per configuration (default: 20000)")
+    parser.add_argument("--dir", default=None, help="Directory of the benchmark log files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for mode in ("direct", "queued"):
+            logger = logging.getLogger(f"benchmark.{mode}")
+            logger.setLevel(logging.DEBUG)
+            logger.propagate = False
+            for handler in make_handlers(Path(tmp) / f"{mode}.log"):
+                if mode == "queued":
+                    add_queued_handler(handler, logger.name)
+                else:
+                    logger.addHandler(handler)
+
+            start = time.perf_counter()
+            timings = measure(logger, args.messages)
+            caller = time.perf_counter() - start
+            flush_logs()
+            total = time.perf_counter() - start
+
+            print(
+                f"  {mode:<8} per call p50 {statistics.median(timings):6.1f} us   "
+                f"p99 {timings[int(len(timings) * 0.99)]:7.1f} us   max {timings[-1]:8.1f} us   "
+                f"caller {caller:.2f}s / handled {total:.2f}s"
+            )
+
+    stop_log_listeners()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Piece Hashing Benchmark for Seedarr v2.0
+
+Compares the multi-core piece hasher (app.services.piece_hasher) with the
+torf hashing path previously used by TorrentGenerator and MediaAnalyzer, on
+a synthetic file, and checks that both produce identical piece hashes.
+
+Usage:
+    # 4 GiB synthetic file, 16 MiB pieces (default)
+    python backend/scripts/benchmark_piece_hasher.py
+
+    # Custom size / piece size / location
+    python backend/scripts/benchmark_piece_hasher.py --size-gb 8 --piece-size-mib 8 --dir /mnt/media
+
+    # Benchmark an existing file instead of a synthetic one
+    python backend/scripts/benchmark_piece_hasher.py --file /media/Movie.2160p.REMUX.mkv
+
+Note:
+    The synthetic file is written once and is usually in the page cache when
+    hashed, so results measure CPU throughput. Use --drop-caches (root only)
+    to benchmark cold reads from disk.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import torf
+
+from backend.app.services.piece_hasher import get_hasher_pool, hash_pieces, shutdown_hasher_pool
+
+MiB = 1024 * 1024
+GiB = 1024 * MiB
+
+
+def create_synthetic_file(directory: str, size: int) -> str:
+    """Write a file of `size` bytes of pseudo-random data."""
+    fd, path = tempfile.mkstemp(prefix="seedarr_hash_bench_", suffix=".mkv", dir=directory)
+    block = os.urandom(64 * MiB)
+    written = 0
+    with os.fdopen(fd, 'wb') as f:
+        while written < size:
+            chunk = block[:min(len(block), size - written)]
+            f.write(chunk)
+            written += len(chunk)
+    return path
+
+
+def drop_caches() -> None:
+    """Drop the Linux page cache (requires root)."""
+    subprocess.run(["sync"], check=False)
+    try:
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+    except OSError as e:
+        print(f"  (could not drop caches: {e})")
+
+
+def bench_torf(path: str, piece_size: int) -> tuple:
+    torrent = torf.Torrent(path=path, private=True)
+    torrent.piece_size = piece_size
+    start = time.perf_counter()
+    torrent.generate()
+    return time.perf_counter() - start, torrent.metainfo['info']['pieces']
+
+
+def bench_parallel(path: str, piece_size: int) -> tuple:
+    last = [0]
+
+    def progress(done, total):
+        pct = int(100 * done / total)
+        if pct >= last[0] + 10:
+            last[0] = pct
+            print(f"  parallel: {pct}%", flush=True)
+
+    start = time.perf_counter()
+    pieces = hash_pieces(path, piece_size, progress_callback=progress)
+    return time.perf_counter() - start, pieces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark torrent piece hashing")
+    parser.add_argument("--size-gb", type=float, default=4.0, help="Synthetic file size in GiB")
+    parser.add_argument("--piece-size-mib", type=int, default=16, help="Piece size in MiB")
+    parser.add_argument("--dir", default=None, help="Directory for the synthetic file")
+    parser.add_argument("--file", default=None, help="Benchmark an existing file instead")
+    parser.add_argument("--drop-caches", action="store_true", help="Drop page cache before each run")
+    args = parser.parse_args()
+
+    piece_size = args.piece_size_mib * MiB
+    synthetic = args.file is None
+    path = args.file or create_synthetic_file(args.dir or tempfile.gettempdir(), int(args.size_gb * GiB))
+    size = os.path.getsize(path)
+
+    print(f"File: {path} ({size / GiB:.2f} GiB), piece size: {args.piece_size_mib} MiB, "
+          f"CPUs: {os.cpu_count()}")
+
+    try:
+        # Warm up the process pool so its startup is not billed to the run
+        list(get_hasher_pool().map(int, range(os.cpu_count() or 1)))
+
+        if args.drop_caches:
+            drop_caches()
+        torf_time, torf_pieces = bench_torf(path, piece_size)
+        print(f"torf:     {torf_time:8.2f}s  {size / MiB / torf_time:8.1f} MiB/s")
+
+        if args.drop_caches:
+            drop_caches()
+        par_time, par_pieces = bench_parallel(path, piece_size)
+        print(f"parallel: {par_time:8.2f}s  {size / MiB / par_time:8.1f} MiB/s")
+
+        print(f"speedup:  {torf_time / par_time:.2f}x")
+        print(f"hashes identical: {torf_pieces == par_pieces}")
+        if torf_pieces != par_pieces:
+            sys.exit(1)
+    finally:
+        shutdown_hasher_pool()
+        if synthetic:
+            os.unlink(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Release Name Parser Benchmark for Seedarr v2.0
+
+Parses the golden corpus of real-world release names
+(tests/unit/data/release_names.json) and reports names per second for:
+
+    - legacy:   the former field matching (one re.search per pattern of
+                each field), title / team extraction as today
+    - compiled: the precompiled parser, without memoization
+    - memoized: ReleaseNameParser.parse with a warm cache
+    - batch:    ReleaseNameParser.parse_many on a cold cache, the corpus
+                repeated as in a scan of several copies of a library
+
+Also checks every name against its golden parse.
+
+Usage:
+    # 50 rounds over the corpus (default)
+    python backend/scripts/benchmark_release_parser.py
+
+    # More rounds
+    python backend/scripts/benchmark_release_parser.py --rounds 500
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path for imports (the services import "app.")
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import release_parser as rp
+
+CORPUS_PATH = BACKEND_DIR / "tests" / "unit" / "data" / "release_names.json"
+
+FIELDS = {
+    'resolution': rp.RESOLUTION_PATTERNS,
+    'source': rp.SOURCE_PATTERNS,
+    'codec': rp.CODEC_PATTERNS,
+    'audio': rp.AUDIO_PATTERNS,
+    'hdr': rp.HDR_PATTERNS,
+    'edition': rp.EDITION_PATTERNS,
+}
+
+
+def legacy_match(text: str, patterns: dict):
+    text_lower = text.lower()
+    for label, pattern_list in patterns.items():
+        for pattern in pattern_list:
+            if re.search(pattern, text_lower, re.IGNORECASE):
+                return label
+    return None
+
+
+def legacy_parse(filename: str) -> dict:
+    """The field matching the compiled parser replaces."""
+    filename_lower = filename.lower()
+    language = legacy_match(filename, rp.LANGUAGE_PATTERNS)
+    title, year = rp.extract_title_and_year(filename)
+    result = {'title': title, 'year': year}
+    result.update((field, legacy_match(filename, patterns)) for field, patterns in FIELDS.items())
+    result.update({
+        'language': language,
+        'language_variant': (
+            legacy_match(filename, rp.LANGUAGE_VARIANT_PATTERNS) if language == 'MULTI' else None
+        ),
+        'is_tv_show': any(re.search(p, filename_lower, re.IGNORECASE) for p in rp.TV_PATTERNS),
+        'remux': any(re.search(p, filename_lower) for p in rp.REMUX_PATTERNS),
+        'repack': any(re.search(p, filename_lower) for p in rp.REPACK_PATTERNS),
+        'imax': any(re.search(p, filename_lower) for p in rp.IMAX_PATTERNS),
+        'team': rp.extract_team(filename),
+    })
+    return result
+
+
+def throughput(parse, names, rounds: int) -> float:
+    """Names parsed per second."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for name in names:
+            parse(name)
+    return rounds * len(names) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark release name parsing")
+    parser.add_argument("--rounds", type=int, default=50, help="Passes over the corpus")
+    args = parser.parse_args()
+
+    corpus = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+    names = [entry["name"] for entry in corpus]
+
+    mismatches = [
+        entry["name"] for entry in corpus
+        if rp.parse_release_name(entry["name"]) != entry["expected"]
+        or legacy_parse(entry["name"]) != entry["expected"]
+    ]
+
+    memoized = rp.ReleaseNameParser(max_entries=len(names))
+    memoized.parse_many(names)
+    results = {
+        "legacy": throughput(legacy_parse, names, args.rounds),
+        "compiled": throughput(rp.parse_release_name, names, args.rounds),
+        "memoized": throughput(memoized.parse, names, args.rounds),
+    }
+
+    batch = names * 10
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        rp.ReleaseNameParser(max_entries=len(names)).parse_many(batch)
+    results["batch"] = args.rounds * len(batch) / (time.perf_counter() - start)
+
+    print(f"{len(names)} release names, {args.rounds} rounds\n")
+    for label, names_per_second in results.items():
+        print(
+            f"{label:<10} {names_per_second:>12,.0f} names/s "
+            f"{names_per_second / results['legacy']:>7.1f}x"
+        )
+
+    if mismatches:
+        print(f"\nGolden parse differs for: {', '.join(mismatches)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Template Rendering Benchmark for Seedarr v2.0
+
+Renders the bundled BBCode templates (alembic migrations 016, 017 and 020)
+and the default NFO template with the preview sample data, with the former
+regex renderer (one pass for conditional blocks, then one re.sub per
+variable, all variables built up front) and with the compiled template
+engine. Checks that both produce the same output for the BBCode templates.
+
+Usage:
+    # 2000 renders per template (default)
+    python backend/scripts/benchmark_template_render.py
+
+    # More renders
+    python backend/scripts/benchmark_template_render.py --renders 10000
+"""
+
+import argparse
+import importlib.util
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path for imports (the services import "app.")
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models.nfo_template import NFOTemplate
+from app.services.bbcode_generator import BBCodeGenerator
+from app.services.template_engine import get_template_cache
+
+TEMPLATE_MIGRATIONS = [
+    "016_add_bbcode_templates.py",
+    "017_add_example_bbcode_templates.py",
+    "020_add_c411_bbcode_template.py",
+]
+
+
+def load_bundled_templates() -> dict:
+    """Collect the *_TEMPLATE_CONTENT constants of the template migrations (by content, deduplicated)."""
+    templates = {}
+    for file_name in TEMPLATE_MIGRATIONS:
+        path = BACKEND_DIR / "alembic" / "versions" / file_name
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name, value in vars(module).items():
+            if name.endswith("_TEMPLATE_CONTENT") and isinstance(value, str) and value not in templates.values():
+                templates[f"{name[:-len('_TEMPLATE_CONTENT')].lower()} ({path.stem[:3]})"] = value
+    return templates
+
+
+def legacy_render(template_content: str, variables: dict) -> str:
+    """The renderer the compiled engine replaces."""
+    def replace_conditional(match):
+        return match.group(2) if variables.get(match.group(1), "") else ""
+
+    result = re.sub(r'\{\{#(\w+)\}\}([\s\S]*?)\{\{/\1\}\}', replace_conditional, template_content)
+    for var_name, var_value in variables.items():
+        result = re.sub(r'\{\{' + re.escape(var_name) + r'\}\}', str(var_value), result)
+    return result
+
+
+def measure(render, renders: int) -> float:
+    """Median time of one render, in microseconds."""
+    samples = []
+    for _ in range(renders):
+        start = time.perf_counter()
+        render()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark BBCode / NFO template rendering")
+    parser.add_argument("--renders", type=int, default=2000, help="Renders per template and renderer")
+    args = parser.parse_args()
+
+    generator = BBCodeGenerator()
+    media, tmdb = generator.get_sample_data()
+    templates = load_bundled_templates()
+    templates["nfo default"] = NFOTemplate.get_default_template_content()
+
+    print(f"{'template':<22} {'size':>6} {'vars':>5} {'legacy':>10} {'compiled':>10} {'speedup':>8}")
+    mismatches = []
+    for template_id, (name, content) in enumerate(templates.items(), start=1):
+        legacy = lambda content=content: legacy_render(content, dict(generator._build_template_variables(media, tmdb)))
+        compiled = lambda content=content, template_id=template_id: generator.render_template(
+            content, media, tmdb, template_id=template_id
+        )
+
+        # The NFO default template nests blocks, which the legacy renderer did not support
+        if not name.startswith("nfo") and legacy() != compiled():
+            mismatches.append(name)
+
+        legacy_us = measure(legacy, args.renders)
+        compiled_us = measure(compiled, args.renders)
+        referenced = len(get_template_cache().get(content, template_id).variables)
+        print(
+            f"{name:<22} {len(content):>6} {referenced:>5} {legacy_us:>8.1f}us {compiled_us:>8.1f}us "
+            f"{legacy_us / compiled_us:>7.1f}x"
+        )
+
+    print(f"\nCompiled template cache: {get_template_cache().get_stats()}")
+    if mismatches:
+        print(f"Output differs from the legacy renderer for: {', '.join(mismatches)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
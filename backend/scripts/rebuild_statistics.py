@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Statistics Rollup Rebuild Script for Seedarr v2.0
+
+Rebuilds the daily_statistics and tracker_statistics rollups from the
+file_entries history. Run it once after upgrading an existing database (the
+rollups were not maintained before), or whenever they need to be recomputed.
+
+Each finished file counts once, with its current outcome; the tracker
+rollups count the last attempt recorded for each tracker of each file.
+
+Usage:
+    # Rebuild the rollups of the configured database (DATABASE_URL)
+    python backend/scripts/rebuild_statistics.py
+
+    # Rebuild the rollups of another database
+    python backend/scripts/rebuild_statistics.py --database-url sqlite:///./data/seedarr.db
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path for imports (the statistics models import "app.")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.config import Config
+from app.database import apply_sqlite_pragmas
+from app.services.statistics_service import StatisticsService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the statistics rollups from the file history")
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Database URL (default: DATABASE_URL from the environment / configuration)"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="File entries loaded at a time (default: 1000)")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url or Config.DATABASE_URL)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+
+    start = time.perf_counter()
+    with sessionmaker(bind=engine, autoflush=False)() as db:
+        counts = StatisticsService(db).rebuild_rollups(batch_size=args.batch_size)
+    engine.dispose()
+
+    print(
+        f"Rebuilt statistics from {counts['files']} finished files in {time.perf_counter() - start:.1f}s: "
+        f"{counts['daily_rows']} daily rows, {counts['tracker_rows']} tracker rows"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,12 @@ This file configures pytest for the backend test suite, including
 fixtures and test discovery settings.
 """
 
+import importlib
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add backend directory to Python path for imports
 backend_root = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_root))
@@ -24,3 +27,45 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "e2e: mark test as an end-to-end test"
     )
+
+
+@pytest.fixture(autouse=True)
+def isolated_clearance_cache(monkeypatch):
+    """
+    Give each test its own in-memory Cloudflare clearance cache.
+
+    The process-wide cache persists clearances in the application database;
+    tests must neither touch that database nor reuse clearances solved by
+    another test.
+    """
+    for name in ('app.services.cloudflare_session_manager',
+                 'backend.app.services.cloudflare_session_manager'):
+        module = importlib.import_module(name)
+        monkeypatch.setattr(module, '_clearance_cache', module.ClearanceCache())
+
+
+@pytest.fixture(autouse=True)
+def isolated_media_library_index(monkeypatch):
+    """Give each test an empty Radarr/Sonarr library index."""
+    for name in ('app.services.media_library_index',
+                 'backend.app.services.media_library_index'):
+        module = importlib.import_module(name)
+        monkeypatch.setattr(module, '_media_library_index', None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_duplicate_cache(monkeypatch):
+    """Give each test an empty tracker duplicate check cache."""
+    for name in ('app.services.duplicate_check_service',
+                 'backend.app.services.duplicate_check_service'):
+        module = importlib.import_module(name)
+        monkeypatch.setattr(module, '_duplicate_cache', None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_mediainfo_cache(monkeypatch):
+    """Give each test an empty, in-memory MediaInfo cache."""
+    for name in ('app.services.mediainfo_cache',
+                 'backend.app.services.mediainfo_cache'):
+        module = importlib.import_module(name)
+        monkeypatch.setattr(module, '_mediainfo_cache', module.MediaInfoCache())
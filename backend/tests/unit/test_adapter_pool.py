@@ -0,0 +1,209 @@
+"""
+Unit Tests for the tracker adapter pool (app.adapters.adapter_pool)
+
+Test Coverage:
+    - Factories share the pooled adapter; changed settings replace it
+    - Authentication once per session, concurrent callers coalesced
+    - Session health checks (expired sessions, lost Cloudflare clearance)
+    - Idle eviction, replaced adapters closed after the grace period, shutdown
+    - Adapters of a previous event loop closed, adapters release their sessions
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import httpx
+import requests
+
+from app.adapters.adapter_pool import TrackerAdapterPool
+from app.adapters.config_adapter import ConfigAdapter
+from app.adapters.tracker_factory import TrackerFactory
+from app.services.cloudflare_session_manager import Clearance, ClearanceCache
+
+
+class FakeAdapter:
+    """Adapter counting authentications and closes."""
+
+    def __init__(self):
+        self.authentications = 0
+        self.closed = False
+        self.valid = True
+
+    async def authenticate(self):
+        self.authentications += 1
+        await asyncio.sleep(0.01)
+        return True
+
+    def has_valid_session(self):
+        return self.valid
+
+    async def close(self):
+        self.closed = True
+
+
+def make_tracker(**overrides):
+    fields = dict(
+        id=1, name="Generic", slug="no-such-config", adapter_type="generic",
+        tracker_url="https://tracker.example", api_key="key", passkey=None,
+        default_category_id=None, updated_at=datetime(2024, 1, 1),
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestFactory:
+    """Test adapters shared by TrackerFactory instances."""
+
+    async def test_factories_share_adapter(self):
+        pool = TrackerAdapterPool()
+        tracker = make_tracker()
+
+        first = TrackerFactory(None, adapter_pool=pool).get_adapter(tracker)
+        second = TrackerFactory(None, adapter_pool=pool).get_adapter(tracker)
+
+        assert first is second
+        assert pool.get_stats()["created"] == 1
+
+        tracker.api_key = "new-key"
+        replaced = TrackerFactory(None, adapter_pool=pool).get_adapter(tracker)
+        assert replaced is not first
+        assert replaced.api_key == "new-key"
+        assert pool.get_stats()["retired"] == 1
+
+        other_flaresolverr = TrackerFactory(None, flaresolverr_url="http://fs:8191", adapter_pool=pool)
+        assert other_flaresolverr.get_adapter(tracker) is not replaced
+        await pool.aclose()
+
+
+class TestSessions:
+    """Test authentication and session health checks."""
+
+    async def test_authenticates_once(self):
+        pool = TrackerAdapterPool()
+        adapter = pool.get(1, "v1", FakeAdapter)
+
+        results = await asyncio.gather(*(pool.authenticate(adapter) for _ in range(5)))
+        assert await pool.authenticate(pool.get(1, "v1", FakeAdapter)) is True
+
+        assert results == [True] * 5
+        assert adapter.authentications == 1
+        assert pool.get_stats()["adapters"][1]["checkouts"] == 2
+
+    async def test_unpooled_adapter_authenticated_directly(self):
+        pool = TrackerAdapterPool()
+        adapter = FakeAdapter()
+
+        await pool.authenticate(adapter)
+        await pool.authenticate(adapter)
+
+        assert adapter.authentications == 2
+
+    async def test_expired_session_replaced(self):
+        pool = TrackerAdapterPool(session_max_age=0)
+        adapter = pool.get(1, "v1", FakeAdapter)
+        await pool.authenticate(adapter)
+        await asyncio.sleep(0.01)
+
+        assert pool.get(1, "v1", FakeAdapter) is not adapter
+
+    async def test_invalid_session_replaced(self):
+        pool = TrackerAdapterPool()
+        adapter = pool.get(1, "v1", FakeAdapter)
+        adapter.valid = False
+
+        assert pool.get(1, "v1", FakeAdapter) is not adapter
+
+    def test_config_adapter_session_follows_clearance(self):
+        cache = ClearanceCache()
+        adapter = ConfigAdapter(config={"cloudflare": {"enabled": True}}, tracker_url="https://cf.example")
+        adapter._session_manager = SimpleNamespace(clearance_cache=cache)
+        adapter._authenticated = True
+        cache.store("cf.example", Clearance(cookies=[], user_agent=None, expires_at=datetime.utcnow() + timedelta(hours=1)))
+
+        assert adapter.has_valid_session() is True
+        cache.invalidate("cf.example")
+        assert adapter.has_valid_session() is False
+
+    async def test_config_adapter_drops_client_on_challenge(self):
+        adapter = ConfigAdapter(config={"cloudflare": {"enabled": True}}, tracker_url="https://cf.example")
+        adapter._session_manager = SimpleNamespace(invalidate=lambda url: None)
+        adapter._authenticated = True
+        adapter._session = requests.Session()
+        stale = await adapter._get_client()
+        challenge = httpx.Response(403, headers={"cf-mitigated": "challenge"}, request=httpx.Request("GET", "https://cf.example"))
+
+        await adapter._invalidate_on_challenge(challenge)
+
+        assert adapter._authenticated is False
+        assert adapter._session is None
+        assert not stale.is_closed
+        assert await adapter._get_client() is not stale
+        assert stale.is_closed
+        await adapter.close()
+
+
+class TestLifecycle:
+    """Test eviction and shutdown."""
+
+    async def test_idle_adapter_closed(self):
+        pool = TrackerAdapterPool(idle_timeout=0, retire_grace=600)
+        adapter = pool.get(1, "v1", FakeAdapter)
+        await asyncio.sleep(0.01)
+
+        await pool.sweep()
+
+        assert adapter.closed
+        assert pool.peek(1) is None
+
+    async def test_replaced_adapter_closed_after_grace(self):
+        pool = TrackerAdapterPool(retire_grace=600)
+        adapter = pool.get(1, "v1", FakeAdapter)
+        pool.invalidate(1)
+
+        await pool.sweep()
+        assert not adapter.closed
+
+        pool.retire_grace = 0
+        await pool.sweep()
+        assert adapter.closed
+
+    def test_adapters_of_previous_loop_closed(self):
+        pool = TrackerAdapterPool(retire_grace=600)
+
+        async def checkout():
+            return pool.get(1, "v1", FakeAdapter)
+
+        async def checkout_and_sweep():
+            adapter = pool.get(1, "v1", FakeAdapter)
+            await pool.sweep()
+            return adapter
+
+        old = asyncio.run(checkout())
+        new = asyncio.run(checkout_and_sweep())
+
+        assert new is not old
+        assert old.closed and not new.closed
+
+    async def test_config_adapter_close_releases_session(self):
+        adapter = ConfigAdapter(config={"cloudflare": {"enabled": True}}, tracker_url="https://cf.example")
+        adapter._session = requests.Session()
+        closed = []
+        adapter._session.close = lambda: closed.append(True)
+        client = await adapter._get_client()
+
+        await adapter.close()
+
+        assert closed == [True]
+        assert adapter._session is None
+        assert client.is_closed
+
+    async def test_aclose(self):
+        pool = TrackerAdapterPool()
+        adapters = [pool.get(i, "v1", FakeAdapter) for i in (1, 2)]
+        pool.invalidate(2)
+
+        await pool.aclose()
+
+        assert all(adapter.closed for adapter in adapters)
+        assert pool.get_stats()["adapters"] == {}
@@ -9,9 +9,11 @@ Tests cover:
     - Health check functionality
     - Status reporting
     - Manual circuit breaker reset
+    - Clearance cache (reuse, single-flight, expiry, invalidation, persistence)
 """
 
 import asyncio
+import io
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
@@ -20,7 +22,10 @@ from requests import Session
 
 from backend.app.services.cloudflare_session_manager import (
     CloudflareSessionManager,
-    CircuitBreakerState
+    CircuitBreakerState,
+    ClearanceCache,
+    Clearance,
+    is_cloudflare_challenge
 )
 from backend.app.services.exceptions import (
     CloudflareBypassError,
@@ -664,3 +669,181 @@ def test_check_circuit_breaker_calculates_remaining_time_correctly(manager):
     assert "Retry in" in error_message
     # Should be around 30 seconds remaining (with some tolerance)
     assert "29." in error_message or "30." in error_message or "31." in error_message
+
+
+# ============================================================================
+# Clearance Cache Tests
+# ============================================================================
+
+@pytest.fixture
+def cached_manager(flaresolverr_url):
+    """CloudflareSessionManager with an in-memory clearance cache."""
+    return CloudflareSessionManager(
+        flaresolverr_url=flaresolverr_url,
+        max_timeout=60000,
+        clearance_cache=ClearanceCache()
+    )
+
+
+def flaresolverr_response(solution):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {'status': 'ok', 'solution': solution}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_clearance_is_reused(cached_manager, mock_flaresolverr_success):
+    """Test that a second get_session does not call FlareSolverr again."""
+    with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread:
+        mock_to_thread.return_value = flaresolverr_response(mock_flaresolverr_success['solution'])
+
+        first = await cached_manager.get_session("https://tracker.example.com")
+        second = await cached_manager.get_session("https://tracker.example.com/api/upload")
+
+        assert mock_to_thread.call_count == 1
+        assert dict(second.cookies) == dict(first.cookies)
+        assert second.headers['User-Agent'] == 'Mozilla/5.0...'
+        assert cached_manager.clearance_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_solves_are_coalesced(cached_manager, mock_flaresolverr_success):
+    """Test that concurrent callers share one in-flight FlareSolverr solve."""
+    async def slow_solve(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return flaresolverr_response(mock_flaresolverr_success['solution'])
+
+    with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread:
+        mock_to_thread.side_effect = slow_solve
+
+        sessions = await asyncio.gather(*(
+            cached_manager.get_session("https://tracker.example.com") for _ in range(5)
+        ))
+
+        assert mock_to_thread.call_count == 1
+        assert all(dict(s.cookies)['cf_clearance'] == 'abc123' for s in sessions)
+
+
+def test_clearance_expiry_from_cf_clearance_cookie():
+    """Test that expiry comes from the cf_clearance cookie."""
+    expires = (datetime.utcnow() + timedelta(hours=2)).timestamp()
+    clearance = Clearance.from_solution({
+        'cookies': [
+            {'name': 'session_id', 'value': 'x', 'expires': -1},
+            {'name': 'cf_clearance', 'value': 'y', 'expires': expires},
+        ],
+        'userAgent': 'UA'
+    })
+
+    assert abs((clearance.expires_at - datetime.utcfromtimestamp(expires)).total_seconds()) < 1
+    assert clearance.is_valid()
+
+
+def test_expired_clearance_is_not_returned():
+    """Test that expired entries are dropped."""
+    cache = ClearanceCache()
+    cache.store('tracker.example.com', Clearance(cookies=[], user_agent=None, expires_at=datetime.utcnow()))
+
+    assert cache.get('tracker.example.com') is None
+
+
+def test_challenge_response_invalidates_clearance(cached_manager):
+    """Test that a challenge page drops the cached clearance."""
+    cache = cached_manager.clearance_cache
+    clearance = Clearance(
+        cookies=[{'name': 'cf_clearance', 'value': 'abc'}],
+        user_agent='UA',
+        expires_at=datetime.utcnow() + timedelta(hours=1)
+    )
+    cache.store('tracker.example.com', clearance)
+    session = cached_manager._build_session('tracker.example.com', clearance)
+
+    challenge = requests.Response()
+    challenge.status_code = 403
+    challenge.headers['Server'] = 'cloudflare'
+    challenge._content = b'<html><title>Just a moment...</title></html>'
+    for hook in session.hooks['response']:
+        hook(challenge)
+
+    assert cache.get('tracker.example.com') is None
+
+
+def test_challenge_hook_leaves_streamed_body_unread(cached_manager):
+    """Test that the challenge hook does not read the body of a regular response."""
+    clearance = Clearance(cookies=[], user_agent='UA', expires_at=datetime.utcnow() + timedelta(hours=1))
+    session = cached_manager._build_session('tracker.example.com', clearance)
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Server'] = 'cloudflare'
+    response.raw = io.BytesIO(b'torrent data')
+    for hook in session.hooks['response']:
+        hook(response)
+
+    assert response._content is False
+    assert response.raw.read() == b'torrent data'
+
+
+def test_is_cloudflare_challenge():
+    """Test challenge page detection."""
+    assert is_cloudflare_challenge(403, {'cf-mitigated': 'challenge'})
+    assert is_cloudflare_challenge(503, {'server': 'cloudflare'}, 'window._cf_chl_opt = {}')
+    assert not is_cloudflare_challenge(403, {'server': 'cloudflare'}, '{"error": "Invalid passkey"}')
+    assert not is_cloudflare_challenge(200, {'server': 'cloudflare'}, 'Just a moment...')
+
+
+def make_clearance_session_factory():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from backend.app.models.cloudflare_clearance import CloudflareClearance
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    CloudflareClearance.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_clearance_cache_persists_across_instances():
+    """Test that clearances survive a restart through the database."""
+    session_factory = make_clearance_session_factory()
+
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    ClearanceCache(session_factory).store(
+        'tracker.example.com',
+        Clearance(cookies=[{'name': 'cf_clearance', 'value': 'abc'}], user_agent='UA', expires_at=expires_at)
+    )
+
+    restarted = ClearanceCache(session_factory)
+    assert restarted.get('tracker.example.com') is None  # memory only
+    clearance = asyncio.run(restarted.aget('tracker.example.com'))
+    assert clearance.cookies == [{'name': 'cf_clearance', 'value': 'abc'}]
+    assert clearance.user_agent == 'UA'
+    assert restarted.get('tracker.example.com') is clearance
+
+    restarted.invalidate('tracker.example.com')
+    assert asyncio.run(ClearanceCache(session_factory).aget('tracker.example.com')) is None
+
+
+@pytest.mark.asyncio
+async def test_clearance_cache_database_off_event_loop():
+    """Test that database loads and writes run on the persistence thread."""
+    import threading
+
+    session_factory = make_clearance_session_factory()
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def tracking_factory():
+        threads.append(threading.get_ident())
+        return session_factory()
+
+    cache = ClearanceCache(tracking_factory)
+    cache.store('tracker.example.com', Clearance(
+        cookies=[], user_agent='UA', expires_at=datetime.utcnow() + timedelta(hours=1)
+    ))
+    await cache.flush()
+
+    assert await ClearanceCache(tracking_factory).aget('tracker.example.com') is not None
+    assert len(threads) == 2
+    assert loop_thread not in threads
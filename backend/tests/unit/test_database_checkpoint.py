@@ -0,0 +1,173 @@
+"""
+Unit Tests for checkpoint commits and the SQLite profile (app.database)
+
+Test Coverage:
+    - Changed columns are written by the checkpoint writer, off the event loop
+    - Changes made while the write runs are still committed
+    - Checkpoints of concurrent pipelines share one transaction
+    - A failing row does not fail the other rows of its batch
+    - In-memory databases fall back to a plain synchronous commit
+    - SQLite connections get the WAL / busy_timeout profile
+    - get_async_db() degrades to a thread-offloaded sync session
+"""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import database
+from backend.app.models.base import Base
+from backend.app.models.file_entry import FileEntry, Status
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """SQLite file engine with the application profile, recording UPDATE threads."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'seedarr.db'}", **database.engine_options("sqlite:///x.db"))
+    event.listen(engine, "connect", database.apply_sqlite_pragmas)
+    Base.metadata.create_all(engine)
+    engine.update_threads = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, *args):
+        if statement.startswith("UPDATE"):
+            engine.update_threads.append(threading.current_thread().name)
+
+    yield engine
+    asyncio.run(database.dispose_async_engines())
+    engine.dispose()
+
+
+@pytest.fixture
+def file_db(file_engine):
+    session = sessionmaker(bind=file_engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+def make_entries(db, count):
+    entries = [FileEntry.create_or_get(db, f"/media/Movie.{i}.mkv") for i in range(count)]
+    db.commit()
+    return entries
+
+
+class TestCommitCheckpoint:
+    """Test checkpoint writes through the checkpoint writer."""
+
+    async def test_changes_written_off_the_event_loop(self, file_db, file_engine):
+        entry, = make_entries(file_db, 1)
+
+        entry.mark_scanned()
+        entry.release_name = "Movie.2023.1080p.BluRay.x264-GRP"
+        await database.commit_checkpoint(file_db, entry)
+
+        assert file_engine.update_threads
+        assert all(name.startswith("db-checkpoint") for name in file_engine.update_threads)
+        file_db.expire_all()
+        assert entry.status == Status.SCANNED
+        assert entry.release_name == "Movie.2023.1080p.BluRay.x264-GRP"
+
+    async def test_concurrent_change_is_not_lost(self, file_db, file_engine, monkeypatch):
+        entry, = make_entries(file_db, 1)
+        write_changes = database._write_changes
+
+        async def write_then_modify(*args):
+            await write_changes(*args)
+            # Another coroutine sets a tracker status once the UPDATE is sent
+            entry.set_tracker_status("lacale", "success")
+
+        monkeypatch.setattr(database, "_write_changes", write_then_modify)
+        entry.set_tracker_status("lacale", "pending")
+        await database.commit_checkpoint(file_db, entry)
+
+        # One UPDATE by the writer, one by the synchronous commit
+        assert len(file_engine.update_threads) == 2
+        file_db.expire_all()
+        assert entry.get_tracker_status("lacale")["status"] == "success"
+
+    async def test_concurrent_checkpoints_are_grouped(self, file_db, file_engine):
+        entries = make_entries(file_db, 5)
+        writer = database.get_checkpoint_writer(file_engine)
+
+        for i, entry in enumerate(entries):
+            entry.set_tracker_status("c411", "success", torrent_id=str(i))
+        await asyncio.gather(*[database.commit_checkpoint(file_db, entry) for entry in entries])
+
+        # All five checkpoints are queued before the writer runs: one transaction
+        assert writer.transactions == 1
+        assert writer.updates == 5
+        file_db.expire_all()
+        assert [e.get_tracker_status("c411")["torrent_id"] for e in entries] == ["0", "1", "2", "3", "4"]
+
+    async def test_failing_row_only_fails_its_caller(self, file_db, file_engine):
+        good, bad = make_entries(file_db, 2)
+        other_db = sessionmaker(bind=file_engine, autoflush=False)()
+        bad = other_db.get(FileEntry, bad.id)
+        bad.file_path = good.file_path  # violates the unique constraint on file_path
+        good.release_name = "Movie.0.1080p.WEB.x264-GRP"
+
+        results = await asyncio.gather(
+            database.commit_checkpoint(file_db, good),
+            database.commit_checkpoint(other_db, bad),
+            return_exceptions=True,
+        )
+        other_db.close()
+
+        assert results[0] is None
+        assert isinstance(results[1], Exception)
+        file_db.expire_all()
+        assert good.release_name == "Movie.0.1080p.WEB.x264-GRP"
+
+    async def test_in_memory_database_commits_synchronously(self):
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        entry, = make_entries(db, 1)
+
+        entry.mark_scanned()
+        await database.commit_checkpoint(db, entry)
+
+        assert database.get_checkpoint_writer(engine) is None
+        db.expire_all()
+        assert entry.status == Status.SCANNED
+
+
+class TestAsyncSessionFallback:
+    """Test get_async_db() without an async engine."""
+
+    async def test_sync_session_in_worker_thread(self, file_db, file_engine, monkeypatch):
+        make_entries(file_db, 2)
+        select_threads = []
+
+        @event.listens_for(file_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, *args):
+            if statement.startswith("SELECT"):
+                select_threads.append(threading.get_ident())
+
+        monkeypatch.setattr(database, "get_async_engine", lambda url=None: None)
+        monkeypatch.setattr(database, "_async_sessionmaker", None)
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=file_engine))
+
+        sessions = database.get_async_db()
+        db = await sessions.__anext__()
+        result = await db.execute(select(FileEntry).order_by(FileEntry.id))
+        paths = [entry.file_path for entry in result.scalars().all()]
+        await sessions.aclose()
+
+        assert isinstance(db, database.ThreadedSession)
+        assert paths == ["/media/Movie.0.mkv", "/media/Movie.1.mkv"]
+        assert select_threads and threading.get_ident() not in select_threads
+
+
+class TestSQLiteProfile:
+    """Test the PRAGMAs applied to new SQLite connections."""
+
+    def test_pragmas_applied(self, file_engine):
+        with file_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == database.Config.SQLITE_BUSY_TIMEOUT_MS
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
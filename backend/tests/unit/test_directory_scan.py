@@ -0,0 +1,135 @@
+"""
+Unit Tests for background folder scans (app.services.directory_scan_service)
+
+Test Coverage:
+    - Nested folders walked, only video files added, symlinked folders skipped
+    - Existing entries skipped, FAILED entries reset, one IN query per chunk
+    - One running job per folder, cancellation
+    - Server-Sent Events progress stream
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.api import filemanager_routes
+from app.models.base import Base
+from app.models.file_entry import FileEntry, Status
+from app.services.directory_scan_service import DirectoryScanner
+
+VIDEO = filemanager_routes.VIDEO_EXTENSIONS
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scan.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    factory.statements = []
+    event.listen(engine, "before_cursor_execute", lambda c, cur, stmt, *a: factory.statements.append(stmt))
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "library"
+    for name in ["A.mkv", "notes.txt", "Show/S01/E01.MP4", "Show/S01/E02.mkv", "Show/cover.jpg", "Movies/B.avi"]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+    os.symlink(root / "Show", root / "Show link")
+    return root
+
+
+async def run_scan(scanner, path):
+    job = scanner.start(str(path), VIDEO)
+    await asyncio.wait_for(job.task, 5)
+    return job
+
+
+def stored(session_factory):
+    with session_factory() as db:
+        return {os.path.basename(e.file_path): e.status for e in db.query(FileEntry)}
+
+
+class TestScan:
+    """Test walking a folder and adding its files."""
+
+    async def test_adds_video_files(self, session_factory, library):
+        job = await run_scan(DirectoryScanner(session_factory, batch_size=2), library)
+
+        assert job.status == 'completed'
+        assert (job.files_found, job.created, job.skipped) == (4, 4, 0)
+        assert job.directories == 4
+        assert stored(session_factory) == {n: Status.PENDING for n in ["A.mkv", "E01.MP4", "E02.mkv", "B.avi"]}
+        assert job.message == "Scan complete: 4 file(s) added to queue"
+
+    async def test_existing_entries(self, session_factory, library):
+        with session_factory() as db:
+            db.add(FileEntry(str(library / "A.mkv")))
+            failed = FileEntry(str(library / "Movies" / "B.avi"))
+            failed.mark_failed("boom")
+            db.add(failed)
+            db.commit()
+        session_factory.statements.clear()
+
+        job = await run_scan(DirectoryScanner(session_factory, batch_size=10), library)
+
+        assert (job.created, job.reset, job.skipped) == (2, 1, 1)
+        # One lookup, one insert and one reset for the single chunk
+        assert [s.split()[0] for s in session_factory.statements] == ["SELECT", "INSERT", "UPDATE"]
+        assert sorted(job.created_names) == ["B.avi", "E01.MP4", "E02.mkv"]
+        with session_factory() as db:
+            entry = FileEntry.get_by_path(db, str(library / "Movies" / "B.avi"))
+            assert (entry.status, entry.is_terminal, entry.error_message) == (Status.PENDING, False, None)
+
+    async def test_rescan_is_idempotent(self, session_factory, library):
+        scanner = DirectoryScanner(session_factory)
+        await run_scan(scanner, library)
+
+        job = await run_scan(scanner, library)
+
+        assert (job.created, job.skipped) == (0, 4)
+        assert len(stored(session_factory)) == 4
+
+
+class TestJobs:
+    """Test job registry and cancellation."""
+
+    async def test_running_job_is_shared_and_cancelled(self, session_factory, library):
+        scanner = DirectoryScanner(session_factory)
+        job = scanner.start(str(library), VIDEO)
+
+        assert scanner.start(str(library) + os.sep, VIDEO) is job
+        scanner.cancel(job.id)
+        await asyncio.wait_for(job.task, 5)
+
+        assert job.status == 'cancelled'
+        assert stored(session_factory) == {}
+        assert scanner.start(str(library), VIDEO) is not job
+        assert scanner.get("unknown") is None
+
+
+class FakeRequest:
+    async def is_disconnected(self):
+        return False
+
+
+class TestScanStream:
+    """Test the Server-Sent Events progress stream."""
+
+    async def test_stream_ends_with_done(self, session_factory, library, monkeypatch):
+        monkeypatch.setattr(filemanager_routes, 'SCAN_STREAM_INTERVAL', 0.01)
+        job = DirectoryScanner(session_factory).start(str(library), VIDEO)
+
+        events = [event async for event in filemanager_routes._scan_event_stream(FakeRequest(), job)]
+
+        name, data = events[-1].strip().split("\n")
+        assert name == "event: done"
+        assert json.loads(data[len("data: "):])["created"] == 4
+        assert all(e.startswith("event: progress") for e in events[:-1])
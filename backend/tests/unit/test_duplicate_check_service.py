@@ -0,0 +1,175 @@
+"""
+Unit Tests for DuplicateCheckService and the shared duplicate result cache
+
+Test Coverage:
+    - Positive and negative results expire after their own TTL
+    - Least recently used entries are evicted past max_entries
+    - Errors and failed check results are not cached; concurrent checks of one key are single-flight
+    - check_all_trackers() queries trackers concurrently with a timeout
+    - Results are shared across service instances
+    - An injected cache is filled, cleared and read with the check's key
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.services import duplicate_check_service as dcs
+from backend.app.services.duplicate_check_service import DuplicateCheckService, DuplicateResultCache
+
+
+class FakeAdapter:
+    """Adapter whose check_duplicate() sleeps then returns a fixed result."""
+
+    def __init__(self, delay=0.0, is_duplicate=False):
+        self.delay = delay
+        self.is_duplicate = is_duplicate
+        self.calls = 0
+
+    async def check_duplicate(self, tmdb_id=None, imdb_id=None, release_name=None, quality=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {
+            'is_duplicate': self.is_duplicate,
+            'existing_torrents': [{'name': release_name}] if self.is_duplicate else [],
+            'search_method': 'tmdb',
+            'message': '',
+        }
+
+
+class TestDuplicateResultCache:
+    """Test TTL, LRU and single-flight behaviour."""
+
+    def test_negative_results_expire_sooner(self, monkeypatch):
+        cache = DuplicateResultCache(ttl=100, negative_ttl=10, max_entries=10)
+        now = time.monotonic()
+        monkeypatch.setattr(dcs.time, 'monotonic', lambda: now)
+        cache.store(('found',), {'is_duplicate': True})
+        cache.store(('missing',), {'is_duplicate': False})
+
+        monkeypatch.setattr(dcs.time, 'monotonic', lambda: now + 50)
+
+        assert cache.get(('found',)) == {'is_duplicate': True}
+        assert cache.get(('missing',)) is None
+
+    def test_lru_eviction(self):
+        cache = DuplicateResultCache(ttl=100, negative_ttl=100, max_entries=2)
+        cache.store(('a',), {'is_duplicate': False})
+        cache.store(('b',), {'is_duplicate': False})
+        cache.get(('a',))
+        cache.store(('c',), {'is_duplicate': False})
+
+        assert cache.get(('a',)) is not None
+        assert cache.get(('b',)) is None
+        assert cache.get_stats()['evictions'] == 1
+
+    async def test_concurrent_checks_are_single_flight(self):
+        cache = DuplicateResultCache()
+        adapter = FakeAdapter(delay=0.05)
+        key = cache.make_key(1, tmdb_id='603')
+
+        results = await asyncio.gather(*[
+            cache.get_or_check(key, lambda: adapter.check_duplicate(tmdb_id='603')) for _ in range(5)
+        ])
+
+        assert adapter.calls == 1
+        assert all(result['is_duplicate'] is False for result in results)
+        assert cache.get(key) is not None
+
+    async def test_errors_are_not_cached(self):
+        cache = DuplicateResultCache()
+        key = cache.make_key(1, tmdb_id='603')
+
+        async def failing():
+            raise RuntimeError("tracker down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_check(key, failing)
+        await asyncio.sleep(0)
+
+        assert cache.get(key) is None
+
+    async def test_failed_check_result_not_cached(self):
+        cache = DuplicateResultCache()
+        key = cache.make_key(1, tmdb_id='603')
+
+        async def failed():
+            return {'is_duplicate': False, 'message': 'Check failed: bad XML', 'error': 'bad XML'}
+
+        result = await cache.get_or_check(key, failed)
+        await asyncio.sleep(0)
+
+        assert result['error'] == 'bad XML'
+        assert cache.get(key) is None
+
+
+@pytest.fixture
+def trackers(monkeypatch):
+    items = [SimpleNamespace(id=1, name='LaCale'), SimpleNamespace(id=2, name='C411')]
+    monkeypatch.setattr(dcs.Tracker, 'get_enabled', classmethod(lambda cls, db: items))
+    return items
+
+
+def make_service(adapters):
+    service = DuplicateCheckService(db=None)
+    service._get_adapter = lambda tracker: adapters[tracker.id]
+    return service
+
+
+class TestCheckAllTrackers:
+    """Test concurrent fan-out across trackers."""
+
+    async def test_trackers_are_checked_concurrently(self, trackers):
+        adapters = {1: FakeAdapter(delay=0.2, is_duplicate=True), 2: FakeAdapter(delay=0.2)}
+
+        start = time.monotonic()
+        result = await make_service(adapters).check_all_trackers(tmdb_id='603', release_name='Matrix')
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.35
+        assert result.trackers_checked == 2
+        assert result.trackers_with_duplicates == 1
+        assert result.results_by_tracker['LaCale'].is_duplicate is True
+
+    async def test_slow_tracker_times_out(self, trackers):
+        adapters = {1: FakeAdapter(), 2: FakeAdapter(delay=1)}
+
+        result = await make_service(adapters).check_all_trackers(tmdb_id='603', timeout=0.05)
+
+        assert result.results_by_tracker['LaCale'].error is None
+        assert result.results_by_tracker['C411'].error == "Duplicate check timed out"
+
+    async def test_results_are_shared_across_instances(self, trackers):
+        adapters = {1: FakeAdapter(), 2: FakeAdapter(is_duplicate=True)}
+
+        await make_service(adapters).check_all_trackers(tmdb_id='603')
+        again = await make_service(adapters).check_all_trackers(tmdb_id='603')
+        await make_service(adapters).check_all_trackers(tmdb_id='603', use_cache=False)
+
+        assert again.trackers_with_duplicates == 1
+        assert [adapters[1].calls, adapters[2].calls] == [2, 2]
+
+    async def test_injected_cache_is_used(self, trackers):
+        adapters = {1: FakeAdapter(), 2: FakeAdapter(is_duplicate=True)}
+        cache = DuplicateResultCache()
+        service = DuplicateCheckService(db=None, cache=cache)
+        service._get_adapter = lambda tracker: adapters[tracker.id]
+
+        await service.check_all_trackers(tmdb_id='603', quality='1080p')
+
+        assert cache.get_stats()['entries'] == 2
+        assert dcs.get_duplicate_cache().get_stats()['entries'] == 0
+        assert service.clear_cache() == 2
+
+    async def test_cached_result_found_with_quality(self, trackers):
+        service = make_service({1: FakeAdapter(is_duplicate=True), 2: FakeAdapter()})
+        service.db = SimpleNamespace(query=lambda model: SimpleNamespace(
+            filter=lambda *args: SimpleNamespace(first=lambda: trackers[0])
+        ))
+
+        await service.check_single_tracker(1, tmdb_id='603', quality='1080p')
+
+        assert service.get_cached_result(1, tmdb_id='603', quality='1080p').is_duplicate is True
+        assert service.get_cached_result(1, tmdb_id='603') is None
@@ -0,0 +1,169 @@
+"""
+Unit Tests for the file manager index (app.services.file_index_service)
+
+Test Coverage:
+    - Initial indexing, listings in folder-first order with pagination
+    - Incremental refresh: unchanged folders are not listed again, added /
+      removed entries, files modified in place caught by a full refresh
+    - On-demand refresh of a browsed folder
+    - Prefix / substring search scoped to a folder
+    - Roots: nested roots skipped, entries of removed roots deleted
+    - Queue flags of files that already have a FileEntry
+"""
+
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.base import Base
+from app.models.file_entry import FileEntry, Status
+from app.models.file_index import FileIndexEntry
+from app.services.file_index_service import FileIndex, get_file_entry_flags
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'index.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "library"
+    for name in ["b.mkv", "A.mkv", "notes_1.txt", "Zeta/z.mkv", "alpha/Alpha.Movie.2020.mkv", "alpha/sub/deep.mkv"]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 10)
+    age(root)
+    return root
+
+
+def age(root):
+    """Move folder mtimes out of the racy window, as on a library at rest."""
+    hour_ago = time.time() - 3600
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (hour_ago, hour_ago))
+
+
+@pytest.fixture
+def index(session_factory, library):
+    file_index = FileIndex(session_factory)
+    file_index.set_roots([str(library)])
+    return file_index
+
+
+def names(entries):
+    return [entry.name for entry in entries]
+
+
+class TestRefresh:
+    """Test building and refreshing the index."""
+
+    def test_initial_index_and_listing(self, index, session_factory, library):
+        counts = index.refresh()
+
+        assert counts['listed'] == 4
+        assert counts['added'] == 10
+        with session_factory() as db:
+            entries, total = index.list_directory(db, str(library))
+            assert total == 5
+            assert names(entries) == ["alpha", "Zeta", "A.mkv", "b.mkv", "notes_1.txt"]
+            page, _ = index.list_directory(db, str(library), offset=2, limit=2)
+            assert names(page) == ["A.mkv", "b.mkv"]
+            movie = db.query(FileIndexEntry).filter_by(name="A.mkv").one()
+            assert (movie.size, movie.extension, movie.is_dir) == (10, ".mkv", False)
+            assert movie.inode == os.stat(library / "A.mkv").st_ino
+
+    def test_incremental_refresh(self, index, session_factory, library):
+        index.refresh()
+        assert index.refresh()['unchanged'] == 4
+
+        (library / "alpha" / "new.mkv").write_bytes(b"y")
+        os.rename(library / "Zeta", library / "Omega")
+        counts = index.refresh()
+
+        assert counts['listed'] == 3  # library, alpha and the new Omega
+        assert counts['unchanged'] == 1
+        with session_factory() as db:
+            assert names(index.list_directory(db, str(library / "alpha"))[0]) == ["sub", "Alpha.Movie.2020.mkv", "new.mkv"]
+            assert db.query(FileIndexEntry).filter(FileIndexEntry.path.like("%Zeta%")).count() == 0
+            assert db.query(FileIndexEntry).filter_by(name="z.mkv").one().parent == str(library / "Omega")
+
+    def test_file_modified_in_place_needs_full_refresh(self, index, session_factory, library):
+        index.refresh()
+        (library / "A.mkv").write_bytes(b"longer content")
+
+        assert index.refresh()['updated'] == 0
+        assert index.refresh(full=True)['updated'] == 1
+        with session_factory() as db:
+            assert db.query(FileIndexEntry).filter_by(name="A.mkv").one().size == 14
+
+    def test_recently_modified_folder_listed_again(self, index, library):
+        os.utime(library, None)
+        index.refresh()
+
+        counts = index.refresh()
+
+        assert counts['listed'] == 1
+        assert counts['unchanged'] == 3
+
+    def test_refresh_browsed_folder(self, index, session_factory, library, tmp_path):
+        with session_factory() as db:
+            assert index.refresh_directory(str(library / "alpha"), db) is True
+            assert index.is_listed(db, str(library / "alpha"))
+            assert not index.is_listed(db, str(library))
+            assert index.refresh_directory(str(tmp_path), db) is False
+            assert index.refresh_directory(str(library / "missing"), db) is False
+
+    def test_removed_root(self, index, session_factory, library, tmp_path):
+        index.refresh()
+        other = tmp_path / "other"
+        other.mkdir()
+
+        assert index.set_roots([str(other), str(library / "alpha"), str(library)]) == sorted([str(library), str(other)])
+        index.set_roots([str(other)])
+        index.refresh()
+
+        with session_factory() as db:
+            assert db.query(FileIndexEntry).filter(FileIndexEntry.root == str(library)).count() == 0
+            assert db.query(FileIndexEntry).count() == 1
+
+
+class TestQueries:
+    """Test search, queue flags and query plans."""
+
+    def test_search(self, index, session_factory, library):
+        index.refresh()
+        with session_factory() as db:
+            # Names starting with the query first, then names containing it
+            assert names(index.search(db, "alpha")) == ["alpha", "Alpha.Movie.2020.mkv"]
+            assert names(index.search(db, "MKV")) == ["A.mkv", "Alpha.Movie.2020.mkv", "b.mkv", "deep.mkv", "z.mkv"]
+            assert names(index.search(db, ".mkv", under=str(library / "alpha"))) == ["Alpha.Movie.2020.mkv", "deep.mkv"]
+            # LIKE wildcards are literal
+            assert names(index.search(db, "_")) == ["notes_1.txt"]
+            assert index.search(db, "  ") == []
+
+    def test_file_entry_flags(self, session_factory, library):
+        with session_factory() as db:
+            entry = FileEntry(str(library / "A.mkv"))
+            db.add(entry)
+            db.commit()
+
+            flags = get_file_entry_flags(db, [str(library / "A.mkv"), str(library / "b.mkv")])
+
+            assert flags == {str(library / "A.mkv"): (entry.id, Status.PENDING)}
+
+    @pytest.mark.parametrize("query", [
+        "SELECT * FROM file_index WHERE parent = '/media' ORDER BY is_dir DESC, name_lower, id LIMIT 20 OFFSET 40",
+        "SELECT * FROM file_index WHERE name_lower >= 'alp' AND name_lower < 'alq' ORDER BY name_lower LIMIT 200",
+    ])
+    def test_query_uses_index(self, session_factory, query):
+        with session_factory() as db:
+            plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {query}")))
+
+        assert "INDEX" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,197 @@
+"""
+Unit Tests for file preparation (app.services.file_preparation)
+
+Test Coverage:
+    - Copy methods fall back in order and resume at the reached offset
+    - Partial copies removed on failure, progress published while copying
+    - At most one copy across a device boundary, other targets hardlinked to it
+    - HardlinkManager async preparation (main and per-tracker releases)
+"""
+
+import errno
+import os
+
+import pytest
+
+from app.services import file_preparation
+from app.services.file_preparation import FilePreparation, copy_file, get_copy_progress
+from app.services.hardlink_manager import HardlinkError, HardlinkManager
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 123)
+
+
+def unsupported(*args, **kwargs):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "media" / "Movie.mkv"
+    path.parent.mkdir()
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+def cross_device(monkeypatch, source):
+    """Make hardlinks to the source fail as across filesystems."""
+    real_link = os.link
+    attempts = []
+
+    def link(src, dst):
+        attempts.append(src)
+        if os.path.samefile(src, source):
+            unsupported()
+        real_link(src, dst)
+
+    monkeypatch.setattr(file_preparation.os, "link", link)
+    return attempts
+
+
+class TestCopyFile:
+    """Test the copy methods."""
+
+    def test_copy_preserves_contents_and_times(self, source, tmp_path):
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        target = tmp_path / "copy.mkv"
+
+        method = copy_file(str(source), str(target))
+
+        assert method in ("reflink", "copy_file_range", "sendfile", "buffered")
+        assert target.read_bytes() == CONTENT
+        assert target.stat().st_mtime == 1_000_000_000
+        assert not (tmp_path / "copy.mkv.partial").exists()
+
+    def test_fallback_resumes_at_offset(self, monkeypatch, source, tmp_path):
+        monkeypatch.setattr(file_preparation, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.setattr(file_preparation, "KERNEL_CHUNK_BYTES", 1024 * 1024)
+        calls = []
+
+        def copy_file_range_once(src_fd, dst_fd, offset, count):
+            calls.append(offset)
+            if calls[1:]:
+                unsupported()
+            return os.pwrite(dst_fd, os.pread(src_fd, count, offset), offset)
+
+        monkeypatch.setattr(file_preparation, "_copy_file_range_chunk", copy_file_range_once)
+        monkeypatch.setattr(file_preparation, "_sendfile_chunk", unsupported)
+        progress = []
+        target = tmp_path / "copy.mkv"
+
+        method = copy_file(str(source), str(target), lambda copied, total: progress.append(copied))
+
+        assert method == "buffered"
+        assert calls == [0, 1024 * 1024]
+        assert target.read_bytes() == CONTENT
+        assert progress[0] == 0 and progress[-1] == len(CONTENT)
+
+    def test_failed_copy_removes_partial(self, monkeypatch, source, tmp_path):
+        def disk_full(*args):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(file_preparation, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.setattr(file_preparation, "_copy_file_range_chunk", disk_full)
+
+        with pytest.raises(OSError):
+            copy_file(str(source), str(tmp_path / "copy.mkv"))
+
+        assert list(tmp_path.iterdir()) == [source.parent]
+        assert get_copy_progress(str(source)) is None
+
+    def test_progress_published_while_copying(self, monkeypatch, source, tmp_path):
+        seen = []
+        monkeypatch.setattr(file_preparation, "_reflink", lambda src_fd, dst_fd: False)
+        monkeypatch.setattr(file_preparation, "KERNEL_CHUNK_BYTES", 1024 * 1024)
+
+        copy_file(str(source), str(tmp_path / "copy.mkv"), lambda *args: seen.append(get_copy_progress(str(source))))
+
+        assert seen[0] == 0.0
+        assert seen[-1] == 100.0
+        assert get_copy_progress(str(source)) is None
+
+
+class TestFilePreparation:
+    """Test placement of one source in several folders."""
+
+    async def test_same_filesystem_hardlinks(self, source, tmp_path):
+        preparation = FilePreparation(str(source))
+
+        assert await preparation.place(str(tmp_path / "a.mkv")) == "hardlink"
+        assert await preparation.place(str(tmp_path / "a.mkv")) == "hardlink"
+        assert preparation.copies == []
+        assert (tmp_path / "a.mkv").stat().st_ino == source.stat().st_ino
+
+    async def test_cross_device_copied_once(self, cross_device, source, tmp_path):
+        preparation = FilePreparation(str(source))
+        targets = [tmp_path / name / "Movie.mkv" for name in ("main", "tracker1", "tracker2")]
+        for target in targets:
+            target.parent.mkdir()
+
+        methods = [await preparation.place(str(targets[0]))]
+        methods += [await preparation.place(str(target), allow_copy=False) for target in targets[1:]]
+
+        assert methods[0] != "hardlink"
+        assert methods[1:] == ["hardlink", "hardlink"]
+        assert preparation.copies == [targets[0]]
+        assert {target.stat().st_ino for target in targets} == {targets[0].stat().st_ino}
+        assert targets[0].stat().st_ino != source.stat().st_ino
+
+    async def test_cross_device_without_copy(self, cross_device, source, tmp_path):
+        preparation = FilePreparation(str(source))
+
+        with pytest.raises(OSError) as exc_info:
+            await preparation.place(str(tmp_path / "a.mkv"), allow_copy=False)
+
+        assert exc_info.value.errno == errno.EXDEV
+        assert not (tmp_path / "a.mkv").exists()
+
+    async def test_existing_different_file_replaced(self, source, tmp_path):
+        target = tmp_path / "a.mkv"
+        target.write_bytes(b"stale")
+
+        await FilePreparation(str(source)).place(str(target))
+
+        assert target.read_bytes() == CONTENT
+
+
+class TestHardlinkManagerPreparation:
+    """Test the async release structure methods."""
+
+    async def test_main_and_tracker_releases_share_copy(self, cross_device, source, tmp_path):
+        manager = HardlinkManager()
+        preparation = FilePreparation(str(source))
+
+        structure = await manager.prepare_release_structure(preparation, "Movie.2024", str(tmp_path / "out"))
+        tracker = await manager.prepare_tracker_release(
+            preparation, "Movie.2024.TRK", str(tmp_path / "out" / "tracker"), fallback_copy=False
+        )
+
+        assert structure["hardlink_used"] is False
+        assert structure["copy_method"] is not None
+        assert os.path.isdir(structure["screens_dir"])
+        assert tracker["method"] == "hardlink"
+        assert os.path.samefile(tracker["media_file"], structure["media_file"])
+
+    async def test_tracker_without_fallback_copy(self, cross_device, source, tmp_path):
+        manager = HardlinkManager()
+
+        with pytest.raises(HardlinkError, match="copy fallback is disabled"):
+            await manager.prepare_tracker_release(
+                FilePreparation(str(source)), "Movie", str(tmp_path / "tracker"), fallback_copy=False
+            )
+
+    async def test_tracker_copy_reported_as_copy(self, cross_device, source, tmp_path):
+        result = await HardlinkManager().prepare_tracker_release(
+            FilePreparation(str(source)), "Movie", str(tmp_path / "tracker")
+        )
+
+        assert result["method"] == "copy"
+        assert result["copy_method"] in ("reflink", "copy_file_range", "sendfile", "buffered")
+
+    async def test_hardlinks_disabled_direct(self, source, tmp_path):
+        result = await HardlinkManager().prepare_tracker_release(
+            FilePreparation(str(source)), "Movie", str(tmp_path / "tracker"), hardlink_enabled=False
+        )
+
+        assert result["method"] == "direct"
+        assert result["media_file"] == str(source)
@@ -0,0 +1,164 @@
+"""
+Unit Tests for the dashboard / history queries (app.api.dashboard_routes)
+
+Test Coverage:
+    - is_terminal follows status changes
+    - Keyset pagination walks the whole history exactly once, ties included
+    - Status filters and all-time history stats
+    - Denormalized status counts follow inserts, status changes and deletes
+    - Queue and history queries read an index instead of scanning the table
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.api import dashboard_routes
+from backend.app.api.dashboard_routes import FileEntry, FileEntryStatusCount, Status
+# dashboard_routes uses the "app." models
+from app.models.file_entry_status_count import install_status_count_triggers
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    FileEntry.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def seed(db, statuses, updated_at=None):
+    """Add one entry per status; entries share ``updated_at`` when given."""
+    start = datetime(2026, 1, 1)
+    for i, status in enumerate(statuses):
+        entry = FileEntry(file_path=f"/media/Movie.{i}.mkv")
+        entry.status = status
+        entry.updated_at = updated_at or start + timedelta(minutes=i)
+        db.add(entry)
+    db.commit()
+
+
+def all_pages(db, status_filter='', limit=3):
+    ids, cursor = [], None
+    while True:
+        entries, cursor = dashboard_routes._query_history_page(db, status_filter, cursor, limit)
+        ids.extend(entry.id for entry in entries)
+        if cursor is None:
+            return ids
+
+
+class TestIsTerminal:
+    """Test the denormalized is_terminal flag."""
+
+    def test_follows_status(self):
+        entry = FileEntry(file_path="/media/Movie.mkv")
+        assert entry.is_terminal is False
+
+        entry.mark_failed("boom")
+        assert entry.is_terminal is True
+
+        entry.reset_from_checkpoint(Status.PENDING)
+        assert entry.is_terminal is False
+
+        entry.mark_uploaded()
+        assert entry.is_terminal is True
+
+
+class TestHistoryPagination:
+    """Test keyset pagination of the history."""
+
+    def test_pages_cover_history_once(self, db):
+        seed(db, [Status.UPLOADED, Status.FAILED, Status.PENDING] * 4)
+
+        ids = all_pages(db)
+
+        finished = db.query(FileEntry).filter(FileEntry.is_terminal == True).all()
+        assert len(ids) == len(set(ids)) == len(finished) == 8
+        # Most recently updated first
+        assert ids == sorted(ids, reverse=True)
+
+    def test_same_updated_at_is_ordered_by_id(self, db):
+        seed(db, [Status.UPLOADED] * 7, updated_at=datetime(2026, 1, 1))
+
+        assert all_pages(db) == [7, 6, 5, 4, 3, 2, 1]
+
+    def test_last_page_has_no_cursor(self, db):
+        seed(db, [Status.UPLOADED] * 3)
+
+        entries, cursor = dashboard_routes._query_history_page(db, limit=3)
+
+        assert len(entries) == 3
+        assert cursor is None
+
+    def test_status_filter(self, db):
+        seed(db, [Status.UPLOADED, Status.FAILED] * 4)
+
+        failed = all_pages(db, 'failed')
+
+        assert len(failed) == 4
+        assert {db.get(FileEntry, i).status for i in failed} == {Status.FAILED}
+
+    def test_history_stats(self, db):
+        seed(db, [Status.UPLOADED] * 3 + [Status.FAILED, Status.PENDING])
+
+        assert dashboard_routes._get_history_stats(db) == {
+            "total": 4, "successful": 3, "failed": 1, "success_rate": 75
+        }
+
+
+class TestStatusCounts:
+    """Test the trigger-maintained status counts."""
+
+    def test_counts_follow_changes(self, db):
+        seed(db, [Status.PENDING] * 3)
+        assert FileEntryStatusCount.get_counts(db) == {Status.PENDING: 3}
+
+        first, second, third = db.query(FileEntry).order_by(FileEntry.id).all()
+        first.mark_uploaded()
+        second.mark_failed("boom")
+        db.commit()
+        assert FileEntryStatusCount.get_counts(db) == {
+            Status.PENDING: 1, Status.UPLOADED: 1, Status.FAILED: 1
+        }
+
+        db.delete(third)
+        # Core UPDATE, as written by the checkpoint writer
+        db.execute(text("UPDATE file_entries SET status = 'UPLOADED' WHERE id = :id"), {"id": second.id})
+        db.commit()
+        assert FileEntryStatusCount.get_counts(db) == {Status.UPLOADED: 2}
+
+    def test_counts_rebuilt_when_triggers_installed(self, db):
+        seed(db, [Status.UPLOADED] * 2)
+        with db.get_bind().begin() as conn:
+            for name in ("insert", "update", "delete"):
+                conn.execute(text(f"DROP TRIGGER file_entries_status_count_{name}"))
+            conn.execute(text("DELETE FROM file_entry_status_counts"))
+
+        with db.get_bind().begin() as conn:
+            assert install_status_count_triggers(conn) is True
+            assert install_status_count_triggers(conn) is False
+
+        assert FileEntryStatusCount.get_counts(db) == {Status.UPLOADED: 2}
+
+
+class TestQueryPlans:
+    """Test that dashboard queries are served by the file_entries indexes."""
+
+    @pytest.mark.parametrize("query", [
+        "SELECT count(*) FROM file_entries WHERE is_terminal = 0",
+        "SELECT id FROM file_entries WHERE is_terminal = 1 "
+        "AND (updated_at, id) < ('2026-01-01', 5) ORDER BY updated_at DESC, id DESC LIMIT 51",
+        "SELECT id FROM file_entries WHERE status = 'FAILED' ORDER BY updated_at DESC, id DESC LIMIT 51",
+        "SELECT count(*) FROM file_entries WHERE status = 'UPLOADED' AND uploaded_at >= '2026-01-01'",
+        "SELECT id FROM file_entries ORDER BY updated_at DESC LIMIT 10",
+        "SELECT count(id) FROM file_entries WHERE created_at >= '2026-01-01' AND status = 'FAILED'",
+    ])
+    def test_query_uses_index(self, db, query):
+        plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {query}")))
+
+        assert "INDEX" in plan
+        assert "TEMP B-TREE" not in plan
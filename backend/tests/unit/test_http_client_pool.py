@@ -0,0 +1,89 @@
+"""
+Unit Tests for the shared HTTP client pool
+
+Test Coverage:
+    - One client per origin (scheme, host, port)
+    - Connections are kept alive and reused across requests
+    - Response cookies are not persisted in the shared client
+    - Shutdown closes the clients
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from backend.app.services.http_client_pool import HttpClientPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "no-cookie").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "SID=secret; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpClientPool:
+    """Test client sharing, keep-alive and statistics."""
+
+    async def test_one_client_per_origin(self):
+        pool = HttpClientPool(http2=False)
+
+        a = pool.get_client("http://radarr:7878/api/v3/movie")
+        b = pool.get_client("http://radarr:7878/api/v3/system/status")
+        c = pool.get_client("http://sonarr:8989/api/v3/series")
+
+        assert a is b
+        assert a is not c
+        await pool.aclose()
+
+    async def test_connection_is_reused(self, server_url):
+        pool = HttpClientPool(http2=False)
+
+        for _ in range(3):
+            async with pool.borrow(server_url) as client:
+                response = await client.get(f"{server_url}/ping", timeout=5)
+                assert response.status_code == 200
+
+        host_stats = next(iter(pool.get_stats()["hosts"].values()))
+        assert host_stats["requests"] == 3
+        assert host_stats["connections"] == 1
+        assert host_stats["in_use"] == 0
+        await pool.aclose()
+
+    async def test_cookies_are_not_shared(self, server_url):
+        pool = HttpClientPool(http2=False)
+
+        async with pool.borrow(server_url) as client:
+            await client.get(server_url, timeout=5)
+            response = await client.get(server_url, timeout=5)
+
+        assert response.text == "no-cookie"
+        await pool.aclose()
+
+    async def test_aclose_closes_clients(self):
+        pool = HttpClientPool(http2=False)
+        client = pool.get_client("http://qbittorrent:8080")
+
+        await pool.aclose()
+
+        assert client.is_closed
+        assert pool.get_stats()["hosts"] == {}
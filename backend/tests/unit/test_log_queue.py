@@ -0,0 +1,137 @@
+"""
+Unit Tests for queued log emission (app.services.structured_logging)
+
+Test Coverage:
+    - Records handled on the background listener, not the calling thread
+    - Correlation context and message arguments captured at logging time
+    - Log store entries added through the queue
+    - Rotating JSON log file
+    - Stopping the listener hands records back to synchronous handlers
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from app.services import structured_logging
+from app.services.log_store import LogStore, LogStoreHandler
+from app.services.structured_logging import (
+    ContextQueueHandler, CorrelationContext, add_queued_handler, flush_logs, get_queued_handlers,
+    setup_json_logging, stop_log_listeners
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread())
+
+
+@pytest.fixture
+def logger(monkeypatch, request):
+    """A non-propagating logger with its own queue listener."""
+    monkeypatch.setattr(structured_logging, '_log_queues', {})
+    name = f"test_log_queue.{request.node.name}"
+    target = logging.getLogger(name)
+    target.setLevel(logging.DEBUG)
+    target.propagate = False
+    yield target
+    stop_log_listeners()
+    target.handlers.clear()
+
+
+class TestQueueHandler:
+    """Test emission through the queue listener."""
+
+    def test_handled_on_listener_thread(self, logger):
+        handler = add_queued_handler(RecordingHandler(), logger.name)
+
+        logger.info("hello")
+        flush_logs()
+
+        assert [r.getMessage() for r in handler.records] == ["hello"]
+        assert threading.current_thread() not in handler.threads
+        assert get_queued_handlers(logger.name) == (handler,)
+        assert handler not in logger.handlers
+
+    def test_context_and_arguments_captured_when_logged(self, logger):
+        handler = add_queued_handler(RecordingHandler(), logger.name)
+        item = {"state": "queued"}
+
+        with CorrelationContext(request_id="req1", file_entry_id=7, tracker="lacale"):
+            logger.info("item %s", item)
+        item["state"] = "changed"
+        flush_logs()
+
+        record = handler.records[0]
+        assert record.getMessage() == "item {'state': 'queued'}"
+        assert record.correlation == ("req1", 7, {"tracker": "lacale"})
+
+    def test_handler_levels(self, logger):
+        errors = add_queued_handler(RecordingHandler(logging.ERROR), logger.name)
+        queue_handler, = [h for h in logger.handlers if isinstance(h, ContextQueueHandler)]
+        assert queue_handler.level == logging.ERROR
+        everything = add_queued_handler(RecordingHandler(logging.DEBUG), logger.name)
+
+        logger.debug("detail")
+        logger.error("failure")
+        flush_logs()
+
+        assert [r.getMessage() for r in errors.records] == ["failure"]
+        assert [r.getMessage() for r in everything.records] == ["detail", "failure"]
+
+    def test_stop_handles_pending_then_synchronous(self, logger):
+        handler = add_queued_handler(RecordingHandler(), logger.name)
+        for i in range(100):
+            logger.info("message %d", i)
+
+        stop_log_listeners()
+        assert len(handler.records) == 100
+
+        logger.info("after stop")
+        assert handler.records[-1].getMessage() == "after stop"
+        assert handler in logger.handlers
+        assert not any(isinstance(h, ContextQueueHandler) for h in logger.handlers)
+
+
+class TestQueuedHandlers:
+    """Test the log store and JSON file handlers behind the queue."""
+
+    def test_log_store_entry(self, logger, monkeypatch):
+        monkeypatch.setattr(LogStore, '_instance', None)
+        store = LogStore(max_entries=10)
+        handler = LogStoreHandler(store)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        add_queued_handler(handler, logger.name)
+
+        with CorrelationContext(request_id="req2", file_entry_id=3):
+            logger.info("Upload %s", "completed")
+        flush_logs()
+
+        entry = store.get_entries()[0]
+        assert entry['message'] == f"[{logger.name}] Upload completed"
+        assert entry['level'] == "SUCCESS"
+        assert (entry['request_id'], entry['file_entry_id']) == ("req2", 3)
+
+    def test_rotating_json_file(self, logger, tmp_path):
+        log_file = tmp_path / "logs" / "seedarr.log"
+        setup_json_logging(logger.name, log_file=str(log_file), max_bytes=2000, backup_count=2)
+
+        with CorrelationContext(file_entry_id=5):
+            for i in range(50):
+                logger.info("line %d", i)
+        flush_logs()
+
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert lines[-1]["message"] == "line 49"
+        assert lines[-1]["file_entry_id"] == 5
+        assert sorted(p.name for p in log_file.parent.iterdir()) == [
+            "seedarr.log", "seedarr.log.1", "seedarr.log.2"
+        ]
@@ -0,0 +1,181 @@
+"""
+Unit Tests for the in-memory log store (app.services.log_store)
+
+Test Coverage:
+    - Sequence numbers and "entries after N" reads
+    - Ring buffer eviction keeps the level / request / file indexes in step
+    - Filtered reads and statistics
+    - Async waiters woken by entries added from other threads
+    - Server-Sent Events log stream
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from backend.app.api import dashboard_routes
+from backend.app.services.log_store import LogStore
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """A fresh store of 5 entries (LogStore is a singleton)."""
+    monkeypatch.setattr(LogStore, '_instance', None)
+    return LogStore(max_entries=5)
+
+
+def messages(entries):
+    return [e['message'] for e in entries]
+
+
+class TestCursor:
+    """Test sequence numbers and cursors."""
+
+    def test_entries_after_cursor(self, store):
+        for i in range(3):
+            store.add_entry("INFO", f"m{i}")
+        cursor = store.latest_seq
+
+        store.add_entry("ERROR", "m3")
+        store.add_entry("INFO", "m4")
+
+        assert cursor == 3
+        assert messages(store.get_entries(after=cursor)) == ["m4", "m3"]
+        assert [e['seq'] for e in store.get_entries()] == [5, 4, 3, 2, 1]
+
+    def test_oldest_first_after_cursor(self, store):
+        store.add_entry("INFO", "m0")
+        for i in range(1, 5):
+            store.add_entry("ERROR" if i % 2 else "INFO", f"m{i}")
+
+        assert messages(store.get_entries(limit=2, after=1)) == ["m4", "m3"]
+        assert messages(store.get_entries(limit=2, after=1, oldest_first=True)) == ["m2", "m1"]
+        assert messages(store.get_entries(limit=1, after=2, level="error", oldest_first=True)) == ["m3"]
+
+    def test_eviction_keeps_indexes_in_step(self, store):
+        for i in range(12):
+            store.add_entry("ERROR" if i % 2 else "INFO", f"m{i}", file_entry_id=i % 3)
+
+        assert messages(store.get_entries()) == ["m11", "m10", "m9", "m8", "m7"]
+        assert messages(store.get_filtered_entries("error")) == ["m11", "m9", "m7"]
+        assert messages(store.get_entries_by_file_entry_id(1)) == ["m10", "m7"]
+        assert store.get_entries_by_file_entry_id(99) == []
+        # A cursor older than the buffer returns what is left
+        assert len(store.get_entries(after=2)) == 5
+        assert store.get_stats()["errors"] == 3
+
+    def test_combined_filters(self, store):
+        store.add_entry("INFO", "a", request_id="r1", file_entry_id=1)
+        store.add_entry("ERROR", "b", request_id="r1", file_entry_id=2)
+        store.add_entry("ERROR", "c", request_id="r2", file_entry_id=1)
+
+        assert messages(store.get_entries(level="error", file_entry_id=1)) == ["c"]
+        assert messages(store.get_entries_by_request_id("r1", limit=1)) == ["b"]
+        assert messages(store.get_entries(level="all", after=1)) == ["c", "b"]
+
+    def test_clear_keeps_sequence(self, store):
+        store.add_entry("INFO", "a")
+        store.add_entry("WARNING", "b")
+
+        assert store.clear() == 2
+        assert store.get_entries() == []
+        assert store.get_stats()["total"] == 0
+
+        store.add_entry("INFO", "c")
+        assert store.get_entries()[0]['seq'] == 3
+        assert store.get_stats()["total"] == 1
+
+
+class TestWaiters:
+    """Test waiting for new entries."""
+
+    async def test_woken_by_entry_from_thread(self, store):
+        waiting = asyncio.ensure_future(store.wait_for_entries(store.latest_seq, timeout=5))
+        await asyncio.sleep(0.01)
+
+        thread = threading.Thread(target=store.add_entry, args=("INFO", "from thread"))
+        thread.start()
+        thread.join()
+
+        assert await asyncio.wait_for(waiting, 1) is True
+
+    async def test_timeout(self, store):
+        store.add_entry("INFO", "seen")
+
+        assert await store.wait_for_entries(store.latest_seq, timeout=0.01) is False
+        assert await store.wait_for_entries(0, timeout=0.01) is True
+
+
+class FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+class TestLogStream:
+    """Test the Server-Sent Events stream."""
+
+    async def test_stream_pushes_new_entries(self, store, monkeypatch):
+        monkeypatch.setattr(dashboard_routes, 'get_log_store', lambda: store)
+        monkeypatch.setattr(dashboard_routes, 'LOG_STREAM_BATCH_DELAY', 0)
+        store.add_entry("INFO", "already displayed", file_entry_id=7)
+        request = FakeRequest()
+        stream = dashboard_routes._log_event_stream(request, store.latest_seq, file_entry_id=7)
+
+        store.add_entry("INFO", "other release", file_entry_id=8)
+        store.add_entry("INFO", "first", file_entry_id=7)
+        store.add_entry("ERROR", "second", file_entry_id=7)
+        event = await asyncio.wait_for(stream.__anext__(), 1)
+
+        lines = event.strip().split("\n")
+        assert lines[0] == "id: 4"
+        assert lines[1] == "event: log"
+        assert messages(json.loads(lines[2][len("data: "):])) == ["first", "second"]
+
+        request.disconnected = True
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(stream.__anext__(), 1)
+
+    async def test_stream_delivers_more_than_batch(self, store, monkeypatch):
+        monkeypatch.setattr(dashboard_routes, 'get_log_store', lambda: store)
+        monkeypatch.setattr(dashboard_routes, 'LOG_STREAM_BATCH_DELAY', 0)
+        monkeypatch.setattr(dashboard_routes, 'LOG_STREAM_MAX_ENTRIES', 2)
+        request = FakeRequest()
+        stream = dashboard_routes._log_event_stream(request, store.latest_seq)
+
+        for i in range(5):
+            store.add_entry("INFO", f"m{i}")
+        received = []
+        for _ in range(3):
+            event = await asyncio.wait_for(stream.__anext__(), 1)
+            received += messages(json.loads(event.strip().split("\n")[2][len("data: "):]))
+
+        assert received == ["m0", "m1", "m2", "m3", "m4"]
+        await stream.aclose()
+
+    async def test_api_entries_pages_through_backlog(self, store, monkeypatch):
+        monkeypatch.setattr(dashboard_routes, 'get_log_store', lambda: store)
+        for i in range(5):
+            store.add_entry("INFO", f"m{i}")
+
+        first = await dashboard_routes.get_log_entries(after=0, level=None, request_id=None, file_entry_id=None, limit=3)
+        second = await dashboard_routes.get_log_entries(
+            after=first["last_seq"], level=None, request_id=None, file_entry_id=None, limit=3
+        )
+
+        assert messages(first["entries"]) == ["m2", "m1", "m0"]
+        assert first["last_seq"] == 3
+        assert messages(second["entries"]) == ["m4", "m3"]
+        assert second["last_seq"] == 5
+
+    async def test_stream_heartbeat(self, store, monkeypatch):
+        monkeypatch.setattr(dashboard_routes, 'get_log_store', lambda: store)
+        monkeypatch.setattr(dashboard_routes, 'LOG_STREAM_HEARTBEAT', 0.01)
+        stream = dashboard_routes._log_event_stream(FakeRequest(), store.latest_seq)
+
+        assert await asyncio.wait_for(stream.__anext__(), 1) == ": keep-alive\n\n"
+        await stream.aclose()
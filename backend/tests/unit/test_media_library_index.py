@@ -0,0 +1,158 @@
+"""
+Unit Tests for the Radarr/Sonarr media library index
+
+Test Coverage:
+    - Lookups share one library download per snapshot (including concurrent ones)
+    - Exact path, normalized basename and history fallback matching (Radarr)
+    - Most recent basename candidate is picked (Sonarr)
+    - A miss rebuilds a snapshot older than MEDIA_LIBRARY_INDEX_MISS_REFRESH
+    - Webhook refreshes replace a single movie without a full download
+"""
+
+import asyncio
+
+import pytest
+
+from backend.app.services import media_library_index
+from backend.app.services.radarr_client import RadarrClient, RadarrError
+from backend.app.services.sonarr_client import SonarrClient
+
+
+class FakeArr:
+    """Records requests and answers them from an in-memory library."""
+
+    def __init__(self, movies=None, episode_files=None, history=None):
+        self.movies = movies or []
+        self.episode_files = episode_files or []
+        self.history = history or {}
+        self.calls = []
+
+    async def request(self, method, endpoint, params=None):
+        self.calls.append(endpoint)
+        await asyncio.sleep(0)
+        if endpoint == '/api/v3/movie':
+            return [m for m in self.movies if m.get('movieFile')]
+        if endpoint.startswith('/api/v3/movie/'):
+            movie_id = int(endpoint.rsplit('/', 1)[1])
+            for movie in self.movies:
+                if movie['id'] == movie_id:
+                    return movie
+            raise RadarrError("Radarr API error: 404", status_code=404)
+        if endpoint == '/api/v3/history/movie':
+            return self.history.get(params['movieId'], [])
+        if endpoint == '/api/v3/episodefile':
+            return self.episode_files
+        raise AssertionError(f"unexpected request {endpoint}")
+
+
+def movie(movie_id, path, scene_name, year=2005):
+    return {
+        'id': movie_id,
+        'title': f'Movie {movie_id}',
+        'year': year,
+        'movieFile': {'path': path, 'sceneName': scene_name},
+    }
+
+
+@pytest.fixture
+def radarr():
+    fake = FakeArr(movies=[
+        movie(1, '/movies/Serenity (2005)/Serenity (2005).mkv', 'Serenity.2005.1080p.BluRay-GRP'),
+        movie(2, '/movies/Title : Subtitle (2005)/Title : Subtitle (2005).mkv', 'Title.Subtitle.2005.720p-GRP'),
+        movie(3, '/movies/Old (2010)/Old (2010).mkv', 'Old.1999.DVDRip-GRP', year=2010),
+    ])
+    fake.history[3] = [{'eventType': 'downloadFolderImported', 'sourceTitle': 'Old.2010.1080p.WEB-GRP'}]
+    client = RadarrClient('http://radarr:7878', 'key')
+    client._request = fake.request
+    return client, fake
+
+
+class TestRadarrLookup:
+    """Test RadarrClient lookups through the index."""
+
+    async def test_lookups_share_one_download(self, radarr):
+        client, fake = radarr
+
+        exact = await client.find_scene_name_by_path('/movies/Serenity (2005)/Serenity (2005).mkv')
+        renamed = await client.find_scene_name_by_path('/mnt/smb/Title  Subtitle (2005).mkv')
+        history = await client.find_scene_name_by_path('/mnt/Old (2010).mkv')
+
+        assert exact == ('Serenity.2005.1080p.BluRay-GRP', True)
+        assert renamed == ('Title.Subtitle.2005.720p-GRP', True)
+        assert history == ('Old.2010.1080p.WEB-GRP', True)
+        assert fake.calls.count('/api/v3/movie') == 1
+
+    async def test_concurrent_lookups_are_single_flight(self, radarr):
+        client, fake = radarr
+
+        results = await asyncio.gather(*[
+            client.find_scene_name_by_path('/movies/Serenity (2005)/Serenity (2005).mkv')
+            for _ in range(10)
+        ])
+
+        assert all(result == ('Serenity.2005.1080p.BluRay-GRP', True) for result in results)
+        assert fake.calls.count('/api/v3/movie') == 1
+
+    async def test_miss_rebuilds_old_snapshot_only(self, radarr):
+        client, fake = radarr
+
+        assert await client.find_scene_name_by_path('/movies/New (2024).mkv') == (None, False)
+        assert fake.calls.count('/api/v3/movie') == 1
+
+        # Imported after the snapshot was built, without webhook
+        fake.movies.append(movie(4, '/movies/New (2024)/New (2024).mkv', 'New.2024.2160p-GRP', year=2024))
+        index = media_library_index.get_media_library_index()
+        state = next(iter(index._states.values()))
+        state.snapshot.built_at -= 3600
+
+        assert await client.find_scene_name_by_path('/movies/New (2024).mkv') == ('New.2024.2160p-GRP', True)
+        assert fake.calls.count('/api/v3/movie') == 2
+
+
+class TestSonarrLookup:
+    """Test SonarrClient lookups through the index."""
+
+    async def test_basename_picks_most_recent(self):
+        fake = FakeArr(episode_files=[
+            {'seriesId': 7, 'path': '/tv/Show/S01/Show - S01E01.mkv', 'sceneName': 'Show.S01E01.720p-OLD',
+             'dateAdded': '2023-01-01T00:00:00Z'},
+            {'seriesId': 8, 'path': '/tv/Show (US)/S01/Show - S01E01.mkv', 'sceneName': 'Show.S01E01.1080p-NEW',
+             'dateAdded': '2024-01-01T00:00:00Z'},
+        ])
+        client = SonarrClient('http://sonarr:8989', 'key')
+        client._request = fake.request
+
+        assert await client.find_scene_name_by_path('/tv/Show/S01/Show - S01E01.mkv') == 'Show.S01E01.720p-OLD'
+        assert await client.find_scene_name_by_path('/mnt/Show - S01E01.mkv') == 'Show.S01E01.1080p-NEW'
+        assert fake.calls.count('/api/v3/episodefile') == 1
+
+
+class TestWebhookRefresh:
+    """Test incremental refresh of a single movie."""
+
+    async def test_refresh_group_replaces_one_movie(self, radarr):
+        client, fake = radarr
+        index = media_library_index.get_media_library_index()
+        await client.find_scene_name_by_path('/movies/Serenity (2005)/Serenity (2005).mkv')
+
+        fake.movies[0] = movie(1, '/movies/Serenity (2005)/Serenity.2005.mkv', 'Serenity.2005.2160p-UHD')
+        await index.refresh_group(client, 1)
+
+        assert await client.find_scene_name_by_path('/movies/Serenity (2005)/Serenity.2005.mkv') == (
+            'Serenity.2005.2160p-UHD', True
+        )
+        assert await client.find_scene_name_by_path('/movies/Serenity (2005)/Serenity (2005).mkv') == (None, False)
+        assert fake.calls.count('/api/v3/movie') == 1
+        assert index.get_stats()['libraries']['radarr:http://radarr:7878']['incremental_updates'] == 1
+
+    async def test_deleted_movie_is_removed(self, radarr):
+        client, fake = radarr
+        index = media_library_index.get_media_library_index()
+        await client.find_scene_name_by_path('/movies/Serenity (2005)/Serenity (2005).mkv')
+
+        del fake.movies[0]
+        await index.refresh_group(client, 1)
+
+        snapshot = await index.get_snapshot(client)
+        assert snapshot.by_path('/movies/Serenity (2005)/Serenity (2005).mkv') == []
+        assert len(snapshot) == 2
@@ -0,0 +1,143 @@
+"""
+Unit Tests for the MediaInfo extraction cache
+
+Test Coverage:
+    - Repeated extractions of an unchanged file parse it once
+    - Hardlinked copies share the entry and keep their own file name
+    - A modified file is parsed again
+    - Concurrent extractions share one parse
+    - Entries persisted in the database survive a new cache instance
+    - Database lookups and writes run off the event loop
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.models.base import Base
+from backend.app.services.mediainfo_cache import MediaInfoCache
+from backend.app.services.nfo_generator import AudioTrack, MediaInfoData, VideoTrack
+
+
+class CountingParser:
+    """Stand-in for NFOGenerator._parse_mediainfo that counts parses."""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def for_path(self, path):
+        async def parse():
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            return MediaInfoData(
+                file_name=os.path.basename(path),
+                format="Matroska",
+                video_tracks=[VideoTrack(format="AVC", width=1920, height=1080)],
+                audio_tracks=[AudioTrack(format="AC-3", channels=6, language="French")],
+            )
+        return parse
+
+
+def make_session_factory():
+    """In-memory database shared by the worker threads."""
+    engine = create_engine(
+        'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def media(tmp_path):
+    path = tmp_path / "Movie.2023.1080p.BluRay.x264-GRP.mkv"
+    path.write_bytes(b"x" * 1024)
+    return str(path)
+
+
+class TestMediaInfoCache:
+    """Test cache hits, invalidation and sharing."""
+
+    async def test_unchanged_file_is_parsed_once(self, media):
+        cache, parser = MediaInfoCache(), CountingParser()
+
+        first = await cache.get_or_extract(media, parser.for_path(media))
+        second = await cache.get_or_extract(media, parser.for_path(media))
+
+        assert parser.calls == 1
+        assert second == first
+        assert second is not first
+        assert cache.get_stats()['hits'] == 1
+        assert cache.get_stats()['misses'] == 1
+
+    async def test_hardlink_hits_with_its_own_name(self, media, tmp_path):
+        link = str(tmp_path / "Movie.2023.FRENCH.1080p.BluRay.x264-GRP.mkv")
+        os.link(media, link)
+        cache, parser = MediaInfoCache(), CountingParser()
+
+        await cache.get_or_extract(media, parser.for_path(media))
+        data = await cache.get_or_extract(link, parser.for_path(link))
+
+        assert parser.calls == 1
+        assert data.file_name == os.path.basename(link)
+
+    async def test_modified_file_is_parsed_again(self, media):
+        cache, parser = MediaInfoCache(), CountingParser()
+        await cache.get_or_extract(media, parser.for_path(media))
+
+        with open(media, 'ab') as f:
+            f.write(b"more")
+        await cache.get_or_extract(media, parser.for_path(media))
+
+        assert parser.calls == 2
+        assert cache.get_stats()['invalidations'] == 1
+
+    async def test_concurrent_extractions_share_one_parse(self, media):
+        cache, parser = MediaInfoCache(), CountingParser(delay=0.05)
+
+        results = await asyncio.gather(*[
+            cache.get_or_extract(media, parser.for_path(media)) for _ in range(5)
+        ])
+
+        assert parser.calls == 1
+        assert all(r.video_tracks[0].width == 1920 for r in results)
+
+    async def test_empty_result_is_not_cached(self, media):
+        cache, calls = MediaInfoCache(), []
+
+        async def failed_parse():
+            calls.append(1)
+            return MediaInfoData(file_name=os.path.basename(media))
+
+        await cache.get_or_extract(media, failed_parse)
+        await cache.get_or_extract(media, failed_parse)
+
+        assert len(calls) == 2
+
+    async def test_persisted_entry_survives_restart(self, media):
+        session_factory = make_session_factory()
+        parser = CountingParser()
+
+        await MediaInfoCache(session_factory).get_or_extract(media, parser.for_path(media))
+        data = await MediaInfoCache(session_factory).get_or_extract(media, parser.for_path(media))
+
+        assert parser.calls == 1
+        assert data.audio_tracks[0].language == "French"
+
+    async def test_database_off_event_loop(self, media):
+        make_session = make_session_factory()
+        threads = []
+
+        def session_factory():
+            threads.append(threading.get_ident())
+            return make_session()
+
+        await MediaInfoCache(session_factory).get_or_extract(media, CountingParser().for_path(media))
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
@@ -0,0 +1,132 @@
+"""
+Unit Tests for the concurrent multi-tracker upload stage
+
+Test Coverage:
+    - Trackers are uploaded concurrently (latency of the slowest, not the sum)
+    - A tracker exceeding PIPELINE_TRACKER_UPLOAD_TIMEOUT is marked failed
+      without failing the others
+    - Each tracker's status is committed as soon as it finishes
+    - A tracker whose rate limit token is refused fails without uploading
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.base import Base
+from backend.app.models.file_entry import FileEntry
+from backend.app.processors import pipeline as pipeline_module
+from backend.app.processors.pipeline import ProcessingPipeline
+
+
+class SlowAdapter:
+    """Tracker adapter whose upload takes `delay` seconds, or waits at `barrier` for the other uploads."""
+
+    def __init__(self, slug, delay, barrier=None):
+        self.slug = slug
+        self.delay = delay
+        self.barrier = barrier
+
+    async def authenticate(self):
+        return True
+
+    async def check_duplicate(self, **kwargs):
+        return {'is_duplicate': False}
+
+    async def upload_torrent(self, **kwargs):
+        if self.barrier is not None:
+            await asyncio.wait_for(self.barrier.wait(), 1)
+        await asyncio.sleep(self.delay)
+        return {'success': True, 'torrent_id': self.slug, 'torrent_url': f'https://{self.slug}/t/1'}
+
+
+@pytest.fixture
+def db():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def file_entry(db, tmp_path):
+    media = tmp_path / "Movie.2023.1080p.BluRay.x264-GRP.mkv"
+    media.write_bytes(b"x" * 1024)
+    nfo = tmp_path / "Movie.nfo"
+    nfo.write_text("nfo")
+
+    entry = FileEntry.create_or_get(db, str(media))
+    entry.release_name = "Movie.2023.1080p.BluRay.x264-GRP"
+    entry.nfo_path = str(nfo)
+    for slug in ("fast", "slow"):
+        torrent = tmp_path / f"{slug}.torrent"
+        torrent.write_bytes(b"d4:infode")
+        entry.set_torrent_path_for_tracker(slug, str(torrent))
+    db.commit()
+    return entry
+
+
+async def run_upload_stage(pipeline, db, file_entry, delays, barrier=None):
+    """Run _upload_stage against SlowAdapters; return tracker statuses at each commit."""
+    trackers = [
+        SimpleNamespace(id=i, slug=slug, name=slug.title(), inject_to_qbit=False, default_template_id=None)
+        for i, slug in enumerate(delays, start=1)
+    ]
+    factory = Mock()
+    factory.get_adapter.side_effect = lambda tracker: SlowAdapter(tracker.slug, delays[tracker.slug], barrier)
+    commits = []
+    original_commit = db.commit
+
+    def commit():
+        original_commit()
+        commits.append({k: dict(v) for k, v in file_entry.get_tracker_statuses().items()})
+
+    with patch('app.models.tracker.Tracker.get_upload_enabled', return_value=trackers), \
+         patch('app.models.settings.Settings.get_settings', return_value=Mock(flaresolverr_url=None)), \
+         patch('app.adapters.tracker_factory.TrackerFactory', return_value=factory), \
+         patch('backend.app.services.qbittorrent_client.get_qbittorrent_client_from_settings', return_value=None), \
+         patch.object(pipeline, '_resolve_category_for_tracker', return_value=('1', None)), \
+         patch.object(pipeline, '_build_tracker_options', return_value=None), \
+         patch.object(pipeline, '_generate_bbcode_description', new=AsyncMock(return_value=None)), \
+         patch.object(pipeline_module, 'get_statistics_service', return_value=AsyncMock()), \
+         patch.object(db, 'commit', side_effect=commit):
+        await pipeline._upload_stage(file_entry)
+    return commits
+
+
+class TestParallelUploadStage:
+    """Test concurrent uploads across trackers."""
+
+    async def test_trackers_upload_concurrently(self, db, file_entry):
+        # Each upload only completes once both are in flight
+        barrier = asyncio.Barrier(2)
+        await run_upload_stage(ProcessingPipeline(db), db, file_entry, {'fast': 0, 'slow': 0}, barrier)
+
+        assert sorted(file_entry.get_successful_trackers()) == ['fast', 'slow']
+
+    async def test_slow_tracker_times_out_alone(self, db, file_entry, monkeypatch):
+        monkeypatch.setattr(pipeline_module.config, 'PIPELINE_TRACKER_UPLOAD_TIMEOUT', 0.2)
+        commits = await run_upload_stage(ProcessingPipeline(db), db, file_entry, {'fast': 0.0, 'slow': 5})
+
+        assert file_entry.get_successful_trackers() == ['fast']
+        assert 'timed out' in file_entry.get_tracker_status('slow')['error']
+        # The fast tracker's success was committed while the slow one was still running
+        assert any(
+            c.get('fast', {}).get('status') == 'success' and c.get('slow', {}).get('status') == 'pending'
+            for c in commits
+        )
+
+    async def test_rate_limited_tracker_not_uploaded(self, db, file_entry, monkeypatch):
+        async def acquire(service, *args, **kwargs):
+            return service != 'tracker:slow'
+
+        monkeypatch.setattr(pipeline_module, 'acquire_rate_limit', acquire)
+        await run_upload_stage(ProcessingPipeline(db), db, file_entry, {'fast': 0.0, 'slow': 0.0})
+
+        assert file_entry.get_successful_trackers() == ['fast']
+        assert 'Rate limit exceeded' in file_entry.get_tracker_status('slow')['error']
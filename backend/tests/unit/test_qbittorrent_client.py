@@ -0,0 +1,216 @@
+"""
+Unit Tests for QBittorrentClient session reuse and batch injection
+
+Test Coverage:
+    - A single login is shared across injections and client instances
+    - Re-authentication happens only when qBittorrent answers 403
+    - inject_torrents() sends torrents sharing a save path in one request
+    - Per-torrent tags of a batch are applied with addTags
+    - Torrents already present in a batch are tagged and categorised
+    - An unreadable .torrent file only fails its own entry
+"""
+
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from email import policy
+from email.parser import BytesParser
+from urllib.parse import parse_qs
+
+import pytest
+import torf
+
+from backend.app.services import qbittorrent_client as qb
+from backend.app.services.qbittorrent_client import QBittorrentClient
+
+
+class FakeQBittorrent:
+    """Minimal qBittorrent Web API: login, add, addTags, setCategory, version."""
+
+    def __init__(self):
+        self.sid = None
+        self.logins = 0
+        self.adds = []      # list of (fields, torrent count)
+        self.tag_calls = []  # list of form dicts
+        self.category_calls = []  # list of form dicts
+
+
+def make_handler(state: FakeQBittorrent):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, body, headers=None):
+            data = body.encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _authorized(self):
+            return state.sid and f"SID={state.sid}" in (self.headers.get("Cookie") or "")
+
+        def do_GET(self):
+            if not self._authorized():
+                return self._reply(403, "Forbidden")
+            self._reply(200, "v4.6.0")
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            if self.path == "/api/v2/auth/login":
+                self.rfile.read(length)
+                state.logins += 1
+                state.sid = uuid.uuid4().hex
+                return self._reply(200, "Ok.", {"Set-Cookie": f"SID={state.sid}; HttpOnly; path=/"})
+
+            if not self._authorized():
+                self.rfile.read(length)
+                return self._reply(403, "Forbidden")
+
+            if self.path == "/api/v2/torrents/add":
+                body = self.rfile.read(length)
+                message = BytesParser(policy=policy.HTTP).parsebytes(
+                    f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body
+                )
+                parts = list(message.iter_parts())
+                count = sum(1 for part in parts if part.get_param("name", header="content-disposition") == "torrents")
+                fields = {
+                    part.get_param("name", header="content-disposition"): part.get_content()
+                    for part in parts
+                    if part.get_param("name", header="content-disposition") != "torrents"
+                }
+                state.adds.append((fields, count))
+                return self._reply(200, "Ok.")
+
+            body = parse_qs(self.rfile.read(length).decode())
+            calls = state.category_calls if self.path == "/api/v2/torrents/setCategory" else state.tag_calls
+            calls.append({k: v[0] for k, v in body.items()})
+            self._reply(200, "")
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def fake_qbit():
+    state = FakeQBittorrent()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    qb._sessions.clear()
+    yield state, f"http://127.0.0.1:{server.server_address[1]}"
+    qb._sessions.clear()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def torrent_files(tmp_path):
+    """Create two .torrent files with distinct info hashes."""
+    content = tmp_path / "Movie.mkv"
+    content.write_bytes(b"x" * 40000)
+    paths = []
+    for source in ("lacale", "c411"):
+        t = torf.Torrent(path=content, private=True, source=source)
+        t.generate()
+        path = tmp_path / f"{source}.torrent"
+        t.write(path)
+        paths.append(str(path))
+    return paths
+
+
+class TestSessionReuse:
+    """Test persistent session cookie handling."""
+
+    async def test_single_login_across_clients(self, fake_qbit, torrent_files):
+        state, url = fake_qbit
+
+        for path in torrent_files:
+            client = QBittorrentClient(url, "admin", "secret")
+            result = await client.inject_torrent(path, "/media/Movie", tags="LACALE")
+            assert result["success"] is True
+        assert (await QBittorrentClient(url, "admin", "secret").test_connection())["success"]
+
+        assert state.logins == 1
+        assert len(state.adds) == 2
+
+    async def test_relogin_on_403(self, fake_qbit, torrent_files):
+        state, url = fake_qbit
+        client = QBittorrentClient(url, "admin", "secret")
+
+        await client.inject_torrent(torrent_files[0], "/media/Movie")
+        state.sid = "expired"  # qBittorrent restarted / session expired
+        result = await client.inject_torrent(torrent_files[1], "/media/Movie")
+
+        assert result["success"] is True
+        assert state.logins == 2
+
+
+class TestBatchInjection:
+    """Test inject_torrents batching."""
+
+    async def test_same_save_path_is_one_request(self, fake_qbit, torrent_files):
+        state, url = fake_qbit
+        client = QBittorrentClient(url, "admin", "secret")
+
+        results = await client.inject_torrents(
+            [
+                {"torrent_path": torrent_files[0], "save_path": "/media/Movie", "tags": "LaCale"},
+                {"torrent_path": torrent_files[1], "save_path": "/media/Movie", "tags": "C411"},
+            ],
+            category="Seedarr",
+        )
+
+        assert [r["success"] for r in results] == [True, True]
+        assert len(state.adds) == 1
+        fields, count = state.adds[0]
+        assert count == 2
+        assert fields["category"] == "Seedarr"
+        assert "tags" not in fields
+        assert sorted(call["tags"] for call in state.tag_calls) == ["C411", "LaCale"]
+
+    async def test_different_save_paths_are_grouped(self, fake_qbit, torrent_files):
+        state, url = fake_qbit
+        client = QBittorrentClient(url, "admin", "secret")
+
+        await client.inject_torrents([
+            {"torrent_path": torrent_files[0], "save_path": "/media/A", "tags": "X"},
+            {"torrent_path": torrent_files[1], "save_path": "/media/B", "tags": "X"},
+        ])
+
+        assert [fields["savepath"] for fields, _ in state.adds] == ["/media/A", "/media/B"]
+        assert all(fields["tags"] == "X" for fields, _ in state.adds)
+        assert state.tag_calls == []
+        assert state.logins == 1
+
+    async def test_missing_torrent_fails_only_its_entry(self, fake_qbit, torrent_files, tmp_path):
+        state, url = fake_qbit
+        client = QBittorrentClient(url, "admin", "secret")
+
+        results = await client.inject_torrents([
+            {"torrent_path": str(tmp_path / "missing.torrent"), "save_path": "/media/Movie", "tags": "X"},
+            {"torrent_path": torrent_files[1], "save_path": "/media/Movie", "tags": "X"},
+        ])
+
+        assert [r["success"] for r in results] == [False, True]
+        assert "not found" in results[0]["message"]
+        assert state.adds[0][1] == 1
+
+    async def test_batch_tags_and_categorises_present_torrents(self, fake_qbit, torrent_files):
+        state, url = fake_qbit
+        client = QBittorrentClient(url, "admin", "secret")
+        hashes = sorted(str(torf.Torrent.read(path).infohash).lower() for path in torrent_files)
+
+        # "Ok." for a batch may mean only some were added; the others kept their options
+        await client.inject_torrents(
+            [{"torrent_path": path, "save_path": "/media/Movie", "tags": "X"} for path in torrent_files],
+            category="Seedarr",
+        )
+
+        assert [sorted(call["hashes"].split("|")) for call in state.tag_calls] == [hashes]
+        assert len(state.category_calls) == 1
+        assert state.category_calls[0]["category"] == "Seedarr"
+        assert sorted(state.category_calls[0]["hashes"].split("|")) == hashes
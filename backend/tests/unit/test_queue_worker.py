@@ -0,0 +1,116 @@
+"""
+Unit Tests for QueueWorker continuous scheduling
+
+Test Coverage:
+    - Free slots are refilled without waiting for the slowest item
+    - Concurrency never exceeds max_concurrent
+    - notify() wakes an idle worker without waiting for poll_interval
+"""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch
+
+from backend.app.workers import queue_worker as qw
+from backend.app.workers.queue_worker import QueueWorker
+
+
+class FakeQueue:
+    """In-memory stand-in for the persistent queue."""
+
+    def __init__(self, items=None):
+        self.pending = list(items or [])
+        self.lock = threading.Lock()
+
+    def add(self, queue_id):
+        with self.lock:
+            self.pending.append(queue_id)
+
+    def claim(self, exclude_ids):
+        with self.lock:
+            for queue_id in self.pending:
+                if queue_id not in exclude_ids:
+                    self.pending.remove(queue_id)
+                    return (queue_id, queue_id, 0)
+        return None
+
+
+@pytest.fixture
+def run_worker():
+    """Run a QueueWorker against a FakeQueue with a fake pipeline."""
+    started = []
+    finished = []
+    state = {"active": 0, "max_active": 0}
+
+    async def fake_process(file_entry_id, skip_approval=False):
+        started.append(file_entry_id)
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.5 if file_entry_id == 1 else 0.02)
+        state["active"] -= 1
+        finished.append(file_entry_id)
+        return {"success": True}
+
+    def run(queue, **worker_kwargs):
+        worker = QueueWorker(**worker_kwargs)
+        patches = [
+            patch.object(qw, '_claim_next_item_sync', queue.claim),
+            patch.object(qw, '_get_file_entry_path_sync', lambda _id: f"/media/{_id}.mkv"),
+            patch.object(qw, '_mark_completed_sync', lambda _id: None),
+            patch.object(qw, '_mark_failed_sync', lambda _id, _err: None),
+            patch('app.processors.pipeline.process_file_by_id', fake_process),
+        ]
+        for p in patches:
+            p.start()
+        return worker, patches
+
+    yield run, started, finished, state
+
+
+class TestContinuousScheduling:
+    """Test slot refill and concurrency cap."""
+
+    async def test_slow_item_does_not_stall_queue(self, run_worker):
+        run, started, finished, state = run_worker
+        worker, patches = run(FakeQueue([1, 2, 3, 4, 5]), max_concurrent=2, poll_interval=0.05)
+        try:
+            await worker.start()
+            for _ in range(100):
+                if len(finished) == 5:
+                    break
+                await asyncio.sleep(0.02)
+            await worker.stop()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert sorted(finished) == [1, 2, 3, 4, 5]
+        # Items 2..5 all ran while the slow item 1 was still in flight
+        assert finished[-1] == 1
+        assert state["max_active"] == 2
+
+    async def test_notify_wakes_idle_worker(self, run_worker):
+        run, started, finished, state = run_worker
+        queue = FakeQueue()
+        worker, patches = run(queue, max_concurrent=2, poll_interval=60)
+        try:
+            await worker.start()
+            await asyncio.sleep(0.05)  # worker is now idle, waiting up to 60s
+
+            queue.add(7)
+            await asyncio.to_thread(worker.notify)  # from another thread
+
+            for _ in range(50):
+                if finished:
+                    break
+                await asyncio.sleep(0.02)
+            await worker.stop()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert finished == [7]
+
+    def test_notify_when_stopped_is_noop(self):
+        QueueWorker().notify()
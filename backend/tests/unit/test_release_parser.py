@@ -0,0 +1,99 @@
+"""
+Unit Tests for the release name parser (app.services.release_parser)
+
+Test Coverage:
+    - Golden corpus of real-world release names (tests/unit/data/release_names.json)
+    - Label priorities within a field
+    - Memoization, copies of cached results, parse_many
+    - MetadataMapper, UniversalRenamer and TMDBCacheService share the parser
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services import release_parser
+from app.services.metadata_mapper import MetadataMapper
+from app.services.release_parser import ReleaseNameParser, parse_release_name
+from app.services.tmdb_cache_service import TMDBCacheService
+from app.services.universal_renamer import UniversalRenamer
+
+CORPUS = json.loads((Path(__file__).parent / "data" / "release_names.json").read_text(encoding="utf-8"))
+
+
+class TestGoldenCorpus:
+    """Test the parse of every name of the corpus."""
+
+    @pytest.mark.parametrize("entry", CORPUS, ids=[entry["name"] for entry in CORPUS])
+    def test_corpus(self, entry):
+        assert parse_release_name(entry["name"]) == entry["expected"]
+
+
+class TestPriorities:
+    """Test that the first label of a field wins wherever it matches."""
+
+    def test_earlier_label_wins_over_leftmost_match(self):
+        parsed = parse_release_name("Movie.2020.DTS.x264.Atmos.1080p.mkv")
+
+        assert parsed["audio"] == "Atmos"
+
+    def test_language_variant_only_with_multi(self):
+        assert parse_release_name("Film.2018.VFQ.MULTi.mkv")["language_variant"] == "VFQ"
+        assert parse_release_name("Film.2018.VFQ.mkv")["language_variant"] is None
+
+
+class TestMemoization:
+    """Test the cache of parsed names."""
+
+    def test_parse_returns_copies(self):
+        parser = ReleaseNameParser()
+
+        first = parser.parse("Movie.2020.1080p.BluRay.x264-GRP.mkv")
+        first["source"] = "WEB-DL"
+
+        assert parser.parse("Movie.2020.1080p.BluRay.x264-GRP.mkv")["source"] == "BluRay"
+        assert parser.get_stats() == {"entries": 1, "max_entries": 4096, "hits": 1, "misses": 1}
+
+    def test_parse_many(self):
+        parser = ReleaseNameParser(max_entries=2)
+        names = ["A.2020.720p.mkv", "B.2021.1080p.mkv", "A.2020.720p.mkv", "C.2022.2160p.mkv"]
+
+        parsed = parser.parse_many(names)
+
+        assert [info["resolution"] for info in parsed] == ["720p", "1080p", "720p", "2160p"]
+        assert parsed[0] is not parsed[2]
+        assert parser.get_stats()["misses"] == 3
+        assert parser.get_stats()["entries"] == 2
+
+
+class TestCallers:
+    """Test the services parsing release names through the shared parser."""
+
+    @pytest.fixture
+    def parser(self, monkeypatch):
+        parser = ReleaseNameParser()
+        monkeypatch.setattr(release_parser, "_release_parser", parser)
+        return parser
+
+    def test_mapper_and_renamer_share_parse(self, parser):
+        name = "Dune.Part.Two.2024.MULTi.VFF.2160p.WEB-DL.DDP5.1.Atmos.x265-GRP.mkv"
+        mapper = MetadataMapper.__new__(MetadataMapper)
+
+        assert mapper.parse_filename(name)["title"] == "Dune Part Two"
+        assert mapper.is_tv_show(name) is False
+        assert UniversalRenamer().extract_team_from_filename(name) == "GRP"
+        assert parser.get_stats()["misses"] == 1
+
+    async def test_tmdb_search_uses_parser(self, parser):
+        service = TMDBCacheService.__new__(TMDBCacheService)
+        service.search_by_title = AsyncMock(return_value=None)
+
+        await service.search_and_get_metadata(
+            "/media/Cloud 9 (2014)/Cloud.9.FRENCH.1080p.WEB.x264-GRP.mkv"
+        )
+        await service.search_and_get_metadata("Show.Name.S01E05.720p.HDTV.x264.mkv", is_tv_show=True)
+
+        assert service.search_by_title.await_args_list[0].args == ("Cloud 9", 2014, "movie")
+        assert service.search_by_title.await_args_list[1].args == ("Show Name", None, "tv")
@@ -0,0 +1,75 @@
+"""
+Unit Tests for pipeline ResourcePools
+
+Test Coverage:
+    - Per-resource concurrency limits
+    - Independent pools per tracker
+    - Different resources overlap
+    - Usage statistics
+"""
+
+import asyncio
+
+from backend.app.processors.resource_pools import (
+    ResourcePools, tracker_resource, HASHING, FFMPEG
+)
+
+
+async def hold(pools, resource, log, duration=0.05):
+    """Hold a slot of `resource` and record concurrency."""
+    async with pools.slot(resource):
+        log.append(("start", resource, pools.get_stats()[resource]["active"]))
+        await asyncio.sleep(duration)
+        log.append(("end", resource, None))
+
+
+class TestResourcePools:
+    """Test bounded resource pools."""
+
+    async def test_limit_is_enforced(self):
+        pools = ResourcePools(limits={HASHING: 1})
+        log = []
+
+        await asyncio.gather(*(hold(pools, HASHING, log) for _ in range(3)))
+
+        assert max(active for event, _, active in log if event == "start") == 1
+
+    async def test_different_resources_overlap(self):
+        pools = ResourcePools(limits={HASHING: 1, FFMPEG: 1})
+        log = []
+
+        await asyncio.gather(hold(pools, HASHING, log), hold(pools, FFMPEG, log))
+
+        # Both started before either finished
+        assert [event for event, _, _ in log[:2]] == ["start", "start"]
+
+    async def test_trackers_are_isolated(self):
+        pools = ResourcePools(limits={}, tracker_limit=1)
+        log = []
+
+        await asyncio.gather(
+            hold(pools, tracker_resource("lacale"), log),
+            hold(pools, tracker_resource("c411"), log),
+        )
+
+        assert [event for event, _, _ in log[:2]] == ["start", "start"]
+        assert pools.get_limit(tracker_resource("anything")) == 1
+
+    async def test_stats_report_waiting(self):
+        pools = ResourcePools(limits={HASHING: 1})
+        release = asyncio.Event()
+
+        async def blocker():
+            async with pools.slot(HASHING):
+                await release.wait()
+
+        first = asyncio.create_task(blocker())
+        second = asyncio.create_task(blocker())
+        await asyncio.sleep(0.01)
+
+        stats = pools.get_stats()[HASHING]
+        assert stats == {"limit": 1, "active": 1, "waiting": 1}
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert pools.get_stats()[HASHING]["active"] == 0
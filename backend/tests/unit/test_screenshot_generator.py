@@ -0,0 +1,133 @@
+"""
+Unit Tests for screenshot capture (app.services.screenshot_generator)
+
+Test Coverage:
+    - Durations stored by the analyze stage reused (no ffprobe)
+    - Captures run concurrently within the ffmpeg pool limit
+    - Keyframe seeking, downscaling and output formats
+    - Failed captures skipped
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.processors import resource_pools
+from app.processors.resource_pools import FFMPEG, ResourcePools
+from app.services import screenshot_generator
+from app.services.screenshot_generator import ScreenshotError, ScreenshotGenerator, parse_duration
+
+
+class FakeProcesses:
+    """Stand-in for asyncio.create_subprocess_exec running ffmpeg / ffprobe."""
+
+    def __init__(self, fail_at=None):
+        self.commands = []
+        self.active = 0
+        self.max_active = 0
+        self.fail_at = fail_at
+
+    async def __call__(self, *cmd, **kwargs):
+        self.commands.append(list(cmd))
+        return FakeProcess(self, list(cmd))
+
+
+class FakeProcess:
+    def __init__(self, processes, cmd):
+        self.processes = processes
+        self.cmd = cmd
+        self.returncode = None
+
+    async def communicate(self):
+        self.processes.active += 1
+        self.processes.max_active = max(self.processes.max_active, self.processes.active)
+        await asyncio.sleep(0.01)
+        self.processes.active -= 1
+
+        if self.cmd[0] == "ffprobe":
+            self.returncode = 0
+            return b"1000.0\n", b""
+        if self.processes.fail_at and self.processes.fail_at in self.cmd:
+            self.returncode = 1
+            return b"", b"seek failed"
+        Path(self.cmd[-1]).write_bytes(b"image")
+        self.returncode = 0
+        return b"", b""
+
+
+@pytest.fixture
+def processes(monkeypatch):
+    fake = FakeProcesses()
+    monkeypatch.setattr(screenshot_generator.asyncio, "create_subprocess_exec", fake)
+    monkeypatch.setattr(resource_pools, "_resource_pools", ResourcePools(limits={FFMPEG: 2}))
+    return fake
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "movie.mkv"
+    path.write_bytes(b"")
+    return str(path)
+
+
+def make_generator():
+    return ScreenshotGenerator(ffmpeg_path="ffmpeg", ffprobe_path="ffprobe")
+
+
+class TestDuration:
+    """Test the conversion of stored durations."""
+
+    def test_parse_duration(self):
+        assert parse_duration("1h 52mn 03s") == 6723
+        assert parse_duration("45mn") == 2700
+        assert parse_duration("5400.5") == 5400.5
+        assert parse_duration(90) == 90
+        assert parse_duration("") is None
+        assert parse_duration(None) is None
+        assert parse_duration("unknown") is None
+
+
+class TestCapture:
+    """Test concurrent captures."""
+
+    async def test_known_duration_concurrent_captures(self, processes, video, tmp_path):
+        paths = await make_generator().generate_screenshots(
+            video, str(tmp_path / "screens"), "Movie", duration="1h 40mn", format="png",
+            keyframe_seek=False, max_width=0
+        )
+
+        assert [Path(p).name for p in paths] == [f"Movie_00{i}.png" for i in range(1, 5)]
+        assert all(cmd[0] == "ffmpeg" for cmd in processes.commands)
+        assert [cmd[cmd.index("-ss") + 1] for cmd in processes.commands] == ["900.0", "2400.0", "3600.0", "5100.0"]
+        assert processes.max_active == 2
+
+    async def test_unknown_duration_probed(self, processes, video, tmp_path):
+        await make_generator().generate_screenshots(video, str(tmp_path), "Movie", count=1, duration="")
+
+        assert processes.commands[0][0] == "ffprobe"
+        assert processes.commands[1][processes.commands[1].index("-ss") + 1] == "500.0"
+
+    async def test_keyframe_seek_scaled_webp(self, processes, video, tmp_path):
+        paths = await make_generator().generate_screenshots(
+            video, str(tmp_path), "Movie", count=1, duration=100, format="webp",
+            keyframe_seek=True, max_width=1280
+        )
+
+        cmd = processes.commands[0]
+        assert paths[0].endswith("Movie_001.webp")
+        assert cmd[cmd.index("-skip_frame") + 1] == "nokey"
+        assert cmd.index("-noaccurate_seek") < cmd.index("-i")
+        assert cmd[cmd.index("-vf") + 1] == "scale='min(1280,iw)':-2"
+        assert "-quality" in cmd
+
+    async def test_failed_capture_skipped(self, processes, video, tmp_path):
+        processes.fail_at = "2400.0"
+
+        paths = await make_generator().generate_screenshots(video, str(tmp_path), "Movie", duration=6000)
+
+        assert [Path(p).name for p in paths] == ["Movie_001.png", "Movie_003.png", "Movie_004.png"]
+
+    async def test_unsupported_format(self, processes, video, tmp_path):
+        with pytest.raises(ScreenshotError):
+            await make_generator().generate_screenshots(video, str(tmp_path), "Movie", format="gif")
@@ -0,0 +1,195 @@
+"""
+Unit Tests for the statistics rollups (app.services.statistics_service)
+
+Test Coverage:
+    - Atomic daily / tracker increments, row creation and weighted averages
+    - Finished files and tracker uploads recorded with time and size
+    - Rollups rebuilt from the file_entries history
+    - Dashboard data read from the rollups only
+    - Statistics increments grouped with checkpoint writes
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# The statistics service and models use the "app." models
+from app import database
+from app.models.base import Base
+from app.models.file_entry import FileEntry, Status, TrackerStatus
+from app.models.statistics import DailyStatistics, TrackerStatistics
+from app.services.statistics_service import StatisticsService
+
+DAY = date(2026, 3, 1)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def finished_entry(db, status, finished_at, processing=timedelta(minutes=10), size=1000, trackers=None):
+    entry = FileEntry(file_path=f"/media/Movie.{finished_at.isoformat()}.mkv")
+    entry.created_at = finished_at - processing
+    entry.updated_at = finished_at
+    entry.mediainfo_data = {'file_size': size}
+    if status == Status.UPLOADED:
+        entry.mark_uploaded()
+        entry.uploaded_at = finished_at
+    else:
+        entry.mark_failed("boom")
+    entry.updated_at = finished_at
+    entry.tracker_statuses = trackers
+    db.add(entry)
+    db.commit()
+    return entry
+
+
+class TestAtomicIncrements:
+    """Test the rollup increments of the models."""
+
+    def test_daily_add_creates_then_increments(self, db):
+        DailyStatistics.add(db.connection(), DAY, successful=1, processing_time_seconds=30, bytes_processed=100)
+        DailyStatistics.add(db.connection(), DAY, failed=1, processing_time_seconds=10, bytes_processed=50)
+        db.commit()
+
+        stats = db.query(DailyStatistics).one()
+        assert (stats.total_uploads, stats.successful_uploads, stats.failed_uploads) == (2, 1, 1)
+        assert stats.total_processing_time_seconds == 40
+        assert stats.avg_processing_time_seconds == 20
+        assert stats.total_bytes_processed == 150
+
+    def test_tracker_average_only_counts_timed_uploads(self, db):
+        TrackerStatistics.add(db.connection(), DAY, "lacale", successful=3)
+        TrackerStatistics.add(db.connection(), DAY, "lacale", successful=1, processing_time_seconds=8, timed_uploads=1)
+        TrackerStatistics.add(db.connection(), DAY, "c411", failed=1, processing_time_seconds=2, timed_uploads=1)
+        db.commit()
+
+        lacale = db.query(TrackerStatistics).filter_by(tracker_name="lacale").one()
+        assert (lacale.total_uploads, lacale.timed_uploads) == (4, 1)
+        assert lacale.avg_processing_time_seconds == 8
+        assert db.query(TrackerStatistics).count() == 2
+
+    def test_summary_average_is_weighted(self, db):
+        today = date.today()
+        DailyStatistics.add(db.connection(), today, successful=9, processing_time_seconds=90)
+        DailyStatistics.add(db.connection(), today - timedelta(days=1), successful=1, processing_time_seconds=110)
+        db.commit()
+
+        summary = DailyStatistics.get_summary(db, days=30)
+
+        assert summary['total_uploads'] == 10
+        assert summary['avg_processing_time'] == 20
+
+
+class TestRecording:
+    """Test recording from the pipeline."""
+
+    async def test_record_file_finished(self, db):
+        entry = finished_entry(db, Status.UPLOADED, datetime.utcnow(), size=4096)
+        entry.approval_requested_at = entry.created_at + timedelta(minutes=1)
+        entry.approved_at = entry.approval_requested_at + timedelta(minutes=5)
+
+        await StatisticsService(db).record_file_finished(entry)
+
+        stats = db.query(DailyStatistics).one()
+        assert stats.date == datetime.utcnow().date()
+        assert stats.successful_uploads == 1
+        assert stats.total_bytes_processed == 4096
+        # 10 minutes in the pipeline, 5 of them waiting for approval
+        assert stats.total_processing_time_seconds == pytest.approx(300, abs=5)
+
+    async def test_record_tracker_upload(self, db):
+        service = StatisticsService(db)
+
+        await service.record_tracker_upload("lacale", True, 2.5)
+        await service.record_tracker_upload("lacale", False, 0.5)
+
+        stats = db.query(TrackerStatistics).one()
+        assert (stats.successful_uploads, stats.failed_uploads, stats.timed_uploads) == (1, 1, 2)
+        assert stats.avg_processing_time_seconds == 1.5
+
+    async def test_recording_error_is_logged_not_raised(self, db, caplog):
+        db.close()
+        db.get_bind().dispose()
+        broken = sessionmaker(bind=create_engine("sqlite:///:memory:"))()
+
+        await StatisticsService(broken).record_tracker_upload("lacale", True, 1.0)
+
+        assert "Error recording statistics" in caplog.text
+
+
+class TestRebuild:
+    """Test rebuilding the rollups from the history."""
+
+    def test_rebuild_from_history(self, db):
+        first = datetime(2026, 3, 1, 12)
+        finished_entry(db, Status.UPLOADED, first, trackers={
+            "lacale": {"status": TrackerStatus.SUCCESS.value, "updated_at": first.isoformat(), "duration": 4.0},
+            "c411": {"status": TrackerStatus.FAILED.value, "updated_at": first.isoformat()},
+        })
+        finished_entry(db, Status.FAILED, first + timedelta(hours=1), size=500)
+        finished_entry(db, Status.UPLOADED, first + timedelta(days=1), processing=timedelta(minutes=20), trackers={
+            "lacale": {"status": TrackerStatus.SUCCESS.value, "updated_at": (first + timedelta(days=1)).isoformat()},
+            "torr9": {"status": TrackerStatus.SKIPPED_DUPLICATE.value},
+        })
+        # Stale rollups are replaced
+        DailyStatistics.add(db.connection(), DAY, successful=100)
+        db.commit()
+
+        counts = StatisticsService(db).rebuild_rollups(batch_size=2)
+
+        assert counts == {'files': 3, 'daily_rows': 2, 'tracker_rows': 3}
+        day1, day2 = db.query(DailyStatistics).order_by(DailyStatistics.date).all()
+        assert (day1.date, day1.successful_uploads, day1.failed_uploads) == (DAY, 1, 1)
+        assert day1.total_bytes_processed == 1500
+        assert day1.avg_processing_time_seconds == 600
+        assert (day2.total_uploads, day2.avg_processing_time_seconds) == (1, 1200)
+
+        lacale = {s.date: s for s in db.query(TrackerStatistics).filter_by(tracker_name="lacale")}
+        assert lacale[DAY].avg_processing_time_seconds == 4.0
+        assert lacale[DAY + timedelta(days=1)].timed_uploads == 0
+        assert db.query(TrackerStatistics).filter_by(tracker_name="c411").one().failed_uploads == 1
+
+    def test_dashboard_reads_rollups(self, db):
+        # History without rollups is not scanned by the dashboard
+        finished_entry(db, Status.UPLOADED, datetime.utcnow())
+        service = StatisticsService(db)
+        assert service.get_dashboard_data()['summary']['total_uploads'] == 0
+
+        service.rebuild_rollups()
+
+        data = service.get_dashboard_data()
+        assert data['summary']['total_uploads'] == 1
+        assert data['summary']['total_bytes_processed'] == 1000
+        assert service.get_status_distribution() == {'uploaded': 1}
+
+
+class TestCheckpointGrouping:
+    """Test statistics increments written by the checkpoint writer."""
+
+    async def test_increments_share_a_transaction(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+        event.listen(engine, "connect", database.apply_sqlite_pragmas)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        service = StatisticsService(session)
+        try:
+            await asyncio.gather(*[service.record_tracker_upload("lacale", True, 1.0) for _ in range(10)])
+
+            writer = database.get_checkpoint_writer(engine)
+            assert session.query(TrackerStatistics).one().successful_uploads == 10
+            assert writer.operations == 10
+            assert writer.transactions < 10
+        finally:
+            session.close()
+            await database.dispose_async_engines()
+            engine.dispose()
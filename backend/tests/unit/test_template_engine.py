@@ -0,0 +1,92 @@
+"""
+Unit Tests for the compiled template engine (app.services.template_engine)
+
+Test Coverage:
+    - Placeholders, conditional blocks, nested blocks
+    - Unknown placeholders and unmatched block tags kept as written
+    - Compiled template cache keyed by template ID and content hash
+    - BBCodeGenerator only computes the variables a template references
+"""
+
+from app.services.bbcode_generator import BBCodeGenerator
+from app.services.template_engine import TemplateCache, TemplateVariables, parse_template
+
+
+def render(content, **variables):
+    return parse_template(content).render(variables)
+
+
+class TestRendering:
+    """Test the compiled form."""
+
+    def test_placeholders_and_blocks(self):
+        template = "[b]{{title}}[/b]{{#year}} ({{year}}){{/year}}{{#tagline}}\n{{tagline}}{{/tagline}}"
+
+        assert render(template, title="Dune", year="2021", tagline="") == "[b]Dune[/b] (2021)"
+        assert parse_template(template).variables == {"title", "year", "tagline"}
+
+    def test_nested_blocks(self):
+        template = "{{#video}}Video{{#hdr}} HDR: {{hdr}}{{/hdr}}{{/video}}."
+
+        assert render(template, video="1", hdr="DV") == "Video HDR: DV."
+        assert render(template, video="1", hdr="") == "Video."
+        assert render(template, video="", hdr="DV") == "."
+
+    def test_unknown_and_unmatched_tags_kept(self):
+        assert render("{{missing}} {{#gone}}x{{/gone}}", title="t") == "{{missing}} "
+        assert render("a {{/stray}} {{#open}}b {{title}}", title="t") == "a {{/stray}} {{#open}}b t"
+        assert render("{{#a}}{{#b}}x{{/a}}", a="1", b="") == "{{#b}}x"
+
+    def test_values_inserted_verbatim(self):
+        assert render("{{path}} {{n}}", path=r"C:\new\1", n=0) == r"C:\new\1 0"
+
+
+class TestCache:
+    """Test the compiled template cache."""
+
+    def test_cached_by_id_and_content(self):
+        cache = TemplateCache(max_entries=2)
+
+        first = cache.get("{{title}}", template_id=1)
+        assert cache.get("{{title}}", template_id=1) is first
+        assert cache.get("{{title}} edited", template_id=1) is not first
+        cache.get("{{other}}", template_id=2)
+
+        assert cache.get_stats() == {"entries": 2, "max_entries": 2, "hits": 1, "misses": 3}
+        assert cache.get("{{title}}", template_id=1) is not first
+
+
+class TestLazyVariables:
+    """Test variables computed on first access."""
+
+    def test_providers_called_once(self):
+        calls = []
+        variables = TemplateVariables({"a": "1"}, {"b": lambda: calls.append("b") or "2"})
+
+        assert parse_template("{{b}}{{b}}{{a}}").render(variables) == "221"
+        assert calls == ["b"]
+        assert dict(variables) == {"a": "1", "b": "2"}
+
+    def test_generator_computes_referenced_variables_only(self, monkeypatch):
+        generator = BBCodeGenerator()
+        media, tmdb = generator.get_sample_data()
+        monkeypatch.setattr(generator, "_build_audio_table", lambda media_data: 1 / 0)
+
+        variables = generator._build_template_variables(media, tmdb)
+        rendered = parse_template("{{title}} ({{year}}) {{quality}}").render(variables)
+
+        assert rendered.startswith("Harry Potter et l'Ordre du Phenix (2007) ")
+        assert {"title", "year", "quality"} <= variables.computed
+        assert "audio_table" not in variables.computed
+        assert "cast_1_card" not in variables.computed
+
+    def test_extra_variables_override(self):
+        generator = BBCodeGenerator()
+        media, _ = generator.get_sample_data()
+
+        rendered = generator.render_template(
+            "{{title}} / {{release_name}} / {{release_team}}", media,
+            extra_variables={"release_name": "Custom-TEAM"}
+        )
+
+        assert rendered == "Titre / Custom-TEAM / GROUP"
@@ -12,6 +12,7 @@ Test Coverage:
     - Error handling (API errors, network failures, rate limiting)
     - Cache invalidation and cleanup
     - Cache statistics
+    - Search result cache and single-flight searches
 
 Requirements:
     - pytest
@@ -24,7 +25,7 @@ from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
-from backend.app.services.tmdb_cache_service import TMDBCacheService
+from backend.app.services.tmdb_cache_service import TMDBCacheService, make_search_key
 from backend.app.services.exceptions import TrackerAPIError, NetworkRetryableError
 from backend.app.models.tmdb_cache import TMDBCache
 from backend.app.models.settings import Settings
@@ -619,3 +620,82 @@ class TestMediaAnalyzerIntegration:
         # Execute and expect error
         with pytest.raises(TrackerAPIError):
             await analyzer.validate_tmdb_metadata("550")
+
+
+@pytest.fixture
+def search_db():
+    """In-memory database with the search cache table."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from backend.app.models.base import Base
+
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestSearchCache:
+    """Test caching and coalescing of TMDB title searches."""
+
+    def test_search_key_normalization(self):
+        """Case, punctuation and whitespace do not change the key."""
+        assert make_search_key("R.I.P.D.", 2013, "movie") == make_search_key("r i p d", 2013, "movie")
+        assert make_search_key("Dark", 2017, "tv") != make_search_key("Dark", 2017, "movie")
+        assert make_search_key("Dark", 2017, "tv") != make_search_key("Dark", None, "tv")
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_hits_cache(self, search_db):
+        """Episodes of a season share one search request."""
+        service = TMDBCacheService(search_db)
+        results = [{'id': 70523, 'name': 'Dark'}]
+
+        with patch.object(TMDBCacheService, '_search_from_api', new=AsyncMock(return_value=results)) as api, \
+             patch.object(TMDBCacheService, 'get_metadata', new=AsyncMock(return_value={'tmdb_id': '70523'})):
+            for _ in range(3):
+                metadata = await service.search_by_title("Dark", 2017, "tv")
+            await TMDBCacheService(search_db).search_by_title("DARK", 2017, "tv")
+
+        assert metadata == {'tmdb_id': '70523'}
+        assert api.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_are_coalesced(self, search_db):
+        """Identical searches in flight share one request."""
+        import asyncio
+
+        async def slow_search(*args):
+            await asyncio.sleep(0.05)
+            return [{'id': 550, 'title': 'Fight Club', 'release_date': '1999-10-15'}]
+
+        service = TMDBCacheService(search_db)
+        with patch.object(TMDBCacheService, '_search_from_api', side_effect=slow_search) as api:
+            results = await asyncio.gather(*[
+                service.search_movies_autocomplete("Fight Club") for _ in range(4)
+            ])
+
+        assert api.call_count == 1
+        assert all(r[0]['tmdb_id'] == '550' and r[0]['year'] == 1999 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_not_cached(self, search_db):
+        """HTTP failures are retried on the next lookup."""
+        service = TMDBCacheService(search_db)
+
+        with patch.object(TMDBCacheService, '_search_from_api', new=AsyncMock(return_value=None)) as api:
+            assert await service.search_by_title("Unknown Movie") is None
+            assert await service.search_by_title("Unknown Movie") is None
+
+        assert api.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refused_rate_limit_skips_search(self, search_db):
+        """A refused rate limit token fails the search without a request."""
+        service = TMDBCacheService(search_db)
+
+        with patch('backend.app.services.tmdb_cache_service.acquire_rate_limit', new=AsyncMock(return_value=False)), \
+             patch.object(TMDBCacheService, '_search_from_api', new=AsyncMock(return_value=[])) as api:
+            assert await service.search_by_title("Dark", 2017, "tv") is None
+
+        api.assert_not_awaited()
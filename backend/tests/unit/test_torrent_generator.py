@@ -0,0 +1,157 @@
+"""
+Unit Tests for TorrentGenerator
+
+Test Coverage:
+    - Piece size strategies
+    - Hash-once, sign-many generation across trackers
+    - Hardlinked per-tracker copies reuse the same piece hashes
+    - Distinct piece sizes are hashed separately
+    - Parallel piece hasher matches torf's hashes
+"""
+
+import os
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import torf
+
+from backend.app.services import piece_hasher
+from backend.app.services.torrent_generator import TorrentGenerator, KiB, MiB
+
+
+def make_tracker(slug, source_flag, strategy="auto"):
+    """Create a lightweight Tracker stand-in."""
+    return SimpleNamespace(
+        slug=slug,
+        name=slug.title(),
+        enabled=True,
+        announce_url=f"https://{slug}.example/announce",
+        source_flag=source_flag,
+        piece_size_strategy=strategy,
+    )
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    """Create a small media file spanning several pieces."""
+    path = tmp_path / "Movie.2024.1080p.mkv"
+    path.write_bytes(os.urandom(3 * MiB + 123))
+    return path
+
+
+@pytest.fixture
+def count_generate():
+    """Count hashing passes while keeping real hashing."""
+    original = piece_hasher.hash_pieces
+    calls = []
+
+    def wrapper(file_path, *args, **kwargs):
+        calls.append(file_path)
+        return original(file_path, *args, **kwargs)
+
+    with patch('backend.app.services.torrent_generator.hash_pieces', wrapper):
+        yield calls
+
+
+class TestPieceSize:
+    """Test piece size strategies."""
+
+    def test_auto_returns_none(self):
+        assert TorrentGenerator().calculate_piece_size(10 * MiB, "auto") is None
+
+    def test_c411_table(self):
+        generator = TorrentGenerator()
+        assert generator.calculate_piece_size(500 * MiB, "c411") == 1024 * KiB
+        assert generator.calculate_piece_size(20 * 1024 * MiB, "c411") == 16384 * KiB
+
+
+class TestHashOnceSignMany:
+    """Test piece hash reuse across trackers."""
+
+    async def test_same_piece_size_hashed_once(self, media_file, tmp_path, count_generate):
+        trackers = [make_tracker("lacale", "lacale"), make_tracker("c411", "C411")]
+        generator = TorrentGenerator(output_dir=str(tmp_path / "out"))
+
+        with patch('backend.app.models.tracker.Tracker.get_enabled', return_value=trackers):
+            paths = await generator.generate_all(Mock(), str(media_file), "Movie.2024")
+
+        assert set(paths) == {"lacale", "c411"}
+        assert len(count_generate) == 1
+
+        infohashes = set()
+        for slug, path in paths.items():
+            torrent = torf.Torrent.read(path)
+            assert torrent.source == next(t.source_flag for t in trackers if t.slug == slug)
+            assert torrent.trackers[0][0].endswith(f"{slug}.example/announce")
+            assert torrent.verify(str(media_file))
+            infohashes.add(torrent.infohash)
+
+        # Different source flags still produce unique infohashes
+        assert len(infohashes) == 2
+
+    async def test_hardlinked_copies_share_hashes(self, media_file, tmp_path, count_generate):
+        trackers = [make_tracker("lacale", "lacale"), make_tracker("c411", "C411")]
+        link_dir = tmp_path / "c411"
+        link_dir.mkdir()
+        linked = link_dir / "Movie.2024.FRENCH.1080p.mkv"
+        os.link(media_file, linked)
+
+        generator = TorrentGenerator(output_dir=str(tmp_path / "out"))
+        with patch('backend.app.models.tracker.Tracker.get_enabled', return_value=trackers):
+            paths = await generator.generate_all(
+                Mock(), str(media_file), "Movie.2024",
+                tracker_file_paths={"c411": str(linked)},
+            )
+
+        assert len(count_generate) == 1
+        c411_torrent = torf.Torrent.read(paths["c411"])
+        assert c411_torrent.name == linked.name
+        assert c411_torrent.verify(str(linked))
+
+    async def test_distinct_piece_sizes_hashed_separately(self, media_file, tmp_path, count_generate):
+        trackers = [
+            make_tracker("lacale", "lacale", strategy="auto"),
+            make_tracker("c411", "C411", strategy="c411"),
+        ]
+        generator = TorrentGenerator(output_dir=str(tmp_path / "out"))
+
+        with patch('backend.app.models.tracker.Tracker.get_enabled', return_value=trackers):
+            paths = await generator.generate_all(Mock(), str(media_file), "Movie.2024")
+
+        assert len(paths) == 2
+        assert len(count_generate) == 2
+        assert torf.Torrent.read(paths["c411"]).piece_size == 1024 * KiB
+
+
+class TestParallelPieceHasher:
+    """Test the multi-core piece hasher against torf."""
+
+    @pytest.mark.parametrize("piece_size", [16 * KiB, 256 * KiB, 1024 * KiB])
+    def test_matches_torf(self, media_file, piece_size):
+        reference = torf.Torrent(path=str(media_file), piece_size=piece_size)
+        reference.generate()
+
+        progress = []
+        with patch.object(piece_hasher, 'PARALLEL_THRESHOLD', 0), \
+                patch.object(piece_hasher, 'TASK_BYTES', 512 * KiB):
+            pieces = piece_hasher.hash_pieces(
+                str(media_file), piece_size,
+                progress_callback=lambda done, total: progress.append((done, total)),
+            )
+
+        assert pieces == reference.metainfo['info']['pieces']
+        assert progress[-1] == (media_file.stat().st_size, media_file.stat().st_size)
+        assert piece_hasher.get_hash_progress(str(media_file)) is None
+
+    def test_empty_file_rejected(self, tmp_path):
+        empty = tmp_path / "empty.mkv"
+        empty.touch()
+        with pytest.raises(ValueError):
+            piece_hasher.hash_pieces(str(empty), 16 * KiB)
+
+    def test_shutdown_reports_running_pool(self):
+        piece_hasher.get_hasher_pool()
+
+        assert piece_hasher.shutdown_hasher_pool() is True
+        assert piece_hasher.shutdown_hasher_pool() is False